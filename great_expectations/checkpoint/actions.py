@@ -12,6 +12,7 @@ import logging
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Dict,
     List,
     Literal,
@@ -19,10 +20,10 @@ from typing import (
     Union,
 )
 
-import requests
-
 from great_expectations._docs_decorators import public_api
 from great_expectations.checkpoint.util import (
+    NOTIFICATION_REQUEST_TIMEOUT,
+    get_notification_session,
     send_email,
     send_microsoft_teams_notifications,
     send_opsgenie_alert,
@@ -56,6 +57,8 @@ from great_expectations.render.renderer import (
 from great_expectations.render.renderer.renderer import Renderer
 
 if TYPE_CHECKING:
+    import requests
+
     from great_expectations.checkpoint.v1_checkpoint import CheckpointResult
     from great_expectations.core.expectation_validation_result import (
         ExpectationSuiteValidationResult,
@@ -96,6 +99,9 @@ class ValidationAction(BaseModel):
 
     type: str
 
+    # Whether action (e.g., notification) does not affect others, so that it may run concurrently.
+    _dispatch_concurrently: ClassVar[bool] = False
+
     @property
     def _using_cloud_context(self) -> bool:
         from great_expectations import project_manager
@@ -232,6 +238,8 @@ class SlackNotificationAction(DataDocsAction):
 
     type: Literal["slack"] = "slack"
 
+    _dispatch_concurrently: ClassVar[bool] = True
+
     slack_webhook: Optional[str] = None
     slack_token: Optional[str] = None
     slack_channel: Optional[str] = None
@@ -396,6 +404,8 @@ class PagerdutyAlertAction(ValidationAction):
 
     type: Literal["pagerduty"] = "pagerduty"
 
+    _dispatch_concurrently: ClassVar[bool] = True
+
     api_key: str
     routing_key: str
     notify_on: Literal["all", "failure", "success"] = "failure"
@@ -502,6 +512,8 @@ class MicrosoftTeamsNotificationAction(ValidationAction):
 
     type: Literal["microsoft"] = "microsoft"
 
+    _dispatch_concurrently: ClassVar[bool] = True
+
     teams_webhook: str
     notify_on: Literal["all", "failure", "success"] = "all"
     renderer: MicrosoftTeamsRenderer = Field(default_factory=MicrosoftTeamsRenderer)
@@ -598,6 +610,8 @@ class OpsgenieAlertAction(ValidationAction):
 
     type: Literal["opsgenie"] = "opsgenie"
 
+    _dispatch_concurrently: ClassVar[bool] = True
+
     api_key: str
     region: Optional[str] = None
     priority: Literal["P1", "P2", "P3", "P4", "P5"] = "P3"
@@ -721,6 +735,8 @@ class EmailAction(ValidationAction):
 
     type: Literal["email"] = "email"
 
+    _dispatch_concurrently: ClassVar[bool] = True
+
     smtp_address: str
     smtp_port: str
     receiver_emails: str
@@ -1003,6 +1019,8 @@ class SNSNotificationAction(ValidationAction):
 
     type: Literal["sns"] = "sns"
 
+    _dispatch_concurrently: ClassVar[bool] = True
+
     sns_topic_arn: str
     sns_message_subject: Optional[str]
 
@@ -1043,6 +1061,8 @@ class SNSNotificationAction(ValidationAction):
 class APINotificationAction(ValidationAction):
     type: Literal["api"] = "api"
 
+    _dispatch_concurrently: ClassVar[bool] = True
+
     url: str
 
     @override
@@ -1079,10 +1099,12 @@ class APINotificationAction(ValidationAction):
     def send_results(self, payload) -> requests.Response:
         try:
             headers = {"Content-Type": "application/json"}
-            return requests.post(self.url, headers=headers, data=payload)
-        except Exception as e:
-            print(f"Exception when sending data to API - {e}")
-            raise e  # noqa: TRY201
+            return get_notification_session().post(
+                self.url, headers=headers, data=payload, timeout=NOTIFICATION_REQUEST_TIMEOUT
+            )
+        except Exception:
+            logger.exception("Exception when sending data to API")
+            raise
 
     @staticmethod
     def create_payload(data_asset_name, suite_name, validation_results_serializable) -> str:
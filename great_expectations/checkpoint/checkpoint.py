@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import contextlib
 import datetime
+import functools
 import logging
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
+    ContextManager,
     Literal,
     Optional,
     Sequence,
@@ -24,7 +29,9 @@ from great_expectations.checkpoint.util import (
     convert_validations_list_to_checkpoint_validation_definitions,
     does_batch_request_in_validations_contain_batch_data,
     get_substituted_validation_dict,
+    get_validation_results,
     get_validations_with_batch_request_as_dict,
+    run_validations,
     substitute_runtime_config,
     validate_validation_dict,
 )
@@ -54,8 +61,12 @@ from great_expectations.validation_operators import ActionListValidationOperator
 
 if TYPE_CHECKING:
     from great_expectations.checkpoint.configurator import ActionDict
+    from great_expectations.checkpoint.util import ValidationRun
     from great_expectations.core.config_provider import _ConfigurationProvider
     from great_expectations.data_context import AbstractDataContext
+    from great_expectations.data_context.types.resource_identifiers import (
+        ValidationResultIdentifier,
+    )
     from great_expectations.datasource.fluent.interfaces import (
         BatchRequest as FluentBatchRequest,
     )
@@ -115,6 +126,7 @@ class BaseCheckpoint(ConfigPeer):
         run_time: datetime.datetime | None = None,
         result_format: str | dict | None = None,
         expectation_suite_id: str | None = None,
+        max_workers: int | None = None,
     ) -> CheckpointResult:
         """Validate against current Checkpoint.
 
@@ -134,6 +146,12 @@ class BaseCheckpoint(ConfigPeer):
             run_time: The date/time of the run.
             result_format: One of several supported formatting directives for expectation validation results
             expectation_suite_id: Great Expectations Cloud id for the expectation suite
+            max_workers: Maximum number of validations run concurrently (default is None, meaning one at a time);
+                validations of Checkpoint created with a validator always run one at a time.
+
+        Failure of one validation does not stop the others, which store their results and run their actions;
+        once all validations have completed, exception of the first failed validation (in order of validations)
+        is raised.
 
         Raises:
             InvalidCheckpointConfigError: If `run_id` is provided with `run_name` or `run_time`.
@@ -226,30 +244,54 @@ class BaseCheckpoint(ConfigPeer):
             for validation in validations:
                 validation.id = self.config.default_validation_id
 
-        validation_operator_results: list[ValidationOperatorResult] = []
+        # Validations share DataContext; its use by validations running concurrently is serialized.
+        context_lock = threading.Lock()
+
+        run_validation_fns: list[Callable[[], ValidationOperatorResult]]
         if len(validations) > 0:
-            for idx, validation_dict in enumerate(validations):
-                result = self._run_validation(
+            run_validation_fns = [
+                functools.partial(
+                    self._run_validation,
                     substituted_runtime_config=substituted_runtime_config,
                     result_format=result_format,
                     run_id=run_id,
                     idx=idx,
                     validation_dict=validation_dict,
                     context=context,
+                    context_lock=context_lock,
                 )
-                validation_operator_results.append(result)
+                for idx, validation_dict in enumerate(validations)
+            ]
         else:
-            result = self._run_validation(
-                substituted_runtime_config=substituted_runtime_config,
-                result_format=result_format,
-                run_id=run_id,
-                context=context,
-            )
-            validation_operator_results.append(result)
+            run_validation_fns = [
+                functools.partial(
+                    self._run_validation,
+                    substituted_runtime_config=substituted_runtime_config,
+                    result_format=result_format,
+                    run_id=run_id,
+                    context=context,
+                    context_lock=context_lock,
+                )
+            ]
+
+        # Validator, supplied to Checkpoint, is shared by all of its validations, which thus cannot run concurrently.  # noqa: E501
+        validation_runs: list[ValidationRun[ValidationOperatorResult]] = run_validations(
+            run_validation_fns=run_validation_fns,
+            max_workers=None if self._validator else max_workers,
+        )
+
+        # Every validation has completed (and run its actions); first exception, in order of validations, is raised.  # noqa: E501
+        validation_operator_results: list[ValidationOperatorResult] = get_validation_results(
+            validation_runs=validation_runs
+        )
 
         checkpoint_run_results: dict = {}
-        for validation_operator_result in validation_operator_results:
+        validation_durations: dict[ValidationResultIdentifier, float] = {}
+        for validation_run, validation_operator_result in zip(
+            validation_runs, validation_operator_results
+        ):
             run_results = validation_operator_result.run_results
+            validation_durations.update({key: validation_run.duration for key in run_results})
 
             validation_result_url: str | None = None
             for run_result in run_results.values():
@@ -279,6 +321,7 @@ class BaseCheckpoint(ConfigPeer):
             run_id=run_id,  # type: ignore[arg-type] # could be str
             run_results=checkpoint_run_results,
             checkpoint_config=self.config,
+            validation_durations=validation_durations,
         )
 
     def _get_substituted_config(
@@ -308,7 +351,12 @@ class BaseCheckpoint(ConfigPeer):
         context: AbstractDataContext,
         idx: int | None = 0,
         validation_dict: CheckpointValidationDefinition | None = None,
+        context_lock: threading.Lock | None = None,
     ) -> ValidationOperatorResult:
+        # Batch retrieval and actions hold "context_lock" (if given), so that validations running
+        # concurrently use shared DataContext one at a time (Expectations are validated without it).
+        lock: ContextManager = context_lock or contextlib.nullcontext()
+
         if validation_dict is None:
             validation_dict = CheckpointValidationDefinition(
                 id=substituted_runtime_config.get("default_validation_id")
@@ -341,14 +389,17 @@ class BaseCheckpoint(ConfigPeer):
                     context._determine_if_expectation_validation_result_include_rendered_content()
                 )
 
-            validator: Validator = self._validator or context.get_validator(
-                batch_request=batch_request,
-                expectation_suite_name=expectation_suite_name
-                if not self._using_cloud_context
-                else None,
-                expectation_suite_id=(expectation_suite_id if self._using_cloud_context else None),
-                include_rendered_content=include_rendered_content,
-            )
+            with lock:
+                validator: Validator = self._validator or context.get_validator(
+                    batch_request=batch_request,
+                    expectation_suite_name=expectation_suite_name
+                    if not self._using_cloud_context
+                    else None,
+                    expectation_suite_id=(
+                        expectation_suite_id if self._using_cloud_context else None
+                    ),
+                    include_rendered_content=include_rendered_content,
+                )
 
             action_list: Sequence[ActionDict] | None = substituted_validation_dict.get(
                 "action_list"
@@ -369,6 +420,7 @@ class BaseCheckpoint(ConfigPeer):
                     action_list=action_list,
                     result_format=result_format,
                     name=f"{self.name}-checkpoint-validation[{idx}]",
+                    actions_lock=context_lock,
                 )
             )
             checkpoint_identifier = None
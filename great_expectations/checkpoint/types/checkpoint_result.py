@@ -61,6 +61,7 @@ class CheckpointResult(SerializableDictDot):
         run_results: A Dict with ValidationResultIdentifier keys and Dict values, which contains at minimum a `validation_result` key and an `action_results` key.
         checkpoint_config: The CheckpointConfig instance used to create this CheckpointResult.
         success: An optional boolean describing the success of all run_results in this CheckpointResult.
+        validation_durations: An optional Dict with ValidationResultIdentifier keys and run durations (in seconds) of the corresponding validations as values.
     """  # noqa: E501
 
     # JC: I think this needs to be changed to be an instance of a new type called CheckpointResult,
@@ -76,6 +77,7 @@ class CheckpointResult(SerializableDictDot):
         checkpoint_config: CheckpointConfig,
         validation_result_url: Optional[str] = None,
         success: Optional[bool] = None,
+        validation_durations: Optional[dict[ValidationResultIdentifier, float]] = None,
     ) -> None:
         self._validation_result_url = validation_result_url
         self._run_id = run_id
@@ -89,6 +91,7 @@ class CheckpointResult(SerializableDictDot):
         else:
             self._success = success
 
+        self._validation_durations = validation_durations or {}
         self._validation_results: list[ExpectationSuiteValidationResult] | dict | None = None
         self._data_assets_validated: list[dict] | dict | None = None
         self._data_assets_validated_by_batch_id: dict | None = None
@@ -131,6 +134,10 @@ class CheckpointResult(SerializableDictDot):
     def success(self) -> bool:
         return self._success
 
+    @property
+    def validation_durations(self) -> dict[ValidationResultIdentifier, float]:
+        return self._validation_durations
+
     def list_batch_identifiers(self) -> list[str]:
         if self._batch_identifiers is None:
             self._batch_identifiers = list(
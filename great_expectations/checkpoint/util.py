@@ -5,11 +5,28 @@ import json
 import logging
 import smtplib
 import ssl
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import List, Optional, Union
+from typing import (
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws
@@ -26,9 +43,51 @@ from great_expectations.types import DictDot
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Notifications are not idempotent, so requests are retried (with exponential backoff, honoring
+# "Retry-After") only when they were not processed: on failure to connect and on throttling.
+# Each attempt is bounded by timeout (in seconds).
+NOTIFICATION_MAX_RETRIES: int = 3
+NOTIFICATION_RETRY_BACKOFF_FACTOR: float = 0.5
+NOTIFICATION_RETRY_STATUS_CODES: Tuple[int, ...] = (429,)
+NOTIFICATION_REQUEST_TIMEOUT: float = 30.0
+
+# Maximum time (in seconds) that actions, dispatched concurrently, are waited for.
+DEFAULT_ACTION_TIMEOUT: float = 120.0
+# Maximum number of actions, dispatched together, running concurrently.
+MAX_CONCURRENT_ACTIONS: int = 16
+
+_notification_session: Optional[requests.Session] = None
+_notification_session_lock = threading.Lock()
+
+
+def get_notification_session() -> requests.Session:
+    """Returns HTTP session shared by notification actions (for connection reuse and retry)."""
+    global _notification_session  # noqa: PLW0603
+    with _notification_session_lock:
+        if _notification_session is None:
+            retry = Retry(
+                total=NOTIFICATION_MAX_RETRIES,
+                # Request, which was sent but not answered, may have been processed.
+                read=0,
+                other=0,
+                backoff_factor=NOTIFICATION_RETRY_BACKOFF_FACTOR,
+                status_forcelist=NOTIFICATION_RETRY_STATUS_CODES,
+                allowed_methods=frozenset(["POST"]),
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            adapter = HTTPAdapter(max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _notification_session = session
+
+        return _notification_session
+
 
 def send_slack_notification(query, slack_webhook=None, slack_channel=None, slack_token=None):
-    session = requests.Session()
+    session = get_notification_session()
     url = slack_webhook
     headers = None
 
@@ -43,13 +102,17 @@ def send_slack_notification(query, slack_webhook=None, slack_channel=None, slack
         headers = {"Authorization": f"Bearer {slack_token}"}
 
     try:
-        response = session.post(url=url, headers=headers, json=query)
+        response = session.post(
+            url=url, headers=headers, json=query, timeout=NOTIFICATION_REQUEST_TIMEOUT
+        )
         if slack_webhook:
             ok_status = response.text == "ok"
         else:
             ok_status = response.json()["ok"]
     except requests.ConnectionError:
-        logger.warning(f"Failed to connect to Slack webhook after {10} retries.")
+        logger.warning(
+            f"Failed to connect to Slack webhook after {NOTIFICATION_MAX_RETRIES} retries."
+        )
     except Exception as e:
         logger.error(str(e))  # noqa: TRY400
     else:
@@ -81,10 +144,12 @@ def send_opsgenie_alert(query, suite_name, settings):
         "tags": settings["tags"],
     }
 
-    session = requests.Session()
+    session = get_notification_session()
 
     try:
-        response = session.post(url, headers=headers, json=payload)
+        response = session.post(
+            url, headers=headers, json=payload, timeout=NOTIFICATION_REQUEST_TIMEOUT
+        )
     except requests.ConnectionError:
         logger.warning("Failed to connect to Opsgenie")
     except Exception as e:
@@ -100,11 +165,16 @@ def send_opsgenie_alert(query, suite_name, settings):
 
 
 def send_microsoft_teams_notifications(query, microsoft_teams_webhook):
-    session = requests.Session()
+    session = get_notification_session()
     try:
-        response = session.post(url=microsoft_teams_webhook, json=query)
+        response = session.post(
+            url=microsoft_teams_webhook, json=query, timeout=NOTIFICATION_REQUEST_TIMEOUT
+        )
     except requests.ConnectionError:
-        logger.warning("Failed to connect to Microsoft Teams webhook after 10 retries.")
+        logger.warning(
+            "Failed to connect to Microsoft Teams webhook "
+            f"after {NOTIFICATION_MAX_RETRIES} retries."
+        )
 
     except Exception as e:
         logger.error(str(e))  # noqa: TRY400
@@ -120,11 +190,14 @@ def send_microsoft_teams_notifications(query, microsoft_teams_webhook):
 
 
 def send_webhook_notifications(query, webhook, target_platform):
-    session = requests.Session()
+    session = get_notification_session()
     try:
-        response = session.post(url=webhook, json=query)
+        response = session.post(url=webhook, json=query, timeout=NOTIFICATION_REQUEST_TIMEOUT)
     except requests.ConnectionError:
-        logger.warning(f"Failed to connect to {target_platform} webhook after 10 retries.")
+        logger.warning(
+            f"Failed to connect to {target_platform} webhook "
+            f"after {NOTIFICATION_MAX_RETRIES} retries."
+        )
     except Exception as e:
         logger.error(str(e))  # noqa: TRY400
     else:
@@ -160,14 +233,16 @@ def send_email(  # noqa: C901, PLR0913
             if use_tls:
                 logger.warning("Please choose between SSL or TLS, will default to SSL")
             context = ssl.create_default_context()
-            mailserver = smtplib.SMTP_SSL(smtp_address, smtp_port, context=context)
+            mailserver = smtplib.SMTP_SSL(
+                smtp_address, smtp_port, context=context, timeout=NOTIFICATION_REQUEST_TIMEOUT
+            )
         elif use_tls:
-            mailserver = smtplib.SMTP(smtp_address, smtp_port)
+            mailserver = smtplib.SMTP(smtp_address, smtp_port, timeout=NOTIFICATION_REQUEST_TIMEOUT)
             context = ssl.create_default_context()
             mailserver.starttls(context=context)
         else:
             logger.warning("Not using TLS or SSL to send an email is not secure")
-            mailserver = smtplib.SMTP(smtp_address, smtp_port)
+            mailserver = smtplib.SMTP(smtp_address, smtp_port, timeout=NOTIFICATION_REQUEST_TIMEOUT)
         if sender_login is not None and sender_password is not None:
             mailserver.login(sender_login, sender_password)
         elif not (sender_login is None and sender_password is None):
@@ -411,6 +486,166 @@ def validate_validation_dict(validation_dict: dict, batch_request_required: bool
         raise gx_exceptions.CheckpointError("validation expectation_suite_name must be specified")  # noqa: TRY003
 
 
+@dataclass(frozen=True)
+class ValidationRun(Generic[T]):
+    """Outcome of one validation, run by "run_validations()".
+
+    Attributes:
+        result: value returned by validation (None, if validation raised "exception")
+        duration: wall-clock duration of validation (in seconds)
+        exception: exception raised by validation (None, if validation succeeded)
+    """
+
+    result: Optional[T]
+    duration: float
+    exception: Optional[Exception] = None
+
+
+def run_validations(
+    run_validation_fns: Sequence[Callable[[], T]],
+    max_workers: Optional[int] = None,
+) -> List[ValidationRun[T]]:
+    """Runs validations (each given as function of no arguments), with at most "max_workers" running concurrently.
+
+    Exceptions are isolated: every validation runs to completion, even if others raise, and exception raised by any
+    validation is returned as part of its "ValidationRun" (callers decide how to report it).
+
+    Args:
+        run_validation_fns: functions, each running one validation and returning its result
+        max_workers: maximum number of validations running concurrently (default is None, meaning serial execution)
+
+    Returns:
+        List of "ValidationRun" objects, in order of "run_validation_fns"
+    """  # noqa: E501
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(  # noqa: TRY003
+            f'"max_workers" must be a positive integer or None (got "{max_workers}").'
+        )
+
+    def _run_validation(run_validation_fn: Callable[[], T]) -> ValidationRun[T]:
+        start_time: float = time.perf_counter()
+        try:
+            result: T = run_validation_fn()
+        except Exception as e:
+            logger.exception("Error running validation")
+            return ValidationRun(
+                result=None, duration=time.perf_counter() - start_time, exception=e
+            )
+
+        return ValidationRun(result=result, duration=time.perf_counter() - start_time)
+
+    if max_workers is None or max_workers == 1 or len(run_validation_fns) <= 1:
+        return [_run_validation(run_validation_fn) for run_validation_fn in run_validation_fns]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(run_validation_fns))) as executor:
+        return list(executor.map(_run_validation, run_validation_fns))
+
+
+def get_validation_results(validation_runs: Sequence[ValidationRun[T]]) -> List[T]:
+    """Returns results of validations, which all have run to completion, or raises first exception.
+
+    Both Checkpoint classes follow this policy: failure of one validation does not stop the others
+    (which store their results), but once all have completed, exception of the first failed
+    validation, in order of validations, is raised (so that outcome is independent of completion
+    order).
+
+    Args:
+        validation_runs: "ValidationRun" objects, returned by "run_validations()"
+
+    Returns:
+        List of validation results, in order of "validation_runs"
+    """
+    for validation_run in validation_runs:
+        if validation_run.exception is not None:
+            raise validation_run.exception
+
+    return [cast(T, validation_run.result) for validation_run in validation_runs]
+
+
+def run_actions(
+    run_action_fns: Sequence[Callable[[], T]],
+    dispatch_concurrently: Sequence[bool],
+    timeout: Optional[float] = DEFAULT_ACTION_TIMEOUT,
+) -> Iterator[Optional[T]]:
+    """Runs actions (each given as function of no arguments), yielding their results in order of "run_action_fns".
+
+    Actions, not flagged in "dispatch_concurrently", run one at a time, each after previous results have been consumed
+    (so that actions depending on earlier ones, e.g., on stored Validation Results, observe them).  Every run of
+    consecutive flagged actions (e.g., notifications) is dispatched concurrently; each of them is waited for at most
+    "timeout" seconds, after which it is logged and its result is None.  Exception of first failed action in such run
+    is re-raised after all of its actions have completed.
+
+    Args:
+        run_action_fns: functions, each running one action and returning its result
+        dispatch_concurrently: for every function, whether it may run concurrently with its flagged neighbors
+        timeout: maximum wait (in seconds) for actions dispatched concurrently (None means wait indefinitely)
+
+    Yields:
+        Result of every action, in order of "run_action_fns"
+    """  # noqa: E501
+    if len(run_action_fns) != len(dispatch_concurrently):
+        raise ValueError(  # noqa: TRY003
+            '"run_action_fns" and "dispatch_concurrently" must have the same length.'
+        )
+
+    idx: int = 0
+    end: int
+    while idx < len(run_action_fns):
+        if not dispatch_concurrently[idx]:
+            yield run_action_fns[idx]()
+            idx += 1
+            continue
+
+        end = idx
+        while end < len(run_action_fns) and dispatch_concurrently[end]:
+            end += 1
+
+        yield from _run_actions_concurrently(
+            run_action_fns=run_action_fns[idx:end], timeout=timeout
+        )
+        idx = end
+
+
+def _run_actions_concurrently(
+    run_action_fns: Sequence[Callable[[], T]], timeout: Optional[float]
+) -> List[Optional[T]]:
+    results: List[Optional[T]] = []
+    exceptions: List[Optional[BaseException]] = []
+    # Every run gets its own pool, shut down without waiting: actions that have not started are
+    # cancelled, and action that timed out finishes in its own thread (bounded by its request
+    # timeouts, e.g., "NOTIFICATION_REQUEST_TIMEOUT") without occupying threads of later runs.
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(run_action_fns), MAX_CONCURRENT_ACTIONS),
+        thread_name_prefix="gx-validation-action",
+    )
+    try:
+        futures: List[Future] = [executor.submit(run_action_fn) for run_action_fn in run_action_fns]
+        wait(futures, timeout=timeout)
+        future: Future
+        for future in futures:
+            if not future.done():
+                # Action, which has not started yet, is not run at all.
+                future.cancel()
+                logger.warning(f"Action did not complete within {timeout} seconds; continuing.")
+                results.append(None)
+                exceptions.append(None)
+            elif future.exception() is not None:
+                results.append(None)
+                exceptions.append(future.exception())
+            else:
+                results.append(future.result())
+                exceptions.append(None)
+    finally:
+        executor.shutdown(wait=False)
+
+    exception: Optional[BaseException]
+    for exception in exceptions:
+        if exception is not None:
+            raise exception
+
+    return results
+
+
 def send_sns_notification(
     sns_topic_arn: str, sns_subject: str, validation_results: str, **kwargs
 ) -> str:
@@ -439,7 +674,12 @@ def send_sns_notification(
         "MessageStructure": "json",
     }
     session = aws.boto3.Session(**kwargs)
-    sns = session.client("sns")
+    sns = session.client(
+        "sns",
+        config=aws.Config(
+            connect_timeout=NOTIFICATION_REQUEST_TIMEOUT, read_timeout=NOTIFICATION_REQUEST_TIMEOUT
+        ),
+    )
     try:
         response = sns.publish(**message_dict)
     except sns.exceptions.InvalidParameterException:
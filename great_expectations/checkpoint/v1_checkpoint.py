@@ -1,12 +1,31 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Union, cast
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
 from great_expectations.checkpoint.actions import ValidationAction  # noqa: TCH001
+from great_expectations.checkpoint.util import (
+    ValidationRun,
+    get_validation_results,
+    run_actions,
+    run_validations,
+)
 from great_expectations.compatibility.pydantic import BaseModel, root_validator, validator
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,  # noqa: TCH001
@@ -138,19 +157,35 @@ class Checkpoint(BaseModel):
         self,
         batch_parameters: Dict[str, Any] | None = None,
         expectation_parameters: Dict[str, Any] | None = None,
+        max_workers: int | None = None,
     ) -> CheckpointResult:
+        """Runs validation definitions of this Checkpoint, followed by its actions.
+
+        Args:
+            batch_parameters: Parameters used to retrieve Batches validated by validation definitions.
+            expectation_parameters: Parameters used to evaluate Expectations.
+            max_workers: Maximum number of validation definitions run concurrently (default is None, meaning one at a time).
+
+        Failure of one validation definition does not stop the others, which store their results; once all
+        validation definitions have completed, exception of the first failed one (in order of validation definitions)
+        is raised, and actions of this Checkpoint are not run.
+
+        Returns:
+            CheckpointResult, whose run results are ordered as validation definitions of this Checkpoint.
+        """  # noqa: E501
         run_id = RunIdentifier(run_time=dt.datetime.now(dt.timezone.utc))
-        run_results = self._run_validation_definitions(
+        run_results, validation_durations = self._run_validation_definitions(
             batch_parameters=batch_parameters,
             expectation_parameters=expectation_parameters,
-            result_format=self.result_format,
             run_id=run_id,
+            max_workers=max_workers,
         )
 
         checkpoint_result = CheckpointResult(
             run_id=run_id,
             run_results=run_results,
             checkpoint_config=self,
+            validation_durations=validation_durations,
         )
         self._run_actions(checkpoint_result=checkpoint_result)
 
@@ -160,24 +195,57 @@ class Checkpoint(BaseModel):
         self,
         batch_parameters: Dict[str, Any] | None,
         expectation_parameters: Dict[str, Any] | None,
-        result_format: ResultFormat,
         run_id: RunIdentifier,
-    ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
+        max_workers: int | None = None,
+    ) -> Tuple[
+        Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult],
+        Dict[ValidationResultIdentifier, float],
+    ]:
+        run_kwargs: Dict[str, Any] = {
+            "batch_parameters": batch_parameters,
+            "evaluation_parameters": expectation_parameters,
+            "result_format": self.result_format,
+        }
+        run_validation_fns: List[Callable[[], ExpectationSuiteValidationResult]]
+        if max_workers is None or max_workers == 1:
+            run_validation_fns = [
+                functools.partial(validation_definition.run, **run_kwargs)
+                for validation_definition in self.validation_definitions
+            ]
+        else:
+            # Validation definitions running concurrently share DataContext; its use is serialized.
+            context_lock = threading.Lock()
+            run_validation_fns = [
+                functools.partial(
+                    validation_definition._run, context_lock=context_lock, **run_kwargs
+                )
+                for validation_definition in self.validation_definitions
+            ]
+
+        validation_runs: List[ValidationRun[ExpectationSuiteValidationResult]] = run_validations(
+            run_validation_fns=run_validation_fns, max_workers=max_workers
+        )
+
+        # Every validation definition has completed (and stored its result); first exception, in
+        # order of validation definitions, is raised.
+        validation_results: List[ExpectationSuiteValidationResult] = get_validation_results(
+            validation_runs=validation_runs
+        )
+
         run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
-        for validation_definition in self.validation_definitions:
-            validation_result = validation_definition.run(
-                batch_parameters=batch_parameters,
-                evaluation_parameters=expectation_parameters,
-                result_format=result_format,
-            )
+        validation_durations: Dict[ValidationResultIdentifier, float] = {}
+        for validation_definition, validation_run, validation_result in zip(
+            self.validation_definitions, validation_runs, validation_results
+        ):
             key = self._build_result_key(
                 validation_definition=validation_definition,
                 run_id=run_id,
                 batch_identifier=validation_result.batch_id,
             )
             run_results[key] = validation_result
+            validation_durations[key] = validation_run.duration
 
-        return run_results
+        return run_results, validation_durations
 
     def _build_result_key(
         self,
@@ -197,10 +265,15 @@ class Checkpoint(BaseModel):
         self,
         checkpoint_result: CheckpointResult,
     ) -> None:
-        for action in self.actions:
-            action.v1_run(
-                checkpoint_result=checkpoint_result,
-            )
+        # Notification actions are dispatched concurrently; all others run in order, one at a time.
+        for _ in run_actions(
+            run_action_fns=[
+                functools.partial(action.v1_run, checkpoint_result=checkpoint_result)
+                for action in self.actions
+            ],
+            dispatch_concurrently=[action._dispatch_concurrently for action in self.actions],
+        ):
+            pass
 
     @public_api
     def save(self) -> None:
@@ -217,6 +290,8 @@ class CheckpointResult(BaseModel):
     run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]
     checkpoint_config: Checkpoint
     success: Optional[bool] = None
+    # Run durations (in seconds) of validation definitions, keyed as "run_results".
+    validation_durations: Dict[ValidationResultIdentifier, float] = {}
 
     class Config:
         arbitrary_types_allowed = True
@@ -8,3 +8,18 @@ try:
     import pyarrow
 except ImportError:
     pyarrow = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import parquet
+except ImportError:
+    parquet = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import feather
+except ImportError:
+    feather = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import ipc
+except ImportError:
+    ipc = PYARROW_NOT_IMPORTED
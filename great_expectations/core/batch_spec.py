@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABCMeta
-from typing import TYPE_CHECKING, Any, Callable, List, Literal, Protocol
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Protocol, Sequence
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.id_dict import BatchSpec
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MULTI_PATH_MAX_WORKERS = 4
+
 
 # TODO: <Alex>This module needs to be cleaned up.
 #  We have Batch used for the legacy design, and we also need Batch for the new design.
@@ -160,6 +162,73 @@ class GCSBatchSpec(PathBatchSpec):
     pass
 
 
+class MultiPathBatchSpec(BatchSpec):
+    """Batch of many files (listed in "paths", or all files in local "directory"), read as single DataFrame.
+
+    Files are read concurrently by at most "max_workers" threads and concatenated in order; if "max_rows" is given,
+    reading stops once that many rows have been read.
+    """  # noqa: E501
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *args,
+        paths: Sequence[PathStr] | None = None,
+        directory: PathStr | None = None,
+        reader_options: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+        max_rows: int | None = None,
+        **kwargs,
+    ) -> None:
+        elements: dict[str, Any] = {
+            "paths": None if paths is None else [str(path) for path in paths],
+            "directory": None if directory is None else str(directory),
+            "reader_options": reader_options or None,
+            "max_workers": max_workers,
+            "max_rows": max_rows,
+        }
+        kwargs.update({key: value for key, value in elements.items() if value is not None})
+        super().__init__(*args, **kwargs)
+        self._validate()
+
+    def _validate(self) -> None:
+        if ("paths" in self) == ("directory" in self):
+            raise InvalidBatchSpecError(  # noqa: TRY003
+                "MultiPathBatchSpec requires exactly one of paths or directory elements"
+            )
+        if not isinstance(self.max_workers, int) or self.max_workers < 1:
+            raise InvalidBatchSpecError(  # noqa: TRY003
+                f'MultiPathBatchSpec "max_workers" must be a positive integer (got "{self.max_workers}")'  # noqa: E501
+            )
+        if self.max_rows is not None and (not isinstance(self.max_rows, int) or self.max_rows < 0):
+            raise InvalidBatchSpecError(  # noqa: TRY003
+                f'MultiPathBatchSpec "max_rows" must be a non-negative integer (got "{self.max_rows}")'  # noqa: E501
+            )
+
+    @property
+    def paths(self) -> List[str] | None:
+        return self.get("paths")
+
+    @property
+    def directory(self) -> str | None:
+        return self.get("directory")
+
+    @property
+    def reader_method(self) -> str:
+        return self.get("reader_method")  # type: ignore[return-value]
+
+    @property
+    def reader_options(self) -> dict:
+        return self.get("reader_options") or {}
+
+    @property
+    def max_workers(self) -> int:
+        return self.get("max_workers", DEFAULT_MULTI_PATH_MAX_WORKERS)
+
+    @property
+    def max_rows(self) -> int | None:
+        return self.get("max_rows")
+
+
 class SqlAlchemyDatasourceBatchSpec(BatchSpec, metaclass=ABCMeta):
     """This is an abstract class and should not be instantiated. It's relevant for testing whether
     a subclass is allowed
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Set, TypeVar, Union
+from typing import Any, Optional, Set, TypeVar, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.util import convert_to_json_serializable
@@ -11,13 +11,33 @@ T = TypeVar("T")
 
 
 class IDDict(dict):
+    """Dictionary, identified by its contents (see "to_id()"); used for kwargs of Metrics, Batches, and Domains.
+
+    The default id (i.e., "to_id()" called without arguments, which also backs "__hash__()") is computed once and cached;
+    every mutation of IDDict itself discards the cached id.  Nested values are treated as immutable: mutating them in
+    place does not discard the cached id of the IDDict that contains them.
+    """  # noqa: E501
+
     _id_ignore_keys: Set[str] = set()
+    _cached_id: Optional[Union[str, tuple]] = None
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            if self._cached_id is None:
+                self._cached_id = self._compute_id(
+                    id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys
+                )
+
+            return self._cached_id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys) -> Union[str, tuple]:
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -34,6 +54,46 @@ class IDDict(dict):
         _result_hash: int = hash(self.to_id())
         return _result_hash
 
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._cached_id = None
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._cached_id = None
+        super().__delitem__(key)
+
+    @override
+    def __ior__(self, other):  # type: ignore[override,misc]
+        self._cached_id = None
+        return super().__ior__(other)
+
+    @override
+    def clear(self) -> None:
+        self._cached_id = None
+        super().clear()
+
+    @override
+    def pop(self, *args):
+        self._cached_id = None
+        return super().pop(*args)
+
+    @override
+    def popitem(self):
+        self._cached_id = None
+        return super().popitem()
+
+    @override
+    def setdefault(self, key, default=None):
+        self._cached_id = None
+        return super().setdefault(key, default)
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._cached_id = None
+        super().update(*args, **kwargs)
+
 
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict],
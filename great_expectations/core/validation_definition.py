@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import contextlib
 import datetime
-from typing import TYPE_CHECKING, Any, Optional, Union
+import threading
+from typing import TYPE_CHECKING, Any, ContextManager, Optional, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
@@ -203,23 +205,46 @@ class ValidationDefinition(BaseModel):
         evaluation_parameters: Optional[dict[str, Any]] = None,
         result_format: ResultFormat = ResultFormat.SUMMARY,
     ) -> ExpectationSuiteValidationResult:
+        return self._run(
+            batch_parameters=batch_parameters,
+            evaluation_parameters=evaluation_parameters,
+            result_format=result_format,
+        )
+
+    def _run(
+        self,
+        *,
+        batch_parameters: Optional[BatchRequestOptions] = None,
+        evaluation_parameters: Optional[dict[str, Any]] = None,
+        result_format: ResultFormat = ResultFormat.SUMMARY,
+        context_lock: Optional[threading.Lock] = None,
+    ) -> ExpectationSuiteValidationResult:
+        # Validation definitions, run concurrently by Checkpoint, share DataContext; "context_lock"
+        # serializes Batch retrieval and result storage (Expectations are validated without it).
+        lock: ContextManager = context_lock or contextlib.nullcontext()
+
         validator = Validator(
             batch_definition=self.batch_definition,
             batch_request_options=batch_parameters,
             result_format=result_format,
         )
+        with lock:
+            # Batch is retrieved on first access to Validator.
+            batch_id: Optional[str] = validator.active_batch_id
+
         results = validator.validate_expectation_suite(self.suite, evaluation_parameters)
 
-        (
-            expectation_suite_identifier,
-            validation_result_id,
-        ) = self._get_expectation_suite_and_validation_result_ids(validator)
+        with lock:
+            (
+                expectation_suite_identifier,
+                validation_result_id,
+            ) = self._get_expectation_suite_and_validation_result_ids(batch_id=batch_id)
 
-        ref = self._validation_results_store.store_validation_results(
-            suite_validation_result=results,
-            suite_validation_result_identifier=validation_result_id,
-            expectation_suite_identifier=expectation_suite_identifier,
-        )
+            ref = self._validation_results_store.store_validation_results(
+                suite_validation_result=results,
+                suite_validation_result_identifier=validation_result_id,
+                expectation_suite_identifier=expectation_suite_identifier,
+            )
 
         if isinstance(ref, GXCloudResourceRef):
             results.result_url = self._validation_results_store.parse_result_url_from_gx_cloud_ref(
@@ -230,7 +255,7 @@ class ValidationDefinition(BaseModel):
 
     def _get_expectation_suite_and_validation_result_ids(
         self,
-        validator: Validator,
+        batch_id: Optional[str],
     ) -> (
         tuple[GXCloudIdentifier, GXCloudIdentifier]
         | tuple[ExpectationSuiteIdentifier, ValidationResultIdentifier]
@@ -251,7 +276,7 @@ class ValidationDefinition(BaseModel):
             run_id = RunIdentifier(run_time=run_time)
             expectation_suite_identifier = ExpectationSuiteIdentifier(name=self.suite.name)
             validation_result_id = ValidationResultIdentifier(
-                batch_identifier=validator.active_batch_id,
+                batch_identifier=batch_id,
                 expectation_suite_identifier=expectation_suite_identifier,
                 run_id=run_id,
             )
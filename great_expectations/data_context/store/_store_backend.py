@@ -4,14 +4,21 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Union
 
 import pyparsing as pp
 
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError, StoreError
 
+if TYPE_CHECKING:
+    from great_expectations.data_context.store.store_key_index import StoreKeyIndex
+
 logger = logging.getLogger(__name__)
 
+# Default bound on number of values that "StoreBackend.get_many()" retrieves concurrently.
+DEFAULT_GET_MANY_MAX_WORKERS = 16
+
 
 class StoreBackend(metaclass=ABCMeta):
     """A store backend acts as a key-value store that can accept tuples as keys, to abstract away
@@ -57,6 +64,11 @@ class StoreBackend(metaclass=ABCMeta):
     def store_name(self):
         return self._store_name
 
+    @property
+    def key_index(self) -> Optional[StoreKeyIndex]:
+        """Local index of keys, if this StoreBackend maintains one (see "TupleStoreBackend")."""
+        return None
+
     def _construct_store_backend_id(self, suppress_warning: bool = False) -> Optional[str]:
         """
         Create a store_backend_id if one does not exist, and return it if it exists
@@ -117,6 +129,37 @@ class StoreBackend(metaclass=ABCMeta):
         value = self._get(key, **kwargs)
         return value
 
+    def get_many(
+        self,
+        keys: Iterable[tuple],
+        max_workers: Optional[int] = None,
+        raise_on_missing: bool = True,
+    ) -> List[Any]:
+        """Retrieves values of many keys, using at most "max_workers" concurrent retrievals.
+
+        Args:
+            keys: keys, whose values are to be retrieved
+            max_workers: maximum number of concurrent retrievals (default is DEFAULT_GET_MANY_MAX_WORKERS; 1 is serial)
+            raise_on_missing: if False, then None is returned for keys not found (instead of raising InvalidKeyError)
+
+        Returns:
+            List of values, in order of keys
+        """  # noqa: E501
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(  # noqa: TRY003
+                f'"max_workers" must be a positive integer or None (got "{max_workers}").'
+            )
+
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+
+        return self._get_many(
+            keys=keys,
+            max_workers=max_workers or DEFAULT_GET_MANY_MAX_WORKERS,
+            raise_on_missing=raise_on_missing,
+        )
+
     def get_all(self):
         return self._get_all()
 
@@ -215,6 +258,37 @@ class StoreBackend(metaclass=ABCMeta):
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], max_workers: int, raise_on_missing: bool) -> List[Any]:
+        # Backends with expensive client setup override this to share one client across retrievals.
+        return self._get_concurrently(
+            get_fn=self._get,
+            keys=keys,
+            max_workers=max_workers,
+            raise_on_missing=raise_on_missing,
+        )
+
+    @staticmethod
+    def _get_concurrently(
+        get_fn: Callable[[tuple], Any],
+        keys: List[tuple],
+        max_workers: int,
+        raise_on_missing: bool,
+    ) -> List[Any]:
+        def _get_one(key: tuple) -> Any:
+            try:
+                return get_fn(key)
+            except InvalidKeyError:
+                if raise_on_missing:
+                    raise
+
+                return None
+
+        if max_workers == 1 or len(keys) <= 1:
+            return [_get_one(key) for key in keys]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+            return list(executor.map(_get_one, keys))
+
     @abstractmethod
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
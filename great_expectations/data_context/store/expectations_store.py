@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING, Dict, List, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypeVar, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import pydantic
@@ -26,6 +26,7 @@ from great_expectations.util import (
 )
 
 if TYPE_CHECKING:
+    from great_expectations.core.data_context_key import DataContextKey
     from great_expectations.expectations.expectation import Expectation
 
     _TExpectation = TypeVar("_TExpectation", bound=Expectation)
@@ -214,6 +215,15 @@ class ExpectationsStore(Store):
         suite = ExpectationSuite(**suite_dict)
         return suite_identifier, suite
 
+    @override
+    def _get_key_index_metadata(
+        self, key: DataContextKey, value: Optional[Any] = None
+    ) -> Optional[Dict[str, Any]]:
+        if not isinstance(key, ExpectationSuiteIdentifier):
+            return None
+
+        return {"expectation_suite_name": key.name}
+
     def _add(self, key, value, **kwargs):
         if not self.cloud_mode:
             # this logic should move to the store backend, but is implemented here for now
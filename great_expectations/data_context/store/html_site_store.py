@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
@@ -208,6 +209,29 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        build_manifest_config_defaults = {
+            "module_name": module_name,
+            "filepath_template": "build_manifest.json",
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            build_manifest_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+
+        build_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=build_manifest_config_defaults,
+        )
+        if not build_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         static_assets_config_defaults = {
             "module_name": module_name,
             "filepath_template": None,
@@ -234,6 +258,7 @@ class HtmlSiteStore:
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
+            "build_manifest": build_manifest_obj,
             "static_assets": static_assets_obj,
         }
 
@@ -366,6 +391,23 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def read_build_manifest(self) -> dict | None:
+        """Returns manifest of pages written by incremental site build (None if site has none)."""
+        store_backend = self.store_backends["build_manifest"]
+        if not store_backend.has_key(()):
+            return None
+
+        return json.loads(store_backend.get(()))
+
+    def write_build_manifest(self, manifest: dict):
+        """Like index page, build manifest uses a zero-length tuple as a key."""
+        return self.store_backends["build_manifest"].set(
+            (),
+            json.dumps(manifest),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -8,6 +8,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
 )
@@ -32,6 +33,7 @@ if TYPE_CHECKING:
     from typing_extensions import NotRequired
 
     from great_expectations.core.configuration import AbstractConfig
+    from great_expectations.data_context.store.store_key_index import StoreKeyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +67,8 @@ class Store:
     """
 
     _key_class: ClassVar[Type] = DataContextKey
+    # Whether "_get_key_index_metadata()" needs stored values (not only keys); if so, rebuilding index reads all values.  # noqa: E501
+    _key_index_metadata_requires_value: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -211,6 +215,48 @@ class Store:
 
         return None
 
+    def get_many(
+        self,
+        keys: Sequence[DataContextKey],
+        max_workers: Optional[int] = None,
+        raise_on_missing: bool = True,
+    ) -> List[Optional[Any]]:
+        """Retrieves values of many keys, fetched concurrently from store backend (see "StoreBackend.get_many()").
+
+        Args:
+            keys: keys, whose values are to be retrieved
+            max_workers: maximum number of concurrent retrievals (default is backend-specific)
+            raise_on_missing: if False, then None is returned for keys not found (instead of raising InvalidKeyError)
+
+        Returns:
+            List of deserialized values, in order of keys
+        """  # noqa: E501
+        if self.cloud_mode:
+            values: List[Optional[Any]] = []
+            key: DataContextKey
+            for key in keys:
+                try:
+                    values.append(self.get(key))
+                except gx_exceptions.InvalidKeyError:
+                    if raise_on_missing:
+                        raise
+
+                    values.append(None)
+
+            return values
+
+        for key in keys:
+            self._validate_key(key)
+
+        return [
+            self.deserialize(value) if value else None
+            for value in self._store_backend.get_many(
+                [self.key_to_tuple(key) for key in keys],
+                max_workers=max_workers,
+                raise_on_missing=raise_on_missing,
+            )
+        ]
+
     def get_all(self) -> list[Any]:
         objs = self._store_backend.get_all()
         if self.cloud_mode:
@@ -223,6 +269,7 @@ class Store:
             return self._store_backend.set(key, value, **kwargs)
 
         self._validate_key(key)
+        self._add_key_index_metadata(key=key, value=value, kwargs=kwargs)
         return self._store_backend.set(self.key_to_tuple(key), self.serialize(value), **kwargs)
 
     def add(self, key: DataContextKey, value: Any, **kwargs) -> None:
@@ -233,6 +280,7 @@ class Store:
 
     def _add(self, key: DataContextKey, value: Any, **kwargs) -> None:
         self._validate_key(key)
+        self._add_key_index_metadata(key=key, value=value, kwargs=kwargs)
         return self._store_backend.add(self.key_to_tuple(key), self.serialize(value), **kwargs)
 
     def update(self, key: DataContextKey, value: Any, **kwargs) -> None:
@@ -243,6 +291,7 @@ class Store:
 
     def _update(self, key: DataContextKey, value: Any, **kwargs) -> None:
         self._validate_key(key)
+        self._add_key_index_metadata(key=key, value=value, kwargs=kwargs)
         return self._store_backend.update(self.key_to_tuple(key), self.serialize(value), **kwargs)
 
     def add_or_update(self, key: DataContextKey, value: Any, **kwargs) -> None | GXCloudIdentifier:
@@ -253,6 +302,7 @@ class Store:
 
     def _add_or_update(self, key: DataContextKey, value: Any, **kwargs) -> None | GXCloudIdentifier:
         self._validate_key(key)
+        self._add_key_index_metadata(key=key, value=value, kwargs=kwargs)
         return self._store_backend.add_or_update(
             self.key_to_tuple(key), self.serialize(value), **kwargs
         )
@@ -276,6 +326,124 @@ class Store:
     def remove_key(self, key):
         return self.store_backend.remove_key(key)
 
+    def filter_keys(
+        self,
+        expectation_suite_name: Optional[str] = None,
+        success: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[DataContextKey]:
+        """Returns keys matching all given criteria, most recent run time (then most recently stored) first.
+
+        Queries are answered by key index of store backend (see "StoreKeyIndex"), if one is configured and built;
+        otherwise, all keys are listed (and, to filter on "success", all values are retrieved) from store backend.
+
+        Args:
+            expectation_suite_name: name of Expectation Suite
+            success: success of Validation Result
+            limit: maximum number of keys returned (e.g., latest-N Validation Results)
+
+        Returns:
+            List of keys
+        """  # noqa: E501
+        if limit is not None and limit < 1:
+            raise ValueError(f'"limit" must be a positive integer or None (got "{limit}").')  # noqa: TRY003
+
+        key_index: Optional[StoreKeyIndex] = self._store_backend.key_index
+        tuples: List[Tuple[str, ...]]
+        if key_index is not None and key_index.is_built:
+            tuples = key_index.filter_keys(
+                expectation_suite_name=expectation_suite_name,
+                success=success,
+                # Extra key leaves room for STORE_BACKEND_ID_KEY, which is dropped below.
+                limit=None if limit is None else limit + 1,
+            )
+            tuples = [tuple_ for tuple_ in tuples if tuple_ != StoreBackend.STORE_BACKEND_ID_KEY][
+                :limit
+            ]
+            return [self.tuple_to_key(tuple_) for tuple_ in tuples]
+
+        tuples = [
+            tuple_
+            for tuple_ in self._store_backend.list_keys()
+            if tuple_ != StoreBackend.STORE_BACKEND_ID_KEY
+        ]
+        metadata: List[Dict[str, Any]] = [
+            metadata or {}
+            for metadata in self._get_key_index_metadata_for_tuples(
+                tuples=tuples, include_values=success is not None
+            )
+        ]
+        matches: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = [
+            (tuple_, metadata_)
+            for tuple_, metadata_ in zip(tuples, metadata)
+            if (
+                expectation_suite_name is None
+                or metadata_.get("expectation_suite_name") == expectation_suite_name
+            )
+            and (success is None or metadata_.get("success") == success)
+        ]
+        matches.sort(key=lambda match: match[1].get("run_time") or "", reverse=True)
+        return [self.tuple_to_key(tuple_) for tuple_, _ in matches[:limit]]
+
+    def rebuild_key_index(self) -> int:
+        """Reconstructs key index of store backend (see "StoreKeyIndex") from listing of its keys.
+
+        Returns:
+            Number of keys in rebuilt index
+        """
+        if self._store_backend.key_index is None:
+            raise gx_exceptions.StoreConfigurationError(  # noqa: TRY003
+                f'Store "{self._store_name}" has no key index; configure "key_index_filepath" of its store backend.'  # noqa: E501
+            )
+
+        return self._store_backend.rebuild_key_index(  # type: ignore[attr-defined]
+            get_metadata_fn=self._get_key_index_metadata_for_tuples
+        )
+
+    def _get_key_index_metadata(
+        self, key: DataContextKey, value: Optional[Any] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Returns metadata of key (and, if available, of its value) to be recorded in key index of store backend."""  # noqa: E501
+        return None
+
+    def _add_key_index_metadata(self, key: DataContextKey, value: Any, kwargs: dict) -> None:
+        if self._store_backend.key_index is None:
+            return
+
+        key_index_metadata = self._get_key_index_metadata(key=key, value=value)
+        if key_index_metadata is not None:
+            kwargs["key_index_metadata"] = key_index_metadata
+
+    def _get_key_index_metadata_for_tuples(
+        self, tuples: List[Tuple[str, ...]], include_values: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        values: List[Optional[Any]] = [None] * len(tuples)
+        if include_values and self._key_index_metadata_requires_value:
+            positions: List[int] = [
+                idx
+                for idx, tuple_ in enumerate(tuples)
+                if tuple_ != StoreBackend.STORE_BACKEND_ID_KEY
+            ]
+            idx: int
+            value: Optional[Any]
+            for idx, value in zip(
+                positions,
+                self._store_backend.get_many(
+                    [tuples[idx] for idx in positions], raise_on_missing=False
+                ),
+            ):
+                values[idx] = value
+
+        return [
+            None
+            if tuple_ == StoreBackend.STORE_BACKEND_ID_KEY
+            else self._get_key_index_metadata(
+                key=self.tuple_to_key(tuple_),
+                value=self.deserialize(value) if value else None,
+            )
+            for tuple_, value in zip(tuples, values)
+        ]
+
     def _build_key_from_config(self, config: AbstractConfig) -> DataContextKey:
         id: Optional[str] = None
         # Chetan - 20220831 - Explicit fork in logic to cover legacy behavior (particularly around Checkpoints).  # noqa: E501
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Metadata, which is recorded alongside keys (when provided by Store) to answer filtered queries.
+KEY_INDEX_METADATA_FIELDS: Tuple[str, ...] = ("expectation_suite_name", "run_time", "success")
+
+# Separates (and terminates) key elements in "key_path" column, so that prefix queries are exact.
+_KEY_PATH_SEPARATOR = "\x1f"
+
+_CREATE_STATEMENTS: Tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS store_keys (
+        key TEXT PRIMARY KEY,
+        key_path TEXT NOT NULL,
+        expectation_suite_name TEXT,
+        run_time TEXT,
+        success INTEGER,
+        updated_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_store_keys_key_path ON store_keys (key_path)",
+    """
+    CREATE INDEX IF NOT EXISTS ix_store_keys_expectation_suite_name_run_time
+    ON store_keys (expectation_suite_name, run_time)
+    """,
+    "CREATE TABLE IF NOT EXISTS store_key_index_info (name TEXT PRIMARY KEY, value TEXT)",
+)
+
+
+class StoreKeyIndex:
+    """Local SQLite index of keys (and optional metadata) held by a StoreBackend.
+
+    The index is updated by the StoreBackend on every "set()", "move()", and "remove_key()", so that listing, existence,
+    filter-by-suite, and latest-N queries are answered without listing the filesystem or cloud bucket.  An index starts
+    out "unbuilt" (queries must then go to the StoreBackend) until "rebuild()" has populated it from a full listing; this
+    keeps an index, created for an already populated store, from silently under-reporting keys.
+
+    Args:
+        filepath: path of SQLite database file (created, together with its parent directories, if it does not exist).
+    """  # noqa: E501
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath = filepath
+        self._lock = threading.RLock()
+        # Once built, index stays built (until cleared), so that this need not be queried again.
+        self._is_built: bool = False
+
+        directory: str = os.path.dirname(filepath)  # noqa: PTH120
+        if directory:
+            os.makedirs(directory, exist_ok=True)  # noqa: PTH103
+
+        with self._connect() as connection:
+            statement: str
+            for statement in _CREATE_STATEMENTS:
+                connection.execute(statement)
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def is_built(self) -> bool:
+        """Whether index has been populated from StoreBackend (so that it reflects all keys)."""
+        if self._is_built:
+            return True
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM store_key_index_info WHERE name = 'built'"
+            ).fetchone()
+
+        self._is_built = row is not None and row[0] == "1"
+        return self._is_built
+
+    def add(self, key: Tuple[str, ...], metadata: Optional[Dict[str, Any]] = None) -> None:
+        with self._connect() as connection:
+            self._insert(connection=connection, key=key, metadata=metadata)
+
+    def move(self, source_key: Tuple[str, ...], dest_key: Tuple[str, ...]) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM store_keys WHERE key = ?", (self._encode(dest_key),))
+            connection.execute(
+                "UPDATE store_keys SET key = ?, key_path = ?, updated_at = ? WHERE key = ?",
+                (
+                    self._encode(dest_key),
+                    self._to_key_path(dest_key),
+                    time.time(),
+                    self._encode(source_key),
+                ),
+            )
+
+    def remove(self, key: Tuple[str, ...]) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM store_keys WHERE key = ?", (self._encode(key),))
+
+    def has_key(self, key: Tuple[str, ...]) -> bool:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM store_keys WHERE key = ?", (self._encode(key),)
+            ).fetchone()
+
+        return row is not None
+
+    def list_keys(self, prefix: Tuple[str, ...] = ()) -> List[Tuple[str, ...]]:
+        return self.filter_keys(prefix=prefix)
+
+    def filter_keys(
+        self,
+        prefix: Tuple[str, ...] = (),
+        expectation_suite_name: Optional[str] = None,
+        success: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, ...]]:
+        """Returns keys matching all given criteria, most recent "run_time" (then most recently updated) first.
+
+        Args:
+            prefix: leading key elements
+            expectation_suite_name: name of Expectation Suite recorded in metadata
+            success: recorded success of Validation Result
+            limit: maximum number of keys returned (e.g., latest-N runs)
+
+        Returns:
+            List of keys
+        """  # noqa: E501
+        if limit is not None and limit < 1:
+            raise ValueError(f'"limit" must be a positive integer or None (got "{limit}").')  # noqa: TRY003
+
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if prefix:
+            # Range over "key_path" (rather than expression of it) is answered by its index.
+            key_path_prefix: str = self._to_key_path(prefix)
+            conditions.append("key_path >= ? AND key_path < ?")
+            parameters.extend([key_path_prefix, self._to_key_path_upper_bound(key_path_prefix)])
+
+        if expectation_suite_name is not None:
+            conditions.append("expectation_suite_name = ?")
+            parameters.append(expectation_suite_name)
+
+        if success is not None:
+            conditions.append("success = ?")
+            parameters.append(int(success))
+
+        query: str = "SELECT key FROM store_keys"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+
+        query += " ORDER BY run_time IS NULL, run_time DESC, updated_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+
+        with self._connect() as connection:
+            rows = connection.execute(query, parameters).fetchall()
+
+        return [self._decode(row[0]) for row in rows]
+
+    def rebuild(
+        self, keys_and_metadata: Iterable[Tuple[Tuple[str, ...], Optional[Dict[str, Any]]]]
+    ) -> int:
+        """Replaces contents of index with given keys (and their metadata), and marks index as built.
+
+        Returns:
+            Number of keys in rebuilt index
+        """  # noqa: E501
+        count: int = 0
+        with self._connect() as connection:
+            connection.execute("DELETE FROM store_keys")
+            key: Tuple[str, ...]
+            metadata: Optional[Dict[str, Any]]
+            for key, metadata in keys_and_metadata:
+                self._insert(connection=connection, key=key, metadata=metadata)
+                count += 1
+
+            connection.execute(
+                "INSERT OR REPLACE INTO store_key_index_info (name, value) VALUES ('built', '1')"
+            )
+
+        self._is_built = True
+
+        logger.info(f"Rebuilt store key index {self._filepath} with {count} keys.")
+        return count
+
+    def clear(self) -> None:
+        """Removes all keys and marks index as not built."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM store_keys")
+            connection.execute("DELETE FROM store_key_index_info WHERE name = 'built'")
+
+        self._is_built = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections keep index usable from several threads and processes (SQLite serializes writers).  # noqa: E501
+        with self._lock:
+            connection = sqlite3.connect(self._filepath, timeout=30.0)
+            try:
+                with connection:
+                    yield connection
+            finally:
+                connection.close()
+
+    def _insert(
+        self,
+        connection: sqlite3.Connection,
+        key: Tuple[str, ...],
+        metadata: Optional[Dict[str, Any]],
+    ) -> None:
+        metadata = metadata or {}
+        success: Optional[bool] = metadata.get("success")
+        connection.execute(
+            """
+            INSERT OR REPLACE INTO store_keys
+            (key, key_path, expectation_suite_name, run_time, success, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                self._encode(key),
+                self._to_key_path(key),
+                metadata.get("expectation_suite_name"),
+                metadata.get("run_time"),
+                None if success is None else int(success),
+                time.time(),
+            ),
+        )
+
+    @staticmethod
+    def _encode(key: Tuple[str, ...]) -> str:
+        return json.dumps(list(key))
+
+    @staticmethod
+    def _decode(value: str) -> Tuple[str, ...]:
+        return tuple(json.loads(value))
+
+    @staticmethod
+    def _to_key_path(key: Tuple[str, ...]) -> str:
+        return "".join(f"{key_element}{_KEY_PATH_SEPARATOR}" for key_element in key)
+
+    @staticmethod
+    def _to_key_path_upper_bound(key_path_prefix: str) -> str:
+        # Every "key_path" starting with prefix (which ends with separator) sorts below this bound.
+        return f"{key_path_prefix[:-1]}{chr(ord(_KEY_PATH_SEPARATOR) + 1)}"
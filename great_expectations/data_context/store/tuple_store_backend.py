@@ -9,11 +9,12 @@ import random
 import re
 import shutil
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.store.store_key_index import StoreKeyIndex
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
 
@@ -27,6 +28,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
     For example, in the following template path: expectations/{0}/{1}/{2}/prefix-{2}.json, keys must have
     three components.
+
+    If "key_index_filepath" is provided, keys written through this StoreBackend are also recorded in a local SQLite
+    index (see "StoreKeyIndex"), which answers "list_keys()" and "has_key()" once built with "rebuild_key_index()".
+    The index file must be located outside of directories, which hold stored objects.
     """  # noqa: E501
 
     def __init__(  # noqa: PLR0913
@@ -41,6 +46,7 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        key_index_filepath=None,
     ) -> None:
         super().__init__(
             fixed_length_key=fixed_length_key,
@@ -48,6 +54,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
         )
+        # Optional local index of keys (maintained on "set()", "move()", and "remove_key()"); see "StoreKeyIndex".  # noqa: E501
+        self._key_index: Optional[StoreKeyIndex] = (
+            StoreKeyIndex(filepath=key_index_filepath) if key_index_filepath else None
+        )
         if forbidden_substrings is None:
             forbidden_substrings = ["/", "\\"]
         self.forbidden_substrings = forbidden_substrings
@@ -76,6 +86,74 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             self.verify_that_key_to_filepath_operation_is_reversible()
             self._fixed_length_key = True
 
+    @property
+    @override
+    def key_index(self) -> Optional[StoreKeyIndex]:
+        return self._key_index
+
+    @override
+    def set(self, key, value, **kwargs):
+        # Store passes metadata of key (e.g., Expectation Suite name, run time, success) to be recorded in key index.  # noqa: E501
+        key_index_metadata: Optional[Dict[str, Any]] = kwargs.pop("key_index_metadata", None)
+        result = super().set(key, value, **kwargs)
+        if self._key_index is not None:
+            self._key_index.add(key=key, metadata=key_index_metadata)
+
+        return result
+
+    @override
+    def move(self, source_key, dest_key, **kwargs):
+        result = super().move(source_key, dest_key, **kwargs)
+        if self._key_index is not None and result:
+            self._key_index.move(source_key=source_key, dest_key=dest_key)
+
+        return result
+
+    @override
+    def has_key(self, key) -> bool:
+        if self._key_index is not None and self._key_index.is_built:
+            self._validate_key(key)
+            return self._key_index.has_key(key)
+
+        return super().has_key(key)
+
+    def rebuild_key_index(
+        self,
+        get_metadata_fn: Optional[Callable[[List[Tuple]], List[Optional[Dict[str, Any]]]]] = None,
+    ) -> int:
+        """Reconstructs key index from full listing of this StoreBackend.
+
+        Args:
+            get_metadata_fn: optional function, returning metadata (to be recorded in index) for given list of keys
+
+        Returns:
+            Number of keys in rebuilt index
+        """  # noqa: E501
+        if self._key_index is None:
+            raise StoreBackendError(  # noqa: TRY003
+                f'{self.__class__.__name__} has no key index (configure "key_index_filepath" to maintain one).'  # noqa: E501
+            )
+
+        # Unbuilt index makes "list_keys()" list this StoreBackend, rather than index itself.
+        self._key_index.clear()
+        keys: List[Tuple] = self.list_keys()
+        metadata: List[Optional[Dict[str, Any]]] = (
+            get_metadata_fn(keys) if get_metadata_fn else [None] * len(keys)
+        )
+        return self._key_index.rebuild(keys_and_metadata=zip(keys, metadata))
+
+    def _list_keys_from_key_index(self, prefix: Tuple = ()) -> Optional[List[Tuple]]:
+        """Returns keys from key index, if built (otherwise None, so that keys must be listed)."""
+        if self._key_index is not None and self._key_index.is_built:
+            return self._key_index.list_keys(prefix=tuple(prefix))
+
+        return None
+
+    def _remove_key_from_key_index(self, key) -> None:
+        # Called before removing key, so that key index never lists keys, which may already be gone.
+        if self._key_index is not None:
+            self._key_index.remove(key=key if isinstance(key, tuple) else key.to_tuple())
+
     @override
     def _validate_key(self, key) -> None:
         super()._validate_key(key)
@@ -198,6 +276,43 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             new_key = pathlib.Path(filepath).parts
         return new_key
 
+    def _convert_key_prefix_to_filepath_prefix(self, prefix: Tuple) -> str:
+        """Returns longest filepath prefix (using "/" separator) shared by filepaths of all keys that start with "prefix".
+
+        Only the leading part of "filepath_template" (up to its first element not covered by "prefix") is determined by
+        "prefix"; therefore, listed filepaths must still be converted to keys and compared with "prefix".
+        """  # noqa: E501
+        filepath_prefix: str
+        if not prefix:
+            filepath_prefix = ""
+        elif tuple(prefix) == self.STORE_BACKEND_ID_KEY:
+            filepath_prefix = prefix[0]
+        elif self.filepath_template:
+            filepath_prefix = ""
+            position = 0
+            match: re.Match
+            for match in re.finditer(r"{(\d+)}", self.filepath_template):
+                filepath_prefix += self.filepath_template[position : match.start()]
+                index = int(match.group(1))
+                if index >= len(prefix):
+                    break
+
+                filepath_prefix += prefix[index]
+                position = match.end()
+            else:
+                filepath_prefix += self.filepath_template[position:]
+        else:
+            filepath_prefix = "/".join(prefix)
+
+        if self.filepath_prefix:
+            filepath_prefix = f"{self.filepath_prefix}/{filepath_prefix}"
+
+        return filepath_prefix
+
+    @staticmethod
+    def _key_has_prefix(key: Tuple, prefix: Tuple) -> bool:
+        return tuple(key[: len(prefix)]) == tuple(prefix)
+
     def verify_that_key_to_filepath_operation_is_reversible(self):
         def get_random_hex(size=4):
             return "".join([random.choice(list("ABCDEF0123456789")) for _ in range(size)])
@@ -243,7 +358,13 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        key_index_filepath=None,
     ) -> None:
+        full_key_index_filepath = key_index_filepath
+        if key_index_filepath and root_directory and not os.path.isabs(key_index_filepath):  # noqa: PTH117
+            # Same as "base_directory", relative path of key index is interpreted with respect to "root_directory".  # noqa: E501
+            full_key_index_filepath = os.path.join(root_directory, key_index_filepath)  # noqa: PTH118
+
         super().__init__(
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
@@ -255,6 +376,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            key_index_filepath=full_key_index_filepath,
         )
         if os.path.isabs(base_directory):  # noqa: PTH117
             self.full_base_directory = base_directory
@@ -295,6 +417,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "key_index_filepath": key_index_filepath,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -354,33 +477,62 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        indexed_keys: Optional[List[Tuple]] = self._list_keys_from_key_index(prefix=prefix)
+        if indexed_keys is not None:
+            return indexed_keys
+
+        # Only directories that can contain filepaths of keys starting with "prefix" are walked.
+        filepath_prefix: str = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if filepath_prefix:
+            filepath_prefix = os.path.normpath(filepath_prefix)
+
         key_list = []
         for root, dirs, files in os.walk(
-            os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118
+            os.path.join(  # noqa: PTH118
+                self.full_base_directory,
+                os.path.dirname(filepath_prefix),  # noqa: PTH120
+            )
         ):
+            relative_root = os.path.relpath(root, self.full_base_directory)
+            if filepath_prefix:
+                dirs[:] = [
+                    dir_
+                    for dir_ in dirs
+                    if _filepath_may_start_with(
+                        path=os.path.normpath(os.path.join(relative_root, dir_)),  # noqa: PTH118
+                        filepath_prefix=filepath_prefix,
+                    )
+                ]
+
             for file_ in files:
-                full_path, file_name = os.path.split(
-                    os.path.join(root, file_)  # noqa: PTH118
-                )
-                relative_path = os.path.relpath(
-                    full_path,
-                    self.full_base_directory,
-                )
-                if relative_path == ".":
-                    filepath = file_name
+                if relative_root == ".":
+                    filepath = file_
                 else:
-                    filepath = os.path.join(relative_path, file_name)  # noqa: PTH118
-
-                if self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
-                    continue
-                elif self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
+                    filepath = os.path.join(relative_root, file_)  # noqa: PTH118
+
+                key = self._convert_listed_filepath_to_key(
+                    filepath=filepath, filepath_prefix=filepath_prefix, prefix=prefix
+                )
+                if key:
                     key_list.append(key)
 
         return key_list
 
+    def _convert_listed_filepath_to_key(
+        self, filepath: str, filepath_prefix: str, prefix: Tuple
+    ) -> Optional[Tuple]:
+        if filepath_prefix and not filepath.startswith(filepath_prefix):
+            return None
+        elif self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
+            return None
+        elif self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
+            return None
+        key = self._convert_filepath_to_key(filepath)
+        if key and not self.is_ignored_key(key) and self._key_has_prefix(key, prefix):
+            return key
+
+        return None
+
     def rrmdir(self, mroot, curpath) -> None:
         """
         recursively removes empty dirs between curpath and mroot inclusive
@@ -398,6 +550,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             pass
 
     def remove_key(self, key):
+        self._remove_key_from_key_index(key)
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
@@ -472,6 +625,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        key_index_filepath=None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -484,6 +638,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            key_index_filepath=key_index_filepath,
         )
         self.bucket = bucket
         if prefix:
@@ -523,6 +678,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "key_index_filepath": key_index_filepath,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -551,15 +707,24 @@ class TupleS3StoreBackend(TupleStoreBackend):
     @override
     def _get_all(self) -> list[Any]:
         """Get all objects from the store.
-        NOTE: This is non-performant because we download each object separately.
+        NOTE: S3 has no bulk download; objects are downloaded separately (but concurrently, see "get_many()").
         See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/bucket/objects.html#objects
         for the docs.
-        """
-        client = self._create_client()
+        """  # noqa: E501
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
-        s3_object_keys = [self._build_s3_object_key(key) for key in keys]
-        return [self._get_by_s3_object_key(client, key) for key in s3_object_keys]
+        return self.get_many(keys)
+
+    @override
+    def _get_many(self, keys: List[tuple], max_workers: int, raise_on_missing: bool) -> List[Any]:
+        # boto3 clients are thread-safe; one client is shared by all concurrent downloads.
+        client = self._create_client()
+        return self._get_concurrently(
+            get_fn=lambda key: self._get_by_s3_object_key(client, self._build_s3_object_key(key)),
+            keys=keys,
+            max_workers=max_workers,
+            raise_on_missing=raise_on_missing,
+        )
 
     def _get_by_s3_object_key(self, s3_client, s3_object_key):
         try:
@@ -620,13 +785,22 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3.Object(self.bucket, source_filepath).delete()
 
     @override
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:  # noqa: C901 - too complex
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
+    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:  # noqa: C901, PLR0912 - too complex
+        indexed_keys: Optional[List[Tuple]] = self._list_keys_from_key_index(prefix=prefix)
+        if indexed_keys is not None:
+            return indexed_keys
+
         s3r = self._create_resource()
         bucket = s3r.Bucket(self.bucket)
         key_list = []
+        # Listing is paginated by S3 and scoped to objects, whose keys could start with "prefix".
+        s3_object_key_prefix: str = self._convert_key_prefix_to_filepath_prefix(prefix)
         if self.prefix:
-            objects_list = bucket.objects.filter(Prefix=self.prefix)
+            s3_object_key_prefix = (
+                f"{self.prefix}/{s3_object_key_prefix}" if s3_object_key_prefix else self.prefix
+            )
+        if s3_object_key_prefix:
+            objects_list = bucket.objects.filter(Prefix=s3_object_key_prefix)
         else:
             objects_list = bucket.objects.all()
         for s3_object_info in objects_list:
@@ -645,7 +819,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             elif self.filepath_suffix and not s3_object_key.endswith(self.filepath_suffix):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
-            if key:
+            if key and self._key_has_prefix(key, prefix):
                 key_list.append(key)
         return key_list
 
@@ -687,6 +861,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return public_url
 
     def remove_key(self, key):
+        self._remove_key_from_key_index(key)
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
@@ -702,8 +877,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.list_keys(prefix=key)
 
     def _assume_role_and_get_secret_credentials(self):
         role_session_name = "GXAssumeRoleSession"
@@ -769,6 +943,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        key_index_filepath=None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -781,6 +956,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             base_public_path=base_public_path,
             store_name=store_name,
+            key_index_filepath=key_index_filepath,
         )
         self.bucket = bucket
         self.prefix = prefix
@@ -807,6 +983,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "key_index_filepath": key_index_filepath,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -846,6 +1023,30 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
 
+    @override
+    def _get_many(self, keys: List[tuple], max_workers: int, raise_on_missing: bool) -> List[Any]:
+        from great_expectations.compatibility import google
+
+        # Storage clients are thread-safe; one client is shared by all concurrent downloads.
+        gcs = google.storage.Client(project=self.project)
+        bucket = gcs.bucket(self.bucket)
+
+        def _get_one(key: tuple) -> str:
+            gcs_response_object = bucket.get_blob(self._build_gcs_object_key(key))
+            if not gcs_response_object:
+                raise InvalidKeyError(  # noqa: TRY003
+                    f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {key!s}"  # noqa: E501
+                )
+
+            return gcs_response_object.download_as_bytes().decode("utf-8")
+
+        return self._get_concurrently(
+            get_fn=_get_one,
+            keys=keys,
+            max_workers=max_workers,
+            raise_on_missing=raise_on_missing,
+        )
+
     def _set(
         self,
         key,
@@ -888,14 +1089,24 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
+        indexed_keys: Optional[List[Tuple]] = self._list_keys_from_key_index(prefix=prefix)
+        if indexed_keys is not None:
+            return indexed_keys
+
         key_list = []
 
         from great_expectations.compatibility import google
 
         gcs = google.storage.Client(self.project)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        # Listing is paginated by GCS and scoped to blobs, whose keys could start with "prefix".
+        gcs_object_name_prefix: str = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if self.prefix:
+            gcs_object_name_prefix = (
+                f"{self.prefix}/{gcs_object_name_prefix}" if gcs_object_name_prefix else self.prefix
+            )
+
+        for blob in gcs.list_blobs(self.bucket, prefix=gcs_object_name_prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
@@ -906,7 +1117,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             elif self.filepath_suffix and not gcs_object_key.endswith(self.filepath_suffix):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
+            if key and self._key_has_prefix(key, prefix):
                 key_list.append(key)
         return key_list
 
@@ -948,6 +1159,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return path_url
 
     def remove_key(self, key):
+        self._remove_key_from_key_index(key)
         from great_expectations.compatibility import google
 
         gcs = google.storage.Client(project=self.project)
@@ -959,8 +1171,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.list_keys(prefix=key)
 
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
@@ -992,6 +1203,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        key_index_filepath=None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -1003,6 +1215,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             suppress_store_backend_id=suppress_store_backend_id,
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
+            key_index_filepath=key_index_filepath,
         )
         self.connection_string = connection_string or os.environ.get(  # noqa: TID251
             "AZURE_STORAGE_CONNECTION_STRING"
@@ -1093,10 +1306,22 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature  # noqa: E501
+        indexed_keys: Optional[List[Tuple]] = self._list_keys_from_key_index(prefix=prefix)
+        if indexed_keys is not None:
+            return indexed_keys
+
         key_list = []
 
-        for obj in self._container_client.list_blobs(name_starts_with=self.prefix):
+        # Listing is paginated by Azure and scoped to blobs, whose keys could start with "prefix".
+        az_blob_name_prefix: str = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if self.prefix:
+            az_blob_name_prefix = (
+                os.path.join(self.prefix, az_blob_name_prefix)  # noqa: PTH118
+                if az_blob_name_prefix
+                else self.prefix
+            )
+
+        for obj in self._container_client.list_blobs(name_starts_with=az_blob_name_prefix):
             az_blob_key = os.path.relpath(obj.name)
             if az_blob_key.startswith(f"{self.prefix}{os.path.sep}"):
                 az_blob_key = az_blob_key[len(self.prefix) + 1 :]
@@ -1105,6 +1330,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             elif self.filepath_suffix and not az_blob_key.endswith(self.filepath_suffix):
                 continue
             key = self._convert_filepath_to_key(az_blob_key)
+            if key is None or not self._key_has_prefix(key, prefix):
+                continue
 
             key_list.append(key)
         return key_list
@@ -1118,8 +1345,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         return f"https://{self._container_client.account_name}.blob.core.windows.net/{az_blob_path}"
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.list_keys(prefix=key)
 
     @override
     def _move(self, source_key, dest_key, **kwargs) -> None:
@@ -1147,6 +1373,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         source_blob.delete_blob()
 
     def remove_key(self, key):
+        self._remove_key_from_key_index(key)
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
@@ -1162,3 +1389,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
     @override
     def config(self) -> dict:
         return self._config  # type: ignore[attr-defined]
+
+
+def _filepath_may_start_with(path: str, filepath_prefix: str) -> bool:
+    """Returns True if filepaths under directory "path" may start with "filepath_prefix"."""
+    return path.startswith(filepath_prefix) or filepath_prefix.startswith(f"{path}{os.sep}")
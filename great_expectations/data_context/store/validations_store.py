@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Dict, Optional, Type
+import json
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Sequence, Type
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
 )
+from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -17,15 +20,18 @@ from great_expectations.data_context.types.resource_identifiers import (
     GXCloudIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import instantiate_class_from_config, load_class
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
 )
 
 if TYPE_CHECKING:
+    from great_expectations.core.data_context_key import DataContextKey
     from great_expectations.data_context.types.refs import GXCloudResourceRef
 
+logger = logging.getLogger(__name__)
+
 
 class ValidationsStore(Store):
     """
@@ -94,11 +100,25 @@ class ValidationsStore(Store):
             bug_risk: Moderate
 
     --ge-feature-maturity-info--
+
+    With "store_summaries" enabled (supported for tuple store backends with a filepath suffix),
+    a small summary record (see "get_summaries()") is kept next to every Validation Result written
+    to or removed from this store, so that consumers such as the Data Docs index need not retrieve
+    full Validation Results.
     """  # noqa: E501
 
     _key_class: ClassVar[Type] = ValidationResultIdentifier
+    # Appended to filepath suffix of Validation Results (e.g., ".json") to form that of summaries.
+    SUMMARY_FILEPATH_SUFFIX: ClassVar[str] = ".summary"
+    _key_index_metadata_requires_value: ClassVar[bool] = True
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None) -> None:
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        store_summaries: bool = False,
+    ) -> None:
         self._expectationSuiteValidationResultSchema = ExpectationSuiteValidationResultSchema()
 
         if store_backend is not None:
@@ -133,17 +153,90 @@ class ValidationsStore(Store):
             store_name=store_name,
         )
 
+        self._summary_store_backend: Optional[TupleStoreBackend] = None
+        if store_summaries:
+            self._summary_store_backend = self._build_summary_store_backend(
+                store_backend=store_backend, runtime_environment=runtime_environment
+            )
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.  # noqa: E501
         self._config = {
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "store_summaries": store_summaries,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    def _build_summary_store_backend(
+        self, store_backend: Optional[dict], runtime_environment: Optional[dict]
+    ) -> Optional[TupleStoreBackend]:
+        """Summaries are stored by store backend configured as that of Validation Results, but with distinct suffix."""  # noqa: E501
+        if (
+            self.cloud_mode
+            or store_backend is None
+            or not isinstance(self._store_backend, TupleStoreBackend)
+            or not self._store_backend.filepath_suffix
+        ):
+            logger.warning(
+                "Validation Result summaries require a tuple store backend with a filepath suffix; "
+                "summaries will not be stored."
+            )
+            return None
+
+        summary_store_backend_config: dict = {
+            key: value for key, value in store_backend.items() if key != "key_index_filepath"
+        }
+        summary_store_backend_config["filepath_suffix"] = (
+            f"{self._store_backend.filepath_suffix}{self.SUMMARY_FILEPATH_SUFFIX}"
+        )
+        summary_store_backend_config["suppress_store_backend_id"] = True
+        return instantiate_class_from_config(
+            config=summary_store_backend_config,
+            runtime_environment=runtime_environment or {},
+            config_defaults={"module_name": "great_expectations.data_context.store"},
+        )
+
+    @property
+    def stores_summaries(self) -> bool:
+        return self._summary_store_backend is not None
+
+    def get_summaries(self, keys: Sequence[ValidationResultIdentifier]) -> List[Optional[dict]]:
+        """Retrieves summaries of Validation Results stored in this store, fetched concurrently.
+
+        Summary holds "success", "statistics", "asset_name", "run_id", "batch_kwargs", and "batch_spec" of Validation
+        Result.
+
+        Returns:
+            List of summaries, in order of keys (None for Validation Results without stored summary)
+        """  # noqa: E501
+        if self._summary_store_backend is None:
+            return [None] * len(keys)
+
+        values: List[Optional[Any]] = self._summary_store_backend.get_many(
+            [self.key_to_tuple(key) for key in keys], raise_on_missing=False
+        )
+        return [json.loads(value) if value else None for value in values]
+
+    @staticmethod
+    def build_summary(suite_validation_result: ExpectationSuiteValidationResult) -> dict:
+        batch_kwargs: dict = suite_validation_result.meta.get("batch_kwargs") or {}
+        batch_spec: dict = suite_validation_result.meta.get("batch_spec") or {}
+        return convert_to_json_serializable(
+            {
+                "success": suite_validation_result.success,
+                "statistics": suite_validation_result.statistics,
+                "asset_name": batch_kwargs.get("data_asset_name")
+                or batch_spec.get("data_asset_name"),
+                "run_id": suite_validation_result.meta.get("run_id"),
+                "batch_kwargs": batch_kwargs,
+                "batch_spec": batch_spec,
+            }
+        )
+
     @override
     @staticmethod
     def gx_cloud_response_json_to_object_dict(response_json: Dict) -> Dict:
@@ -175,6 +268,76 @@ class ValidationsStore(Store):
     def config(self) -> dict:
         return self._config
 
+    @override
+    def _get_key_index_metadata(
+        self, key: DataContextKey, value: Optional[Any] = None
+    ) -> Optional[Dict[str, Any]]:
+        if not isinstance(key, ValidationResultIdentifier):
+            return None
+
+        metadata: Dict[str, Any] = {
+            "expectation_suite_name": key.expectation_suite_identifier.name,
+            # Formatted as "%Y%m%dT%H%M%S.%fZ" (UTC), so that lexicographic order is chronological.
+            "run_time": key.run_id.to_tuple()[1],
+        }
+        if isinstance(value, ExpectationSuiteValidationResult):
+            metadata["success"] = value.success
+
+        return metadata
+
+    @override
+    def set(self, key: DataContextKey, value: Any, **kwargs) -> Any:
+        result = super().set(key=key, value=value, **kwargs)
+        self._set_summary(key=key, value=value)
+        return result
+
+    @override
+    def _add(self, key: DataContextKey, value: Any, **kwargs) -> None:
+        result = super()._add(key=key, value=value, **kwargs)
+        self._set_summary(key=key, value=value)
+        return result
+
+    @override
+    def _update(self, key: DataContextKey, value: Any, **kwargs) -> None:
+        result = super()._update(key=key, value=value, **kwargs)
+        self._set_summary(key=key, value=value)
+        return result
+
+    @override
+    def _add_or_update(self, key: DataContextKey, value: Any, **kwargs) -> None | GXCloudIdentifier:
+        result = super()._add_or_update(key=key, value=value, **kwargs)
+        self._set_summary(key=key, value=value)
+        return result
+
+    @override
+    def remove_key(self, key):
+        result = super().remove_key(key)
+        if self._summary_store_backend is not None:
+            summary_key: Optional[tuple] = None
+            if isinstance(key, tuple):
+                summary_key = key
+            elif isinstance(key, ValidationResultIdentifier):
+                summary_key = self.key_to_tuple(key)
+
+            if summary_key is not None:
+                # Missing summaries (e.g., of results stored before enabling them) are ignored.
+                self._summary_store_backend.remove_key(summary_key)
+
+        return result
+
+    def _set_summary(self, key: DataContextKey, value: Any) -> None:
+        if (
+            self._summary_store_backend is None
+            or not isinstance(key, ValidationResultIdentifier)
+            or not isinstance(value, ExpectationSuiteValidationResult)
+        ):
+            return
+
+        self._summary_store_backend.set(
+            self.key_to_tuple(key),
+            json.dumps(self.build_summary(value), sort_keys=True),
+        )
+
     def store_validation_results(
         self,
         suite_validation_result: ExpectationSuiteValidationResult,
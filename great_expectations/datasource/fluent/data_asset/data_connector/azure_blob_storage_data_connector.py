@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING, Callable, ClassVar, List, Optional, Type
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, List, Optional, Type
 
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.typing_extensions import override
@@ -14,6 +14,10 @@ from great_expectations.datasource.data_connector.util import (
 from great_expectations.datasource.fluent.data_asset.data_connector import (
     FilePathDataConnector,
 )
+from great_expectations.datasource.fluent.data_asset.data_connector.file_path_data_connector import (  # noqa: E501
+    _filter_data_references,
+    _narrow_listing_prefix,
+)
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import azure
@@ -46,6 +50,8 @@ class AzureBlobStorageDataConnector(FilePathDataConnector):
         file_path_template_map_fn: Format function mapping path to fully-qualified resource on ABS
     """  # noqa: E501
 
+    _SUPPORTS_LISTING_PUSHDOWN: bool = True
+
     asset_level_option_keys: ClassVar[tuple[str, ...]] = (
         "abs_container",
         "abs_name_starts_with",
@@ -187,9 +193,20 @@ class AzureBlobStorageDataConnector(FilePathDataConnector):
     # Interface Method
     @override
     def get_data_references(self) -> List[str]:
+        return list(self._iter_data_references())
+
+    @override
+    def _iter_data_references(
+        self, prefix: str = "", start_after: Optional[str] = None
+    ) -> Iterator[str]:
         query_options: dict = {
             "container": self._container,
-            "name_starts_with": self._sanitized_prefix,
+            "name_starts_with": _narrow_listing_prefix(
+                listing_prefix=self._sanitized_prefix,
+                prefix=prefix,
+                delimiter=self._delimiter,
+                recursive=self._recursive_file_discovery,
+            ),
             "delimiter": self._delimiter,
         }
         path_list: List[str] = list_azure_keys(
@@ -197,7 +214,10 @@ class AzureBlobStorageDataConnector(FilePathDataConnector):
             query_options=query_options,
             recursive=self._recursive_file_discovery,
         )
-        return path_list
+        # Listing has no lower bound, so data references up to "start_after" are filtered out.
+        yield from _filter_data_references(
+            data_references=path_list, prefix=prefix, start_after=start_after
+        )
 
     # Interface Method
     @override
@@ -4,7 +4,20 @@ import copy
 import logging
 import re
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core import IDDict
@@ -45,10 +58,32 @@ def file_get_unfiltered_batch_definition_list_fn(
         A list of batch definitions from the data connector based on the batch request.
     """  # noqa: E501
 
+    batch_definitions: Iterable[LegacyBatchDefinition] = (
+        data_connector._iter_batch_definitions_from_data_references(options=batch_request.options)
+    )
+    batch_definition: LegacyBatchDefinition
+
+    head_count: Optional[int]
+    tail_count: Optional[int]
+    head_count, tail_count = _get_batch_slice_head_and_tail_counts(
+        batch_slice=batch_request.batch_slice
+    )
+    if tail_count is not None:
+        # Batch definitions are unique (they include "path" of data reference), so only as many
+        # last ones as batch slice can select need to be retained.
+        last_batch_definitions: Deque[LegacyBatchDefinition] = deque(maxlen=tail_count)
+        for batch_definition in batch_definitions:
+            if data_connector._batch_definition_matches_batch_request(
+                batch_definition=batch_definition, batch_request=batch_request
+            ):
+                last_batch_definitions.append(batch_definition)
+
+        return list(last_batch_definitions)
+
     # Use a combination of a list and set to preserve iteration order
     batch_definition_list: list[LegacyBatchDefinition] = list()
     batch_definition_set = set()
-    for batch_definition in data_connector._get_batch_definition_list_from_data_references_cache():
+    for batch_definition in batch_definitions:
         if (
             data_connector._batch_definition_matches_batch_request(
                 batch_definition=batch_definition, batch_request=batch_request
@@ -57,10 +92,40 @@ def file_get_unfiltered_batch_definition_list_fn(
         ):
             batch_definition_list.append(batch_definition)
             batch_definition_set.add(batch_definition)
+            if head_count is not None and len(batch_definition_list) >= head_count:
+                # Batch slice cannot select any more batch definitions; the rest are not listed.
+                break
 
     return batch_definition_list
 
 
+def _get_batch_slice_head_and_tail_counts(
+    batch_slice: slice,
+) -> Tuple[Optional[int], Optional[int]]:
+    """Numbers of first (head) or last (tail) batch definitions, out of which "batch_slice" selects the same ones as out of all.
+
+    Args:
+        batch_slice: Batch slice of batch request.
+
+    Returns:
+        Tuple of head count and tail count (at most one is not None; both are None if all are needed).
+    """  # noqa: E501
+    if batch_slice.step not in (None, 1):
+        return None, None
+
+    if (batch_slice.start is None or batch_slice.start >= 0) and (
+        batch_slice.stop is not None and batch_slice.stop >= 0
+    ):
+        return batch_slice.stop, None
+
+    if (batch_slice.start is not None and batch_slice.start < 0) and (
+        batch_slice.stop is None or batch_slice.stop < 0
+    ):
+        return None, -batch_slice.start
+
+    return None, None
+
+
 def make_directory_get_unfiltered_batch_definition_list_fn(
     data_directory: PathStr,
 ) -> Callable[[FilePathDataConnector, BatchRequest], list[LegacyBatchDefinition]]:
@@ -106,6 +171,9 @@ class FilePathDataConnector(DataConnector):
 
     FILE_PATH_BATCH_SPEC_KEY = "path"
 
+    # Whether "_iter_data_references()" narrows listing call to prefix (rather than filtering all).
+    _SUPPORTS_LISTING_PUSHDOWN: bool = False
+
     def __init__(  # noqa: PLR0913
         self,
         datasource_name: str,
@@ -137,6 +205,8 @@ class FilePathDataConnector(DataConnector):
 
         # This is a dictionary which maps data_references onto batch_requests.
         self._data_references_cache: Dict[str, List[LegacyBatchDefinition] | None] = {}
+        # Greatest data reference in cache; incremental refresh lists only data references after it.
+        self._data_references_watermark: Optional[str] = None
 
     # Interface Method
     @override
@@ -351,26 +421,145 @@ batch identifiers {batch_definition.batch_identifiers} from batch definition {ba
         """  # noqa: E501
         if len(self._data_references_cache) == 0:
             # Map data_references to batch_definitions.
-            for data_reference in self.get_data_references():
-                mapped_batch_definition_list: List[LegacyBatchDefinition] | None = (
-                    self._map_data_reference_string_to_batch_definition_list_using_regex(
-                        data_reference=data_reference
-                    )
+            self._set_data_references_cache(
+                data_references_cache=self._map_data_references(
+                    data_references=self.get_data_references()
                 )
-                self._data_references_cache[data_reference] = mapped_batch_definition_list
+            )
 
         return self._data_references_cache
 
+    def _set_data_references_cache(
+        self, data_references_cache: Dict[str, List[LegacyBatchDefinition] | None]
+    ) -> None:
+        self._data_references_cache = data_references_cache
+        self._data_references_watermark = max(data_references_cache, default=None)
+
+    def _map_data_references(
+        self, data_references: Iterable[str]
+    ) -> Dict[str, List[LegacyBatchDefinition] | None]:
+        data_reference: str
+        return {
+            data_reference: self._map_data_reference_string_to_batch_definition_list_using_regex(
+                data_reference=data_reference
+            )
+            for data_reference in data_references
+        }
+
+    def refresh_data_references(self, incremental: bool = False) -> None:
+        """Lists data references anew, so that batch requests find files added since they were last listed.
+
+        Data references are listed once (by first batch request that needs all of them, or by diagnostic methods, such
+        as "get_data_reference_count()"), and are reused afterwards, until refreshed.
+
+        Args:
+            incremental: If True, only data references that sort after the greatest one listed so far (the watermark)
+                are listed and added (where storage supports it, e.g., "StartAfter" on S3, listing itself starts at the
+                watermark).  This suits data references that grow in sort order as files are added (e.g., paths with
+                dates or sequence numbers); files added under smaller names, or removed, are only accounted for by full
+                (non-incremental) refresh.
+        """  # noqa: E501
+        if not incremental or self._data_references_watermark is None:
+            self._data_references_cache = {}
+            self._get_data_references_cache()
+            return
+
+        data_references_cache: Dict[str, List[LegacyBatchDefinition] | None] = (
+            self._data_references_cache
+        )
+        data_references_cache.update(
+            self._map_data_references(
+                data_references=self._iter_data_references(
+                    start_after=self._data_references_watermark
+                )
+            )
+        )
+        self._set_data_references_cache(data_references_cache=data_references_cache)
+
     def _get_batch_definition_list_from_data_references_cache(
-        self,
+        self, prefix: str = ""
     ) -> List[LegacyBatchDefinition]:
         batch_definition_list: List[LegacyBatchDefinition] = [
             batch_definitions[0]
-            for batch_definitions in self._get_data_references_cache().values()
-            if batch_definitions is not None
+            for data_reference, batch_definitions in self._get_data_references_cache().items()
+            if batch_definitions is not None and data_reference.startswith(prefix)
         ]
         return batch_definition_list
 
+    def _iter_batch_definitions_from_data_references(
+        self, options: Optional[dict] = None
+    ) -> Iterator[LegacyBatchDefinition]:
+        """Batch definitions of data references, which could match given batch request options, streamed lazily.
+
+        Only data references under the literal prefix that every matching data reference starts with (derived from
+        "batching_regex" and those of options, which are values of its groups) are considered.  They are filtered from
+        cache, if it is populated, or if listing cannot be narrowed to prefix (then listing walks all data references
+        anyway, and populates cache).  Otherwise, they are listed (and mapped to batch definitions) only as far as
+        consumer iterates; cache is then populated only by complete listing (when options do not narrow it), if it is
+        iterated to the end.
+
+        Args:
+            options: Batch request options (batch definitions not matching them may still be yielded).
+
+        Yields:
+            Batch definitions of matched data references, in listing order.
+        """  # noqa: E501
+        prefix: str = self._get_data_references_prefix(options=options)
+        if len(self._data_references_cache) > 0 or not self._SUPPORTS_LISTING_PUSHDOWN:
+            yield from self._get_batch_definition_list_from_data_references_cache(prefix=prefix)
+            return
+
+        is_complete_listing: bool = prefix == self._get_data_references_prefix()
+        if is_complete_listing:
+            # Cache also keeps unmatched data references (for diagnostics), so all are listed.
+            prefix = ""
+
+        data_references_cache: Dict[str, List[LegacyBatchDefinition] | None] = {}
+        data_reference: str
+        batch_definitions: List[LegacyBatchDefinition] | None
+        for data_reference in self._iter_data_references(prefix=prefix):
+            batch_definitions = (
+                self._map_data_reference_string_to_batch_definition_list_using_regex(
+                    data_reference=data_reference
+                )
+            )
+            if is_complete_listing:
+                data_references_cache[data_reference] = batch_definitions
+
+            if batch_definitions is not None:
+                yield batch_definitions[0]
+
+        if is_complete_listing and len(data_references_cache) > 0:
+            self._set_data_references_cache(data_references_cache=data_references_cache)
+
+    def _get_data_references_prefix(self, options: Optional[dict] = None) -> str:
+        """Literal prefix of data references matched by "batching_regex", whose groups match (string) option values."""  # noqa: E501
+        group_name_to_group_value_mapping: Dict[str, str] = {
+            key: value for key, value in (options or {}).items() if isinstance(value, str)
+        }
+        return self._regex_parser.get_literal_prefix(
+            group_name_to_group_value_mapping=group_name_to_group_value_mapping
+        )
+
+    def _iter_data_references(
+        self, prefix: str = "", start_after: Optional[str] = None
+    ) -> Iterator[str]:
+        """Data references that start with "prefix" and sort after "start_after" (if given), in listing order.
+
+        This implementation filters all data references; subclasses push both criteria into their listing calls,
+        where storage supports it (and set "_SUPPORTS_LISTING_PUSHDOWN").
+
+        Args:
+            prefix: Literal prefix of data references of interest.
+            start_after: Data reference, after which (in sort order) data references of interest start.
+
+        Yields:
+            Data references.
+        """  # noqa: E501
+        yield from _filter_data_references(
+            data_references=self.get_data_references(), prefix=prefix, start_after=start_after
+        )
+
     def _map_data_reference_string_to_batch_definition_list_using_regex(
         self, data_reference: str
     ) -> List[LegacyBatchDefinition] | None:
@@ -437,3 +626,41 @@ batch identifiers {batch_definition.batch_identifiers} from batch definition {ba
     @abstractmethod
     def _get_full_file_path(self, path: str) -> str:
         pass
+
+
+def _filter_data_references(
+    data_references: Iterable[str], prefix: str = "", start_after: Optional[str] = None
+) -> Iterator[str]:
+    data_reference: str
+    for data_reference in data_references:
+        if data_reference.startswith(prefix) and (
+            start_after is None or data_reference > start_after
+        ):
+            yield data_reference
+
+
+def _narrow_listing_prefix(
+    listing_prefix: str, prefix: str, delimiter: Optional[str], recursive: bool
+) -> str:
+    """Narrows prefix of listing call to literal prefix of data references of interest (if it extends listing prefix).
+
+    Non-recursive listings return only objects directly under listing prefix (up to delimiter); in order for narrowed
+    listing not to return objects from nested "directories", it is narrowed at most up to next delimiter.
+
+    Args:
+        listing_prefix: Prefix (e.g., "s3_prefix") that listing call is configured with.
+        prefix: Literal prefix of data references of interest.
+        delimiter: Delimiter that listing call is configured with.
+        recursive: Whether or not listing is recursive.
+
+    Returns:
+        Prefix to list.
+    """  # noqa: E501
+    if not prefix.startswith(listing_prefix):
+        return listing_prefix
+
+    extension: str = prefix[len(listing_prefix) :]
+    if not recursive and delimiter and delimiter in extension:
+        extension = extension[: extension.index(delimiter)]
+
+    return f"{listing_prefix}{extension}"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING, Callable, ClassVar, List, Optional, Type
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, List, Optional, Type
 
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.typing_extensions import override
@@ -14,6 +14,10 @@ from great_expectations.datasource.data_connector.util import (
 from great_expectations.datasource.fluent.data_asset.data_connector import (
     FilePathDataConnector,
 )
+from great_expectations.datasource.fluent.data_asset.data_connector.file_path_data_connector import (  # noqa: E501
+    _filter_data_references,
+    _narrow_listing_prefix,
+)
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import google
@@ -46,6 +50,8 @@ class GoogleCloudStorageDataConnector(FilePathDataConnector):
         file_path_template_map_fn: Format function mapping path to fully-qualified resource on GCS
     """  # noqa: E501
 
+    _SUPPORTS_LISTING_PUSHDOWN: bool = True
+
     asset_level_option_keys: ClassVar[tuple[str, ...]] = (
         "gcs_prefix",
         "gcs_delimiter",
@@ -184,18 +190,35 @@ class GoogleCloudStorageDataConnector(FilePathDataConnector):
     # Interface Method
     @override
     def get_data_references(self) -> List[str]:
+        return list(self._iter_data_references())
+
+    @override
+    def _iter_data_references(
+        self, prefix: str = "", start_after: Optional[str] = None
+    ) -> Iterator[str]:
         query_options: dict = {
             "bucket_or_name": self._bucket_or_name,
-            "prefix": self._sanitized_prefix,
+            "prefix": _narrow_listing_prefix(
+                listing_prefix=self._sanitized_prefix,
+                prefix=prefix,
+                delimiter=self._delimiter,
+                recursive=self._recursive_file_discovery,
+            ),
             "delimiter": self._delimiter,
             "max_results": self._max_results,
         }
+        if start_after is not None:
+            # Inclusive lower bound; "start_after" itself is filtered out below.
+            query_options["start_offset"] = start_after
+
         path_list: List[str] = list_gcs_keys(
             gcs_client=self._gcs_client,
             query_options=query_options,
             recursive=self._recursive_file_discovery,
         )
-        return path_list
+        yield from _filter_data_references(
+            data_references=path_list, prefix=prefix, start_after=start_after
+        )
 
     # Interface Method
     @override
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Dict, List, Match, Optional, Tuple
+from typing import Dict, Iterator, List, Match, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_REGEX_QUANTIFIER_CHARACTERS: str = "*+?{"
+_REGEX_SPECIAL_CHARACTERS: str = ".^$*+?{}[]|()"
+
 
 class RegExParser:
     def __init__(
@@ -155,3 +158,195 @@ class RegExParser:
             zip(all_group_indexes, all_matched_group_values)
         )
         return group_index_to_group_value_mapping
+
+    def get_literal_prefix(
+        self, group_name_to_group_value_mapping: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Longest string, with which every target, matched by regex (with given groups matching given values), starts.
+
+        Regex is scanned from its beginning for as long as it consists of literal characters, of groups (entered
+        unless they are repeated or contain alternatives), and of groups whose values are given (which contribute
+        their values, since matched targets are filtered by these values anyway).  Scanning stops at first construct
+        that can match different strings (e.g., character class, wildcard, or quantifier).
+
+        Args:
+            group_name_to_group_value_mapping: Values of named and common (e.g., "unnamed_group_1") groups, if known.
+
+        Returns:
+            Literal prefix (possibly empty) of all matched targets, usable to narrow listings of data references.
+        """  # noqa: E501
+        if self._regex_pattern.flags & (re.IGNORECASE | re.VERBOSE):
+            return ""
+
+        group_values: Dict[str, str] = group_name_to_group_value_mapping or {}
+        pattern: str = self._regex_pattern.pattern
+        if _has_top_level_alternation(pattern=pattern):
+            return ""
+
+        prefix: str = ""
+        group_index: int = 0
+        idx: int = 0
+        literal: str
+        while idx < len(pattern):
+            if pattern[idx] == "(":
+                group_step: Optional[Tuple[str, int, int]] = self._get_group_literal_prefix(
+                    pattern=pattern,
+                    idx=idx,
+                    group_index=group_index,
+                    group_values=group_values,
+                )
+                if group_step is None:
+                    break
+
+                literal, idx, group_index = group_step
+            else:
+                literal_step: Optional[Tuple[str, int]] = _get_literal(pattern=pattern, idx=idx)
+                if literal_step is None:
+                    break
+
+                literal, idx = literal_step
+
+            prefix += literal
+
+        return prefix
+
+    def _get_group_literal_prefix(
+        self, pattern: str, idx: int, group_index: int, group_values: Dict[str, str]
+    ) -> Optional[Tuple[str, int, int]]:
+        """Scans group, opened at "idx", returning its literal prefix, next index, and capturing groups passed.
+
+        A group whose value is given contributes its value and is skipped entirely; any other group is entered (its
+        literal prefix is scanned next), unless it is repeated, contains alternatives, or is not a plain group.
+        """  # noqa: E501
+        group_end: Optional[int] = _find_group_end(pattern=pattern, start=idx)
+        if group_end is None or _is_quantified(pattern=pattern, idx=group_end + 1):
+            return None
+
+        body_start: Optional[int] = _get_group_body_start(pattern=pattern, idx=idx)
+        if body_start is None:
+            # Lookarounds, inline flags, comments, and other extensions are not followed.
+            return None
+
+        if _is_capturing_group(pattern=pattern, idx=idx):
+            group_index += 1
+            group_name: str = self.get_all_group_index_to_group_name_mapping()[group_index]
+            if group_name in group_values:
+                group_index += _count_capturing_groups(pattern=pattern[body_start:group_end])
+                return group_values[group_name], group_end + 1, group_index
+
+        if _has_top_level_alternation(pattern=pattern[body_start:group_end]):
+            return None
+
+        return "", body_start, group_index
+
+
+def _get_literal(pattern: str, idx: int) -> Optional[Tuple[str, int]]:
+    """Returns literal at "idx" and index following it (None, if it can match different strings)."""
+    character: str = pattern[idx]
+    if character == ")" or (character == "^" and idx == 0):
+        # Closing parenthesis of entered group (neither repeated nor alternated) and "^" match "".
+        return "", idx + 1
+
+    literal: str
+    literal_end: int
+    if character == "\\":
+        literal = pattern[idx + 1 : idx + 2]
+        if not literal or literal.isalnum():
+            # Character classes (e.g., "\d"), anchors, and backreferences are not literals.
+            return None
+
+        literal_end = idx + 2
+    elif character in _REGEX_SPECIAL_CHARACTERS:
+        return None
+    else:
+        literal = character
+        literal_end = idx + 1
+
+    if _is_quantified(pattern=pattern, idx=literal_end):
+        return None
+
+    return literal, literal_end
+
+
+def _is_quantified(pattern: str, idx: int) -> bool:
+    return idx < len(pattern) and pattern[idx] in _REGEX_QUANTIFIER_CHARACTERS
+
+
+def _is_capturing_group(pattern: str, idx: int) -> bool:
+    return not pattern.startswith("(?", idx) or pattern.startswith("(?P<", idx)
+
+
+def _get_group_body_start(pattern: str, idx: int) -> Optional[int]:
+    if pattern.startswith("(?P<", idx):
+        return pattern.index(">", idx) + 1
+
+    if pattern.startswith("(?:", idx):
+        return idx + 3
+
+    if pattern.startswith("(?", idx):
+        return None
+
+    return idx + 1
+
+
+def _iter_unescaped_characters(pattern: str) -> Iterator[Tuple[int, str, int]]:
+    """Yields index, character, and group nesting depth for every character outside of escapes and character sets."""  # noqa: E501
+    depth: int = 0
+    idx: int = 0
+    while idx < len(pattern):
+        character: str = pattern[idx]
+        if character == "\\":
+            idx += 2
+            continue
+
+        if character == "[":
+            idx = _find_character_set_end(pattern=pattern, start=idx) + 1
+            continue
+
+        if character == ")":
+            depth -= 1
+        yield idx, character, depth
+        if character == "(":
+            depth += 1
+
+        idx += 1
+
+
+def _find_character_set_end(pattern: str, start: int) -> int:
+    idx: int = start + 1
+    # A "]" right after "[" (or "[^") is a literal member of character set.
+    if pattern[idx : idx + 1] == "^":
+        idx += 1
+    if pattern[idx : idx + 1] == "]":
+        idx += 1
+
+    while idx < len(pattern) and pattern[idx] != "]":
+        idx += 2 if pattern[idx] == "\\" else 1
+
+    return idx
+
+
+def _find_group_end(pattern: str, start: int) -> Optional[int]:
+    idx: int
+    character: str
+    depth: int
+    for idx, character, depth in _iter_unescaped_characters(pattern=pattern[start:]):
+        if character == ")" and depth == 0:
+            return start + idx
+
+    return None
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    return any(
+        character == "|" and depth == 0
+        for _, character, depth in _iter_unescaped_characters(pattern=pattern)
+    )
+
+
+def _count_capturing_groups(pattern: str) -> int:
+    return sum(
+        1
+        for idx, character, _ in _iter_unescaped_characters(pattern=pattern)
+        if character == "(" and _is_capturing_group(pattern=pattern, idx=idx)
+    )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING, Callable, ClassVar, List, Optional, Type
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, List, Optional, Type
 
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.typing_extensions import override
@@ -14,6 +14,10 @@ from great_expectations.datasource.data_connector.util import (
 from great_expectations.datasource.fluent.data_asset.data_connector import (
     FilePathDataConnector,
 )
+from great_expectations.datasource.fluent.data_asset.data_connector.file_path_data_connector import (  # noqa: E501
+    _filter_data_references,
+    _narrow_listing_prefix,
+)
 
 if TYPE_CHECKING:
     from botocore.client import BaseClient
@@ -48,6 +52,8 @@ class S3DataConnector(FilePathDataConnector):
         file_path_template_map_fn: Format function mapping path to fully-qualified resource on S3
     """  # noqa: E501
 
+    _SUPPORTS_LISTING_PUSHDOWN: bool = True
+
     asset_level_option_keys: ClassVar[tuple[str, ...]] = (
         "s3_prefix",
         "s3_delimiter",
@@ -186,21 +192,48 @@ class S3DataConnector(FilePathDataConnector):
     # Interface Method
     @override
     def get_data_references(self) -> List[str]:
+        return list(self._iter_data_references())
+
+    @override
+    def _iter_data_references(
+        self, prefix: str = "", start_after: Optional[str] = None
+    ) -> Iterator[str]:
+        listing_prefix: str = _narrow_listing_prefix(
+            listing_prefix=self._sanitized_prefix,
+            prefix=prefix,
+            delimiter=self._delimiter,
+            recursive=self._recursive_file_discovery,
+        )
         query_options: dict = {
             "Bucket": self._bucket,
-            "Prefix": self._sanitized_prefix,
+            "Prefix": listing_prefix,
             "Delimiter": self._delimiter,
             "MaxKeys": self._max_keys,
         }
-        path_list: List[str] = list(
-            list_s3_keys(
-                s3=self._s3_client,
-                query_options=query_options,
-                iterator_dict={},
-                recursive=self._recursive_file_discovery,
-            )
+        recursive: bool = self._recursive_file_discovery
+        if start_after is not None:
+            query_options["StartAfter"] = start_after
+            if recursive:
+                # Common prefixes sorting before "StartAfter" would be skipped, even though objects
+                # under them sort after it; listing without delimiter returns objects at all levels.
+                del query_options["Delimiter"]
+                recursive = False
+
+        # Keys are paged lazily, so listing stops as soon as no more data references are needed.
+        path_iterator: Iterator[str] = list_s3_keys(
+            s3=self._s3_client,
+            query_options=query_options,
+            iterator_dict={},
+            recursive=recursive,
         )
-        return path_list
+        try:
+            yield from _filter_data_references(
+                data_references=path_iterator, prefix=prefix, start_after=start_after
+            )
+        except ValueError:
+            # Nothing under narrowed prefix (or after "StartAfter") is not a configuration error.
+            if listing_prefix == self._sanitized_prefix and start_after is None:
+                raise
 
     # Interface Method
     @override
@@ -402,6 +402,18 @@ class _FilePathDataAsset(DataAsset):
             ) from e
         raise TestConnectionError(self._test_connection_error_message)
 
+    def refresh_data_references(self, incremental: bool = False) -> None:
+        """Lists files of this DataAsset anew, so that batch requests find newly added files.
+
+        Args:
+            incremental: If True, only files whose paths sort after the greatest path listed so
+                far are listed and added (e.g., for paths containing dates); otherwise, all files
+                are listed.
+        """
+        self._data_connector.refresh_data_references(  # type: ignore[attr-defined] # FilePathDataConnector
+            incremental=incremental
+        )
+
     def get_unfiltered_batch_definition_list_fn(
         self,
     ) -> Callable[[FilePathDataConnector, BatchRequest], list[LegacyBatchDefinition]]:
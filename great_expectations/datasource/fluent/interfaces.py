@@ -23,9 +23,11 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
     overload,
 )
 
@@ -859,6 +861,10 @@ class Batch:
 
     This is usually not the data itself but a hook to the data on an external datastore such as
     a spark or a sql database. An exception exists for pandas or any in-memory datastore.
+
+    Instead of "data" and "batch_markers", a "data_loader" may be passed; it is called (once) the
+    first time either of them is accessed, so that batches which are never used (e.g., because they
+    are sliced away) are never materialized by the execution engine.
     """
 
     def __init__(  # noqa: PLR0913
@@ -866,17 +872,24 @@ class Batch:
         datasource: Datasource,
         data_asset: DataAsset,
         batch_request: BatchRequest,
-        data: BatchData,
-        batch_markers: BatchMarkers,
+        data: BatchData | None,
+        batch_markers: BatchMarkers | None,
         batch_spec: BatchSpec,
         batch_definition: LegacyBatchDefinition,
         metadata: Dict[str, Any] | None = None,
+        data_loader: Callable[[], Tuple[BatchData, BatchMarkers]] | None = None,
     ):
+        if data_loader is None and (data is None or batch_markers is None):
+            raise ValueError(  # noqa: TRY003
+                'Either "data" and "batch_markers" or "data_loader" must be provided to a Batch.'
+            )
+
         # Immutable attributes
         self._datasource = datasource
         self._data_asset = data_asset
         self._batch_request = batch_request
         self._data = data
+        self._data_loader = data_loader
 
         # Immutable legacy attributes
         # TODO: These legacy fields are required but we should figure out how to delete them
@@ -913,11 +926,25 @@ class Batch:
 
     @property
     def data(self) -> BatchData:
-        return self._data
+        self._load_data()
+        return cast("BatchData", self._data)
 
     @property
     def batch_markers(self) -> BatchMarkers:
-        return self._batch_markers
+        self._load_data()
+        return cast("BatchMarkers", self._batch_markers)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the data of this Batch has been materialized by the execution engine."""
+        return self._data_loader is None
+
+    def _load_data(self) -> None:
+        if self._data_loader is None:
+            return
+
+        self._data, self._batch_markers = self._data_loader()
+        self._data_loader = None
 
     @property
     def batch_spec(self) -> BatchSpec:
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
+import functools
+import json
 import logging
+import time
 import warnings
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pprint import pformat as pf
 from typing import (
     TYPE_CHECKING,
@@ -151,7 +155,12 @@ class _Partitioner(Protocol):
                  This category was only 1 parameter per column.
         """  # noqa: E501
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> List[Dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
         """Creates all valid batch requests options for sql_asset
 
         This can be implemented by querying the data defined in the sql_asset to generate
@@ -160,22 +169,36 @@ class _Partitioner(Protocol):
         set of distinct (year, month) pairs. We would then return a list of BatchRequest.options,
         ie dictionaries, of the form {"year": year, "month": month} that contain all these distinct
         pairs.
+
+        If "descending" (one sort direction per parameter) and/or "limit" are given, the query
+        returns the options sorted by parameter values and/or only the first "limit" of them.
         """
 
 
 def _partitioner_and_sql_asset_to_batch_identifier_data(
-    partitioner: _Partitioner, asset: _SQLAsset
+    partitioner: _Partitioner,
+    asset: _SQLAsset,
+    descending: Optional[List[bool]] = None,
+    limit: Optional[int] = None,
 ) -> list[dict]:
-    execution_engine = asset.datasource.get_execution_engine()
-    sqlalchemy_data_partitioner = SqlAlchemyDataPartitioner(execution_engine.dialect_name)
-    return sqlalchemy_data_partitioner.get_data_for_batch_identifiers(
-        execution_engine=execution_engine,
-        selectable=asset.as_selectable(),
-        partitioner_method_name=partitioner.method_name,
-        partitioner_kwargs=partitioner.partitioner_method_kwargs(),
+    return asset._get_batch_identifier_data(
+        partitioner=partitioner, descending=descending, limit=limit
     )
 
 
+@dataclasses.dataclass(frozen=True)
+class _PartitionCacheEntry:
+    """Partitions of a _SQLAsset, as discovered (by a query or from catalog) at "refreshed_at".
+
+    "max_partition_column_value" is the largest value of the partition column seen by the last
+    scan of a datetime partitioner; only rows at or after it are scanned on refresh.
+    """
+
+    batch_identifier_data: List[dict]
+    refreshed_at: float
+    max_partition_column_value: Any = None
+
+
 class _PartitionerDatetime(FluentBaseModel):
     column_name: str
     method_name: str
@@ -184,9 +207,14 @@ class _PartitionerDatetime(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
         batch_identifier_data = _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, descending=descending, limit=limit
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
@@ -287,9 +315,14 @@ class _PartitionerOneColumnOneParam(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
         batch_identifier_data = _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, descending=descending, limit=limit
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
@@ -377,11 +410,16 @@ class SqlPartitionerColumnValue(_PartitionerOneColumnOneParam):
         return {self.column_name: options[self.column_name]}
 
     @override
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
         # The superclass version of param_defaults is correct, but here we leverage that
         # the parameter name is the same as the column name to make this much faster.
         return _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, descending=descending, limit=limit
         )
 
 
@@ -410,9 +448,14 @@ class SqlPartitionerMultiColumnValue(FluentBaseModel):
             )
         return {col: options[col] for col in self.column_names}
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self,
+        sql_asset: _SQLAsset,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
         return _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, descending=descending, limit=limit
         )
 
 
@@ -471,6 +514,17 @@ SqlPartitioner = Union[
 ]
 
 
+# Partitioners whose parameters are integers, so batches can be sorted by the database.
+_SQL_PARTITIONERS_WITH_INTEGER_PARAMS: Final[Tuple[Type[FluentBaseModel], ...]] = (
+    SqlPartitionerDividedInteger,
+    SqlPartitionerModInteger,
+    SqlPartitionerYear,
+    SqlPartitionerYearAndMonth,
+    SqlPartitionerYearAndMonthAndDay,
+    SqlPartitionerDatetimePart,
+)
+
+
 class _SQLAsset(DataAsset):
     """A _SQLAsset Mixin
 
@@ -500,6 +554,159 @@ class _SQLAsset(DataAsset):
         )
     )
 
+    # Partition discovery cache; disabled (None) by default (see "set_partition_cache_ttl()").
+    _partition_cache_ttl: Optional[float] = pydantic.PrivateAttr(default=None)
+    _partition_cache: Dict[str, _PartitionCacheEntry] = pydantic.PrivateAttr(default_factory=dict)
+
+    def set_partition_cache_ttl(self, ttl: Union[timedelta, float, None]) -> None:
+        """Caches partitions discovered for batch requests of this asset for "ttl" (seconds or timedelta).
+
+        Until "ttl" expires, batch requests reuse partitions found by the previous partition-discovery query
+        (e.g., "SELECT DISTINCT" over partition column expression) instead of running it again.  Once it expires,
+        datetime partitioners only scan rows at or after the latest partition column value seen so far (so that
+        partitions that appear later in time are found cheaply, but backfilled earlier partitions are not; call
+        "clear_partition_cache()" to rediscover all partitions); other partitioners discover all partitions again.
+
+        Args:
+            ttl: Time to live of cached partitions; "None" disables (and clears) the cache.
+        """  # noqa: E501
+        if isinstance(ttl, timedelta):
+            ttl = ttl.total_seconds()
+
+        if ttl is not None and ttl < 0:
+            raise ValueError(f'"ttl" must be non-negative (got "{ttl}").')  # noqa: TRY003
+
+        self._partition_cache_ttl = ttl
+        if ttl is None:
+            self.clear_partition_cache()
+
+    def clear_partition_cache(self) -> None:
+        """Discards partitions cached for this asset, so that next batch request discovers all of them."""  # noqa: E501
+        self._partition_cache.clear()
+
+    def _get_batch_identifier_data(
+        self,
+        partitioner: _Partitioner,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """Batch identifiers data of partitions, from partition cache (if enabled) or query.
+
+        Cached partitions are always complete, so "descending" and "limit" only apply to queries
+        that are run with partition cache disabled.  Partition metadata in database catalog is only
+        read to fill the cache; with cache disabled, partitions are discovered as they always were.
+        """
+        if self._partition_cache_ttl is None:
+            return self._query_batch_identifier_data(
+                partitioner=partitioner, descending=descending, limit=limit
+            )
+
+        cache_key: str = self._get_partition_cache_key(partitioner=partitioner)
+        cache_entry: Optional[_PartitionCacheEntry] = self._partition_cache.get(cache_key)
+        if (
+            cache_entry is None
+            or time.monotonic() - cache_entry.refreshed_at >= self._partition_cache_ttl
+        ):
+            cache_entry = self._discover_partitions(
+                partitioner=partitioner, previous_cache_entry=cache_entry
+            )
+            self._partition_cache[cache_key] = cache_entry
+
+        # Batch request options are matched against (and may modify) these; cache keeps a copy.
+        return copy.deepcopy(cache_entry.batch_identifier_data)
+
+    def _get_partition_cache_key(self, partitioner: _Partitioner) -> str:
+        return json.dumps(
+            {
+                "selectable": str(self.as_selectable()),
+                "partitioner_method_name": partitioner.method_name,
+                "partitioner_kwargs": partitioner.partitioner_method_kwargs(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    def _discover_partitions(
+        self,
+        partitioner: _Partitioner,
+        previous_cache_entry: Optional[_PartitionCacheEntry],
+    ) -> _PartitionCacheEntry:
+        refreshed_at: float = time.monotonic()
+        catalog_data: Optional[List[dict]] = self._get_batch_identifier_data_from_catalog(
+            partitioner=partitioner
+        )
+        if catalog_data is not None:
+            return _PartitionCacheEntry(
+                batch_identifier_data=catalog_data, refreshed_at=refreshed_at
+            )
+
+        if not isinstance(partitioner, _PartitionerDatetime):
+            return _PartitionCacheEntry(
+                batch_identifier_data=self._query_batch_identifier_data(partitioner=partitioner),
+                refreshed_at=refreshed_at,
+            )
+
+        column: sqlalchemy.ColumnClause = sa.column(partitioner.column_name)
+        selectable: sqlalchemy.Selectable = self.as_selectable()
+        since: Any = None
+        if previous_cache_entry is not None:
+            since = previous_cache_entry.max_partition_column_value
+
+        if since is not None:
+            selectable = (
+                sa.select(sa.text("*")).select_from(selectable).where(column >= since).subquery()
+            )
+
+        # The maximum is read before partitions, so rows added in between are scanned again next time (not missed).  # noqa: E501
+        execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
+        max_partition_column_value: Any = execution_engine.execute_partitioned_query(
+            sa.select(sa.func.max(column)).select_from(selectable)
+        )[0][0]
+        batch_identifier_data: List[dict] = self._query_batch_identifier_data(
+            partitioner=partitioner, selectable=selectable
+        )
+        if previous_cache_entry is not None and since is not None:
+            batch_identifier_data = previous_cache_entry.batch_identifier_data + [
+                data
+                for data in batch_identifier_data
+                if data not in previous_cache_entry.batch_identifier_data
+            ]
+
+        return _PartitionCacheEntry(
+            batch_identifier_data=batch_identifier_data,
+            refreshed_at=refreshed_at,
+            max_partition_column_value=(
+                since if max_partition_column_value is None else max_partition_column_value
+            ),
+        )
+
+    def _query_batch_identifier_data(
+        self,
+        partitioner: _Partitioner,
+        selectable: Optional[sqlalchemy.Selectable] = None,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
+        sqlalchemy_data_partitioner = SqlAlchemyDataPartitioner(execution_engine.dialect_name)
+        return sqlalchemy_data_partitioner.get_data_for_batch_identifiers(
+            execution_engine=execution_engine,
+            selectable=self.as_selectable() if selectable is None else selectable,
+            partitioner_method_name=partitioner.method_name,
+            partitioner_kwargs=partitioner.partitioner_method_kwargs(),
+            descending=descending,
+            limit=limit,
+        )
+
+    def _get_batch_identifier_data_from_catalog(
+        self, partitioner: _Partitioner
+    ) -> Optional[List[dict]]:
+        """Batch identifiers data from partition metadata in database catalog, if available.
+
+        Only assets that map to a catalog table (see TableAsset) can have partition metadata.
+        """
+        return None
+
     def get_partitioner_implementation(self, abstract_partitioner: Partitioner) -> SqlPartitioner:
         PartitionerClass = self._partitioner_implementation_map.get(type(abstract_partitioner))
         if not PartitionerClass:
@@ -548,9 +755,19 @@ class _SQLAsset(DataAsset):
 
         sql_partitioner = self.get_partitioner_implementation(batch_request.partitioner)
 
+        # When the batch slice only keeps the first (or last) batches in the order that the
+        # partition-discovery query can reproduce, only those are fetched from the database.
+        descending: Optional[List[bool]] = None
+        limit: Optional[int] = None
+        pushdown = self._get_partition_query_sort_and_limit(
+            batch_request=batch_request, sql_partitioner=sql_partitioner
+        )
+        if pushdown:
+            descending, limit = pushdown
+
         batch_requests: List[BatchRequest] = []
         # We iterate through all possible batches as determined by the partitioner
-        for params in sql_partitioner.param_defaults(self):
+        for params in sql_partitioner.param_defaults(self, descending=descending, limit=limit):
             # If the params from the partitioner don't match the batch request options
             # we don't create this batch.
             if not _SQLAsset._matches_request_options(params, batch_request.options):
@@ -567,10 +784,62 @@ class _SQLAsset(DataAsset):
             )
         return batch_requests
 
+    def _get_partition_query_sort_and_limit(
+        self, batch_request: BatchRequest, sql_partitioner: SqlPartitioner
+    ) -> Optional[Tuple[List[bool], int]]:
+        """Sort directions (one per partitioner parameter) and limit for the partition-discovery query.
+
+        These can only be pushed down into the query when:
+            - the partitioner parameters are integers (so that the database sorts them as Python would);
+            - no batch request option filters the partitions (filtering happens after the query);
+            - the asset sorts batches by exactly the partitioner parameters, in their order;
+            - the batch slice keeps a prefix (e.g., "[:3]") or a suffix (e.g., "[-1:]") of sorted batches.
+
+        A suffix is fetched by sorting in the opposite direction; batches are sorted again afterwards,
+        and "batch_slice" is still applied to them, which selects the same batches as it would from all.
+
+        Returns:
+            A tuple of sort directions (True for descending) and limit, or None if nothing can be pushed down.
+        """  # noqa: E501
+        if not self._is_partition_query_sortable(
+            batch_request=batch_request, sql_partitioner=sql_partitioner
+        ):
+            return None
+
+        batch_slice: slice = batch_request.batch_slice
+        if batch_slice.step not in (None, 1):
+            return None
+
+        start: Optional[int] = batch_slice.start
+        stop: Optional[int] = batch_slice.stop
+        if (start is None or start >= 0) and stop is not None and stop >= 0:
+            return [sorter.reverse for sorter in self.order_by], stop
+
+        if start is not None and start < 0 and (stop is None or stop < 0):
+            return [not sorter.reverse for sorter in self.order_by], -start
+
+        return None
+
+    def _is_partition_query_sortable(
+        self, batch_request: BatchRequest, sql_partitioner: SqlPartitioner
+    ) -> bool:
+        """Whether the partition-discovery query can sort partitions as the asset sorts batches."""
+        if not isinstance(sql_partitioner, _SQL_PARTITIONERS_WITH_INTEGER_PARAMS):
+            return False
+
+        param_names: List[str] = sql_partitioner.param_names
+        if any(batch_request.options.get(param_name) is not None for param_name in param_names):
+            return False
+
+        return [sorter.key for sorter in self.order_by] == param_names
+
     @override
     def get_batch_list_from_batch_request(self, batch_request: BatchRequest) -> List[Batch]:
         """A list of batches that match the BatchRequest.
 
+        Batch data is not materialized here; the execution engine builds it when a batch is first
+        used (e.g., validated), so that batches dropped by the batch slice cost nothing.
+
         Args:
             batch_request: A batch request for this asset. Usually obtained by calling
                 build_batch_request on the asset.
@@ -585,6 +854,7 @@ class _SQLAsset(DataAsset):
             sql_partitioner = self.get_partitioner_implementation(batch_request.partitioner)
         else:
             sql_partitioner = None
+        execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
         batch_spec_kwargs: dict[str, str | dict | None]
         for request in self._fully_specified_batch_requests(batch_request):
             batch_metadata: BatchMetadata = self._get_batch_metadata_from_batch_request(
@@ -605,8 +875,6 @@ class _SQLAsset(DataAsset):
                 )
             # Creating the batch_spec is our hook into the execution engine.
             batch_spec = self._create_batch_spec(batch_spec_kwargs)
-            execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
-            data, markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
 
             # batch_definition (along with batch_spec and markers) is only here to satisfy a
             # legacy constraint when computing usage statistics in a validator. We hope to remove
@@ -628,11 +896,14 @@ class _SQLAsset(DataAsset):
                     datasource=self.datasource,
                     data_asset=self,
                     batch_request=request,
-                    data=data,
+                    data=None,
                     metadata=batch_metadata,
-                    batch_markers=markers,
+                    batch_markers=None,
                     batch_spec=batch_spec,
                     batch_definition=batch_definition,
+                    data_loader=functools.partial(
+                        execution_engine.get_batch_data_and_markers, batch_spec=batch_spec
+                    ),
                 )
             )
         self.sort_batches(batch_list)
@@ -857,6 +1128,20 @@ class TableAsset(_SQLAsset):
         """
         return sa.text(self.qualified_name)
 
+    @override
+    def _get_batch_identifier_data_from_catalog(
+        self, partitioner: _Partitioner
+    ) -> Optional[List[dict]]:
+        execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
+        sqlalchemy_data_partitioner = SqlAlchemyDataPartitioner(execution_engine.dialect_name)
+        return sqlalchemy_data_partitioner.get_data_for_batch_identifiers_from_catalog(
+            execution_engine=execution_engine,
+            table_name=self.table_name,
+            schema_name=self.schema_name,
+            partitioner_method_name=partitioner.method_name,
+            partitioner_kwargs=partitioner.partitioner_method_kwargs(),
+        )
+
     @override
     def _create_batch_spec_kwargs(self) -> dict[str, Any]:
         return {
@@ -404,6 +404,10 @@ class ExecutionEngineError(DataContextError):
         super().__init__(self.message)
 
 
+class ChunkedBatchDataError(ExecutionEngineError):
+    """Raised when Batch data, read in chunks, is accessed as a whole (e.g., by metric that is not mergeable)."""  # noqa: E501
+
+
 class BatchFilterError(DataContextError):
     def __init__(self, message) -> None:
         self.message = message
@@ -441,11 +445,28 @@ class InvalidMetricAccessorDomainKwargsKeyError(MetricError):
 
 
 class MetricResolutionError(MetricError):
-    def __init__(self, message, failed_metrics) -> None:
+    """Raised when some of metrics, resolved together, fail.
+
+    Args:
+        message: error message (of first failure).
+        failed_metrics: configurations of metrics that failed.
+        resolved_metrics: values of metrics that were resolved, despite failures of others.
+        metric_exceptions: exception of every failed metric (by metric ID), if known.
+    """
+
+    def __init__(
+        self,
+        message,
+        failed_metrics,
+        resolved_metrics: Optional[dict] = None,
+        metric_exceptions: Optional[dict] = None,
+    ) -> None:
         super().__init__(message)
         if not isinstance(failed_metrics, Iterable):
             failed_metrics = (failed_metrics,)
         self.failed_metrics = failed_metrics
+        self.resolved_metrics: dict = resolved_metrics or {}
+        self.metric_exceptions: dict = metric_exceptions or {}
 
 
 class GXCloudError(GreatExpectationsError):
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class _BoundedLRUCacheEntry(Generic[V]):
+    value: V
+    size: int
+
+
+class BoundedLRUCache(Generic[K, V]):
+    """Thread-safe least-recently-used cache, optionally bounded by number of entries and/or memory budget.
+
+    Sizes of entries are not measured here; callers of "put()" pass them in (so that each cache decides how, and
+    whether, to measure its values).
+
+    Args:
+        max_entries: maximum number of cached entries (default is no limit).
+        max_memory_bytes: memory budget for cached entries, as reported by callers of "put()" (default is no limit).
+        on_evict: optional callback, invoked with value of every entry removed from cache (e.g., to unpersist it).
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        on_evict: Optional[Callable[[V], None]] = None,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(  # noqa: TRY003
+                f'"max_entries" must be a positive integer or None (got "{max_entries}").'
+            )
+
+        if max_memory_bytes is not None and max_memory_bytes < 1:
+            raise ValueError(  # noqa: TRY003
+                f'"max_memory_bytes" must be a positive integer or None (got "{max_memory_bytes}").'
+            )
+
+        self._max_entries = max_entries
+        self._max_memory_bytes = max_memory_bytes
+        self._on_evict = on_evict
+
+        self._entries: OrderedDict[K, _BoundedLRUCacheEntry[V]] = OrderedDict()
+        self._memory_bytes: int = 0
+        self._lock = threading.RLock()
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def max_memory_bytes(self) -> Optional[int]:
+        return self._max_memory_bytes
+
+    @property
+    def memory_bytes(self) -> int:
+        """Memory currently used by cached entries."""
+        return self._memory_bytes
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            entry: Optional[_BoundedLRUCacheEntry[V]] = self._entries.get(key)
+            if entry is None:
+                return default
+
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def put(self, key: K, value: V, size: int = 0) -> bool:
+        """Adds entry to cache (evicting least recently used ones, if needed).
+
+        Returns:
+            False, if entry alone exceeds memory budget (and is thus not cached); True otherwise.
+        """
+        if self._max_memory_bytes is not None and size > self._max_memory_bytes:
+            return False
+
+        with self._lock:
+            self._remove(key=key)
+            self._entries[key] = _BoundedLRUCacheEntry(value=value, size=size)
+            self._memory_bytes += size
+            self._evict()
+
+        return True
+
+    def remove_if(self, predicate: Callable[[K, V], bool]) -> None:
+        """Removes all entries, for whose key and value "predicate" returns True."""
+        with self._lock:
+            key: K
+            entry: _BoundedLRUCacheEntry[V]
+            keys: List[K] = [
+                key for key, entry in self._entries.items() if predicate(key, entry.value)
+            ]
+            for key in keys:
+                self._remove(key=key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key=key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def _remove(self, key: K) -> None:
+        entry: Optional[_BoundedLRUCacheEntry[V]] = self._entries.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size
+            self._release(entry=entry)
+
+    def _evict(self) -> None:
+        entry: _BoundedLRUCacheEntry[V]
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_memory_bytes is not None and self._memory_bytes > self._max_memory_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._memory_bytes -= entry.size
+            self._release(entry=entry)
+
+    def _release(self, entry: _BoundedLRUCacheEntry[V]) -> None:
+        if self._on_evict is None:
+            return
+
+        try:
+            self._on_evict(entry.value)
+        except Exception as e:
+            logger.debug(f"Unable to release evicted cache entry: {e!s}")
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Hashable, Optional, Tuple
+
+from great_expectations.execution_engine.bounded_lru_cache import BoundedLRUCache
+
+logger = logging.getLogger(__name__)
+
+# First element of every key is ID of Batch, whose records are filtered (used for invalidation).
+DomainRecordsKey = Tuple[Hashable, ...]
+
+# Enough for dozens of boolean row masks of 10M-row Batch.
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_MEMORY_BYTES: int = 256 * 1024 * 1024
+
+# For backends, whose cached domain records are not measured in bytes (e.g., Spark DataFrames).
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES: int = 64
+
+
+class DomainRecordsCache(BoundedLRUCache[DomainRecordsKey, Any]):
+    """Least-recently-used cache of filtered domain records, keyed by Batch ID and filtering directives.
+
+    ExecutionEngine implementations decide what is cached: "PandasExecutionEngine" keeps boolean row masks (never copied
+    DataFrames), so that "row_condition" and "ignore_row_if" filters are evaluated once per Batch; "SparkDFExecutionEngine"
+    keeps filtered DataFrames (optionally persisted).
+
+    Args:
+        max_entries: maximum number of cached entries (default is no limit).
+        max_memory_bytes: memory budget for cached entries, as reported by callers of "put()" (default is no limit).
+        on_evict: optional callback, invoked with value of every entry removed from cache (e.g., to unpersist it).
+    """  # noqa: E501
+
+    def put(self, key: DomainRecordsKey, value: Any, size: int = 0) -> bool:
+        cached: bool = super().put(key=key, value=value, size=size)
+        if not cached:
+            logger.debug(f"Domain records {key!s} exceed memory budget of cache; not caching them.")
+
+        return cached
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        self.remove_if(lambda key, value: key[0] == batch_id)
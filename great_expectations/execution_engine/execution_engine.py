@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
     Dict,
     Iterable,
     List,
     Optional,
     Set,
     Tuple,
+    TypeVar,
     Union,
 )
 
@@ -23,6 +27,11 @@ from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    MetricCache,
+    NoOpMetricCache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -45,22 +54,15 @@ if TYPE_CHECKING:
         BatchMarkers,
         BatchSpec,
     )
+    from great_expectations.execution_engine.metric_resolution_profiler import (
+        MetricResolutionProfiler,
+    )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
 
-
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def update(self, value):
-        return None
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -133,9 +135,14 @@ class ExecutionEngine(ABC):
     Args:
         name: (str) name of this ExecutionEngine
         caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        metric_cache: (MetricCache) cache of resolved metrics to use when caching is enabled (default is unbounded
+            InMemoryMetricCache); use bounded InMemoryMetricCache for long-lived engines and FilesystemMetricCache to
+            reuse metric values of unchanged (fingerprinted) Batches across runs.
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        max_workers: (int) if greater than 1, then independent directly-computable metrics and metric bundles of every
+            wave of metrics are resolved concurrently, using thread pool of this size (default is serial resolution).
     """  # noqa: E501
 
     recognized_batch_spec_defaults: Set[str] = set()
@@ -147,18 +154,31 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        max_workers: Optional[int] = None,
+        metric_cache: Optional[MetricCache] = None,
     ) -> None:
         self.name = name
         self._validator = validator
 
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(  # noqa: TRY003
+                f'"max_workers" must be a positive integer or None (got "{max_workers}").'
+            )
+
+        self._max_workers = max_workers
+
+        self._metric_resolution_profiler: Optional[MetricResolutionProfiler] = None
+
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store  # noqa: E501
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+        self._metric_cache: MetricCache
+        if not self._caching:
+            self._metric_cache = NoOpMetricCache()
+        elif metric_cache is None:
+            self._metric_cache = InMemoryMetricCache()
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = metric_cache
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -192,6 +212,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "max_workers": max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -216,6 +237,33 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def metric_cache(self) -> MetricCache:
+        """Getter for cache of resolved metrics"""
+        return self._metric_cache
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """Getter for maximum number of concurrent metric computations (None means serial)"""
+        return self._max_workers
+
+    @property
+    def metric_resolution_profiler(self) -> Optional[MetricResolutionProfiler]:
+        """Getter for opt-in profiler of metric resolution (None means it is not profiled)"""
+        return self._metric_resolution_profiler
+
+    @metric_resolution_profiler.setter
+    def metric_resolution_profiler(self, profiler: Optional[MetricResolutionProfiler]) -> None:
+        self._metric_resolution_profiler = profiler
+
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Whether or not metric functions can safely run concurrently against this ExecutionEngine.
+
+        Subclasses, whose backend cannot be shared across threads (e.g., single persisted connection), override this.
+        """  # noqa: E501
+        return True
+
     def _load_batch_data_from_dict(self, batch_data_dict: Dict[str, BatchDataType]) -> None:
         """
         Loads all data in batch_data_dict using cache_batch_data
@@ -226,8 +274,44 @@ class ExecutionEngine(ABC):
             self.load_batch_data(batch_id=batch_id, batch_data=batch_data)  # type: ignore[arg-type]
 
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        # Metrics computed on previously loaded data under same Batch ID are no longer valid.
+        self._metric_cache.invalidate_batch(batch_id=batch_id)
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Returns fingerprint of content of loaded Batch (or None, if content cannot be fingerprinted cheaply).
+
+        Fingerprints key persisted metric values (see "FilesystemMetricCache"); therefore, equal fingerprints must
+        imply equal Batch content.  By default, "pandas_data_fingerprint" Batch marker is used, if present.
+
+        Args:
+            batch_id: ID of loaded Batch
+
+        Returns:
+            Fingerprint string or None
+        """  # noqa: E501
+        if batch_id is None:
+            return None
+
+        batch = self._batch_manager.batch_cache.get(batch_id)
+        if batch is None or not batch.batch_markers:
+            return None
+
+        return batch.batch_markers.get("pandas_data_fingerprint")
+
+    def project_batch_columns(self, batch_id: str, columns: Optional[Collection[str]]) -> None:
+        """Limits data of loaded Batch to given columns (or to all columns, if None), before metrics are resolved.
+
+        "Validator" passes columns, which metrics of validation graph compute over; ExecutionEngines, which read Batch
+        data lazily (e.g., "PandasExecutionEngine" with "column_projection" enabled), then read only these columns.
+        By default, Batch data is left as is.
+
+        Args:
+            batch_id: ID of loaded Batch
+            columns: names of columns to keep (None, if all columns are needed)
+        """  # noqa: E501
+        return None
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -268,20 +352,87 @@ class ExecutionEngine(ABC):
         if not metrics_to_resolve:
             return metrics or {}
 
+        profiler: Optional[MetricResolutionProfiler] = self._metric_resolution_profiler
+        if profiler is None:
+            return self._resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        metrics_to_resolve = list(metrics_to_resolve)
+        with profiler.wave(engine=self.__class__.__name__, metrics_to_resolve=metrics_to_resolve):
+            return self._resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+    def _resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        uncached_metrics_to_resolve: List[MetricConfiguration] = []
+        cached_metrics: List[MetricConfiguration] = []
+
+        # Metrics, computed on Batch with known content fingerprint, are reused, not recomputed.
+        sentinel = object()
+        batch_fingerprint: Optional[str]
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            batch_fingerprint = self._get_metric_batch_fingerprint(
+                metric_configuration=metric_to_resolve
+            )
+            value = (
+                sentinel
+                if batch_fingerprint is None
+                else self._metric_cache.get(
+                    metric_id=metric_to_resolve.id,
+                    batch_id=self._get_metric_batch_id(metric_configuration=metric_to_resolve),
+                    batch_fingerprint=batch_fingerprint,
+                    default=sentinel,
+                )
+            )
+            if value is sentinel:
+                uncached_metrics_to_resolve.append(metric_to_resolve)
+            else:
+                resolved_metrics[metric_to_resolve.id] = value
+                cached_metrics.append(metric_to_resolve)
+
+        if cached_metrics and self._metric_resolution_profiler is not None:
+            self._metric_resolution_profiler.record_cache_hits(
+                engine=self.__class__.__name__, metric_configurations=cached_metrics
+            )
+
+        if not uncached_metrics_to_resolve:
+            return resolved_metrics
+
         metric_fn_direct_configurations: List[MetricComputationConfiguration]
         metric_fn_bundle_configurations: List[MetricComputationConfiguration]
         (
             metric_fn_direct_configurations,
             metric_fn_bundle_configurations,
         ) = self._build_direct_and_bundled_metric_computation_configurations(
-            metrics_to_resolve=metrics_to_resolve,
+            metrics_to_resolve=uncached_metrics_to_resolve,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
         )
-        return self._process_direct_and_bundled_metric_computation_configurations(
-            metric_fn_direct_configurations=metric_fn_direct_configurations,
-            metric_fn_bundle_configurations=metric_fn_bundle_configurations,
-        )
+        try:
+            resolved_metrics.update(
+                self._process_direct_and_bundled_metric_computation_configurations(
+                    metric_fn_direct_configurations=metric_fn_direct_configurations,
+                    metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+                )
+            )
+        except gx_exceptions.MetricResolutionError as e:
+            # Cached metrics are handed over, along with metrics resolved despite other failures.
+            e.resolved_metrics = {**resolved_metrics, **e.resolved_metrics}
+            raise
+
+        return resolved_metrics
 
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], MetricValue]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
@@ -386,7 +537,8 @@ class ExecutionEngine(ABC):
         """
         This method organizes "metrics_to_resolve" ("MetricConfiguration" objects) into two lists: direct and bundled.
         Directly-computable "MetricConfiguration" must have non-NULL metric function ("metric_fn").  Aggregate metrics
-        have NULL metric function, but non-NULL partial metric function ("metric_partial_fn"); aggregates are bundled.
+        have non-NULL partial metric function ("metric_partial_fn"); aggregates are bundled (even if "ExecutionEngine"
+        is also able to compute them directly, as is the case for "PandasExecutionEngine").
 
         See documentation in "MetricProvider._register_metric_functions()" for in-depth description of this mechanism.
 
@@ -438,7 +590,10 @@ class ExecutionEngine(ABC):
                 "metrics": resolved_metric_dependencies_by_metric_name,
                 "runtime_configuration": runtime_configuration,
             }
-            if metric_fn is None:
+            if (
+                metric_fn is None
+                or "metric_partial_fn" in resolved_metric_dependencies_by_metric_name
+            ):
                 try:
                     (
                         metric_aggregate_fn,
@@ -501,7 +656,7 @@ class ExecutionEngine(ABC):
         ) in metric_to_resolve.metric_dependencies.items():
             if metric_configuration.id in metrics:
                 metric_dependencies_by_metric_name[metric_name] = metrics[metric_configuration.id]
-            elif self._caching and metric_configuration.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
+            elif metric_configuration.id in self._metric_cache:
                 metric_dependencies_by_metric_name[metric_name] = self._metric_cache[
                     metric_configuration.id
                 ]
@@ -527,6 +682,106 @@ class ExecutionEngine(ABC):
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+        if self._should_resolve_metrics_concurrently(
+            num_tasks=len(metric_fn_direct_configurations) + 1
+        ):
+            resolved_metrics = self._process_metric_computation_configurations_concurrently(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+        else:
+            resolved_metrics = self._process_metric_computation_configurations_serially(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+
+        if self._caching:
+            self._cache_resolved_metrics(
+                metric_computation_configurations=itertools.chain(
+                    metric_fn_direct_configurations, metric_fn_bundle_configurations
+                ),
+                resolved_metrics=resolved_metrics,
+            )
+
+        return resolved_metrics
+
+    def _cache_resolved_metrics(
+        self,
+        metric_computation_configurations: Iterable[MetricComputationConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        metric_computation_configuration: MetricComputationConfiguration
+        metric_configuration: MetricConfiguration
+        for metric_computation_configuration in metric_computation_configurations:
+            metric_configuration = metric_computation_configuration.metric_configuration
+            if metric_configuration.id not in resolved_metrics:
+                continue
+
+            self._metric_cache.put(
+                metric_id=metric_configuration.id,
+                value=resolved_metrics[metric_configuration.id],
+                batch_id=self._get_metric_batch_id(metric_configuration=metric_configuration),
+                batch_fingerprint=self._get_metric_batch_fingerprint(
+                    metric_configuration=metric_configuration
+                ),
+            )
+
+    def _get_metric_batch_id(self, metric_configuration: MetricConfiguration) -> Optional[str]:
+        return (
+            metric_configuration.metric_domain_kwargs.get("batch_id")
+            or self._batch_manager.active_batch_data_id
+        )
+
+    def _get_metric_batch_fingerprint(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[str]:
+        if not self._metric_cache.uses_batch_fingerprints:
+            return None
+
+        return self.get_batch_fingerprint(
+            batch_id=self._get_metric_batch_id(metric_configuration=metric_configuration)
+        )
+
+    def _compute_metrics(
+        self,
+        metric_fn: Callable,
+        metric_configurations: List[MetricConfiguration],
+        bundled: bool,
+        kwargs: dict,
+    ) -> Any:
+        """Calls metric function (or bundle resolution) with "kwargs", profiling it if profiler is attached."""  # noqa: E501
+        profiler: Optional[MetricResolutionProfiler] = self._metric_resolution_profiler
+        if profiler is None or not metric_configurations:
+            return metric_fn(**kwargs)
+
+        with profiler.computation(
+            engine=self.__class__.__name__,
+            metric_configurations=metric_configurations,
+            bundled=bundled,
+        ):
+            return metric_fn(**kwargs)
+
+    def _bind_to_current_metric_span(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wraps callable for worker thread, so that its profiled work is child of current span."""
+        if self._metric_resolution_profiler is None:
+            return fn
+
+        return self._metric_resolution_profiler.bind_to_current_span(fn)
+
+    def _should_resolve_metrics_concurrently(self, num_tasks: int) -> bool:
+        return (
+            self._max_workers is not None
+            and self._max_workers > 1
+            and num_tasks > 1
+            and self.supports_concurrent_metric_resolution
+        )
+
+    def _process_metric_computation_configurations_serially(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
         metric_computation_configuration: MetricComputationConfiguration
@@ -534,8 +789,13 @@ class ExecutionEngine(ABC):
         for metric_computation_configuration in metric_fn_direct_configurations:
             try:
                 resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
-                    metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
-                        **metric_computation_configuration.metric_provider_kwargs
+                    self._compute_metrics(
+                        metric_computation_configuration.metric_fn,  # type: ignore[arg-type] # F not callable
+                        metric_configurations=[
+                            metric_computation_configuration.metric_configuration
+                        ],
+                        bundled=False,
+                        kwargs=metric_computation_configuration.metric_provider_kwargs,
                     )
                 )
             except Exception as e:
@@ -546,10 +806,19 @@ class ExecutionEngine(ABC):
 
         try:
             # an engine-specific way of computing metrics together
-            resolved_metric_bundle: Dict[Tuple[str, str, str], MetricValue] = (
-                self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle_configurations)
+            resolved_metric_bundle: Dict[Tuple[str, str, str], MetricValue] = self._compute_metrics(
+                self.resolve_metric_bundle,
+                metric_configurations=[
+                    metric_computation_configuration.metric_configuration
+                    for metric_computation_configuration in metric_fn_bundle_configurations
+                ],
+                bundled=True,
+                kwargs={"metric_fn_bundle": metric_fn_bundle_configurations},
             )
             resolved_metrics.update(resolved_metric_bundle)
+        except gx_exceptions.MetricResolutionError:
+            # engine already narrowed failure down to subset of bundled metrics
+            raise
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
@@ -559,8 +828,89 @@ class ExecutionEngine(ABC):
                 ],
             ) from e
 
-        if self._caching:
-            self._metric_cache.update(resolved_metrics)
+        return resolved_metrics
+
+    def _process_metric_computation_configurations_concurrently(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Submits every directly-computable metric and the metric bundle as independent tasks to thread pool of size
+        "max_workers".  Failures are collected from all tasks, so that "MetricResolutionError.failed_metrics" lists
+        every metric that failed in this wave (and only those), and retry/abort logic of "ValidationGraph" applies.
+        """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        failed_metrics: List[MetricConfiguration] = []
+        metric_exceptions: Dict[Tuple[str, str, str], Exception] = {}
+        first_exception: Optional[Exception] = None
+
+        metric_computation_configuration: MetricComputationConfiguration
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=f"{self.__class__.__name__}-metrics",
+        ) as executor:
+            direct_futures: List[Tuple[MetricComputationConfiguration, Future]] = [
+                (
+                    metric_computation_configuration,
+                    executor.submit(
+                        self._bind_to_current_metric_span(self._compute_metrics),
+                        metric_computation_configuration.metric_fn,  # type: ignore[arg-type] # F not callable
+                        metric_configurations=[
+                            metric_computation_configuration.metric_configuration
+                        ],
+                        bundled=False,
+                        kwargs=metric_computation_configuration.metric_provider_kwargs,
+                    ),
+                )
+                for metric_computation_configuration in metric_fn_direct_configurations
+            ]
+            # an engine-specific way of computing metrics together
+            bundle_future: Future = executor.submit(
+                self._bind_to_current_metric_span(self._compute_metrics),
+                self.resolve_metric_bundle,
+                metric_configurations=[
+                    metric_computation_configuration.metric_configuration
+                    for metric_computation_configuration in metric_fn_bundle_configurations
+                ],
+                bundled=True,
+                kwargs={"metric_fn_bundle": metric_fn_bundle_configurations},
+            )
+
+            future: Future
+            for metric_computation_configuration, future in direct_futures:
+                try:
+                    resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
+                        future.result()
+                    )
+                except Exception as e:
+                    failed_metrics.append(metric_computation_configuration.metric_configuration)
+                    metric_exceptions[metric_computation_configuration.metric_configuration.id] = e
+                    first_exception = first_exception or e
+
+            try:
+                resolved_metrics.update(bundle_future.result())
+            except gx_exceptions.MetricResolutionError as e:
+                # engine already narrowed failure down to subset of bundled metrics
+                failed_metrics.extend(e.failed_metrics)
+                metric_exceptions.update(e.metric_exceptions)
+                resolved_metrics.update(e.resolved_metrics)
+                first_exception = first_exception or e
+            except Exception as e:
+                failed_metrics.extend(
+                    metric_computation_configuration.metric_configuration
+                    for metric_computation_configuration in metric_fn_bundle_configurations
+                )
+                first_exception = first_exception or e
+
+        if first_exception is not None:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(first_exception),
+                failed_metrics=failed_metrics,
+                resolved_metrics=resolved_metrics,
+                metric_exceptions=metric_exceptions,
+            ) from first_exception
 
         return resolved_metrics
 
@@ -0,0 +1,722 @@
+from __future__ import annotations
+
+import ast
+import logging
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set, Union
+
+import numpy as np
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+    SummarizationMetricNameSuffixes,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.execution_engine import (
+        MetricComputationConfiguration,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+# Exact distinct values (their 64-bit hashes) are kept until there are more than this many of them.
+DEFAULT_DISTINCT_COUNT_SKETCH_MAX_EXACT_VALUES: int = 2**16
+# HyperLogLog precision (2**14 registers), for relative standard error of about 0.8%.
+DEFAULT_DISTINCT_COUNT_SKETCH_PRECISION: int = 14
+# Quantiles are exact until more than this many values have been seen.
+DEFAULT_QUANTILE_SKETCH_CAPACITY: int = 2**16
+
+
+@dataclass(frozen=True)
+class MetricChunk:
+    """One chunk of Batch data, as seen by "MergeableMetric.partial" of one metric.
+
+    Args:
+        metric_configuration: metric being computed.
+        value_fn: computes metric (with its own metric function) on this chunk alone.
+        column_fn: returns Domain column (with "row_condition" and other Domain filters applied)
+            of this chunk.
+    """
+
+    metric_configuration: MetricConfiguration
+    value_fn: Callable[[], Any]
+    column_fn: Callable[[], pd.Series]
+
+    def value(self) -> Any:
+        return self.value_fn()
+
+    def column(self) -> pd.Series:
+        return self.column_fn()
+
+
+def _chunk_value(chunk: MetricChunk) -> Any:
+    return chunk.value()
+
+
+def _identity(value: Any, metric_configuration: MetricConfiguration) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class MergeableMetric:
+    """Describes how metric is computed on Batch data, read in chunks (memory scales with chunk size).
+
+    Partial result is computed for every chunk, partial results are merged (in order of chunks), and
+    merged result is finalized into metric value.
+
+    Args:
+        partial: computes partial result on one chunk (by default, metric value on that chunk alone).
+        merge: merges two partial results (of preceding and following chunks) into one.
+        finalize: converts merged partial result into metric value (by default, it is metric value).
+        empty: partial result for Batch without any chunks.
+    """  # noqa: E501
+
+    merge: Callable[[Any, Any, MetricConfiguration], Any]
+    partial: Callable[[MetricChunk], Any] = _chunk_value
+    finalize: Callable[[Any, MetricConfiguration], Any] = _identity
+    empty: Any = None
+
+
+class DeferredChunkMetricValue:
+    """Stands for value of "map" or "condition" metric (row-wise Series) on chunked Batch data.
+
+    Such values cannot be merged across chunks; instead, "PandasExecutionEngine" evaluates them on
+    every chunk, when metric that depends on them (e.g., "unexpected_count") is computed on it.
+    """
+
+    def __init__(self, metric_computation_configuration: MetricComputationConfiguration) -> None:
+        self._metric_computation_configuration = metric_computation_configuration
+
+    @property
+    def metric_computation_configuration(self) -> MetricComputationConfiguration:
+        return self._metric_computation_configuration
+
+    def _raise_not_mergeable(self, *args, **kwargs):
+        raise gx_exceptions.ChunkedBatchDataError(  # noqa: TRY003
+            f'Value of metric "{self._metric_computation_configuration.metric_configuration.metric_name}" is computed '  # noqa: E501
+            "chunk by chunk and can only be used by metrics, whose partial results can be merged "
+            "across chunks."
+        )
+
+    __getitem__ = _raise_not_mergeable
+    __iter__ = _raise_not_mergeable
+    __len__ = _raise_not_mergeable
+
+
+_MAP_METRIC_SUFFIXES: tuple = (
+    f".{MetricPartialFunctionTypeSuffixes.MAP.value}",
+    f".{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+)
+
+
+def is_deferred_chunk_metric(metric_name: str) -> bool:
+    """Whether metric is row-wise ("map" or "condition") metric, evaluated chunk by chunk."""
+    return metric_name.endswith(_MAP_METRIC_SUFFIXES)
+
+
+_cross_row_map_metric_names: Set[str] = set()
+
+
+def register_cross_row_map_metric(metric_name: str) -> None:
+    """Registers "map" or "condition" metric, whose value for row depends on other rows.
+
+    Such metric (e.g., uniqueness) cannot be evaluated chunk by chunk.  Name is given without
+    "map"/"condition" suffix.
+    """
+    _cross_row_map_metric_names.add(metric_name)
+
+
+def is_cross_row_map_metric(metric_name: str) -> bool:
+    return (
+        is_deferred_chunk_metric(metric_name=metric_name)
+        and metric_name.rpartition(".")[0] in _cross_row_map_metric_names
+    )
+
+
+_mergeable_metrics: Dict[str, MergeableMetric] = {}
+_mergeable_metric_name_suffixes: Dict[str, MergeableMetric] = {}
+
+
+def register_mergeable_metric(
+    metric_name: str, mergeable_metric: MergeableMetric, name_suffix: bool = False
+) -> None:
+    """Registers how metric is merged across chunks.
+
+    If "name_suffix" is True, registration applies to every metric named "<prefix>.<metric_name>".
+    """
+    if name_suffix:
+        _mergeable_metric_name_suffixes[metric_name] = mergeable_metric
+    else:
+        _mergeable_metrics[metric_name] = mergeable_metric
+
+
+def get_mergeable_metric(metric_name: str) -> Optional[MergeableMetric]:
+    if metric_name in _mergeable_metrics:
+        return _mergeable_metrics[metric_name]
+
+    name_suffix: str
+    mergeable_metric: MergeableMetric
+    for name_suffix, mergeable_metric in _mergeable_metric_name_suffixes.items():
+        if metric_name.endswith(f".{name_suffix}"):
+            return mergeable_metric
+
+    return None
+
+
+class DistinctCountSketch:
+    """Mergeable count of distinct values: exact up to "max_exact_values", HyperLogLog beyond.
+
+    Values are represented by their 64-bit hashes (see "pandas.util.hash_pandas_object()").
+    """
+
+    def __init__(
+        self,
+        max_exact_values: int = DEFAULT_DISTINCT_COUNT_SKETCH_MAX_EXACT_VALUES,
+        precision: int = DEFAULT_DISTINCT_COUNT_SKETCH_PRECISION,
+    ) -> None:
+        self._max_exact_values = max_exact_values
+        self._precision = precision
+        self._hashes: Optional[np.ndarray] = np.empty(0, dtype=np.uint64)
+        self._registers: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_series(cls, series: pd.Series, **kwargs) -> DistinctCountSketch:
+        sketch = cls(**kwargs)
+        sketch.add_hashes(
+            pd.util.hash_pandas_object(series.dropna(), index=False).to_numpy(dtype=np.uint64)
+        )
+        return sketch
+
+    @property
+    def is_exact(self) -> bool:
+        return self._registers is None
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if self._registers is not None:
+            self._add_to_registers(hashes=hashes)
+            return
+
+        self._hashes = np.union1d(self._hashes, hashes)
+        if len(self._hashes) > self._max_exact_values:
+            self._registers = np.zeros(2**self._precision, dtype=np.uint8)
+            self._add_to_registers(hashes=self._hashes)
+            self._hashes = None
+
+    def merge(self, other: DistinctCountSketch) -> DistinctCountSketch:
+        if other._registers is None:
+            self.add_hashes(hashes=other._hashes)  # type: ignore[arg-type]
+        else:
+            if self._registers is None:
+                self._registers = np.zeros(2**self._precision, dtype=np.uint8)
+                self._add_to_registers(hashes=self._hashes)  # type: ignore[arg-type]
+                self._hashes = None
+
+            np.maximum(self._registers, other._registers, out=self._registers)
+
+        return self
+
+    def estimate(self) -> int:
+        if self._registers is None:
+            return len(self._hashes)  # type: ignore[arg-type]
+
+        num_registers: int = len(self._registers)
+        alpha: float = 0.7213 / (1.0 + 1.079 / num_registers)
+        estimate: float = (
+            alpha
+            * num_registers**2
+            / float(np.sum(np.power(2.0, -self._registers.astype(np.float64))))
+        )
+        num_zero_registers: int = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * num_registers and num_zero_registers > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = num_registers * math.log(num_registers / num_zero_registers)
+
+        return int(round(estimate))
+
+    def _add_to_registers(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+
+        remainder_bits = np.uint64(64 - self._precision)
+        register_indices: np.ndarray = (hashes >> remainder_bits).astype(np.int64)
+        remainders: np.ndarray = hashes & np.uint64((1 << (64 - self._precision)) - 1)
+        # Position of leftmost 1 bit among remainder bits.
+        ranks: np.ndarray = (int(remainder_bits) + 1 - _bit_length(remainders)).astype(np.uint8)
+        np.maximum.at(self._registers, register_indices, ranks)  # type: ignore[arg-type]
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    values = values.copy()
+    bit_lengths: np.ndarray = np.zeros(len(values), dtype=np.int64)
+
+    shift: int
+    shifted: np.ndarray
+    for shift in (32, 16, 8, 4, 2, 1):
+        shifted = values >= (np.uint64(1) << np.uint64(shift))
+        bit_lengths[shifted] += shift
+        values[shifted] >>= np.uint64(shift)
+
+    bit_lengths += (values > 0).astype(np.int64)
+    return bit_lengths
+
+
+class QuantileSketch:
+    """Mergeable quantiles: exact up to "capacity" values, approximate (with bounded memory) beyond.
+
+    Once more than "capacity" values are kept, sorted adjacent values are compacted pairwise
+    (keeping one of each pair, with combined weight), so that every kept value is an actual data
+    value and weights sum up to number of values.  Values keep dtype of column (e.g., datetimes and
+    strings are not converted to floats).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_QUANTILE_SKETCH_CAPACITY) -> None:
+        self._capacity = capacity
+        # Replaced by first non-empty values added, so that their dtype is kept.
+        self._values: np.ndarray = np.empty(0, dtype=np.float64)
+        self._weights: np.ndarray = np.empty(0, dtype=np.int64)
+        self._compacted: bool = False
+
+    @classmethod
+    def from_series(cls, series: pd.Series, **kwargs) -> QuantileSketch:
+        sketch = cls(**kwargs)
+        values: np.ndarray = series.dropna().to_numpy()
+        sketch._add(values=values, weights=np.ones(len(values), dtype=np.int64))
+        return sketch
+
+    @property
+    def is_exact(self) -> bool:
+        return not self._compacted
+
+    @property
+    def count(self) -> int:
+        return int(self._weights.sum())
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        self._compacted = self._compacted or other._compacted
+        self._add(values=other._values, weights=other._weights)
+        return self
+
+    def quantiles(
+        self, quantiles: Sequence[float], interpolation: str = "nearest"
+    ) -> List[Union[float, Any]]:
+        if self.is_exact:
+            return pd.Series(self._values).quantile(quantiles, interpolation=interpolation).tolist()
+
+        if len(self._values) == 0:
+            return [np.nan for _ in quantiles]
+
+        order: np.ndarray = np.argsort(self._values, kind="stable")
+        values: np.ndarray = self._values[order]
+        cumulative_weights: np.ndarray = np.cumsum(self._weights[order])
+        positions: np.ndarray = np.searchsorted(
+            cumulative_weights,
+            np.asarray(quantiles, dtype=np.float64) * cumulative_weights[-1],
+            side="left",
+        )
+        # Converted via Series, so that datetimes are returned as Timestamps (rather than integers).
+        return pd.Series(values[np.clip(positions, 0, len(values) - 1)]).tolist()
+
+    def median(self) -> Any:
+        if self.is_exact:
+            return pd.Series(self._values).median()
+
+        return self.quantiles(quantiles=[0.5])[0]
+
+    def _add(self, values: np.ndarray, weights: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+
+        if len(self._values) == 0:
+            self._values, self._weights = values, weights
+        else:
+            self._values = np.concatenate([self._values, values])
+            self._weights = np.concatenate([self._weights, weights])
+
+        while len(self._values) > self._capacity:
+            self._compact()
+
+    def _compact(self) -> None:
+        order: np.ndarray = np.argsort(self._values, kind="stable")
+        values: np.ndarray = self._values[order]
+        weights: np.ndarray = self._weights[order]
+
+        # Odd value out is carried over as is.
+        num_pairs: int = len(values) // 2
+        left_values, right_values = values[0 : 2 * num_pairs : 2], values[1 : 2 * num_pairs : 2]
+        left_weights, right_weights = weights[0 : 2 * num_pairs : 2], weights[1 : 2 * num_pairs : 2]
+        # Ties alternate between left and right value of pair, so that neither end is favored.
+        keep_left: np.ndarray = (left_weights > right_weights) | (
+            (left_weights == right_weights) & (np.arange(num_pairs) % 2 == 0)
+        )
+        self._values = np.concatenate(
+            [np.where(keep_left, left_values, right_values), values[2 * num_pairs :]]
+        )
+        self._weights = np.concatenate([left_weights + right_weights, weights[2 * num_pairs :]])
+        self._compacted = True
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (np.ndim(value) == 0 and bool(pd.isna(value)))
+
+
+def _merge_sum(left: Any, right: Any, metric_configuration: MetricConfiguration) -> Any:
+    return left + right
+
+
+def _merge_min(left: Any, right: Any, metric_configuration: MetricConfiguration) -> Any:
+    if _is_missing(left):
+        return right
+
+    if _is_missing(right):
+        return left
+
+    return min(left, right)
+
+
+def _merge_max(left: Any, right: Any, metric_configuration: MetricConfiguration) -> Any:
+    if _is_missing(left):
+        return right
+
+    if _is_missing(right):
+        return left
+
+    return max(left, right)
+
+
+def _merge_first(left: Any, right: Any, metric_configuration: MetricConfiguration) -> Any:
+    return left
+
+
+def _merge_sketches(left: Any, right: Any, metric_configuration: MetricConfiguration) -> Any:
+    return left.merge(right)
+
+
+def _get_unexpected_limit(metric_configuration: MetricConfiguration) -> Optional[int]:
+    result_format: dict = metric_configuration.metric_value_kwargs["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return None
+
+    return result_format["partial_unexpected_count"]
+
+
+def _merge_unexpected_list(
+    left: list, right: list, metric_configuration: MetricConfiguration
+) -> list:
+    limit: Optional[int] = _get_unexpected_limit(metric_configuration=metric_configuration)
+    if limit is not None and len(left) >= limit:
+        return left
+
+    return (left + right)[:limit]
+
+
+def _merge_unexpected_rows(
+    left: pd.DataFrame, right: pd.DataFrame, metric_configuration: MetricConfiguration
+) -> pd.DataFrame:
+    limit: Optional[int] = _get_unexpected_limit(metric_configuration=metric_configuration)
+    if limit is not None and len(left) >= limit:
+        return left
+
+    return pd.concat([left, right]).iloc[:limit]
+
+
+# Pandas "unexpected_index_query" lists index of every unexpected row
+# (see "_pandas_map_condition_query()").
+_PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX: str = "df.filter(items="
+_PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX: str = ", axis=0)"
+
+
+def _unexpected_index_query_partial(chunk: MetricChunk) -> Optional[list]:
+    query: Optional[str] = chunk.value()
+    if query is None:
+        # Query is not requested (see "return_unexpected_index_query" of "result_format").
+        return None
+
+    try:
+        if not (
+            query.startswith(_PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX)
+            and query.endswith(_PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX)
+        ):
+            raise ValueError(query)  # noqa: TRY301
+
+        return ast.literal_eval(
+            query[
+                len(_PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX) : -len(
+                    _PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX
+                )
+            ]
+        )
+    except (SyntaxError, ValueError) as e:
+        raise gx_exceptions.ChunkedBatchDataError(  # noqa: TRY003
+            f'Unexpected index query "{query}" cannot be merged across chunks.'
+        ) from e
+
+
+def _merge_unexpected_index_queries(
+    left: Optional[list], right: Optional[list], metric_configuration: MetricConfiguration
+) -> Optional[list]:
+    if left is None or right is None:
+        return None
+
+    return _merge_unexpected_list(left=left, right=right, metric_configuration=metric_configuration)
+
+
+def _finalize_unexpected_index_query(
+    index_list: Optional[list], metric_configuration: MetricConfiguration
+) -> Optional[str]:
+    if index_list is None:
+        return None
+
+    return "".join(
+        (
+            _PANDAS_UNEXPECTED_INDEX_QUERY_PREFIX,
+            str(index_list),
+            _PANDAS_UNEXPECTED_INDEX_QUERY_SUFFIX,
+        )
+    )
+
+
+def _merge_histograms(left: list, right: list, metric_configuration: MetricConfiguration) -> list:
+    return [left_count + right_count for left_count, right_count in zip(left, right)]
+
+
+def _merge_sets(left: set, right: set, metric_configuration: MetricConfiguration) -> set:
+    return left | right
+
+
+def _merge_value_counts(
+    left: pd.Series, right: pd.Series, metric_configuration: MetricConfiguration
+) -> pd.Series:
+    return left.add(right, fill_value=0)
+
+
+def _finalize_value_counts(
+    value_counts: Optional[pd.Series], metric_configuration: MetricConfiguration
+) -> pd.Series:
+    if value_counts is None:
+        value_counts = pd.Series(dtype=np.int64)
+
+    value_counts = value_counts.astype(np.int64)
+    if (metric_configuration.metric_value_kwargs.get("sort") or "value") == "value":
+        try:
+            value_counts = value_counts.sort_index()
+        except TypeError:
+            # Values of multiple types (e.g., strings and floats) are not comparable.
+            value_counts.index = value_counts.index.astype(str)
+            value_counts = value_counts.sort_index()
+
+    value_counts.name = "count"
+    value_counts.index.name = "value"
+    return value_counts
+
+
+def _get_table_head_limit(metric_configuration: MetricConfiguration) -> Optional[int]:
+    metric_value_kwargs: dict = metric_configuration.metric_value_kwargs
+    if metric_value_kwargs.get("fetch_all"):
+        return None
+
+    n_rows: Optional[int] = metric_value_kwargs.get("n_rows")
+    return 5 if n_rows is None else n_rows
+
+
+def _table_head_partial(chunk: MetricChunk) -> pd.DataFrame:
+    limit: Optional[int] = _get_table_head_limit(metric_configuration=chunk.metric_configuration)
+    if limit is not None and limit < 0:
+        raise gx_exceptions.ChunkedBatchDataError(  # noqa: TRY003
+            '"table.head" with negative "n_rows" requires entire Batch and cannot be merged across chunks.'  # noqa: E501
+        )
+
+    return chunk.value()
+
+
+def _merge_table_heads(
+    left: pd.DataFrame, right: pd.DataFrame, metric_configuration: MetricConfiguration
+) -> pd.DataFrame:
+    limit: Optional[int] = _get_table_head_limit(metric_configuration=metric_configuration)
+    if limit is not None and len(left) >= limit:
+        return left
+
+    return pd.concat([left, right]).iloc[:limit]
+
+
+def _mean_partial(chunk: MetricChunk) -> tuple:
+    column: pd.Series = chunk.column().dropna().astype(np.float64)
+    return len(column), float(column.sum())
+
+
+def _merge_means(left: tuple, right: tuple, metric_configuration: MetricConfiguration) -> tuple:
+    return left[0] + right[0], left[1] + right[1]
+
+
+def _finalize_mean(partial: tuple, metric_configuration: MetricConfiguration) -> float:
+    count, total = partial
+    return total / count if count else np.nan
+
+
+def _standard_deviation_partial(chunk: MetricChunk) -> tuple:
+    column: pd.Series = chunk.column().dropna().astype(np.float64)
+    if len(column) == 0:
+        return 0, 0.0, 0.0
+
+    mean: float = float(column.mean())
+    return len(column), mean, float(((column - mean) ** 2).sum())
+
+
+def _merge_standard_deviations(
+    left: tuple, right: tuple, metric_configuration: MetricConfiguration
+) -> tuple:
+    # Parallel variance algorithm (Chan et al.), combining counts, means, and squared deviations.
+    left_count, left_mean, left_m2 = left
+    right_count, right_mean, right_m2 = right
+    count: int = left_count + right_count
+    if count == 0:
+        return 0, 0.0, 0.0
+
+    delta: float = right_mean - left_mean
+    return (
+        count,
+        left_mean + delta * right_count / count,
+        left_m2 + right_m2 + delta**2 * left_count * right_count / count,
+    )
+
+
+def _finalize_standard_deviation(
+    partial: tuple, metric_configuration: MetricConfiguration
+) -> float:
+    count, _, m2 = partial
+    return math.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+
+def _distinct_count_partial(chunk: MetricChunk) -> DistinctCountSketch:
+    return DistinctCountSketch.from_series(series=chunk.column())
+
+
+def _finalize_distinct_count(
+    sketch: Optional[DistinctCountSketch], metric_configuration: MetricConfiguration
+) -> int:
+    return 0 if sketch is None else sketch.estimate()
+
+
+def _quantile_partial(chunk: MetricChunk) -> QuantileSketch:
+    return QuantileSketch.from_series(series=chunk.column())
+
+
+def _finalize_quantile_values(
+    sketch: Optional[QuantileSketch], metric_configuration: MetricConfiguration
+) -> list:
+    metric_value_kwargs: dict = metric_configuration.metric_value_kwargs
+    interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
+    allow_relative_error = metric_value_kwargs.get("allow_relative_error") or "nearest"
+    if allow_relative_error not in interpolation_options:
+        raise ValueError(  # noqa: TRY003
+            f"If specified for pandas, allow_relative_error must be one an allowed value for the 'interpolation'"  # noqa: E501
+            f"parameter of .quantile() (one of {interpolation_options})"
+        )
+
+    sketch = sketch or QuantileSketch()
+    return sketch.quantiles(
+        quantiles=metric_value_kwargs["quantiles"], interpolation=allow_relative_error
+    )
+
+
+def _finalize_median(
+    sketch: Optional[QuantileSketch], metric_configuration: MetricConfiguration
+) -> Any:
+    return (sketch or QuantileSketch()).median()
+
+
+_SUM = MergeableMetric(merge=_merge_sum, empty=0)
+_MIN = MergeableMetric(merge=_merge_min)
+_MAX = MergeableMetric(merge=_merge_max)
+
+register_mergeable_metric("table.row_count", _SUM)
+# Column types are those of first chunk (pass "dtype" reader option to fix types of every chunk).
+register_mergeable_metric("table.column_types", MergeableMetric(merge=_merge_first))
+register_mergeable_metric(
+    "table.head", MergeableMetric(partial=_table_head_partial, merge=_merge_table_heads)
+)
+register_mergeable_metric("column.min", _MIN)
+register_mergeable_metric("column.max", _MAX)
+register_mergeable_metric("column.sum", _SUM)
+register_mergeable_metric("column_values.between.count", _SUM)
+register_mergeable_metric("column_values.length.min", _MIN)
+register_mergeable_metric("column_values.length.max", _MAX)
+register_mergeable_metric(
+    "column.mean",
+    MergeableMetric(
+        partial=_mean_partial, merge=_merge_means, finalize=_finalize_mean, empty=(0, 0.0)
+    ),
+)
+register_mergeable_metric(
+    "column.standard_deviation",
+    MergeableMetric(
+        partial=_standard_deviation_partial,
+        merge=_merge_standard_deviations,
+        finalize=_finalize_standard_deviation,
+        empty=(0, 0.0, 0.0),
+    ),
+)
+register_mergeable_metric(
+    "column.value_counts",
+    MergeableMetric(merge=_merge_value_counts, finalize=_finalize_value_counts),
+)
+register_mergeable_metric("column.histogram", MergeableMetric(merge=_merge_histograms))
+register_mergeable_metric("column.distinct_values", MergeableMetric(merge=_merge_sets, empty=set()))
+register_mergeable_metric(
+    "column.distinct_values.count",
+    MergeableMetric(
+        partial=_distinct_count_partial,
+        merge=_merge_sketches,
+        finalize=_finalize_distinct_count,
+    ),
+)
+register_mergeable_metric(
+    "column.quantile_values",
+    MergeableMetric(
+        partial=_quantile_partial,
+        merge=_merge_sketches,
+        finalize=_finalize_quantile_values,
+    ),
+)
+register_mergeable_metric(
+    "column.median",
+    MergeableMetric(partial=_quantile_partial, merge=_merge_sketches, finalize=_finalize_median),
+)
+register_mergeable_metric(
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value, _SUM, name_suffix=True
+)
+register_mergeable_metric(
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value,
+    MergeableMetric(merge=_merge_unexpected_list, empty=[]),
+    name_suffix=True,
+)
+register_mergeable_metric(
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value,
+    MergeableMetric(merge=_merge_unexpected_list, empty=[]),
+    name_suffix=True,
+)
+register_mergeable_metric(
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value,
+    MergeableMetric(
+        partial=_unexpected_index_query_partial,
+        merge=_merge_unexpected_index_queries,
+        finalize=_finalize_unexpected_index_query,
+        empty=[],
+    ),
+    name_suffix=True,
+)
+register_mergeable_metric(
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value,
+    MergeableMetric(merge=_merge_unexpected_rows),
+    name_suffix=True,
+)
+
+# Values are compared with those of other rows (of entire Batch), e.g., for duplicates or ordering.
+register_cross_row_map_metric("column_values.unique")
+register_cross_row_map_metric("column_values.increasing")
+register_cross_row_map_metric("column_values.decreasing")
+register_cross_row_map_metric("compound_columns.count")
+register_cross_row_map_metric("compound_columns.unique")
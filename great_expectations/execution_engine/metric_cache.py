@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import pickle
+import sys
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypeSuffixes
+from great_expectations.execution_engine.bounded_lru_cache import BoundedLRUCache
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+_MetricKey = Tuple[str, str, str]
+
+_NON_PERSISTABLE_METRIC_NAME_SUFFIXES: Tuple[str, ...] = tuple(
+    f".{suffix.value}" for suffix in MetricPartialFunctionTypeSuffixes
+)
+
+
+class MetricCache(ABC):
+    """Interface for caches of resolved metric values, keyed by "MetricConfiguration.id".
+
+    Besides the metric identifier, every entry may carry the ID of the Batch the metric was computed on (so that all
+    entries of a Batch can be invalidated when its data is reloaded) and the fingerprint of that Batch's content (so
+    that implementations can share values across ExecutionEngine instances and runs for unchanged data).
+    """  # noqa: E501
+
+    # If set, ExecutionEngine computes Batch fingerprints and looks up metrics before computing.
+    uses_batch_fingerprints: bool = False
+
+    @abstractmethod
+    def get(
+        self,
+        metric_id: _MetricKey,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+        default: Any = None,
+    ) -> Any:
+        """Returns cached value of metric (or "default", if metric is not in cache)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(
+        self,
+        metric_id: _MetricKey,
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+    ) -> None:
+        """Adds resolved value of metric to cache (possibly evicting other entries)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_batch(self, batch_id: str) -> None:
+        """Removes all in-memory entries, computed on Batch with specified ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all in-memory entries."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, metric_id: _MetricKey) -> bool:
+        sentinel = object()
+        return self.get(metric_id=metric_id, default=sentinel) is not sentinel
+
+    def __getitem__(self, metric_id: _MetricKey) -> MetricValue:
+        sentinel = object()
+        value = self.get(metric_id=metric_id, default=sentinel)
+        if value is sentinel:
+            raise KeyError(metric_id)
+
+        return value
+
+    def __setitem__(self, metric_id: _MetricKey, value: MetricValue) -> None:
+        self.put(metric_id=metric_id, value=value)
+
+    def update(self, metrics: Mapping[_MetricKey, MetricValue]) -> None:
+        metric_id: _MetricKey
+        value: MetricValue
+        for metric_id, value in metrics.items():
+            self.put(metric_id=metric_id, value=value)
+
+
+class NoOpMetricCache(MetricCache):
+    """MetricCache that does not retain anything (used when caching is disabled)."""
+
+    def get(
+        self,
+        metric_id: _MetricKey,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+        default: Any = None,
+    ) -> Any:
+        return default
+
+    def put(
+        self,
+        metric_id: _MetricKey,
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+    ) -> None:
+        return None
+
+    def invalidate_batch(self, batch_id: str) -> None:
+        return None
+
+    def clear(self) -> None:
+        return None
+
+    def __len__(self) -> int:
+        return 0
+
+
+@dataclass(frozen=True)
+class _MetricCacheEntry:
+    value: Any
+    batch_id: Optional[str]
+    batch_fingerprint: Optional[str]
+
+
+class InMemoryMetricCache(MetricCache):
+    """Least-recently-used in-memory MetricCache, optionally bounded by number of entries and/or memory budget.
+
+    Args:
+        max_entries: maximum number of cached metric values (default is no limit).
+        max_memory_bytes: approximate memory budget for cached metric values (default is no limit); sizes of pandas
+            and NumPy objects are measured exactly, sizes of other objects are estimated.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+    ) -> None:
+        self._entries: BoundedLRUCache[_MetricKey, _MetricCacheEntry] = BoundedLRUCache(
+            max_entries=max_entries, max_memory_bytes=max_memory_bytes
+        )
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._entries.max_entries
+
+    @property
+    def max_memory_bytes(self) -> Optional[int]:
+        return self._entries.max_memory_bytes
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory currently used by cached metric values."""
+        return self._entries.memory_bytes
+
+    def get(
+        self,
+        metric_id: _MetricKey,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+        default: Any = None,
+    ) -> Any:
+        entry: Optional[_MetricCacheEntry] = self._entries.get(metric_id)
+        if entry is None or (
+            batch_fingerprint is not None
+            and entry.batch_fingerprint is not None
+            and entry.batch_fingerprint != batch_fingerprint
+        ):
+            return default
+
+        return entry.value
+
+    def put(
+        self,
+        metric_id: _MetricKey,
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+    ) -> None:
+        size: int = _get_metric_value_size(value=value) if self.max_memory_bytes else 0
+        if not self._entries.put(
+            key=metric_id,
+            value=_MetricCacheEntry(
+                value=value, batch_id=batch_id, batch_fingerprint=batch_fingerprint
+            ),
+            size=size,
+        ):
+            logger.debug(f"Metric {metric_id!s} exceeds memory budget of cache; not caching it.")
+
+    def invalidate_batch(self, batch_id: str) -> None:
+        self._entries.remove_if(lambda metric_id, entry: entry.batch_id == batch_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FilesystemMetricCache(InMemoryMetricCache):
+    """InMemoryMetricCache that also persists metric values of fingerprinted Batches to local directory.
+
+    Values are stored under "<base_directory>/<batch_fingerprint>/", so that re-validating Batch with unchanged content
+    (e.g., same "pandas_data_fingerprint", or same SQL table and partition) reuses metric values computed by earlier
+    runs.  Only summary metric values are persisted; partial functions (map, condition, and aggregate metrics) are not.
+
+    Values are serialized with "pickle"; therefore, "base_directory" must only be writable by trusted users.
+
+    Args:
+        base_directory: directory, in which persisted metric values are stored.
+        max_entries: maximum number of in-memory cached metric values (default is no limit).
+        max_memory_bytes: approximate in-memory memory budget for cached metric values (default is no limit).
+    """  # noqa: E501
+
+    uses_batch_fingerprints: bool = True
+
+    def __init__(
+        self,
+        base_directory: Union[str, os.PathLike],
+        max_entries: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+    ) -> None:
+        super().__init__(max_entries=max_entries, max_memory_bytes=max_memory_bytes)
+        self._base_directory = pathlib.Path(base_directory)
+
+    @property
+    def base_directory(self) -> pathlib.Path:
+        return self._base_directory
+
+    def get(
+        self,
+        metric_id: _MetricKey,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+        default: Any = None,
+    ) -> Any:
+        sentinel = object()
+        value = super().get(
+            metric_id=metric_id, batch_fingerprint=batch_fingerprint, default=sentinel
+        )
+        if value is not sentinel:
+            return value
+
+        if batch_fingerprint is None:
+            return default
+
+        path: pathlib.Path = self._get_path(
+            metric_id=metric_id, batch_fingerprint=batch_fingerprint
+        )
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception as e:
+            logger.warning(f"Unable to read persisted value of metric {metric_id!s}: {e!s}")
+            return default
+
+        super().put(
+            metric_id=metric_id,
+            value=value,
+            batch_id=batch_id,
+            batch_fingerprint=batch_fingerprint,
+        )
+        return value
+
+    def put(
+        self,
+        metric_id: _MetricKey,
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+        batch_fingerprint: Optional[str] = None,
+    ) -> None:
+        super().put(
+            metric_id=metric_id,
+            value=value,
+            batch_id=batch_id,
+            batch_fingerprint=batch_fingerprint,
+        )
+
+        if batch_fingerprint is None or not _is_persistable_metric(metric_id=metric_id):
+            return
+
+        path: pathlib.Path = self._get_path(
+            metric_id=metric_id, batch_fingerprint=batch_fingerprint
+        )
+        try:
+            payload: bytes = pickle.dumps(value)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary file first, so that concurrent readers never observe partial file.
+            temp_path: pathlib.Path = path.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            temp_path.write_bytes(payload)
+            temp_path.replace(path)
+        except Exception as e:
+            logger.debug(f"Unable to persist value of metric {metric_id!s}: {e!s}")
+
+    def _get_path(self, metric_id: _MetricKey, batch_fingerprint: str) -> pathlib.Path:
+        key: str = hashlib.md5(json.dumps(list(metric_id)).encode("utf-8")).hexdigest()
+        return self._base_directory / batch_fingerprint / f"{key}.pkl"
+
+
+def _is_persistable_metric(metric_id: _MetricKey) -> bool:
+    metric_name: str = metric_id[0]
+    return not metric_name.endswith(_NON_PERSISTABLE_METRIC_NAME_SUFFIXES)
+
+
+def _get_metric_value_size(value: Any) -> int:
+    """Returns approximate number of bytes held by metric value."""
+    if hasattr(value, "memory_usage") and callable(value.memory_usage):
+        try:
+            usage = value.memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        except Exception:
+            pass
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size: int = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            _get_metric_value_size(key) + _get_metric_value_size(element)
+            for key, element in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_get_metric_value_size(element) for element in value)
+
+    return size
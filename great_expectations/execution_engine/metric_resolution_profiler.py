@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from great_expectations.core.util import convert_to_json_serializable
+
+if TYPE_CHECKING:
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+_MetricKey = Tuple[str, str, str]
+
+T = TypeVar("T")
+
+WAVE_SPAN_NAME = "gx.metrics.wave"
+COMPUTATION_SPAN_NAME = "gx.metrics.computation"
+
+
+@dataclass
+class MetricSpan:
+    """Finished span of metric resolution work, modeled after OpenTelemetry spans.
+
+    Span hooks receive every span once it has ended, and can forward it to any tracing backend (e.g., by starting and
+    ending an OpenTelemetry span with "start_time=start_time_ns" and "end_time=end_time_ns").  Computation spans are
+    children of their wave span (or of enclosing computation span, if engine profiles nested computations).
+    """  # noqa: E501
+
+    name: str
+    span_id: str
+    parent_span_id: Optional[str]
+    start_time_ns: int
+    end_time_ns: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+
+MetricSpanHook = Callable[[MetricSpan], None]
+
+
+@dataclass
+class MetricResolutionRecord:
+    """How (and how quickly) one metric was resolved in one wave of "ValidationGraph" resolution.
+
+    For bundled metrics, "compute_seconds" and "queries" are those of entire bundle (all metrics, computed together by
+    single query); "bundle_size" tells how many metrics share them.
+    """  # noqa: E501
+
+    metric_id: _MetricKey
+    metric_name: str
+    engine: str
+    wave: int
+    cache_hit: bool
+    bundled: bool
+    bundle_size: int
+    compute_seconds: float
+    queries: List[str]
+    success: bool
+
+    def to_json_dict(self) -> dict:
+        return {
+            "metric_id": list(self.metric_id),
+            "metric_name": self.metric_name,
+            "engine": self.engine,
+            "wave": self.wave,
+            "cache_hit": self.cache_hit,
+            "bundled": self.bundled,
+            "bundle_size": self.bundle_size,
+            "compute_seconds": self.compute_seconds,
+            "queries": self.queries,
+            "success": self.success,
+        }
+
+
+@dataclass
+class _ComputationFrame:
+    span_id: str
+    queries: List[str] = field(default_factory=list)
+
+
+class MetricResolutionProfiler:
+    """Opt-in profiler of metric resolution, attached to ExecutionEngine (see "ExecutionEngine.metric_resolution_profiler").
+
+    While attached, ExecutionEngine records, for every metric it resolves, compute time, engine, bundling, cache hit or
+    miss, wave number, and SQL text (or Spark plan) issued; Validator aggregates these records per Expectation and adds
+    them to "meta" of ExpectationSuiteValidationResult.  Every wave and computation is also reported to span hooks.
+
+    Args:
+        span_hooks: callables, each receiving every finished "MetricSpan"; exceptions they raise are logged and ignored.
+        record_queries: if False, SQL text and Spark plans are neither rendered nor recorded.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        span_hooks: Optional[Sequence[MetricSpanHook]] = None,
+        record_queries: bool = True,
+    ) -> None:
+        self._span_hooks: List[MetricSpanHook] = list(span_hooks or [])
+        self._record_queries = record_queries
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self._wave: int = 0
+        self._wave_span_id: Optional[str] = None
+        self._records: Dict[Tuple[int, _MetricKey], MetricResolutionRecord] = {}
+        self._expectations: List[Tuple[ExpectationConfiguration, List[_MetricKey]]] = []
+
+    @property
+    def record_queries(self) -> bool:
+        return self._record_queries
+
+    @property
+    def waves(self) -> int:
+        return self._wave
+
+    @property
+    def records(self) -> List[MetricResolutionRecord]:
+        with self._lock:
+            return list(self._records.values())
+
+    def reset(self) -> None:
+        """Discards all records (span hooks are kept)."""
+        with self._lock:
+            self._wave = 0
+            self._wave_span_id = None
+            self._records = {}
+            self._expectations = []
+
+    @contextmanager
+    def wave(self, engine: str, metrics_to_resolve: Sequence[MetricConfiguration]) -> Iterator[int]:
+        """Delimits one "ExecutionEngine.resolve_metrics()" call (one wave of graph resolution)."""
+        with self._lock:
+            self._wave += 1
+            wave: int = self._wave
+
+        span_id: str = _new_span_id()
+        self._wave_span_id = span_id
+        start_time_ns: int = time.time_ns()
+        try:
+            yield wave
+        finally:
+            self._wave_span_id = None
+            self._emit(
+                MetricSpan(
+                    name=WAVE_SPAN_NAME,
+                    span_id=span_id,
+                    parent_span_id=None,
+                    start_time_ns=start_time_ns,
+                    end_time_ns=time.time_ns(),
+                    attributes={
+                        "gx.engine": engine,
+                        "gx.wave": wave,
+                        "gx.metrics.count": len(metrics_to_resolve),
+                    },
+                )
+            )
+
+    def record_cache_hits(
+        self, engine: str, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            self._add_record(
+                MetricResolutionRecord(
+                    metric_id=metric_configuration.id,
+                    metric_name=metric_configuration.metric_name,
+                    engine=engine,
+                    wave=self._wave,
+                    cache_hit=True,
+                    bundled=False,
+                    bundle_size=1,
+                    compute_seconds=0.0,
+                    queries=[],
+                    success=True,
+                )
+            )
+
+    @contextmanager
+    def computation(
+        self,
+        engine: str,
+        metric_configurations: Sequence[MetricConfiguration],
+        bundled: bool,
+    ) -> Iterator[None]:
+        """Times computation of given metrics (on current thread), collecting queries issued while it runs.
+
+        Computations may nest (e.g., engine profiling its per-Domain queries inside bundle); a metric is recorded by
+        innermost computation that covers it.
+        """  # noqa: E501
+        stack: List[_ComputationFrame] = self._get_stack()
+        parent_span_id: Optional[str] = stack[-1].span_id if stack else self._wave_span_id
+        frame = _ComputationFrame(span_id=_new_span_id())
+        stack.append(frame)
+
+        success: bool = False
+        start_time_ns: int = time.time_ns()
+        try:
+            yield
+            success = True
+        finally:
+            end_time_ns: int = time.time_ns()
+            stack.pop()
+            if stack:
+                # Enclosing computation may run on other thread (see "bind_to_current_span()").
+                with self._lock:
+                    stack[-1].queries.extend(frame.queries)
+
+            compute_seconds: float = (end_time_ns - start_time_ns) / 1e9
+            metric_configuration: MetricConfiguration
+            for metric_configuration in metric_configurations:
+                self._add_record(
+                    MetricResolutionRecord(
+                        metric_id=metric_configuration.id,
+                        metric_name=metric_configuration.metric_name,
+                        engine=engine,
+                        wave=self._wave,
+                        cache_hit=False,
+                        bundled=bundled,
+                        bundle_size=len(metric_configurations),
+                        compute_seconds=compute_seconds,
+                        queries=list(frame.queries),
+                        success=success,
+                    ),
+                    replace=False,
+                )
+
+            self._emit(
+                MetricSpan(
+                    name=COMPUTATION_SPAN_NAME,
+                    span_id=frame.span_id,
+                    parent_span_id=parent_span_id,
+                    start_time_ns=start_time_ns,
+                    end_time_ns=end_time_ns,
+                    attributes={
+                        "gx.engine": engine,
+                        "gx.wave": self._wave,
+                        "gx.bundled": bundled,
+                        "gx.metric.names": sorted(
+                            {
+                                metric_configuration.metric_name
+                                for metric_configuration in metric_configurations
+                            }
+                        ),
+                        "gx.metrics.count": len(metric_configurations),
+                        "gx.queries": list(frame.queries),
+                        "gx.success": success,
+                    },
+                )
+            )
+
+    def record_query(self, query: Callable[[], Optional[str]]) -> None:
+        """Attributes query (SQL text or Spark plan) to computation, running on current thread.
+
+        Query text is passed as callable, so that it is only rendered if profiler records queries and computation is
+        being profiled.
+        """  # noqa: E501
+        if not self._record_queries:
+            return
+
+        stack: List[_ComputationFrame] = self._get_stack()
+        if not stack:
+            return
+
+        try:
+            query_text: Optional[str] = query()
+        except Exception as e:
+            logger.debug(f"Unable to render query for metric resolution profile: {e!s}")
+            return
+
+        if query_text:
+            with self._lock:
+                stack[-1].queries.append(query_text)
+
+    def bind_to_current_span(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wraps callable, so that work it profiles on another thread (e.g., of thread pool) is child of current span.
+
+        Computations of wrapped callable become children of computation running on current thread (or of current
+        wave), and queries issued by it are also attributed to that computation, as they would be if it ran here.
+        """  # noqa: E501
+        parent_stack: List[_ComputationFrame] = list(self._get_stack())
+
+        def _run_in_current_span(*args, **kwargs) -> T:
+            previous_stack: Optional[List[_ComputationFrame]] = getattr(self._local, "stack", None)
+            self._local.stack = list(parent_stack)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._local.stack = previous_stack
+
+        return _run_in_current_span
+
+    def add_expectation(
+        self, configuration: ExpectationConfiguration, metric_ids: Iterable[_MetricKey]
+    ) -> None:
+        """Registers metrics, which Expectation depends on, so that records can be aggregated per Expectation."""  # noqa: E501
+        with self._lock:
+            self._expectations.append((configuration, list(dict.fromkeys(metric_ids))))
+
+    def get_expectation_profiles(self) -> List[dict]:
+        """Aggregates records per registered Expectation.
+
+        Metrics, shared by several Expectations, count towards each of them.
+        """
+        records_by_metric_id: Dict[_MetricKey, List[MetricResolutionRecord]] = defaultdict(list)
+
+        record: MetricResolutionRecord
+        for record in self.records:
+            records_by_metric_id[record.metric_id].append(record)
+
+        expectation_profiles: List[dict] = []
+
+        configuration: ExpectationConfiguration
+        metric_ids: List[_MetricKey]
+        records: List[MetricResolutionRecord]
+        for configuration, metric_ids in self._expectations:
+            records = [
+                record for metric_id in metric_ids for record in records_by_metric_id[metric_id]
+            ]
+            expectation_profiles.append(
+                {
+                    "expectation_type": configuration.expectation_type,
+                    "id": configuration.id,
+                    "domain_kwargs": convert_to_json_serializable(
+                        data={
+                            key: value
+                            for key, value in configuration.get_domain_kwargs().items()
+                            if key != "batch_id" and value is not None
+                        }
+                    ),
+                    "metrics": len(metric_ids),
+                    "computed_metrics": sum(1 for record in records if not record.cache_hit),
+                    "cache_hits": sum(1 for record in records if record.cache_hit),
+                    "bundled_metrics": sum(1 for record in records if record.bundled),
+                    "failed_metrics": sum(1 for record in records if not record.success),
+                    "compute_seconds": sum(record.compute_seconds for record in records),
+                    "queries": sum(len(record.queries) for record in records),
+                    "waves": sorted({record.wave for record in records}),
+                }
+            )
+
+        return expectation_profiles
+
+    def to_json_dict(self) -> dict:
+        records: List[MetricResolutionRecord] = self.records
+        return {
+            "waves": self._wave,
+            "total_compute_seconds": sum(
+                record.compute_seconds for record in records if not record.cache_hit
+            ),
+            "cache_hits": sum(1 for record in records if record.cache_hit),
+            "expectations": self.get_expectation_profiles(),
+            "metrics": [record.to_json_dict() for record in records],
+        }
+
+    def _add_record(self, record: MetricResolutionRecord, replace: bool = True) -> None:
+        key: Tuple[int, _MetricKey] = (record.wave, record.metric_id)
+        with self._lock:
+            if replace or key not in self._records:
+                self._records[key] = record
+
+    def _get_stack(self) -> List[_ComputationFrame]:
+        stack: Optional[List[_ComputationFrame]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+
+        return stack
+
+    def _emit(self, span: MetricSpan) -> None:
+        span_hook: MetricSpanHook
+        for span_hook in self._span_hooks:
+            try:
+                span_hook(span)
+            except Exception as e:
+                logger.warning(f'Span hook failed on span "{span.name}": {e!s}')
+
+
+def _new_span_id() -> str:
+    return uuid.uuid4().hex[:16]
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from typing import Callable, Collection, Iterator, List, Optional, Set
 
-from great_expectations.core.batch import BatchData
+import pandas as pd
 
-if TYPE_CHECKING:
-    import pandas as pd
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.batch import BatchData
 
 
 class PandasBatchData(BatchData):
@@ -16,3 +17,121 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class ChunkedPandasBatchData(PandasBatchData):
+    """Batch data that is never held in memory as a whole, but is read (anew, on every pass) in chunks of rows.
+
+    While chunks are being iterated over, "dataframe" is the current chunk, so that metric functions, evaluated by
+    "PandasExecutionEngine" on every chunk, read it as they would read entire DataFrame.  Outside of iteration,
+    accessing "dataframe" raises "ChunkedBatchDataError".
+
+    Args:
+        execution_engine: "PandasExecutionEngine" that reads Batch data.
+        chunk_reader: callable, returning new iterator over DataFrame chunks (in order) every time it is called.
+        chunk_size: number of rows per chunk (last chunk may be shorter).
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader: Callable[[], Iterator[pd.DataFrame]],
+        chunk_size: int,
+    ) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type]
+        self._chunk_reader = chunk_reader
+        self._chunk_size = chunk_size
+        self._current_chunk: Optional[pd.DataFrame] = None
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def dataframe(self):
+        if self._current_chunk is None:
+            raise gx_exceptions.ChunkedBatchDataError(  # noqa: TRY003
+                "Batch data is read in chunks and cannot be accessed as a single DataFrame; only metrics, whose "  # noqa: E501
+                "partial results can be merged across chunks, can be computed on it."
+            )
+
+        return self._current_chunk
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Reads Batch data from its source, one chunk at a time; each chunk is "dataframe" until next one is read."""  # noqa: E501
+        chunk: pd.DataFrame
+        try:
+            for chunk in self._chunk_reader():
+                self._current_chunk = chunk
+                yield chunk
+                self._current_chunk = None
+        finally:
+            self._current_chunk = None
+
+
+class ProjectedPandasBatchData(PandasBatchData):
+    """Batch data that is read from its source when first accessed, limited to columns that validation needs.
+
+    Before metrics are resolved, "PandasExecutionEngine" sets (see "project()") columns that they compute over; then
+    "dataframe" holds at least these columns (or all columns, if no projection is set).  Data read is kept across
+    projections: it is reused for narrower projections, and only missing columns are read for wider ones.
+
+    Args:
+        execution_engine: "PandasExecutionEngine" that reads Batch data.
+        reader: callable, reading DataFrame with given columns (all columns, if None) from source of Batch data.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        execution_engine,
+        reader: Callable[[Optional[List[str]]], pd.DataFrame],
+    ) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type]
+        self._reader = reader
+        self._columns: Optional[Set[str]] = None
+        # Columns requested from reader so far (None, if all columns are read); columns missing from
+        # file are included, so that they are not requested again.
+        self._read_columns: Optional[Set[str]] = None
+        # Metrics may be resolved concurrently; data is read only once.
+        self._lock = threading.Lock()
+
+    @property
+    def columns(self) -> Optional[Set[str]]:
+        """Names of projected columns (None, if all columns are needed)."""
+        return self._columns
+
+    def project(self, columns: Optional[Collection[str]]) -> None:
+        """Limits Batch data to given columns (all columns, if None); it is read on next access."""
+        with self._lock:
+            self._columns = None if columns is None else set(columns)
+
+    @property
+    def dataframe(self):
+        with self._lock:
+            if self._dataframe is None:
+                self._dataframe = self._reader(
+                    None if self._columns is None else sorted(self._columns)
+                )
+                self._read_columns = self._columns
+            elif self._read_columns is not None:
+                if self._columns is None:
+                    self._dataframe = self._reader(None)
+                    self._read_columns = None
+                elif not self._columns <= self._read_columns:
+                    self._dataframe = self._read_missing_columns(
+                        columns=self._columns - self._read_columns
+                    )
+                    self._read_columns = self._read_columns | self._columns
+
+            return self._dataframe
+
+    def _read_missing_columns(self, columns: Set[str]) -> pd.DataFrame:
+        """Adds given columns (those of them, which exist in file) to data read so far."""
+        df: pd.DataFrame = self._reader(sorted(columns))
+        # Reader reads some column, even if none of given columns exists in file.
+        df = df[[column for column in df.columns if column not in self._dataframe.columns]]
+        if df.columns.empty:
+            return self._dataframe
+
+        # Projection is only applied if rows do not depend on columns, so that rows line up.
+        return pd.concat([self._dataframe, df], axis=1)
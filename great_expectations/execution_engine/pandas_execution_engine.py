@@ -1,29 +1,45 @@
 from __future__ import annotations
 
+import copy
 import datetime
 import hashlib
+import io
+import itertools
 import logging
+import pathlib
 import pickle
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
 from io import BytesIO
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
+    Deque,
     Dict,
+    Hashable,
     Iterable,
+    Iterator,
+    List,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
-from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility import aws, azure, google, pyarrow
+from great_expectations.compatibility.not_imported import is_version_less_than
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
@@ -34,21 +50,39 @@ from great_expectations.core.batch_spec import (
     BatchSpec,
     FabricBatchSpec,
     GCSBatchSpec,
+    MultiPathBatchSpec,
     PandasBatchSpec,
     PandasBatchSpecProtocol,
     PathBatchSpec,
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
-from great_expectations.core.metric_domain_types import (
-    MetricDomainTypes,  # noqa: TCH001
-)
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.domain_records_cache import (
+    DEFAULT_DOMAIN_RECORDS_CACHE_MAX_MEMORY_BYTES,
+    DomainRecordsCache,
+    DomainRecordsKey,
+)
 from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,  # noqa: TCH001
     PartitionDomainKwargs,  # noqa: TCH001
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.mergeable_metrics import (
+    DeferredChunkMetricValue,
+    MergeableMetric,
+    MetricChunk,
+    get_mergeable_metric,
+    is_cross_row_map_metric,
+    is_deferred_chunk_metric,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+    ProjectedPandasBatchData,
+)
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
@@ -59,6 +93,8 @@ from great_expectations.execution_engine.partition_and_sample.pandas_data_sample
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +102,83 @@ HASH_THRESHOLD = 1e9
 
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
+# Pandas reader methods, which return iterator over DataFrame chunks, given "chunksize" option.
+CHUNKED_READER_METHODS = (
+    "read_csv",
+    "read_table",
+    "read_fwf",
+    "read_json",
+    "read_sas",
+    "read_stata",
+    "read_sql",
+    "read_sql_query",
+    "read_sql_table",
+)
+
+# Pandas reader methods, which read file sequentially (e.g., "read_parquet" seeks within file).
+STREAMING_READER_METHODS = (
+    "read_csv",
+    "read_table",
+    "read_fwf",
+    "read_json",
+)
+
+# Pandas reader methods, which stop reading file after "nrows" rows.
+ROW_LIMITED_READER_METHODS = (
+    "read_csv",
+    "read_table",
+    "read_fwf",
+)
+
+# Pandas reader methods, which can read only some columns of file (see "column_projection").
+PROJECTABLE_READER_METHODS = (
+    "read_csv",
+    "read_table",
+    "read_parquet",
+    "read_feather",
+)
+
+# Pandas reader methods of Arrow-based formats, whose local files can be memory-mapped.
+ARROW_FILE_READER_METHODS = (
+    "read_parquet",
+    "read_feather",
+)
+
+# Pandas reader methods, accepting "dtype_backend" option (pandas 2.0 or later).
+DTYPE_BACKEND_READER_METHODS = (
+    "read_csv",
+    "read_table",
+    "read_fwf",
+    "read_json",
+    "read_parquet",
+    "read_feather",
+    "read_orc",
+    "read_excel",
+    "read_html",
+    "read_xml",
+    "read_sql",
+    "read_sql_query",
+    "read_sql_table",
+)
+
+DTYPE_BACKENDS = ("pyarrow", "numpy_nullable")
+
+# "DataFrame.agg()" functions, whose results retain dtype of numeric column (batched separately
+# from others, such as "mean" and "std", so that integer results are not upcast to float).
+DTYPE_PRESERVING_AGGREGATE_FN_NAMES = ("min", "max", "sum")
+
+# "how" argument of "DataFrame.dropna()" per "ignore_row_if" directive value (None: keep all rows).
+_COLUMN_PAIR_IGNORE_ROW_IF_TO_DROPNA_HOW: Dict[str, Optional[str]] = {
+    "both_values_are_missing": "all",
+    "either_value_is_missing": "any",
+    "neither": None,
+}
+_MULTICOLUMN_IGNORE_ROW_IF_TO_DROPNA_HOW: Dict[str, Optional[str]] = {
+    "all_values_are_missing": "all",
+    "any_value_is_missing": "any",
+    "never": None,
+}
+
 
 @public_api
 class PandasExecutionEngine(ExecutionEngine):
@@ -115,6 +228,41 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        domain_records_cache_max_memory_bytes: Optional[int] = kwargs.pop(
+            "domain_records_cache_max_memory_bytes",
+            DEFAULT_DOMAIN_RECORDS_CACHE_MAX_MEMORY_BYTES,
+        )
+        # If set, file-based Batch data is read (on every pass over it) in chunks of this many rows.
+        chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+            raise ValueError(  # noqa: TRY003
+                f'"chunk_size" must be a positive integer or None (got "{chunk_size}").'
+            )
+
+        self._chunk_size = chunk_size
+
+        # If set, file-based Batch data is read lazily, limited to columns that validation needs.
+        column_projection: bool = kwargs.pop("column_projection", False)
+        self._column_projection = column_projection
+
+        # If set, DataFrames are read with nullable or Arrow-backed ("pyarrow") dtypes.
+        dtype_backend: Optional[str] = kwargs.pop("dtype_backend", None)
+        if dtype_backend is not None:
+            if dtype_backend not in DTYPE_BACKENDS:
+                raise ValueError(  # noqa: TRY003
+                    f'"dtype_backend" must be one of {", ".join(DTYPE_BACKENDS)} or None (got "{dtype_backend}").'  # noqa: E501
+                )
+            if is_version_less_than(pd.__version__, "2.0.0"):
+                raise ValueError(  # noqa: TRY003
+                    f'"dtype_backend" requires pandas 2.0.0 or later (installed: {pd.__version__}).'
+                )
+
+        self._dtype_backend = dtype_backend
+
+        # Row masks of filtered domain records (must exist before base class loads Batch data).
+        self._domain_records_cache = DomainRecordsCache(
+            max_memory_bytes=domain_records_cache_max_memory_bytes
+        )
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -130,6 +278,10 @@ class PandasExecutionEngine(ExecutionEngine):
                 "boto3_options": boto3_options,
                 "azure_options": azure_options,
                 "gcs_options": gcs_options,
+                "domain_records_cache_max_memory_bytes": domain_records_cache_max_memory_bytes,
+                "chunk_size": chunk_size,
+                "column_projection": column_projection,
+                "dtype_backend": dtype_backend,
             }
         )
 
@@ -182,6 +334,18 @@ class PandasExecutionEngine(ExecutionEngine):
         except (TypeError, AttributeError, google.DefaultCredentialsError):
             self._gcs = None
 
+    @property
+    def chunk_size(self) -> Optional[int]:
+        return self._chunk_size
+
+    @property
+    def column_projection(self) -> bool:
+        return self._column_projection
+
+    @property
+    def dtype_backend(self) -> Optional[str]:
+        return self._dtype_backend
+
     @override
     def configure_validator(self, validator) -> None:
         super().configure_validator(validator)
@@ -200,6 +364,8 @@ class PandasExecutionEngine(ExecutionEngine):
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"  # noqa: E501
             )
 
+        # Row masks computed on previously loaded data under same Batch ID are no longer valid.
+        self._domain_records_cache.invalidate_batch(batch_id=batch_id)
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
     @override
@@ -215,6 +381,17 @@ class PandasExecutionEngine(ExecutionEngine):
             }
         )
 
+        if self._chunk_size is not None and isinstance(
+            batch_spec, (PathBatchSpec, PandasBatchSpec)
+        ):
+            return self._get_chunked_batch_data(batch_spec=batch_spec), batch_markers
+
+        if self._column_projection and self._supports_column_projection(batch_spec=batch_spec):
+            return (
+                self._get_projected_batch_data(batch_spec=cast(PathBatchSpec, batch_spec)),
+                batch_markers,
+            )
+
         batch_data: Any
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
@@ -319,11 +496,10 @@ Bucket: {error}"""  # noqa: E501
 
         # Experimental datasources will go down this code path
         elif isinstance(batch_spec, PathBatchSpec):
-            reader_method = batch_spec.reader_method
-            reader_options = batch_spec.reader_options
-            path = batch_spec.path
-            reader_fn = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            df = self._read_file(batch_spec=batch_spec)
+
+        elif isinstance(batch_spec, MultiPathBatchSpec):
+            df = self._read_multi_path_batch_data(batch_spec=batch_spec)
 
         elif isinstance(batch_spec, PandasBatchSpec):
             reader_method = batch_spec.reader_method
@@ -349,8 +525,8 @@ Bucket: {error}"""  # noqa: E501
 
         else:
             raise gx_exceptions.BatchSpecError(  # noqa: TRY003
-                f"""batch_spec must be of type RuntimeDataBatchSpec, PandasBatchSpec, PathBatchSpec, S3BatchSpec, AzureBatchSpec or FabricBatchSpec \
-not {batch_spec.__class__.__name__}"""  # noqa: E501
+                f"""batch_spec must be of type RuntimeDataBatchSpec, PandasBatchSpec, PathBatchSpec, S3BatchSpec, AzureBatchSpec, MultiPathBatchSpec \
+or FabricBatchSpec not {batch_spec.__class__.__name__}"""  # noqa: E501
             )
 
         df = self._apply_partitioning_and_sampling_methods(batch_spec, df)  # type: ignore[arg-type]
@@ -383,6 +559,392 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
 
         return batch_data
 
+    def _get_chunked_batch_data(  # noqa: C901
+        self, batch_spec: Union[PathBatchSpec, PandasBatchSpec]
+    ) -> ChunkedPandasBatchData:
+        """Builds Batch data, which is read from its source in chunks of "chunk_size" rows on every pass over it.
+
+        Partitioning and sampling methods are applied to every chunk; "sample_using_limit" (first n rows of entire
+        Batch) is not supported.
+        """  # noqa: E501
+        if batch_spec.get("sampling_method") == "sample_using_limit":
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                'Sampling method "sample_using_limit" is not supported for Batch data read in chunks.'  # noqa: E501
+            )
+
+        chunk_size: int = cast(int, self._chunk_size)
+        reader_method: Optional[str] = batch_spec.reader_method
+        reader_options: dict = dict(batch_spec.reader_options or {})
+
+        path: Optional[str] = None
+        open_source: Optional[Callable[[], Any]] = None
+        if isinstance(batch_spec, PathBatchSpec):
+            path, open_source = self._get_file_source(
+                batch_spec=batch_spec, reader_options=reader_options
+            )
+
+        reader_method_name: str = (
+            reader_method or self.guess_reader_method_from_path(path)["reader_method"]  # type: ignore[arg-type]
+        )
+        if reader_method_name not in CHUNKED_READER_METHODS and not (
+            reader_method_name == "read_parquet" and open_source is not None
+        ):
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                f'Reader method "{reader_method_name}" cannot read data in chunks; chunked Batch data requires one of '  # noqa: E501
+                f'{", ".join(CHUNKED_READER_METHODS)} (or "read_parquet" of file).'
+            )
+
+        reader_fn: DataFrameFactoryFn = self._get_reader_fn(reader_method, path)
+
+        def read_chunks() -> Iterator[pd.DataFrame]:
+            source: Any = None
+            chunks: Iterable[pd.DataFrame]
+            if open_source is None:
+                chunks = execute_pandas_reader_fn(
+                    reader_fn, {**reader_options, "chunksize": chunk_size}
+                )
+            else:
+                source = open_source()
+                if reader_method_name == "read_parquet":
+                    chunks = _read_parquet_chunks(
+                        source=source,
+                        chunk_size=chunk_size,
+                        columns=reader_options.get("columns"),
+                    )
+                else:
+                    chunks = reader_fn(source, chunksize=chunk_size, **reader_options)
+
+            chunk: pd.DataFrame
+            try:
+                for chunk in chunks:
+                    yield self._apply_partitioning_and_sampling_methods(batch_spec, chunk)  # type: ignore[arg-type]
+            finally:
+                if hasattr(chunks, "close"):
+                    chunks.close()
+                if hasattr(source, "close"):
+                    source.close()
+
+        return ChunkedPandasBatchData(
+            execution_engine=self, chunk_reader=read_chunks, chunk_size=chunk_size
+        )
+
+    def _get_file_source(
+        self, batch_spec: PathBatchSpec, reader_options: dict
+    ) -> Tuple[str, Callable[[], Any]]:
+        """Returns path (for guessing reader method) of file and callable, opening file for streaming reads.
+
+        Cloud objects are opened as streams of their bodies (compression of S3 objects is inferred into given
+        "reader_options", unless specified); local files are "opened" as their paths, for readers to open them.
+        """  # noqa: E501
+        if isinstance(batch_spec, S3BatchSpec):
+            return self._get_s3_file_source(batch_spec=batch_spec, reader_options=reader_options)
+
+        if isinstance(batch_spec, AzureBatchSpec):
+            return self._get_azure_file_source(batch_spec=batch_spec)
+
+        if isinstance(batch_spec, GCSBatchSpec):
+            return self._get_gcs_file_source(batch_spec=batch_spec)
+
+        path: str = batch_spec.path
+
+        def open_source() -> Any:
+            return path
+
+        return path, open_source
+
+    def _get_s3_file_source(
+        self, batch_spec: S3BatchSpec, reader_options: dict
+    ) -> Tuple[str, Callable[[], Any]]:
+        if self._s3 is None:
+            self._instantiate_s3_client()
+        s3_engine = self._s3
+        s3_url = S3Url(batch_spec.path)
+        if "compression" not in reader_options.keys():
+            inferred_compression_param = sniff_s3_compression(s3_url)
+            if inferred_compression_param is not None:
+                reader_options["compression"] = inferred_compression_param
+
+        def open_source() -> Any:
+            try:
+                return s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)["Body"]  # type: ignore[attr-defined]
+            except (
+                aws.exceptions.ParamValidationError,
+                aws.exceptions.ClientError,
+            ) as error:
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                    f"""PandasExecutionEngine encountered the following error while trying to read data from S3 Bucket: {error}"""  # noqa: E501
+                )
+
+        return s3_url.key, open_source
+
+    def _get_azure_file_source(self, batch_spec: AzureBatchSpec) -> Tuple[str, Callable[[], Any]]:
+        if self._azure is None:
+            self._instantiate_azure_client()
+        if self._azure is None:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                """PandasExecutionEngine has been passed a AzureBatchSpec,
+                    but the ExecutionEngine does not have an Azure client configured. Please check your config."""  # noqa: E501
+            )
+        azure_url = AzureUrl(batch_spec.path)
+        blob_client = self._azure.get_blob_client(
+            container=azure_url.container, blob=azure_url.blob
+        )
+
+        def open_source() -> Any:
+            return io.BufferedReader(_ByteChunksReader(blob_client.download_blob().chunks()))
+
+        return azure_url.blob, open_source
+
+    def _get_gcs_file_source(self, batch_spec: GCSBatchSpec) -> Tuple[str, Callable[[], Any]]:
+        if self._gcs is None:
+            self._instantiate_gcs_client()
+        if self._gcs is None:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                """PandasExecutionEngine has been passed a GCSBatchSpec,
+                    but the ExecutionEngine does not have an GCS client configured. Please check your config."""  # noqa: E501
+            )
+        gcs_url = GCSUrl(batch_spec.path)
+        try:
+            gcs_blob = self._gcs.get_bucket(gcs_url.bucket).blob(gcs_url.blob)
+        except google.GoogleAPIError as error:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                f"""PandasExecutionEngine encountered the following error while trying to read data from GCS \
+Bucket: {error}"""  # noqa: E501
+            )
+
+        def open_source() -> Any:
+            return gcs_blob.open("rb")
+
+        return gcs_url.blob, open_source
+
+    def _read_multi_path_batch_data(self, batch_spec: MultiPathBatchSpec) -> pd.DataFrame:
+        """Reads files of Batch concurrently (by at most "max_workers" threads) and concatenates them in order.
+
+        At most "max_workers" files are being read (or held, awaiting concatenation) at any time; once "max_rows" rows
+        have been read, remaining files are not read.
+        """  # noqa: E501
+        file_batch_specs: List[PathBatchSpec] = self._get_file_batch_specs(batch_spec=batch_spec)
+        if not file_batch_specs:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                f'MultiPathBatchSpec has no files to read (paths: "{batch_spec.paths}", directory: "{batch_spec.directory}").'  # noqa: E501
+            )
+
+        # Cloud clients are instantiated once, before files are read by worker threads.
+        self._instantiate_cloud_clients(file_batch_specs=file_batch_specs)
+
+        frames: List[pd.DataFrame] = self._read_files_concurrently(
+            file_batch_specs=file_batch_specs,
+            max_workers=batch_spec.max_workers,
+            max_rows=batch_spec.max_rows,
+        )
+        if len(frames) == 1:
+            return frames[0]
+
+        return pd.concat(frames, ignore_index=True)
+
+    def _instantiate_cloud_clients(self, file_batch_specs: List[PathBatchSpec]) -> None:
+        if self._s3 is None and any(isinstance(spec, S3BatchSpec) for spec in file_batch_specs):
+            self._instantiate_s3_client()
+        if self._azure is None and any(
+            isinstance(spec, AzureBatchSpec) for spec in file_batch_specs
+        ):
+            self._instantiate_azure_client()
+        if self._gcs is None and any(isinstance(spec, GCSBatchSpec) for spec in file_batch_specs):
+            self._instantiate_gcs_client()
+
+    def _read_files_concurrently(
+        self,
+        file_batch_specs: List[PathBatchSpec],
+        max_workers: int,
+        max_rows: Optional[int],
+    ) -> List[pd.DataFrame]:
+        """Reads files in order, on up to "max_workers" threads, until "max_rows" rows are read."""
+        frames: List[pd.DataFrame] = []
+        num_rows: int = 0
+
+        remaining_file_batch_specs: Iterator[PathBatchSpec] = iter(file_batch_specs)
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def submit_next() -> None:
+                file_batch_spec: Optional[PathBatchSpec] = next(remaining_file_batch_specs, None)
+                if file_batch_spec is not None:
+                    pending.append(executor.submit(self._read_file, file_batch_spec, max_rows))
+
+            try:
+                for _ in range(max_workers):
+                    submit_next()
+
+                df: pd.DataFrame
+                while pending:
+                    df = pending.popleft().result()
+                    if max_rows is not None and num_rows + len(df) >= max_rows:
+                        frames.append(df.iloc[: max_rows - num_rows])
+                        break
+
+                    frames.append(df)
+                    num_rows += len(df)
+                    submit_next()
+            finally:
+                future: Future
+                for future in pending:
+                    future.cancel()
+
+        return frames
+
+    @staticmethod
+    def _get_file_batch_specs(batch_spec: MultiPathBatchSpec) -> List[PathBatchSpec]:
+        """Returns "PathBatchSpec" (of type, matching storage of URL) for every file of Batch."""
+        paths: List[str]
+        if batch_spec.directory is not None:
+            directory = pathlib.Path(batch_spec.directory)
+            if not directory.is_dir():
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                    f'MultiPathBatchSpec directory "{directory}" is not a local directory.'
+                )
+
+            # Hidden files (e.g., "_SUCCESS" markers, written by Spark) are skipped.
+            paths = sorted(
+                str(path)
+                for path in directory.iterdir()
+                if path.is_file() and not path.name.startswith((".", "_"))
+            )
+        else:
+            paths = batch_spec.paths or []
+
+        file_batch_specs: List[PathBatchSpec] = []
+        path: str
+        file_batch_spec_type: type[PathBatchSpec]
+        for path in paths:
+            if path.startswith(("s3://", "s3a://")):
+                file_batch_spec_type = S3BatchSpec
+            elif path.startswith("gs://"):
+                file_batch_spec_type = GCSBatchSpec
+            elif ".blob.core.windows.net/" in path:
+                file_batch_spec_type = AzureBatchSpec
+            else:
+                file_batch_spec_type = PathBatchSpec
+
+            file_batch_specs.append(
+                file_batch_spec_type(
+                    path=path,
+                    reader_method=batch_spec.reader_method,
+                    reader_options=batch_spec.reader_options,
+                )
+            )
+
+        return file_batch_specs
+
+    def _read_file(
+        self,
+        batch_spec: PathBatchSpec,
+        max_rows: Optional[int] = None,
+        columns: Optional[Collection[str]] = None,
+    ) -> pd.DataFrame:
+        """Reads file into DataFrame, streaming it from its source (and stopping after "max_rows" rows, if possible).
+
+        Streams of cloud objects are passed to reader directly, unless reader seeks within file (e.g., Parquet), and
+        stream cannot seek; only then is object downloaded into memory first.  If "columns" are given, only those of
+        them, which exist in file, are read (see "PROJECTABLE_READER_METHODS").
+        """  # noqa: E501
+        reader_options: dict = dict(batch_spec.reader_options)
+        path: str
+        open_source: Callable[[], Any]
+        path, open_source = self._get_file_source(
+            batch_spec=batch_spec, reader_options=reader_options
+        )
+        reader_method_name: str = (
+            batch_spec.reader_method or self.guess_reader_method_from_path(path)["reader_method"]
+        )
+        reader_fn: DataFrameFactoryFn = self._get_reader_fn(batch_spec.reader_method, path)
+        if (
+            max_rows is not None
+            and reader_method_name in ROW_LIMITED_READER_METHODS
+            and "nrows" not in reader_options
+        ):
+            reader_options["nrows"] = max_rows
+
+        opened_source: Any = open_source()
+        source: Any = opened_source
+        try:
+            if (
+                not isinstance(source, str)
+                and reader_method_name not in STREAMING_READER_METHODS
+                and not (hasattr(source, "seekable") and source.seekable())
+            ):
+                source = BytesIO(opened_source.read())
+
+            if columns is not None:
+                reader_options.update(
+                    _get_column_projection_reader_options(
+                        source=source, reader_method_name=reader_method_name, columns=columns
+                    )
+                )
+
+            if (
+                self._dtype_backend == "pyarrow"
+                and isinstance(source, str)
+                and reader_method_name in ARROW_FILE_READER_METHODS
+                and set(reader_options.keys()) <= {"columns"}
+            ):
+                df = _read_arrow_file(
+                    path=source,
+                    reader_method_name=reader_method_name,
+                    columns=reader_options.get("columns"),
+                )
+            else:
+                df = reader_fn(source, **reader_options)
+        finally:
+            if hasattr(opened_source, "close"):
+                opened_source.close()
+
+        if isinstance(reader_options.get("usecols"), _ColumnProjection):
+            df = reader_options["usecols"].drop_first_column(df)
+
+        if max_rows is not None and len(df) > max_rows:
+            df = df.iloc[:max_rows]
+
+        return df
+
+    def _supports_column_projection(self, batch_spec: BatchSpec | PandasBatchSpecProtocol) -> bool:
+        """Whether or not Batch data can be read lazily, limited to columns that validation needs.
+
+        Projection applies to files, read by "PROJECTABLE_READER_METHODS" without explicit column selection, whose
+        rows do not depend on columns (i.e., neither partitioned nor sampled, except for "sample_using_limit").
+        """  # noqa: E501
+        if not isinstance(batch_spec, PathBatchSpec):
+            return False
+
+        reader_method_name: str = (
+            batch_spec.reader_method
+            or self.guess_reader_method_from_path(batch_spec.path)["reader_method"]
+        )
+        return (
+            reader_method_name in PROJECTABLE_READER_METHODS
+            and not {"columns", "usecols"} & set(batch_spec.reader_options.keys())
+            and not batch_spec.get("partitioner_method")
+            and batch_spec.get("sampling_method") in (None, "sample_using_limit")
+        )
+
+    def _get_projected_batch_data(self, batch_spec: PathBatchSpec) -> ProjectedPandasBatchData:
+        """Builds Batch data, read from file when first accessed (only projected columns)."""
+
+        def read_columns(columns: Optional[List[str]]) -> pd.DataFrame:
+            df: pd.DataFrame = self._read_file(batch_spec=batch_spec, columns=columns)
+            return self._apply_partitioning_and_sampling_methods(batch_spec, df)  # type: ignore[arg-type]
+
+        return ProjectedPandasBatchData(execution_engine=self, reader=read_columns)
+
+    @override
+    def project_batch_columns(self, batch_id: str, columns: Optional[Collection[str]]) -> None:
+        batch_data = self.batch_manager.batch_data_cache.get(batch_id)
+        if not isinstance(batch_data, ProjectedPandasBatchData):
+            return
+
+        # Data read so far is kept (and widened, if needed); its rows, and thus cached row masks of
+        # domain records, do not depend on projection.
+        batch_data.project(columns=columns)
+
     @property
     def dataframe(self) -> pd.DataFrame:
         """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
@@ -471,18 +1033,521 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
 
         try:
             reader_fn = getattr(pd, reader_method)
-            if reader_options:
-                reader_fn = partial(reader_fn, **reader_options)
-            return reader_fn
         except AttributeError:
             raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+        if self._dtype_backend is not None and reader_method in DTYPE_BACKEND_READER_METHODS:
+            reader_options = {**(reader_options or {}), "dtype_backend": self._dtype_backend}
+        if reader_options:
+            reader_fn = partial(reader_fn, **reader_options)
+        return reader_fn
+
     @override
-    def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], Any]:
-        """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
-        return {}  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).  # noqa: E501
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine.
+
+        Bundled metrics are grouped by compute Domain; records of every Domain (with "row_condition" and other filters
+        applied) are obtained only once, and then every aggregate function of that Domain is evaluated on them.
+
+        Args:
+            metric_fn_bundle (Iterable[MetricComputationConfiguration]): \
+                "MetricComputationConfiguration" objects, whose "metric_fn" is aggregate function, accepting DataFrame.
+
+        Returns:
+            A dictionary of "MetricConfiguration" IDs and their corresponding fully resolved values.
+        """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+
+        bundles: Dict[str, Tuple[dict, List[MetricComputationConfiguration]]] = {}
+
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            compute_domain_kwargs: dict = bundled_metric_configuration.compute_domain_kwargs or {}
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+
+            bundles.setdefault(compute_domain_kwargs.to_id(), (compute_domain_kwargs, []))[
+                1
+            ].append(bundled_metric_configuration)
+
+        failed_metrics: List[MetricConfiguration] = []
+        first_exception: Optional[Exception] = None
+
+        domain_id: str
+        domain_kwargs: dict
+        bundled_metric_configurations: List[MetricComputationConfiguration]
+        for domain_id, (domain_kwargs, bundled_metric_configurations) in bundles.items():
+            try:
+                df: pd.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+            except Exception as e:
+                failed_metrics.extend(
+                    bundled_metric_configuration.metric_configuration
+                    for bundled_metric_configuration in bundled_metric_configurations
+                )
+                first_exception = first_exception or e
+                continue
+
+            logger.debug(
+                f"PandasExecutionEngine computing {len(bundled_metric_configurations)} metrics on domain_id {domain_id}"  # noqa: E501
+            )
+
+            batched_metrics: Dict[Tuple[str, str, str], Any]
+            remaining_configurations: List[MetricComputationConfiguration]
+            batched_metrics, remaining_configurations = self._resolve_batched_aggregates(
+                df=df, bundled_metric_configurations=bundled_metric_configurations
+            )
+            resolved_metrics.update(batched_metrics)
+
+            for bundled_metric_configuration in remaining_configurations:
+                try:
+                    resolved_metrics[bundled_metric_configuration.metric_configuration.id] = (
+                        bundled_metric_configuration.metric_fn(df)  # type: ignore[operator] # F not callable
+                    )
+                except Exception as e:
+                    failed_metrics.append(bundled_metric_configuration.metric_configuration)
+                    first_exception = first_exception or e
+
+        if first_exception is not None:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(first_exception),
+                failed_metrics=failed_metrics,
+            ) from first_exception
+
+        return resolved_metrics
+
+    @staticmethod
+    def _resolve_batched_aggregates(
+        df: pd.DataFrame,
+        bundled_metric_configurations: List[MetricComputationConfiguration],
+    ) -> Tuple[Dict[Tuple[str, str, str], Any], List[MetricComputationConfiguration]]:
+        """Evaluates named aggregates (e.g., "min", "mean") of numeric columns with one "DataFrame.agg()" call per family.
+
+        Returns resolved metric values and "MetricComputationConfiguration" objects still to be evaluated one by one.
+        """  # noqa: E501
+        families: Dict[bool, List[Tuple[MetricComputationConfiguration, str, str]]] = {
+            True: [],
+            False: [],
+        }
+        remaining_configurations: List[MetricComputationConfiguration] = []
+
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in bundled_metric_configurations:
+            batchable_aggregate: Optional[Tuple[str, str]] = _get_batchable_aggregate(
+                df=df, metric_fn=bundled_metric_configuration.metric_fn
+            )
+            if batchable_aggregate is None:
+                remaining_configurations.append(bundled_metric_configuration)
+            else:
+                families[batchable_aggregate[1] in DTYPE_PRESERVING_AGGREGATE_FN_NAMES].append(
+                    (bundled_metric_configuration, *batchable_aggregate)
+                )
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+
+        family: List[Tuple[MetricComputationConfiguration, str, str]]
+        for family in families.values():
+            if not family:
+                continue
+
+            # Every column gets every aggregate of family, so no result is missing (upcast by NaN).
+            column_names: List[str] = list(dict.fromkeys(item[1] for item in family))
+            aggregate_fn_names: List[str] = list(dict.fromkeys(item[2] for item in family))
+            try:
+                aggregates: pd.DataFrame = df[column_names].agg(aggregate_fn_names)
+            except Exception as e:
+                logger.debug(f"Batched aggregation failed ({e}); computing aggregates one by one.")
+                remaining_configurations.extend(item[0] for item in family)
+                continue
+
+            column_name: str
+            aggregate_fn_name: str
+            for bundled_metric_configuration, column_name, aggregate_fn_name in family:
+                resolved_metrics[bundled_metric_configuration.metric_configuration.id] = (
+                    aggregates.at[aggregate_fn_name, column_name]
+                )
+
+        return resolved_metrics, remaining_configurations
+
+    @override
+    def _process_direct_and_bundled_metric_computation_configurations(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Metrics of chunked Batch data are computed in one pass (see "mergeable_metrics")."""
+        chunked_configurations: Dict[
+            str,
+            Tuple[
+                ChunkedPandasBatchData,
+                List[MetricComputationConfiguration],
+                List[MetricComputationConfiguration],
+            ],
+        ] = {}
+        direct_configurations: List[MetricComputationConfiguration] = (
+            self._split_off_chunked_metric_computation_configurations(
+                metric_computation_configurations=metric_fn_direct_configurations,
+                chunked_configurations=chunked_configurations,
+                bundled=False,
+            )
+        )
+        bundle_configurations: List[MetricComputationConfiguration] = (
+            self._split_off_chunked_metric_computation_configurations(
+                metric_computation_configurations=metric_fn_bundle_configurations,
+                chunked_configurations=chunked_configurations,
+                bundled=True,
+            )
+        )
+
+        if not chunked_configurations:
+            return super()._process_direct_and_bundled_metric_computation_configurations(
+                metric_fn_direct_configurations=metric_fn_direct_configurations,
+                metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            )
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        # Failures are collected (not raised right away), so that metrics resolved in pass over
+        # chunks are kept, and retry of failed metrics does not read chunks for others again.
+        failed_metrics: List[MetricConfiguration] = []
+        metric_exceptions: Dict[Tuple[str, str, str], Exception] = {}
+        first_exception: Optional[Exception] = None
+        if direct_configurations or bundle_configurations:
+            try:
+                resolved_metrics.update(
+                    super()._process_direct_and_bundled_metric_computation_configurations(
+                        metric_fn_direct_configurations=direct_configurations,
+                        metric_fn_bundle_configurations=bundle_configurations,
+                    )
+                )
+            except gx_exceptions.MetricResolutionError as e:
+                failed_metrics.extend(e.failed_metrics)
+                metric_exceptions.update(e.metric_exceptions)
+                resolved_metrics.update(e.resolved_metrics)
+                first_exception = e
+
+        chunked_batch_data: ChunkedPandasBatchData
+        chunked_direct_configurations: List[MetricComputationConfiguration]
+        chunked_bundle_configurations: List[MetricComputationConfiguration]
+        chunked_resolved_metrics: Dict[Tuple[str, str, str], Any]
+        chunked_metric_exceptions: Dict[Tuple[str, str, str], Exception]
+        for (
+            chunked_batch_data,
+            chunked_direct_configurations,
+            chunked_bundle_configurations,
+        ) in chunked_configurations.values():
+            chunked_metric_exceptions = {}
+            chunked_resolved_metrics = self._resolve_metrics_in_chunks(
+                batch_data=chunked_batch_data,
+                metric_fn_direct_configurations=chunked_direct_configurations,
+                metric_fn_bundle_configurations=chunked_bundle_configurations,
+                metric_exceptions=chunked_metric_exceptions,
+            )
+            if self._caching:
+                self._cache_resolved_metrics(
+                    metric_computation_configurations=itertools.chain(
+                        chunked_direct_configurations, chunked_bundle_configurations
+                    ),
+                    resolved_metrics=chunked_resolved_metrics,
+                )
+
+            resolved_metrics.update(chunked_resolved_metrics)
+            failed_metrics.extend(
+                metric_computation_configuration.metric_configuration
+                for metric_computation_configuration in itertools.chain(
+                    chunked_direct_configurations, chunked_bundle_configurations
+                )
+                if metric_computation_configuration.metric_configuration.id
+                in chunked_metric_exceptions
+            )
+            metric_exceptions.update(chunked_metric_exceptions)
+            first_exception = first_exception or next(
+                iter(chunked_metric_exceptions.values()), None
+            )
+
+        if first_exception is not None:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(first_exception),
+                failed_metrics=failed_metrics,
+                resolved_metrics=resolved_metrics,
+                metric_exceptions=metric_exceptions,
+            ) from first_exception
+
+        return resolved_metrics
+
+    def _split_off_chunked_metric_computation_configurations(
+        self,
+        metric_computation_configurations: List[MetricComputationConfiguration],
+        chunked_configurations: Dict[
+            str,
+            Tuple[
+                ChunkedPandasBatchData,
+                List[MetricComputationConfiguration],
+                List[MetricComputationConfiguration],
+            ],
+        ],
+        bundled: bool,
+    ) -> List[MetricComputationConfiguration]:
+        """Adds configurations of metrics of chunked Batch data to "chunked_configurations".
+
+        Returns:
+            Remaining configurations (of metrics of Batch data held in memory)
+        """
+        remaining_configurations: List[MetricComputationConfiguration] = []
+
+        metric_computation_configuration: MetricComputationConfiguration
+        batch_id: str
+        batch_data: Any
+        for metric_computation_configuration in metric_computation_configurations:
+            batch_id = self._get_metric_batch_id(  # type: ignore[assignment]
+                metric_configuration=metric_computation_configuration.metric_configuration
+            )
+            batch_data = self.batch_manager.batch_data_cache.get(batch_id)
+            if isinstance(batch_data, ChunkedPandasBatchData):
+                chunked_configurations.setdefault(batch_id, (batch_data, [], []))[
+                    2 if bundled else 1
+                ].append(metric_computation_configuration)
+            else:
+                remaining_configurations.append(metric_computation_configuration)
+
+        return remaining_configurations
+
+    def _resolve_metrics_in_chunks(  # noqa: C901
+        self,
+        batch_data: ChunkedPandasBatchData,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+        metric_exceptions: Dict[Tuple[str, str, str], Exception],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolves metrics of Batch data, read in chunks, so that memory use scales with chunk size.
+
+        - "map" and "condition" metrics (row-wise Series) are deferred; they are evaluated on every chunk, on demand.
+          Those, whose value for row depends on other rows (see "register_cross_row_map_metric()"), are rejected.
+        - Mergeable metrics (see "register_mergeable_metric()") are computed in one pass over chunks: partial result of
+          every chunk is merged into result of preceding chunks.
+        - Other metrics are computed as usual, provided that they only use values of metrics they depend on; metrics
+          that need to read Batch data (or values of deferred metrics) are rejected with "ChunkedBatchDataError".
+
+        Exception of every metric that fails is added to "metric_exceptions"; other metrics are resolved regardless.
+        """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        mergeable_metrics: List[Tuple[MetricComputationConfiguration, bool, MergeableMetric]] = []
+
+        metric_computation_configuration: MetricComputationConfiguration
+        bundled: bool
+        metric_configuration: MetricConfiguration
+        mergeable_metric: Optional[MergeableMetric]
+        for metric_computation_configuration, bundled in itertools.chain(
+            ((configuration, False) for configuration in metric_fn_direct_configurations),
+            ((configuration, True) for configuration in metric_fn_bundle_configurations),
+        ):
+            metric_configuration = metric_computation_configuration.metric_configuration
+            if not bundled and is_deferred_chunk_metric(
+                metric_name=metric_configuration.metric_name
+            ):
+                if is_cross_row_map_metric(metric_name=metric_configuration.metric_name):
+                    metric_exceptions[metric_configuration.id] = (
+                        gx_exceptions.ChunkedBatchDataError(
+                            f'Metric "{metric_configuration.metric_name}" cannot be computed on Batch data read in chunks, '  # noqa: E501
+                            "because its value for every row depends on other rows of entire Batch."
+                        )
+                    )
+                else:
+                    resolved_metrics[metric_configuration.id] = DeferredChunkMetricValue(
+                        metric_computation_configuration=metric_computation_configuration
+                    )
+
+                continue
+
+            mergeable_metric = get_mergeable_metric(metric_name=metric_configuration.metric_name)
+            if mergeable_metric is not None:
+                mergeable_metrics.append(
+                    (metric_computation_configuration, bundled, mergeable_metric)
+                )
+                continue
+
+            try:
+                if bundled:
+                    raise gx_exceptions.ChunkedBatchDataError(  # noqa: TRY003, TRY301
+                        "aggregate function requires entire Batch"
+                    )
+
+                resolved_metrics[metric_configuration.id] = self._compute_metrics(
+                    metric_computation_configuration.metric_fn,  # type: ignore[arg-type] # F not callable
+                    metric_configurations=[metric_configuration],
+                    bundled=False,
+                    kwargs=metric_computation_configuration.metric_provider_kwargs,
+                )
+            except gx_exceptions.ChunkedBatchDataError as e:
+                metric_exceptions[metric_configuration.id] = gx_exceptions.ChunkedBatchDataError(
+                    f'Metric "{metric_configuration.metric_name}" cannot be computed on Batch data read in chunks, '  # noqa: E501
+                    f"because its partial results cannot be merged across chunks ({e.message})."
+                )
+            except Exception as e:
+                metric_exceptions[metric_configuration.id] = e
+
+        if mergeable_metrics:
+            resolved_metrics.update(
+                self._compute_metrics(
+                    self._resolve_mergeable_metrics_in_chunks,
+                    metric_configurations=[
+                        metric_computation_configuration.metric_configuration
+                        for metric_computation_configuration, _, _ in mergeable_metrics
+                    ],
+                    bundled=True,
+                    kwargs={
+                        "batch_data": batch_data,
+                        "mergeable_metrics": mergeable_metrics,
+                        "metric_exceptions": metric_exceptions,
+                    },
+                )
+            )
+
+        return resolved_metrics
+
+    def _resolve_mergeable_metrics_in_chunks(
+        self,
+        batch_data: ChunkedPandasBatchData,
+        mergeable_metrics: List[Tuple[MetricComputationConfiguration, bool, MergeableMetric]],
+        metric_exceptions: Dict[Tuple[str, str, str], Exception],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Computes mergeable metrics in one pass over chunks; failed metric does not stop rest."""
+        partial_results: Dict[Tuple[str, str, str], Any] = {}
+
+        metric_computation_configuration: MetricComputationConfiguration
+        bundled: bool
+        mergeable_metric: MergeableMetric
+        deferred_metric_values: Dict[Tuple[str, str, str], Any]
+        for _ in batch_data.iter_chunks():
+            # Values of deferred ("map" and "condition") metrics are only valid for current chunk.
+            deferred_metric_values = {}
+            for metric_computation_configuration, bundled, mergeable_metric in mergeable_metrics:
+                self._merge_chunk_partial_result(
+                    metric_computation_configuration=metric_computation_configuration,
+                    bundled=bundled,
+                    mergeable_metric=mergeable_metric,
+                    deferred_metric_values=deferred_metric_values,
+                    partial_results=partial_results,
+                    exceptions=metric_exceptions,
+                )
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        metric_configuration: MetricConfiguration
+        for metric_computation_configuration, _, mergeable_metric in mergeable_metrics:
+            metric_configuration = metric_computation_configuration.metric_configuration
+            if metric_configuration.id in metric_exceptions:
+                continue
+
+            try:
+                resolved_metrics[metric_configuration.id] = mergeable_metric.finalize(
+                    partial_results.get(metric_configuration.id, copy.copy(mergeable_metric.empty)),
+                    metric_configuration,
+                )
+            except Exception as e:
+                metric_exceptions[metric_configuration.id] = e
+
+        return resolved_metrics
+
+    def _merge_chunk_partial_result(  # noqa: PLR0913
+        self,
+        metric_computation_configuration: MetricComputationConfiguration,
+        bundled: bool,
+        mergeable_metric: MergeableMetric,
+        deferred_metric_values: Dict[Tuple[str, str, str], Any],
+        partial_results: Dict[Tuple[str, str, str], Any],
+        exceptions: Dict[Tuple[str, str, str], Exception],
+    ) -> None:
+        """Merges partial result of metric for current chunk into "partial_results"."""
+        metric_configuration: MetricConfiguration = (
+            metric_computation_configuration.metric_configuration
+        )
+        if metric_configuration.id in exceptions:
+            return
+
+        try:
+            partial_result: Any = mergeable_metric.partial(
+                MetricChunk(
+                    metric_configuration=metric_configuration,
+                    value_fn=partial(
+                        self._compute_chunk_metric_value,
+                        metric_computation_configuration=metric_computation_configuration,
+                        bundled=bundled,
+                        deferred_metric_values=deferred_metric_values,
+                    ),
+                    column_fn=partial(
+                        self._get_chunk_domain_column,
+                        metric_configuration=metric_configuration,
+                    ),
+                )
+            )
+            if metric_configuration.id in partial_results:
+                partial_result = mergeable_metric.merge(
+                    partial_results[metric_configuration.id],
+                    partial_result,
+                    metric_configuration,
+                )
+
+            partial_results[metric_configuration.id] = partial_result
+        except Exception as e:
+            exceptions[metric_configuration.id] = e
+
+    def _compute_chunk_metric_value(
+        self,
+        metric_computation_configuration: MetricComputationConfiguration,
+        bundled: bool,
+        deferred_metric_values: Dict[Tuple[str, str, str], Any],
+    ) -> Any:
+        """Computes metric on current chunk, evaluating deferred metrics it depends on (once per chunk)."""  # noqa: E501
+        if bundled:
+            return metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+                self.get_domain_records(
+                    domain_kwargs=metric_computation_configuration.compute_domain_kwargs  # type: ignore[arg-type]
+                )
+            )
+
+        metric_dependencies: Dict[str, Any] = (
+            metric_computation_configuration.metric_provider_kwargs["metrics"]
+        )
+        metrics: Dict[str, Any] = {
+            metric_name: self._get_chunk_metric_dependency_value(
+                metric_value=metric_value, deferred_metric_values=deferred_metric_values
+            )
+            for metric_name, metric_value in metric_dependencies.items()
+        }
+
+        return metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+            **{**metric_computation_configuration.metric_provider_kwargs, "metrics": metrics}
+        )
+
+    def _get_chunk_metric_dependency_value(
+        self, metric_value: Any, deferred_metric_values: Dict[Tuple[str, str, str], Any]
+    ) -> Any:
+        if not isinstance(metric_value, DeferredChunkMetricValue):
+            return metric_value
+
+        deferred_metric_id: Tuple[str, str, str] = (
+            metric_value.metric_computation_configuration.metric_configuration.id
+        )
+        if deferred_metric_id not in deferred_metric_values:
+            deferred_metric_values[deferred_metric_id] = self._compute_chunk_metric_value(
+                metric_computation_configuration=metric_value.metric_computation_configuration,
+                bundled=False,
+                deferred_metric_values=deferred_metric_values,
+            )
+
+        return deferred_metric_values[deferred_metric_id]
+
+    def _get_chunk_domain_column(self, metric_configuration: MetricConfiguration) -> pd.Series:
+        df: pd.DataFrame
+        accessor_domain_kwargs: dict
+        df, _, accessor_domain_kwargs = self.get_compute_domain(
+            domain_kwargs=metric_configuration.metric_domain_kwargs,
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        return df[accessor_domain_kwargs["column"]]
 
     @public_api
     @override
@@ -505,26 +1570,27 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
             )
 
         batch_id = domain_kwargs.get("batch_id")
+        batch_data: PandasBatchData
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
-                data = cast(PandasBatchData, self.batch_manager.active_batch_data).dataframe
+                batch_data = cast(PandasBatchData, self.batch_manager.active_batch_data)
             else:
                 raise gx_exceptions.ValidationError(  # noqa: TRY003
                     "No batch is specified, but could not identify a loaded batch."
                 )
         else:  # noqa: PLR5501
             if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
-                    PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
+                batch_data = cast(PandasBatchData, self.batch_manager.batch_data_cache[batch_id])
             else:
                 raise gx_exceptions.ValidationError(  # noqa: TRY003
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
-        # Filtering by row condition.
+        data = batch_data.dataframe
+
         row_condition = domain_kwargs.get("row_condition", None)
+        condition_parser = None
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
 
@@ -534,65 +1600,109 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                     "condition_parser is required when setting a row_condition,"
                     " and must be 'python' or 'pandas'"
                 )
-            else:
-                # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
 
-        if "column" in domain_kwargs:
+        # Rows are dropped by "ignore_row_if" directive if "how" (of "DataFrame.dropna()") is set.
+        subset: Optional[List[str]]
+        how: Optional[str]
+        subset, how = self._get_ignore_row_if_dropna_arguments(domain_kwargs=domain_kwargs)
+
+        if not row_condition and how is None:
             return data
 
-        if (
-            "column_A" in domain_kwargs
-            and "column_B" in domain_kwargs
-            and "ignore_row_if" in domain_kwargs
-        ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
-                )
-            elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+        # Filters are evaluated once per Batch; only boolean row masks (not data copies) are cached.
+        key: DomainRecordsKey = (
+            batch_id or self.batch_manager.active_batch_data_id,
+            row_condition or None,
+            condition_parser,
+            how,
+            tuple(subset) if how is not None else None,
+        )
+        mask: Optional[np.ndarray] = self._domain_records_cache.get(key)
+        if mask is None:
+            mask = self._get_domain_records_mask(
+                data=data,
+                row_condition=row_condition,
+                condition_parser=condition_parser,
+                subset=subset,
+                how=how,
+            )
+            if mask is None:
+                # Row condition does not evaluate to boolean row mask; filter without caching.
+                data = data.query(row_condition, parser=condition_parser)
+                if how is not None:
+                    data = data.dropna(axis=0, how=how, subset=subset)
 
-            return data
+                return data
 
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
+            # Masks of chunks (of Batch data, read in chunks) are not reusable.
+            if self._caching and not isinstance(batch_data, ChunkedPandasBatchData):
+                self._domain_records_cache.put(key=key, value=mask, size=mask.nbytes)
 
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
-            elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+        return data[mask]
 
-            return data
+    @staticmethod
+    def _get_ignore_row_if_dropna_arguments(
+        domain_kwargs: dict,
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Translates "ignore_row_if" directive into "subset" and "how" arguments of "dropna()".
+
+        Returned "how" is None if no rows are to be dropped.
+        """
+        if "column" in domain_kwargs or "ignore_row_if" not in domain_kwargs:
+            return None, None
+
+        subset: List[str]
+        ignore_row_if_to_how: Dict[str, Optional[str]]
+        if "column_A" in domain_kwargs and "column_B" in domain_kwargs:
+            subset = [domain_kwargs["column_A"], domain_kwargs["column_B"]]
+            ignore_row_if_to_how = _COLUMN_PAIR_IGNORE_ROW_IF_TO_DROPNA_HOW
+        elif "column_list" in domain_kwargs:
+            subset = list(domain_kwargs["column_list"])
+            ignore_row_if_to_how = _MULTICOLUMN_IGNORE_ROW_IF_TO_DROPNA_HOW
+        else:
+            return None, None
 
-        return data
+        ignore_row_if = domain_kwargs["ignore_row_if"]
+        if ignore_row_if not in ignore_row_if_to_how:
+            raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+
+        return subset, ignore_row_if_to_how[ignore_row_if]
+
+    @staticmethod
+    def _get_domain_records_mask(
+        data: pd.DataFrame,
+        row_condition: Optional[str],
+        condition_parser: Optional[str],
+        subset: Optional[List[str]],
+        how: Optional[str],
+    ) -> Optional[np.ndarray]:
+        """Returns boolean mask of rows that pass "row_condition" and are kept by "ignore_row_if".
+
+        Returns None if "row_condition" cannot be evaluated as boolean row mask (caller must then
+        use "DataFrame.query()").
+        """
+        mask: np.ndarray = np.ones(len(data), dtype=bool)
+
+        if row_condition:
+            # This is how "DataFrame.query()" evaluates "row_condition" before indexing rows.
+            condition = data.eval(row_condition, parser=condition_parser)
+            if not (
+                isinstance(condition, pd.Series)
+                and condition.dtype == np.bool_
+                and condition.index.equals(data.index)
+            ):
+                return None
+
+            mask &= condition.to_numpy(dtype=bool)
+
+        if how is not None:
+            not_missing: pd.DataFrame = data[subset].notna()
+            if how == "all":
+                mask &= not_missing.any(axis=1).to_numpy()
+            else:
+                mask &= not_missing.all(axis=1).to_numpy()
+
+        return mask
 
     @public_api
     @override
@@ -646,3 +1756,166 @@ def hash_pandas_dataframe(df):
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
 
     return hashlib.md5(obj).hexdigest()
+
+
+def _get_batchable_aggregate(df: pd.DataFrame, metric_fn: Any) -> Optional[Tuple[str, str]]:
+    """Returns column name and "DataFrame.agg()" function name of aggregate, if it can be batched; otherwise, None.
+
+    Only NumPy numeric columns qualify: their named aggregates skip nulls exactly like "metric_fn" does, whereas other
+    columns (e.g., nullable extension dtypes or "Decimal" objects) need conversions performed by "metric_fn" itself.
+    """  # noqa: E501
+    aggregate_fn_name: Optional[str] = getattr(metric_fn, "aggregate_fn_name", None)
+    column_name: Optional[str] = getattr(metric_fn, "column_name", None)
+    if aggregate_fn_name is None or column_name is None:
+        return None
+
+    if not df.columns.is_unique or column_name not in df.columns:
+        return None
+
+    dtype = df[column_name].dtype
+    if not (isinstance(dtype, np.dtype) and dtype.kind in "iuf"):
+        return None
+
+    return column_name, aggregate_fn_name
+
+
+def _read_parquet_chunks(
+    source: Any, chunk_size: int, columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """Reads Parquet file in record batches of "chunk_size" rows (index continues across chunks).
+
+    Parquet footer is read before data, so that streamed (non-seekable) cloud object bodies are
+    first spooled to temporary file on disk (rather than read into memory).
+    """
+    if not pyarrow.parquet:
+        raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+            "Reading Parquet files in chunks requires pyarrow; please 'pip install pyarrow'."
+        )
+
+    seekable_source: Any = _get_seekable_source(source)
+    offset: int = 0
+    chunk: pd.DataFrame
+    try:
+        for record_batch in pyarrow.parquet.ParquetFile(seekable_source).iter_batches(
+            batch_size=chunk_size, columns=columns
+        ):
+            chunk = record_batch.to_pandas()
+            chunk.index = pd.RangeIndex(start=offset, stop=offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    finally:
+        if seekable_source is not source:
+            seekable_source.close()
+
+
+def _get_seekable_source(source: Any) -> Any:
+    """Returns source (path or file-like object), if seekable; otherwise, temporary file copy."""
+    if isinstance(source, (str, pathlib.Path)) or (
+        hasattr(source, "seekable") and source.seekable()
+    ):
+        return source
+
+    spooled_file = tempfile.TemporaryFile()
+    shutil.copyfileobj(source, spooled_file)
+    spooled_file.seek(0)
+    return spooled_file
+
+
+class _ColumnProjection:
+    """Callable "usecols" reader option, selecting given columns and first column of file."""
+
+    def __init__(self, columns: Collection[str]) -> None:
+        self._column_names: Set[str] = set(columns)
+        self._first_column_name: Optional[Hashable] = None
+
+    def __call__(self, column_name: Hashable) -> bool:
+        if self._first_column_name is None:
+            self._first_column_name = column_name
+
+        return column_name == self._first_column_name or column_name in self._column_names
+
+    def drop_first_column(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Drops first column of file, if it is not projected and any projected column was read."""
+        if self._first_column_name in self._column_names or len(df.columns) <= 1:
+            return df
+
+        return df.drop(columns=self._first_column_name)
+
+
+def _get_column_projection_reader_options(
+    source: Any, reader_method_name: str, columns: Collection[str]
+) -> dict:
+    """Returns reader options, limiting read of file to given columns (columns, missing from file, are skipped).
+
+    At least one column is always read, so that number of rows is preserved even if no column is projected.
+    """  # noqa: E501
+    if reader_method_name not in ARROW_FILE_READER_METHODS:
+        # Columns of file are not known before it is read; first column is read along, and dropped
+        # afterwards, unless no projected column exists in file (see "_ColumnProjection").
+        return {"usecols": _ColumnProjection(columns=columns)}
+
+    if not (pyarrow.parquet and pyarrow.ipc):
+        raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+            "Reading some columns of Parquet and Feather files requires pyarrow; please 'pip install pyarrow'."  # noqa: E501
+        )
+
+    # Only schema (not data) is read, to leave out columns missing from file.
+    file_column_names: List[str]
+    if reader_method_name == "read_parquet":
+        file_column_names = pyarrow.parquet.read_schema(source).names
+    else:
+        file_column_names = pyarrow.ipc.open_file(source).schema.names
+
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+    projected_column_names: List[str] = [name for name in file_column_names if name in columns]
+    return {"columns": projected_column_names or file_column_names[:1]}
+
+
+def _read_arrow_file(
+    path: str, reader_method_name: str, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Reads memory-mapped local Parquet or Feather file into DataFrame with Arrow-backed dtypes.
+
+    Arrow buffers are wrapped (not converted into NumPy arrays); uncompressed Feather data is not copied at all.
+    """  # noqa: E501
+    if not (pyarrow.parquet and pyarrow.feather):
+        raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+            "Reading Arrow-backed DataFrames requires pyarrow; please 'pip install pyarrow'."
+        )
+
+    if reader_method_name == "read_parquet":
+        table = pyarrow.parquet.read_table(
+            path, columns=columns, memory_map=True, use_pandas_metadata=True
+        )
+    else:
+        table = pyarrow.feather.read_table(path, columns=columns, memory_map=True)
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+class _ByteChunksReader(io.RawIOBase):
+    """Read-only file-like view of iterator over bytes (e.g., chunks of Azure blob download)."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._buffer: memoryview = memoryview(b"")
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size: int = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
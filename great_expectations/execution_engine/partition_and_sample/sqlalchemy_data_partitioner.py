@@ -16,7 +16,8 @@ not by itself.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Union
+import logging
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.sqlalchemy import (
@@ -35,6 +36,8 @@ if TYPE_CHECKING:
         SqlAlchemyExecutionEngine,
     )
 
+logger = logging.getLogger(__name__)
+
 
 class SqlAlchemyDataPartitioner(DataPartitioner):
     """Methods for partitioning data accessible via SqlAlchemyExecutionEngine.
@@ -53,6 +56,25 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
         PartitionerMethod.PARTITION_ON_DATE_PARTS: "get_data_for_batch_identifiers_for_partition_on_date_parts",  # noqa: E501
     }
 
+    DATETIME_PARTITIONER_METHOD_TO_DATE_PARTS_MAPPING: dict = {
+        PartitionerMethod.PARTITION_ON_YEAR: [DatePart.YEAR],
+        PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH: [DatePart.YEAR, DatePart.MONTH],
+        PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH_AND_DAY: [
+            DatePart.YEAR,
+            DatePart.MONTH,
+            DatePart.DAY,
+        ],
+    }
+
+    # Dialects that expose Hive-style partition values of a table in a "<table>$partitions" catalog table.  # noqa: E501
+    CATALOG_PARTITIONS_TABLE_DIALECTS: tuple = (GXSqlDialect.AWSATHENA, GXSqlDialect.TRINO)
+
+    # Partitioner methods whose batch identifiers are plain column values, which catalog can provide.  # noqa: E501
+    CATALOG_PARTITIONER_METHODS: tuple = (
+        PartitionerMethod.PARTITION_ON_COLUMN_VALUE,
+        PartitionerMethod.PARTITION_ON_MULTI_COLUMN_VALUES,
+    )
+
     PARTITIONER_METHOD_TO_GET_UNIQUE_BATCH_IDENTIFIERS_METHOD_MAPPING: dict = {
         PartitionerMethod.PARTITION_ON_WHOLE_TABLE: "get_partition_query_for_data_for_batch_identifiers_for_partition_on_whole_table",  # noqa: E501
         PartitionerMethod.PARTITION_ON_COLUMN_VALUE: "get_partition_query_for_data_for_batch_identifiers_for_partition_on_column_value",  # noqa: E501
@@ -308,12 +330,14 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
             f'Partitioner method "partition_on_hashed_column" is not supported for "{self._dialect}" SQL dialect.'  # noqa: E501
         )
 
-    def get_data_for_batch_identifiers(
+    def get_data_for_batch_identifiers(  # noqa: PLR0913
         self,
         execution_engine: SqlAlchemyExecutionEngine,
         selectable: sqlalchemy.Selectable,
         partitioner_method_name: str,
         partitioner_kwargs: dict,
+        descending: Optional[List[bool]] = None,
+        limit: Optional[int] = None,
     ) -> List[dict]:
         """Build data used to construct batch identifiers for the input table using the provided partitioner config.
 
@@ -324,6 +348,9 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
             selectable: Selectable to partition.
             partitioner_method_name: Desired partitioner method to use.
             partitioner_kwargs: Dict of directives used by the partitioner method as keyword arguments of key=value.
+            descending: If provided, batch identifiers are sorted in the query by their values (in order of date parts or
+                columns), each in descending order if the corresponding flag is True; NULL values sort as smallest.
+            limit: If provided, only this many (first, if sorted) batch identifiers are returned by the query.
 
         Returns:
             List of dicts of the form [{column_name: {"key": value}}]
@@ -331,6 +358,16 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
         processed_partitioner_method_name: str = self._get_partitioner_method_name(
             partitioner_method_name
         )
+        if descending is not None or limit is not None:
+            return self._get_sorted_and_limited_data_for_batch_identifiers(
+                execution_engine=execution_engine,
+                selectable=selectable,
+                partitioner_method_name=processed_partitioner_method_name,
+                partitioner_kwargs=partitioner_kwargs,
+                descending=descending,
+                limit=limit,
+            )
+
         batch_identifiers_list: List[dict]
         if self._is_datetime_partitioner(processed_partitioner_method_name):
             partitioner_fn_name: str = (
@@ -353,6 +390,156 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
 
         return batch_identifiers_list
 
+    def get_data_for_batch_identifiers_from_catalog(  # noqa: PLR0913
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        table_name: str,
+        schema_name: Optional[str],
+        partitioner_method_name: str,
+        partitioner_kwargs: dict,
+    ) -> Optional[List[dict]]:
+        """Build batch identifiers data from partition metadata in the database catalog, without scanning the table.
+
+        This is possible for column value partitioners on tables partitioned (in the catalog) by the same columns, in
+        dialects that list partition values in a "<table>$partitions" table (e.g., Hive connector of Trino, Athena).
+        The inspector (see "SqlAlchemyExecutionEngine.get_inspector()") is used to check that this table exists and
+        has all partitioner columns.
+
+        Args:
+            execution_engine: Used to inspect the catalog and to query partition metadata.
+            table_name: Name of partitioned table.
+            schema_name: Schema of partitioned table.
+            partitioner_method_name: Desired partitioner method to use.
+            partitioner_kwargs: Dict of directives used by the partitioner method as keyword arguments of key=value.
+
+        Returns:
+            List of dicts of the form [{column_name: value, ...}], or None if catalog cannot provide batch identifiers.
+        """  # noqa: E501
+        processed_partitioner_method_name: str = self._get_partitioner_method_name(
+            partitioner_method_name
+        )
+        if (
+            self._dialect not in self.CATALOG_PARTITIONS_TABLE_DIALECTS
+            or processed_partitioner_method_name not in self.CATALOG_PARTITIONER_METHODS
+        ):
+            return None
+
+        partitions_table_name: str = f"{table_name}$partitions"
+        column_names: List[str] = self._get_column_names_from_partitioner_kwargs(partitioner_kwargs)
+        try:
+            catalog_column_names: set[str] = {
+                column["name"]
+                for column in execution_engine.get_inspector().get_columns(
+                    partitions_table_name, schema=schema_name
+                )
+            }
+        except Exception as e:
+            logger.debug(
+                f'Partition metadata of table "{table_name}" is not available in catalog: {e}'
+            )
+            return None
+
+        if not set(column_names) <= catalog_column_names:
+            return None
+
+        partitions_query: sqlalchemy.Selectable = (
+            sa.select(*[sa.column(column_name) for column_name in column_names])
+            .distinct()
+            .select_from(sa.table(partitions_table_name, schema=schema_name))
+        )
+        rows: List[sqlalchemy.Row | sqlalchemy.LegacyRow] = self._execute_partitioned_query(
+            execution_engine, partitions_query
+        )
+        return self._get_params_for_batch_identifiers_from_non_date_part_partitioners(
+            column_names, rows
+        )
+
+    def _get_sorted_and_limited_data_for_batch_identifiers(  # noqa: PLR0913
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        selectable: sqlalchemy.Selectable,
+        partitioner_method_name: str,
+        partitioner_kwargs: dict,
+        descending: Optional[List[bool]],
+        limit: Optional[int],
+    ) -> List[dict]:
+        """Build batch identifiers data like "get_data_for_batch_identifiers()", with ORDER BY and LIMIT in the query.
+
+        The partition query is wrapped in a subquery (its own ORDER BY, if any, is dropped, since some dialects do not
+        allow it in subqueries), which is then ordered by the batch identifier columns and limited.
+        """  # noqa: E501
+        partitioned_query: sqlalchemy.Select
+        date_parts: Optional[List[DatePart]] = None
+        if self._is_datetime_partitioner(partitioner_method_name):
+            date_parts = self._convert_date_parts(
+                partitioner_kwargs.get("date_parts")
+                or self.DATETIME_PARTITIONER_METHOD_TO_DATE_PARTS_MAPPING[partitioner_method_name]
+            )
+            partitioned_query = (
+                self.get_partition_query_for_data_for_batch_identifiers_for_partition_on_date_parts(
+                    selectable, partitioner_kwargs["column_name"], date_parts
+                )
+            )
+        else:
+            partitioned_query = getattr(
+                self,
+                self._get_method_name_for_get_data_for_batch_identifiers_method(
+                    partitioner_method_name
+                ),
+            )(selectable=selectable, **partitioner_kwargs)
+
+        subquery: sqlalchemy.Subquery = partitioned_query.order_by(None).subquery()
+        identifier_columns: List[sqlalchemy.ColumnElement]
+        if date_parts is None:
+            identifier_columns = list(subquery.c)
+        else:
+            identifier_columns = [subquery.c[date_part.value] for date_part in date_parts]
+
+        sorted_query: sqlalchemy.Select = sa.select(*subquery.c).select_from(subquery)
+        if descending is not None:
+            sorted_query = sorted_query.order_by(
+                *self._get_order_by_clauses(identifier_columns, descending)
+            )
+
+        if limit is not None:
+            sorted_query = sorted_query.limit(limit)
+
+        rows: List[sqlalchemy.Row | sqlalchemy.LegacyRow] = self._execute_partitioned_query(
+            execution_engine, sorted_query
+        )
+        if date_parts is None:
+            return self._get_params_for_batch_identifiers_from_non_date_part_partitioners(
+                self._get_column_names_from_partitioner_kwargs(partitioner_kwargs), rows
+            )
+
+        return self._get_params_for_batch_identifiers_from_date_part_partitioner(
+            partitioner_kwargs["column_name"], rows, date_parts
+        )
+
+    @staticmethod
+    def _get_order_by_clauses(
+        identifier_columns: List[sqlalchemy.ColumnElement], descending: List[bool]
+    ) -> List[sqlalchemy.ColumnElement]:
+        """ORDER BY clauses, sorting batch identifier columns in given directions (NULLs first)."""
+        if len(descending) != len(identifier_columns):
+            raise ValueError(  # noqa: TRY003
+                f"Sort direction must be given for each of {len(identifier_columns)} batch identifier "  # noqa: E501
+                f"columns, but {len(descending)} directions were given."
+            )
+
+        order_by_clauses: List[sqlalchemy.ColumnElement] = []
+        column: sqlalchemy.ColumnElement
+        column_descending: bool
+        for column, column_descending in zip(identifier_columns, descending):
+            # "NULLS FIRST" is not supported by all dialects, so sort on a NULL flag first.
+            is_not_null = sa.case((column.is_(None), 0), else_=1)
+            if column_descending:
+                order_by_clauses.extend([is_not_null.desc(), column.desc()])
+            else:
+                order_by_clauses.extend([is_not_null.asc(), column.asc()])
+
+        return order_by_clauses
+
     def _is_datetime_partitioner(self, partitioner_method_name: str) -> bool:
         """Whether the partitioner method is a datetime partitioner.
 
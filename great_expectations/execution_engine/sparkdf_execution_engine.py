@@ -52,6 +52,11 @@ from great_expectations.exceptions import (
 )
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.domain_records_cache import (
+    DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES,
+    DomainRecordsCache,
+    DomainRecordsKey,
+)
 from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,  # noqa: TCH001
     PartitionDomainKwargs,  # noqa: TCH001
@@ -110,6 +115,9 @@ class SparkDFExecutionEngine(ExecutionEngine):
         spark: A PySpark Session used to set the SparkDFExecutionEngine being configured. Will override
           spark_config if provided.
         force_reuse_spark_context: If True then utilize existing SparkSession if it exists and is active
+        persist_domain_records: If True, then filtered domain records (by "row_condition", "filter_conditions", and
+          "ignore_row_if" directives) are persisted, and unpersisted when evicted from domain records cache
+        domain_records_cache_max_entries: Maximum number of filtered domain records DataFrames to retain
         **kwargs: Keyword arguments for configuring SparkDFExecutionEngine
 
     For example:
@@ -200,16 +208,25 @@ class SparkDFExecutionEngine(ExecutionEngine):
         "reader_options",
     }
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *args,
         persist: bool = True,
         spark_config: Optional[dict] = None,
         spark: Optional[pyspark.SparkSession] = None,
         force_reuse_spark_context: Optional[bool] = None,
+        persist_domain_records: bool = False,
+        domain_records_cache_max_entries: Optional[int] = DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES,
         **kwargs,
     ) -> None:
         self._persist = persist
+        self._persist_domain_records = persist_domain_records
+
+        # Filtered domain records (must exist before Batch data is loaded by base class).
+        self._domain_records_cache = DomainRecordsCache(
+            max_entries=domain_records_cache_max_entries,
+            on_evict=self._unpersist_domain_records if persist_domain_records else None,
+        )
 
         spark_config = spark_config or {}
         self.spark: pyspark.SparkSession
@@ -239,6 +256,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "persist": self._persist,
                 "spark_config": spark_config,
                 "azure_options": azure_options,
+                "persist_domain_records": persist_domain_records,
+                "domain_records_cache_max_entries": domain_records_cache_max_entries,
             }
         )
 
@@ -411,8 +430,14 @@ class SparkDFExecutionEngine(ExecutionEngine):
         if self._persist:
             batch_data.dataframe.persist()
 
+        # Domain records filtered from data previously loaded under same Batch ID are stale.
+        self._domain_records_cache.invalidate_batch(batch_id=batch_id)
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @staticmethod
+    def _unpersist_domain_records(data: pyspark.DataFrame) -> None:
+        data.unpersist()
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec
@@ -624,7 +649,7 @@ illegal.  Please check your config."""  # noqa: E501
 
     @public_api
     @override
-    def get_domain_records(  # noqa: C901, PLR0912, PLR0915
+    def get_domain_records(  # noqa: C901
         self,
         domain_kwargs: dict,
     ) -> "pyspark.DataFrame":  # noqa F821
@@ -664,6 +689,66 @@ illegal.  Please check your config."""  # noqa: E501
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")  # noqa: TRY003
 
+        # Filtered DataFrames are reused across metrics with same filtering directives.
+        key: Optional[DomainRecordsKey] = self._get_domain_records_key(
+            batch_id=batch_id or self.batch_manager.active_batch_data_id,
+            domain_kwargs=domain_kwargs,
+        )
+        if key is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        filtered_data: Optional[pyspark.DataFrame] = self._domain_records_cache.get(key)
+        if filtered_data is None:
+            filtered_data = self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+            if self._caching:
+                if self._persist_domain_records:
+                    filtered_data.persist()
+
+                self._domain_records_cache.put(key=key, value=filtered_data)
+
+        return filtered_data
+
+    @staticmethod
+    def _get_domain_records_key(
+        batch_id: Optional[str], domain_kwargs: dict
+    ) -> Optional[DomainRecordsKey]:
+        """Returns cache key of filtered domain records (or None, if records are not filtered)."""
+        row_condition = domain_kwargs.get("row_condition", None) or None
+        filter_conditions: List[RowCondition] = domain_kwargs.get("filter_conditions", [])
+
+        ignore_row_if = None
+        columns: Optional[Tuple[str, ...]] = None
+        if "column" not in domain_kwargs:
+            if "column_A" in domain_kwargs and "column_B" in domain_kwargs:
+                ignore_row_if = domain_kwargs.get("ignore_row_if")
+                columns = (domain_kwargs["column_A"], domain_kwargs["column_B"])
+            elif "column_list" in domain_kwargs:
+                ignore_row_if = domain_kwargs.get("ignore_row_if")
+                columns = tuple(domain_kwargs["column_list"])
+
+            if ignore_row_if in [None, "neither", "never"]:
+                ignore_row_if = None
+                columns = None
+
+        if not (row_condition or filter_conditions or ignore_row_if):
+            return None
+
+        return (
+            batch_id,
+            row_condition,
+            domain_kwargs.get("condition_parser") if row_condition else None,
+            tuple(
+                (filter_condition.condition, filter_condition.condition_type.value)
+                for filter_condition in filter_conditions
+            ),
+            ignore_row_if,
+            columns,
+        )
+
+    def _filter_domain_records(
+        self, data: pyspark.DataFrame, domain_kwargs: dict
+    ) -> pyspark.DataFrame:
+        """Applies "row_condition", "filter_conditions", and "ignore_row_if" directives to data."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -684,6 +769,13 @@ illegal.  Please check your config."""  # noqa: E501
             filter_condition = self._combine_row_conditions(filter_conditions)
             data = data.filter(filter_condition.condition)
 
+        return self._filter_ignored_rows(data=data, domain_kwargs=domain_kwargs)
+
+    @staticmethod
+    def _filter_ignored_rows(  # noqa: C901
+        data: pyspark.DataFrame, domain_kwargs: dict
+    ) -> pyspark.DataFrame:
+        """Drops rows of data that "ignore_row_if" directive of Domain kwargs ignores."""
         if "column" in domain_kwargs:
             return data
 
@@ -863,8 +955,6 @@ illegal.  Please check your config."""  # noqa: E501
         """  # noqa: E501
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
-        res: List[pyspark.Row]
-
         aggregates: Dict[Tuple[str, str, str], dict] = {}
 
         aggregate: dict
@@ -886,35 +976,61 @@ illegal.  Please check your config."""  # noqa: E501
                 aggregates[domain_id] = {
                     "column_aggregates": [],
                     "metric_ids": [],
+                    "metric_configurations": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
+            aggregates[domain_id]["metric_configurations"].append(metric_to_resolve)
 
         for aggregate in aggregates.values():
-            domain_kwargs: dict = aggregate["domain_kwargs"]
-            df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+            # Every Domain aggregation is profiled as computation of its own (if profiler is attached).  # noqa: E501
+            resolved_metrics.update(
+                self._compute_metrics(
+                    self._resolve_metric_bundle_domain_aggregate,
+                    metric_configurations=aggregate["metric_configurations"],
+                    bundled=True,
+                    kwargs={"aggregate": aggregate},
+                )
+            )
+
+        return resolved_metrics
 
-            assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
+    def _resolve_metric_bundle_domain_aggregate(
+        self, aggregate: dict
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes all aggregate metrics of one Domain with single Spark job."""
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        res: List[pyspark.Row]
+
+        domain_kwargs: dict = aggregate["domain_kwargs"]
+        df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
 
-            res = df.agg(*aggregate["column_aggregates"]).collect()
+        assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
 
-            logger.debug(
-                f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"  # noqa: E501
+        aggregated_df: pyspark.DataFrame = df.agg(*aggregate["column_aggregates"])
+        if self._metric_resolution_profiler is not None:
+            self._metric_resolution_profiler.record_query(
+                query=lambda: aggregated_df._jdf.queryExecution().simpleString()
             )
 
-            assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
-            assert len(aggregate["metric_ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-
-            idx: int
-            metric_id: Tuple[str, str, str]
-            for idx, metric_id in enumerate(aggregate["metric_ids"]):
-                # Converting DataFrame.collect() results into JSON-serializable format produces simple data types,  # noqa: E501
-                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
-                resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
+        res = aggregated_df.collect()
+
+        logger.debug(
+            f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"  # noqa: E501
+        )
+
+        assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
+        assert len(aggregate["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
+
+        idx: int
+        metric_id: Tuple[str, str, str]
+        for idx, metric_id in enumerate(aggregate["metric_ids"]):
+            # Converting DataFrame.collect() results into JSON-serializable format produces simple data types,  # noqa: E501
+            # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
+            resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
 
         return resolved_metrics
 
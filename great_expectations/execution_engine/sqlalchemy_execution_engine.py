@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import datetime
 import hashlib
+import json
 import logging
 import math
 import os
@@ -10,7 +11,9 @@ import random
 import re
 import string
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -248,6 +251,19 @@ def _dialect_requires_persisted_connection(
     return return_val
 
 
+@dataclass(frozen=True)
+class RowwiseAggregateFn:
+    """Bundled aggregate metric, whose per-row input cannot be placed inside of SQL aggregate function directly.
+
+    Window functions and subqueries (e.g., "column NOT IN (SELECT ...)") are not allowed inside of aggregate functions
+    by most dialects.  Instead, "row_expression" is projected as column of derived table (computed over Domain records)
+    and "aggregate" is applied to that column.  All "RowwiseAggregateFn" metrics of one Domain share single query.
+    """  # noqa: E501
+
+    row_expression: Any
+    aggregate: Callable[[Any], Any]
+
+
 @public_api
 class SqlAlchemyExecutionEngine(ExecutionEngine):
     """SparkDFExecutionEngine instantiates the ExecutionEngine API to support computations using Spark platform.
@@ -274,6 +290,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        max_workers (int): If greater than 1, then independent metrics are resolved concurrently over the connection \
+            pool (not applicable to dialects requiring single persisted connection, which are resolved serially).
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -293,10 +311,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        max_workers: Optional[int] = None,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(name=name, batch_data_dict=batch_data_dict, max_workers=max_workers)
         self._name = name
 
         self._credentials = credentials
@@ -426,6 +445,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "max_workers": max_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -504,6 +524,38 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         return self.engine.dialect.name.lower()
 
+    @override
+    def get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Fingerprints SQL Batch by database, table (or query), and partition/sampling options of its BatchSpec.
+
+        Unlike "pandas_data_fingerprint", this does not reflect table content; hence, persisted metric values are only
+        valid as long as data in the Batch's partition does not change.
+        """  # noqa: E501
+        fingerprint: Optional[str] = super().get_batch_fingerprint(batch_id=batch_id)
+        if fingerprint is not None or batch_id is None:
+            return fingerprint
+
+        batch = self._batch_manager.batch_cache.get(batch_id)
+        if batch is None or not isinstance(
+            batch.batch_spec, (SqlAlchemyDatasourceBatchSpec, RuntimeQueryBatchSpec)
+        ):
+            return None
+
+        url = getattr(self.engine, "url", None)
+        fingerprint_source: dict = {
+            "url": url.render_as_string(hide_password=True) if url is not None else None,
+            "batch_spec": convert_to_json_serializable(data=dict(batch.batch_spec)),
+        }
+        return hashlib.md5(
+            json.dumps(fingerprint_source, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    @property
+    @override
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Metrics resolve concurrently, unless all queries share single persisted connection."""
+        return self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS
+
     def _build_engine(self, credentials: dict, **kwargs) -> sa.engine.Engine:
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -954,6 +1006,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         bundles of the metrics into one large query dictionary so that they are all executed simultaneously. Will fail
         if bundling the metrics together is not possible.
 
+        One query is issued per Domain.  If "max_workers" is set and dialect does not rely on single persisted
+        connection, these queries are executed concurrently (at most "max_workers" at a time); if some of them fail,
+        "MetricResolutionError" lists only metrics of failed Domains.
+
             Args:
                 metric_fn_bundle (Iterable[MetricComputationConfiguration]): \
                     "MetricComputationConfiguration" contains MetricProvider's MetricConfiguration (its unique identifier),
@@ -965,14 +1021,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """  # noqa: E501
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
-        res: List[sqlalchemy.Row]
-
-        # We need a different query for each Domain (where clause).
-        queries: Dict[Tuple[str, str, str], dict] = {}
+        # We need a different query for each Domain (where clause); rowwise aggregates of Domain share separate query.  # noqa: E501
+        queries: Dict[Tuple[str, bool], dict] = {}
 
         query: dict
 
-        domain_id: Tuple[str, str, str]
+        query_key: Tuple[str, bool]
 
         bundled_metric_configuration: MetricComputationConfiguration
         for bundled_metric_configuration in metric_fn_bundle:
@@ -984,16 +1038,24 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             if not isinstance(compute_domain_kwargs, IDDict):
                 compute_domain_kwargs = IDDict(compute_domain_kwargs)
 
-            domain_id = compute_domain_kwargs.to_id()
-            if domain_id not in queries:
-                queries[domain_id] = {
+            query_key = (compute_domain_kwargs.to_id(), isinstance(metric_fn, RowwiseAggregateFn))
+            if query_key not in queries:
+                queries[query_key] = {
                     "select": [],
+                    "row_expressions": [],
                     "metric_ids": [],
+                    "metric_configurations": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
+            query = queries[query_key]
+            if isinstance(metric_fn, RowwiseAggregateFn):
+                row_expression_name: str = f"row_expression_{len(query['row_expressions'])}"
+                query["row_expressions"].append(metric_fn.row_expression.label(row_expression_name))
+                metric_fn = metric_fn.aggregate(sa.column(row_expression_name))
+
             if self.engine.dialect.name == "clickhouse":
-                queries[domain_id]["select"].append(
+                query["select"].append(
                     metric_fn.label(
                         metric_to_resolve.metric_name.join(
                             random.choices(string.ascii_lowercase, k=4)
@@ -1001,58 +1063,126 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     )
                 )
             else:
-                queries[domain_id]["select"].append(metric_fn.label(metric_to_resolve.metric_name))
+                query["select"].append(metric_fn.label(metric_to_resolve.metric_name))
 
-            queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
+            query["metric_ids"].append(metric_to_resolve.id)
+            query["metric_configurations"].append(metric_to_resolve)
 
-        for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
+        if not self._should_resolve_metrics_concurrently(num_tasks=len(queries)):
+            for query in queries.values():
+                resolved_metrics.update(
+                    self._resolve_profiled_metric_bundle_domain_query(query=query)
+                )
 
-            assert len(query["select"]) == len(query["metric_ids"])
+            return resolved_metrics
+
+        # Each Domain query is independent; dispatch them concurrently over connection pool.
+        failed_metrics: List[MetricConfiguration] = []
+        first_exception: Optional[Exception] = None
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=f"{self.__class__.__name__}-queries",
+        ) as executor:
+            futures: List[Tuple[dict, Future]] = [
+                (
+                    query,
+                    executor.submit(
+                        self._bind_to_current_metric_span(
+                            self._resolve_profiled_metric_bundle_domain_query
+                        ),
+                        query=query,
+                    ),
+                )
+                for query in queries.values()
+            ]
+            future: Future
+            for query, future in futures:
+                try:
+                    resolved_metrics.update(future.result())
+                except Exception as e:
+                    failed_metrics.extend(query["metric_configurations"])
+                    first_exception = first_exception or e
+
+        if first_exception is not None:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(first_exception),
+                failed_metrics=failed_metrics,
+            ) from first_exception
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
-                    sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable.subquery())
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable)
+        return resolved_metrics
 
-                logger.debug(f"Attempting query {sa_query_object!s}")
-                res = self.execute_query(sa_query_object).fetchall()
+    def _resolve_profiled_metric_bundle_domain_query(
+        self, query: dict
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        # Every Domain query is profiled as computation of its own (if profiler is attached).
+        return self._compute_metrics(
+            self._resolve_metric_bundle_domain_query,
+            metric_configurations=query["metric_configurations"],
+            bundled=True,
+            kwargs={"query": query},
+        )
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
-                )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += (
-                    f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+    def _resolve_metric_bundle_domain_query(
+        self, query: dict
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Executes single bundled query, computing all aggregate metrics of one Domain (where clause)."""  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        res: List[sqlalchemy.Row]
+
+        domain_kwargs: dict = query["domain_kwargs"]
+        selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+        assert len(query["select"]) == len(query["metric_ids"])
+
+        try:
+            """
+            If a custom query is passed, selectable will be TextClause and not formatted
+            as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+            to TextualSelect using sa.columns() before it can be converted to type Subquery
+            """
+            if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
+                selectable = selectable.columns().subquery()
+            elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+                sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)
+            ):
+                selectable = selectable.subquery()
+
+            if query["row_expressions"]:
+                # Rowwise inputs are projected by derived table; aggregates are taken over it.
+                selectable = (
+                    sa.select(*query["row_expressions"])
+                    .select_from(selectable)
+                    .alias("RowExpressionsSubquery")
                 )
-                logger.error(exception_message)  # noqa: TRY400
-                raise ExecutionEngineError(message=exception_message)
 
-            assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
-            assert len(query["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
+            sa_query_object = sa.select(*query["select"]).select_from(selectable)
+
+            logger.debug(f"Attempting query {sa_query_object!s}")
+            res = self.execute_query(sa_query_object).fetchall()
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{IDDict(domain_kwargs).to_id()}"""
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)  # noqa: TRY400
+            raise ExecutionEngineError(message=exception_message)
+
+        assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
+        assert len(query["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
 
-            idx: int
-            metric_id: Tuple[str, str, str]
-            for idx, metric_id in enumerate(query["metric_ids"]):
-                # Converting SQL query execution results into JSON-serializable format produces simple data types,  # noqa: E501
-                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
-                resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
+        idx: int
+        metric_id: Tuple[str, str, str]
+        for idx, metric_id in enumerate(query["metric_ids"]):
+            # Converting SQL query execution results into JSON-serializable format produces simple data types,  # noqa: E501
+            # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
+            resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
 
         return resolved_metrics
 
@@ -1320,6 +1450,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             CursorResult for sqlalchemy 2.0+ or LegacyCursorResult for earlier versions.
         """
+        self._record_profiled_query(query=query)
         with self.get_connection() as connection:
             result = connection.execute(query)
 
@@ -1340,6 +1471,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             CursorResult for sqlalchemy 2.0+ or LegacyCursorResult for earlier versions.
         """  # noqa: E501
+        self._record_profiled_query(query=query)
         with self.get_connection() as connection:
             if (
                 is_version_greater_or_equal(sqlalchemy.sqlalchemy.__version__, "2.0.0")
@@ -1352,3 +1484,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     result = connection.execute(query)
 
         return result
+
+    def _record_profiled_query(self, query: sqlalchemy.Selectable) -> None:
+        if self._metric_resolution_profiler is None:
+            return
+
+        def _render_query() -> str:
+            try:
+                return str(
+                    query.compile(  # type: ignore[union-attr]
+                        dialect=self.engine.dialect,
+                        compile_kwargs={"literal_binds": True},
+                    )
+                )
+            except Exception:
+                # Not every bound parameter type can be rendered as literal.
+                return str(query)
+
+        self._metric_resolution_profiler.record_query(query=_render_query)
@@ -429,7 +429,7 @@ class ExpectColumnValuesToBeInTypeList(ColumnMapExpectation):
             expected_types_list = configuration.kwargs.get("type_list") if configuration else None
             metric_kwargs = get_metric_kwargs(
                 metric_name="table.column_types",
-                configuration=configuration,
+                expectation=self,
                 runtime_configuration=runtime_configuration,
             )
             metric_domain_kwargs: dict = metric_kwargs.get("metric_domain_kwargs") or {}
@@ -465,7 +465,7 @@ class ExpectColumnValuesToBeInTypeList(ColumnMapExpectation):
         # this adds table.column_types dependency for both aggregate and map versions of expectation
         column_types_metric_kwargs = get_metric_kwargs(
             metric_name="table.column_types",
-            configuration=configuration,
+            expectation=self,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
@@ -387,7 +387,7 @@ class ExpectColumnValuesToBeOfType(ColumnMapExpectation):
             expected_type = kwargs.get("type_")
             metric_kwargs = get_metric_kwargs(
                 metric_name="table.column_types",
-                configuration=configuration,
+                expectation=self,
                 runtime_configuration=runtime_configuration,
             )
             metric_domain_kwargs = metric_kwargs.get("metric_domain_kwargs", {})
@@ -429,7 +429,7 @@ class ExpectColumnValuesToBeOfType(ColumnMapExpectation):
         # this adds table.column_types dependency for both aggregate and map versions of expectation
         column_types_metric_kwargs = get_metric_kwargs(
             metric_name="table.column_types",
-            configuration=configuration,
+            expectation=self,
             runtime_configuration=runtime_configuration,
         )
         validation_dependencies.set_metric_configuration(
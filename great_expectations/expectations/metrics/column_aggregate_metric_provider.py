@@ -31,7 +31,10 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.compatibility import sqlalchemy
+    from great_expectations.execution_engine.execution_engine import PartitionDomainKwargs
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
@@ -115,14 +118,99 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):  # noqa:
         engine: The `ExecutionEngine` used to to evaluate the condition
         partial_fn_type: The metric function type
         domain_type: The domain over which the metric will operate
-        **kwargs: Arguments passed to specified function
+        **kwargs: Arguments passed to specified function (for Pandas, "aggregate_fn_name" names the equivalent
+            "DataFrame.agg()" function, enabling batched evaluation of bundled metrics of numeric columns)
 
     Returns:
         An annotated metric_function which will be called with a simplified signature.
     """  # noqa: E501
     partial_fn_type: MetricPartialFunctionTypes = MetricPartialFunctionTypes.AGGREGATE_FN
     domain_type: MetricDomainTypes = MetricDomainTypes.COLUMN
-    if issubclass(engine, SqlAlchemyExecutionEngine):
+    if issubclass(engine, PandasExecutionEngine):
+
+        def wrapper(metric_fn: Callable):
+            @metric_partial(
+                engine=PandasExecutionEngine,
+                partial_fn_type=partial_fn_type,
+                domain_type=domain_type,
+            )
+            @wraps(metric_fn)
+            def inner_func(  # noqa: PLR0913
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                # Domain records are obtained by "PandasExecutionEngine.resolve_metric_bundle()",
+                # once for all bundled metrics of same compute Domain.
+                partition_domain_kwargs: PartitionDomainKwargs = (
+                    execution_engine._partition_domain_kwargs(
+                        domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                    )
+                )
+                compute_domain_kwargs: dict = partition_domain_kwargs.compute
+                accessor_domain_kwargs: dict = partition_domain_kwargs.accessor
+
+                column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
+
+                def metric_aggregate(df: pd.DataFrame) -> Any:
+                    column: pd.Series = df[column_name]
+                    if filter_column_isnull:
+                        column = column[column.notnull()]
+
+                    return metric_fn(
+                        cls,
+                        column=column,
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
+                # Lets "PandasExecutionEngine.resolve_metric_bundle()" evaluate named aggregates of
+                # bundled columns with one "DataFrame.agg()" call (nulls are skipped either way).
+                metric_aggregate.column_name = column_name  # type: ignore[attr-defined]
+                metric_aggregate.aggregate_fn_name = kwargs.get("aggregate_fn_name")  # type: ignore[attr-defined]
+
+                return metric_aggregate, compute_domain_kwargs, accessor_domain_kwargs
+
+            @wraps(metric_fn)
+            def direct_metric_fn(  # noqa: PLR0913
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                # Used if metric is resolved alone (i.e., without "metric_partial_fn" dependency).
+                metric_aggregate, compute_domain_kwargs, _ = inner_func(
+                    cls,
+                    execution_engine=execution_engine,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=metric_value_kwargs,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                return metric_aggregate(
+                    execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+                )
+
+            inner_func.direct_metric_fn = direct_metric_fn  # type: ignore[attr-defined]
+            return inner_func
+
+        return wrapper
+
+    elif issubclass(engine, SqlAlchemyExecutionEngine):
 
         def wrapper(metric_fn: Callable):
             @metric_partial(
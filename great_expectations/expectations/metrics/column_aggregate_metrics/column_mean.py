@@ -11,7 +11,6 @@ from great_expectations.execution_engine import (
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
 from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 
@@ -21,7 +20,7 @@ class ColumnMean(ColumnAggregateMetricProvider):
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_partial(engine=PandasExecutionEngine, aggregate_fn_name="mean")
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
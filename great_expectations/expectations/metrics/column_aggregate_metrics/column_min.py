@@ -10,7 +10,6 @@ from great_expectations.execution_engine import (
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
 
 
@@ -18,7 +17,7 @@ class ColumnMin(ColumnAggregateMetricProvider):
     metric_name = "column.min"
     value_keys = ()
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_partial(engine=PandasExecutionEngine, aggregate_fn_name="min")
     def _pandas(cls, column, **kwargs):
         return column.min()
 
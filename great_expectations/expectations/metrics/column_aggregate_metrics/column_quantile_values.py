@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 import itertools
 import logging
+import math
 import traceback
 from collections.abc import Iterable
 from typing import Any
@@ -123,6 +124,7 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 allow_relative_error=allow_relative_error,
                 selectable=selectable,
                 execution_engine=execution_engine,
+                table_row_count=table_row_count,
             )
         elif dialect_name == GXSqlDialect.SQLITE:
             return _get_column_quantiles_sqlite(
@@ -131,6 +133,7 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 selectable=selectable,
                 execution_engine=execution_engine,
                 table_row_count=table_row_count,
+                allow_relative_error=allow_relative_error,
             )
         elif dialect_name == GXSqlDialect.AWSATHENA:
             return _get_column_quantiles_athena(
@@ -146,6 +149,7 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 allow_relative_error=allow_relative_error,
                 selectable=selectable,
                 execution_engine=execution_engine,
+                table_row_count=table_row_count,
             )
 
     @metric_value(engine=SparkDFExecutionEngine)
@@ -315,20 +319,52 @@ def _get_column_quantiles_clickhouse(
         raise pe  # noqa: TRY201
 
 
-def _get_column_quantiles_sqlite(
+def _get_column_quantiles_sqlite(  # noqa: PLR0913
     column,
     quantiles: Iterable,
     selectable,
     execution_engine: SqlAlchemyExecutionEngine,
     table_row_count,
+    allow_relative_error: bool | float = False,
 ) -> list:
     """
-    The present implementation is somewhat inefficient, because it requires as many calls to
-    "execution_engine.execute_query()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    All quantiles are obtained from single ordered scan, numbering rows with "ROW_NUMBER()" window function and keeping
+    only rows at requested offsets.  If "allow_relative_error" is specified as a float (maximum error in rank, as for
+    Spark), quantiles are computed from uniform sample of column values instead, which avoids sorting entire table.
+
+    SQLite versions older than 3.25 lack window functions; for them, one "ORDER BY ... OFFSET ... LIMIT 1" query is
+    issued per quantile.
     """  # noqa: E501
-    offsets: list[int] = [quantile * table_row_count - 1 for quantile in quantiles]
+    quantiles = list(quantiles)
+
+    sample_size: int | None = _get_quantile_sample_size(allow_relative_error=allow_relative_error)
+    if sample_size is not None and table_row_count and sample_size < table_row_count:
+        quantiles_results = _get_column_quantiles_from_sample(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+            table_row_count=table_row_count,
+            sample_size=sample_size,
+        )
+        if quantiles_results is not None:
+            return quantiles_results
+
+    offsets: list[int] = [
+        _get_sqlite_quantile_offset(quantile=quantile, row_count=table_row_count)
+        for quantile in quantiles
+    ]
+
+    try:
+        return _get_column_quantiles_using_row_number(
+            column=column,
+            row_numbers=[offset + 1 for offset in offsets],
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+    except sqlalchemy.OperationalError:
+        logger.debug("SQLite does not support window functions; querying quantiles one by one.")
+
     quantile_queries: list[sqlalchemy.Select] = [
         sa.select(column).order_by(column.asc()).offset(offset).limit(1).select_from(selectable)
         for offset in offsets
@@ -352,6 +388,84 @@ def _get_column_quantiles_sqlite(
         raise pe  # noqa: TRY201
 
 
+def _get_sqlite_quantile_offset(quantile: float, row_count: int) -> int:
+    # Zero-based offset of quantile value in ordered column (negative offsets are treated as zero by SQLite).  # noqa: E501
+    return max(int(quantile * row_count - 1), 0)
+
+
+def _get_column_quantiles_using_row_number(
+    column,
+    row_numbers: list[int],
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> list:
+    """Returns values of column at given (one-based) positions in ascending order (single scan)."""
+    ordered_query: sqlalchemy.Subquery = (
+        sa.select(
+            column.label("value"),
+            sa.func.row_number().over(order_by=column.asc()).label("row_number"),
+        )
+        .select_from(selectable)
+        .subquery("ordered")
+    )
+    quantiles_query: sqlalchemy.Select = sa.select(
+        ordered_query.c.row_number, ordered_query.c.value
+    ).where(ordered_query.c.row_number.in_(sorted(set(row_numbers))))
+
+    values_by_row_number: dict[int, Any] = dict(
+        execution_engine.execute_query(quantiles_query).fetchall()
+    )
+    return [values_by_row_number.get(row_number) for row_number in row_numbers]
+
+
+# Probability that all sample quantiles lie within "allow_relative_error" (in rank) of true ones.
+_QUANTILE_SAMPLE_CONFIDENCE: float = 0.99
+
+
+def _get_quantile_sample_size(allow_relative_error: bool | float | str) -> int | None:
+    """Returns number of sampled rows guaranteeing specified rank error (per Dvoretzky-Kiefer-Wolfowitz inequality).
+
+    Sampling is only used if "allow_relative_error" is a float between 0 and 1 (exclusive); otherwise, returns None.
+    """  # noqa: E501
+    if not isinstance(allow_relative_error, float) or not 0.0 < allow_relative_error < 1.0:
+        return None
+
+    return math.ceil(
+        math.log(2.0 / (1.0 - _QUANTILE_SAMPLE_CONFIDENCE)) / (2.0 * allow_relative_error**2)
+    )
+
+
+def _get_column_quantiles_from_sample(  # noqa: PLR0913
+    column,
+    quantiles: list,
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    table_row_count: int,
+    sample_size: int,
+) -> list | None:
+    # Bernoulli sample (probability of about "sample_size / table_row_count" per row) requires no sorting in database.  # noqa: E501
+    sample_query: sqlalchemy.Select = (
+        sa.select(column)
+        .select_from(selectable)
+        .where(sa.func.abs(sa.func.random() % table_row_count) < sample_size)
+    )
+    sample: list = [row[0] for row in execution_engine.execute_query(sample_query).fetchall()]
+    if not sample:
+        return None
+
+    # Like SQLite "ORDER BY", place NULL values first.
+    sample.sort(key=lambda value: (value is not None, value))
+    return [
+        sample[
+            min(
+                _get_sqlite_quantile_offset(quantile=quantile, row_count=len(sample)),
+                len(sample) - 1,
+            )
+        ]
+        for quantile in quantiles
+    ]
+
+
 def _get_column_quantiles_athena(
     column,
     quantiles: Iterable,
@@ -378,12 +492,13 @@ def _get_column_quantiles_athena(
 # the generic sqlalchemy compatible DBMS engine, because users often use the postgresql driver to connect to Redshift  # noqa: E501
 # The key functional difference is that Redshift does not support the aggregate function
 # "percentile_disc", but does support the approximate percentile_disc or percentile_cont function version instead.```  # noqa: E501
-def _get_column_quantiles_generic_sqlalchemy(
+def _get_column_quantiles_generic_sqlalchemy(  # noqa: PLR0913
     column,
     quantiles: Iterable,
     allow_relative_error: bool,
     selectable,
     execution_engine: SqlAlchemyExecutionEngine,
+    table_row_count: int | None = None,
 ) -> list:
     selects: list[sqlalchemy.WithinGroup] = [
         sa.func.percentile_disc(quantile).within_group(column.asc()) for quantile in quantiles
@@ -424,6 +539,22 @@ def _get_column_quantiles_generic_sqlalchemy(
                     f'The SQL engine dialect "{execution_engine.dialect!s}" does not support computing quantiles '  # noqa: E501
                     "without approximation error; set allow_relative_error to True to allow approximate quantiles."  # noqa: E501
                 )
+        elif table_row_count is not None:
+            # Dialect has no "percentile_disc"; obtain exact ("discrete") quantiles from single ordered scan.  # noqa: E501
+            try:
+                return _get_column_quantiles_using_row_number(
+                    column=column,
+                    row_numbers=[
+                        max(math.ceil(quantile * table_row_count), 1) for quantile in quantiles
+                    ],
+                    selectable=selectable,
+                    execution_engine=execution_engine,
+                )
+            except (sqlalchemy.ProgrammingError, sqlalchemy.OperationalError) as e:
+                raise ValueError(  # noqa: TRY003
+                    f'The SQL engine dialect "{execution_engine.dialect!s}" does not support computing quantiles '  # noqa: E501
+                    '(neither "percentile_disc" nor window functions are available).'
+                ) from e
         else:
             raise ValueError(  # noqa: TRY003
                 f'The SQL engine dialect "{execution_engine.dialect!s}" does not support computing quantiles with '  # noqa: E501
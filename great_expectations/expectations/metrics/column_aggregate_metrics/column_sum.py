@@ -10,7 +10,6 @@ from great_expectations.execution_engine import (
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
 from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 
@@ -18,7 +17,7 @@ from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 class ColumnSum(ColumnAggregateMetricProvider):
     metric_name = "column.sum"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_partial(engine=PandasExecutionEngine, aggregate_fn_name="sum")
     def _pandas(cls, column, **kwargs):
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
         return column.sum()
@@ -24,6 +24,9 @@ from great_expectations.core.metric_function_types import (
 )
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    RowwiseAggregateFn,
+)
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (  # noqa: E501
     _is_sqlalchemy_metric_selectable,
 )
@@ -271,6 +274,50 @@ def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
     )
 
 
+def _sqlalchemy_map_condition_unexpected_count_rowwise_aggregate_fn(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns unexpected count for MapExpectations, whose unexpected_condition is a window function (or contains a
+    subquery), as bundled aggregate, so that all such unexpected counts of a Domain are computed by a single query.
+    """  # noqa: E501
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
+        "unexpected_condition"
+    ]
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.  Column name does not affect records, so leaving it out lets
+    unexpected counts for all columns of a Domain share one query.
+    """  # noqa: E501
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+    domain_kwargs.pop("column", None)
+
+    # The integral values are cast to SQL Numeric in order to avoid a bug in AWS Redshift (converted to integer by aggregate).  # noqa: E501
+    return (
+        RowwiseAggregateFn(
+            row_expression=sa.case(
+                (
+                    unexpected_condition,
+                    sa.sql.expression.cast(1, sa.Numeric),
+                ),
+                else_=sa.sql.expression.cast(0, sa.Numeric),
+            ),
+            aggregate=_sqlalchemy_unexpected_count_sum,
+        ),
+        domain_kwargs,
+        {},
+    )
+
+
+def _sqlalchemy_unexpected_count_sum(condition: sqlalchemy.ColumnClause) -> sqlalchemy.Cast:
+    # Unexpected count is NULL if the table is empty, in which case it should default to zero.
+    return sa.sql.expression.cast(sa.func.coalesce(sa.func.sum(condition), 0), sa.Integer)
+
+
 def _sqlalchemy_map_condition_unexpected_count_value(
     cls,
     execution_engine: SqlAlchemyExecutionEngine,
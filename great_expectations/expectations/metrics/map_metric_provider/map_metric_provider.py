@@ -53,6 +53,7 @@ from great_expectations.expectations.metrics.map_metric_provider.map_condition_a
     _sqlalchemy_map_condition_query,
     _sqlalchemy_map_condition_rows,
     _sqlalchemy_map_condition_unexpected_count_aggregate_fn,
+    _sqlalchemy_map_condition_unexpected_count_rowwise_aggregate_fn,
     _sqlalchemy_map_condition_unexpected_count_value,
 )
 from great_expectations.expectations.metrics.map_metric_provider.multicolumn_map_condition_auxilliary_methods import (  # noqa: E501
@@ -309,24 +310,18 @@ class MapMetricProvider(MetricProvider):
                                 metric_fn_type=MetricFunctionTypes.VALUE,
                             )
                         else:
-                            register_metric(
-                                metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+                            cls._register_sqlalchemy_rowwise_unexpected_count_metrics(
+                                metric_name=metric_name,
                                 metric_domain_keys=metric_domain_keys,
                                 metric_value_keys=metric_value_keys,
-                                execution_engine=engine,
-                                metric_class=cls,
-                                metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
-                                metric_fn_type=MetricFunctionTypes.VALUE,
+                                engine=engine,
                             )
                     elif metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN:
-                        register_metric(
-                            metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+                        cls._register_sqlalchemy_rowwise_unexpected_count_metrics(
+                            metric_name=metric_name,
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=metric_value_keys,
-                            execution_engine=engine,
-                            metric_class=cls,
-                            metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
-                            metric_fn_type=MetricFunctionTypes.VALUE,
+                            engine=engine,
                         )
                     if domain_type == MetricDomainTypes.COLUMN:
                         register_metric(
@@ -546,6 +541,52 @@ class MapMetricProvider(MetricProvider):
                     metric_fn_type=metric_fn_type,
                 )
 
+    @classmethod
+    def _register_sqlalchemy_rowwise_unexpected_count_metrics(
+        cls,
+        metric_name: str,
+        metric_domain_keys: tuple[str, ...],
+        metric_value_keys: tuple[str, ...],
+        engine: type[ExecutionEngine],
+    ) -> None:
+        """Registers "unexpected_count" of condition, which cannot be summed directly (window function or subquery).
+
+        Unless metric resolves all columns itself (in which case it is computed by separate query), "unexpected_count"
+        is bundled (as "RowwiseAggregateFn"), so that "SqlAlchemyExecutionEngine" computes unexpected counts of all such
+        conditions on same Domain with one query.
+        """  # noqa: E501
+        if _is_sqlalchemy_metric_selectable(map_metric_provider=cls):
+            register_metric(
+                metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+                metric_domain_keys=metric_domain_keys,
+                metric_value_keys=metric_value_keys,
+                execution_engine=engine,
+                metric_class=cls,
+                metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
+                metric_fn_type=MetricFunctionTypes.VALUE,
+            )
+            return
+
+        # Documentation in "MetricProvider._register_metric_functions()" explains registration protocol.  # noqa: E501
+        register_metric(
+            metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_keys=metric_domain_keys,
+            metric_value_keys=metric_value_keys,
+            execution_engine=engine,
+            metric_class=cls,
+            metric_provider=_sqlalchemy_map_condition_unexpected_count_rowwise_aggregate_fn,
+            metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+        )
+        register_metric(
+            metric_name=f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+            metric_domain_keys=metric_domain_keys,
+            metric_value_keys=metric_value_keys,
+            execution_engine=engine,
+            metric_class=cls,
+            metric_provider=None,
+            metric_fn_type=MetricFunctionTypes.VALUE,
+        )
+
     @classmethod
     @override
     def _get_evaluation_dependencies(
@@ -196,6 +196,9 @@ class MetricProvider(metaclass=MetaMetricProvider):
                 of "resolved_metric_dependencies_by_metric_name" using previously declared "metric_partial_fn" key (as
                 described above), composes full metric execution configuration structure, and adds this configuration
                 to list of metrics to be resolved as one bundle (specifics pertaining to "ExecutionEngine" subclasses).
+                Backends able to compute aggregate directly as well (e.g., Pandas) set "direct_metric_fn" attribute of
+                partial metric implementation function; it is registered as "metric_provider" of original metric, and
+                used when "metric_partial_fn" dependency is absent (otherwise, metric is bundled as described above).
                 """  # noqa: E501
                 if metric_fn_type not in [
                     MetricFunctionTypes.VALUE,
@@ -233,7 +236,7 @@ support "{MetricFunctionTypes.VALUE.value}" and "{MetricPartialFunctionTypes.AGG
                         metric_value_keys=metric_value_keys,
                         execution_engine=engine,
                         metric_class=cls,
-                        metric_provider=None,
+                        metric_provider=getattr(metric_fn, "direct_metric_fn", None),
                         metric_fn_type=metric_fn_type,
                     )
             elif hasattr(attr_obj, "_renderer_type"):
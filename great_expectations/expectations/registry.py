@@ -338,7 +338,12 @@ def get_metric_kwargs(
     metric_name: str,
     configuration: Optional[ExpectationConfiguration] = None,
     runtime_configuration: Optional[dict] = None,
+    expectation: Optional[Expectation] = None,
 ) -> dict:
+    """Returns domain and value keys of metric (and kwargs, given "expectation" or "configuration").
+
+    Passing already built "expectation" avoids constructing it again from "configuration".
+    """
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -348,8 +353,9 @@ def get_metric_kwargs(
             "metric_domain_keys": metric_definition["metric_domain_keys"],
             "metric_value_keys": metric_definition["metric_value_keys"],
         }
-        if configuration:
+        if expectation is None and configuration:
             expectation = configuration.to_domain_obj()
+        if expectation is not None:
             configuration_kwargs = expectation._get_runtime_kwargs(
                 runtime_configuration=runtime_configuration
             )
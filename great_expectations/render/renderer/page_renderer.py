@@ -178,6 +178,27 @@ class ValidationResultsPageRenderer(Renderer):
         expectation_suite_name: str,
     ) -> Dict[str, list]:
         columns = defaultdict(list)
+        self.add_meta_properties_to_render(
+            validation_results=validation_results, expectation_suite_name=expectation_suite_name
+        )
+        for evr in validation_results.results:
+            if "column" in evr.expectation_config.kwargs:
+                column = evr.expectation_config.kwargs["column"]
+            else:
+                column = "Table-Level Expectations"
+
+            columns[column].append(evr)
+
+        return columns
+
+    def add_meta_properties_to_render(
+        self,
+        validation_results: ExpectationSuiteValidationResult,
+        expectation_suite_name: str,
+    ) -> None:
+        """Adds custom meta properties of Expectation Suite (see "_get_meta_properties_notes()")
+        to Expectation configurations of validation results, which then render them.
+        """
         try:
             suite_meta = (
                 self._data_context.suites.get(expectation_suite_name).meta
@@ -187,19 +208,11 @@ class ValidationResultsPageRenderer(Renderer):
         except Exception:
             suite_meta = None
         meta_properties_to_render = self._get_meta_properties_notes(suite_meta)
-        for evr in validation_results.results:
-            if meta_properties_to_render is not None:
-                evr.expectation_config.kwargs["meta_properties_to_render"] = (
-                    meta_properties_to_render
-                )
-            if "column" in evr.expectation_config.kwargs:
-                column = evr.expectation_config.kwargs["column"]
-            else:
-                column = "Table-Level Expectations"
-
-            columns[column].append(evr)
+        if meta_properties_to_render is None:
+            return
 
-        return columns
+        for evr in validation_results.results:
+            evr.expectation_config.kwargs["meta_properties_to_render"] = meta_properties_to_render
 
     def _generate_collapse_content_block(
         self,
@@ -1,32 +1,49 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import pathlib
+import threading
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
 )
 from great_expectations.data_context.store.json_site_store import JsonSiteStore
+from great_expectations.data_context.store.validations_store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.render.renderer.page_renderer import ValidationResultsPageRenderer
 from great_expectations.render.util import resource_key_passes_run_name_filter
 
+if TYPE_CHECKING:
+    from great_expectations.core.data_context_key import DataContextKey
+
 logger = logging.getLogger(__name__)
 
+# Number of resources fetched from source store together (bounds memory held by fetched resources).
+SOURCE_STORE_GET_MANY_CHUNK_SIZE = 64
+
+# Version of layout of build manifest (manifests of other versions are discarded).
+SITE_BUILD_MANIFEST_VERSION = 2
+
 FALSEY_YAML_STRINGS = [
     "0",
     "None",
@@ -38,6 +55,63 @@ FALSEY_YAML_STRINGS = [
 ]
 
 
+class SiteBuildManifest:
+    """Record of pages rendered by incremental builds of a Data Docs site (see "SiteBuilder"), persisted in site itself.
+
+    For every site section, manifest holds fingerprint of section's rendering configuration and, for every rendered page,
+    content hash of its source resource and information shown about it on index page.  Page, whose source content hash
+    is unchanged (and whose section fingerprint is unchanged), is not rendered again; index page is built from recorded
+    information, without retrieving source resources.
+    """  # noqa: E501
+
+    def __init__(self, sections: Optional[Dict[str, dict]] = None) -> None:
+        self._sections: Dict[str, dict] = sections or {}
+
+    @classmethod
+    def from_json_dict(cls, manifest: Optional[dict]) -> SiteBuildManifest:
+        if not manifest or manifest.get("version") != SITE_BUILD_MANIFEST_VERSION:
+            return cls()
+
+        return cls(sections=manifest.get("sections"))
+
+    def to_json_dict(self) -> dict:
+        return {"version": SITE_BUILD_MANIFEST_VERSION, "sections": self._sections}
+
+    def use_section(self, section_name: str, fingerprint: str) -> None:
+        """Starts recording pages of section; pages of other fingerprint are discarded."""
+        section: Optional[dict] = self._sections.get(section_name)
+        if section is None or section.get("fingerprint") != fingerprint:
+            self._sections[section_name] = {"fingerprint": fingerprint, "pages": {}}
+
+    def get_page(self, section_name: str, resource_key: DataContextKey) -> Optional[dict]:
+        section: dict = self._sections.get(section_name) or {}
+        return section.get("pages", {}).get(self._to_page_id(resource_key))
+
+    def set_page(
+        self,
+        section_name: str,
+        resource_key: DataContextKey,
+        content_hash: str,
+        index_info: Optional[dict] = None,
+    ) -> None:
+        self._sections[section_name]["pages"][self._to_page_id(resource_key)] = {
+            "content_hash": content_hash,
+            "index_info": index_info,
+        }
+
+    def retain_pages(self, section_name: str, resource_keys: List[DataContextKey]) -> None:
+        """Discards pages of section, whose resources are no longer in source store."""
+        pages: dict = self._sections[section_name]["pages"]
+        page_ids = {self._to_page_id(resource_key) for resource_key in resource_keys}
+        self._sections[section_name]["pages"] = {
+            page_id: page for page_id, page in pages.items() if page_id in page_ids
+        }
+
+    @staticmethod
+    def _to_page_id(resource_key: DataContextKey) -> str:
+        return "/".join(str(key_element) for key_element in resource_key.to_tuple())
+
+
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
     DataContext.
@@ -126,12 +200,18 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        incremental=False,
+        max_workers=None,
+        use_process_pool=False,
         **kwargs,
     ) -> None:
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental = incremental
+        self.max_workers = max_workers
+        self.use_process_pool = use_process_pool
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -148,26 +228,13 @@ class SiteBuilder:
 
         self.data_context_id = data_context_id
 
-        # set custom_styles_directory if present
-        custom_styles_directory = None
-        plugins_directory = data_context.plugins_directory
-        if plugins_directory and os.path.isdir(  # noqa: PTH112
-            os.path.join(  # noqa: PTH118
-                plugins_directory, "custom_data_docs", "styles"
-            )
-        ):
-            custom_styles_directory = os.path.join(  # noqa: PTH118
-                plugins_directory, "custom_data_docs", "styles"
-            )
-
-        # set custom_views_directory if present
-        custom_views_directory = None
-        if plugins_directory and os.path.isdir(  # noqa: PTH112
-            os.path.join(plugins_directory, "custom_data_docs", "views")  # noqa: PTH118
-        ):
-            custom_views_directory = os.path.join(  # noqa: PTH118
-                plugins_directory, "custom_data_docs", "views"
-            )
+        # set custom_styles_directory and custom_views_directory if present
+        custom_styles_directory = _get_custom_data_docs_directory(
+            plugins_directory=data_context.plugins_directory, directory_name="styles"
+        )
+        custom_views_directory = _get_custom_data_docs_directory(
+            plugins_directory=data_context.plugins_directory, directory_name="views"
+        )
 
         if site_index_builder is None:
             site_index_builder = {"class_name": "DefaultSiteIndexBuilder"}
@@ -239,6 +306,8 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "max_workers": self.max_workers,
+                    "use_process_pool": self.use_process_pool,
                 },
                 config_defaults={
                     "name": site_section_name,
@@ -305,12 +374,25 @@ class SiteBuilder:
 
         :param build_index: a flag if False, skips building the index page
 
+        If the site is configured with "incremental: true", pages are rendered only for resources
+        that are new or whose content changed since the previous build (as recorded in the site's
+        build manifest), and the index page is built without retrieving recorded resources.
+
         :return:
         """
 
+        build_manifest: Optional[SiteBuildManifest] = None
+        if self.incremental and not self.cloud_mode:
+            build_manifest = SiteBuildManifest.from_json_dict(
+                self.target_store.read_build_manifest()
+            )
+
+        # Site section builders (and site index builder) only receive build manifest in incremental mode.  # noqa: E501
+        build_kwargs: dict = {} if build_manifest is None else {"build_manifest": build_manifest}
+
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
-            site_section_builder.build(resource_identifiers=resource_identifiers)
+            site_section_builder.build(resource_identifiers=resource_identifiers, **build_kwargs)
 
         # GX Cloud supports JSON Site Data Docs
         # Skip static assets, indexing
@@ -319,7 +401,10 @@ class SiteBuilder:
 
         self.target_store.copy_static_assets()
 
-        _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        _, index_links_dict = self.site_index_builder.build(build_index=build_index, **build_kwargs)
+        if build_manifest is not None:
+            self.target_store.write_build_manifest(build_manifest.to_json_dict())
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -360,11 +445,17 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_workers=None,
+        use_process_pool=False,
         **kwargs,
     ) -> None:
         self.name = name
         self.data_context = data_context
         self.source_store = data_context.stores[source_store_name]
+        self.max_workers = max_workers
+        self.use_process_pool = use_process_pool
+        # Renderer and view of page render worker thread (see "_initialize_page_render_thread()").
+        self._page_render_thread_local = threading.local()
         self.target_store = target_store
         self.run_name_filter = run_name_filter
         self.validation_results_limit = validation_results_limit
@@ -379,6 +470,8 @@ class DefaultSiteSectionBuilder:
                 "SiteSectionBuilder requires a renderer configuration " "with a class_name key."
             )
         module_name = renderer.get("module_name") or "great_expectations.render.renderer"
+        # Page render workers instantiate their own renderer and view from these configurations.
+        self._renderer_config = {**renderer, "module_name": module_name}
         self.renderer_class = instantiate_class_from_config(
             config=renderer,
             runtime_environment={"data_context": data_context},
@@ -398,12 +491,14 @@ class DefaultSiteSectionBuilder:
                 "class_name": "DefaultJinjaPageView",
             }
         module_name = view.get("module_name") or module_name
+        self._view_config = {**view, "module_name": module_name}
+        self._view_runtime_environment = {
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        }
         self.view_class = instantiate_class_from_config(
             config=view,
-            runtime_environment={
-                "custom_styles_directory": custom_styles_directory,
-                "custom_views_directory": custom_views_directory,
-            },
+            runtime_environment=self._view_runtime_environment,
             config_defaults={"module_name": module_name},
         )
         if not self.view_class:
@@ -413,13 +508,23 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: C901, PLR0912
+    def build(  # noqa: C901
+        self,
+        resource_identifiers=None,
+        build_manifest: Optional[SiteBuildManifest] = None,
+    ) -> None:
         source_store_keys = self.source_store.list_keys()
+        if build_manifest is not None:
+            build_manifest.use_section(section_name=self.name, fingerprint=self._get_fingerprint())
+            if not resource_identifiers:
+                build_manifest.retain_pages(section_name=self.name, resource_keys=source_store_keys)
+
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -432,68 +537,380 @@ class DefaultSiteSectionBuilder:
             if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
                 if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+
+            resource_keys.append(resource_key)
+
+        with self._get_page_render_executor() as executor:
+            if build_manifest is not None:
+                self._build_changed_resource_pages(
+                    resource_keys=resource_keys, build_manifest=build_manifest, executor=executor
                 )
-                continue
+                return
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.name
-                logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = resource_key.expectation_suite_identifier.name
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
-                    )
+            # Resources are fetched from source store concurrently, a bounded chunk at a time.
+            chunk_start: int
+            for chunk_start in range(0, len(resource_keys), SOURCE_STORE_GET_MANY_CHUNK_SIZE):
+                resource_keys_chunk = resource_keys[
+                    chunk_start : chunk_start + SOURCE_STORE_GET_MANY_CHUNK_SIZE
+                ]
+                resources = self.source_store.get_many(resource_keys_chunk, raise_on_missing=False)
+                resource_keys_and_resources = []
+                for resource_key, resource in zip(resource_keys_chunk, resources):
+                    if resource is None:
+                        logger.warning(
+                            f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+                        )
+                        continue
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
+                    resource_keys_and_resources.append(
+                        (resource_key, _to_page_resource(resource_key, resource))
                     )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
+
+                self._build_resource_pages(
+                    resource_keys_and_resources=resource_keys_and_resources, executor=executor
+                )
+
+    def _build_changed_resource_pages(
+        self,
+        resource_keys: list,
+        build_manifest: SiteBuildManifest,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Renders pages only for resources, whose pages are missing or whose content changed since recorded in build manifest."""  # noqa: E501
+        site_keys = set(self._get_site_store_backend().list_keys())
+
+        chunk_start: int
+        for chunk_start in range(0, len(resource_keys), SOURCE_STORE_GET_MANY_CHUNK_SIZE):
+            resource_keys_chunk = resource_keys[
+                chunk_start : chunk_start + SOURCE_STORE_GET_MANY_CHUNK_SIZE
+            ]
+            # Serialized values are hashed as stored; unchanged resources need not be deserialized.
+            values = self.source_store.store_backend.get_many(
+                [
+                    self.source_store.key_to_tuple(resource_key)
+                    for resource_key in resource_keys_chunk
+                ],
+                raise_on_missing=False,
+            )
+            resource_keys_and_resources = []
+            content_hashes: List[str] = []
+            for resource_key, value in zip(resource_keys_chunk, values):
+                if not value:
+                    logger.warning(
+                        f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
                     )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
+                    continue
+
+                content_hash: str = _hash_serialized_value(value)
+                page: Optional[dict] = build_manifest.get_page(
+                    section_name=self.name, resource_key=resource_key
+                )
+                if (
+                    page is not None
+                    and page["content_hash"] == content_hash
+                    and resource_key.to_tuple() in site_keys
+                ):
+                    continue
+
+                resource = _to_page_resource(resource_key, self.source_store.deserialize(value))
+                resource_keys_and_resources.append((resource_key, resource))
+                content_hashes.append(content_hash)
+
+            built_pages: List[bool] = self._build_resource_pages(
+                resource_keys_and_resources=resource_keys_and_resources, executor=executor
+            )
+            for (resource_key, resource), content_hash, built_page in zip(
+                resource_keys_and_resources, content_hashes, built_pages
+            ):
+                if built_page:
+                    build_manifest.set_page(
+                        section_name=self.name,
+                        resource_key=resource_key,
+                        content_hash=content_hash,
+                        index_info=convert_to_json_serializable(_get_index_info(resource)),
                     )
+
+    def _get_site_store_backend(self):
+        if self.name == "expectations":
+            return self.target_store.store_backends[ExpectationSuiteIdentifier]
+
+        return self.target_store.store_backends[ValidationResultIdentifier]
+
+    def _get_fingerprint(self) -> str:
+        """Identifies configuration that rendered pages depend on; pages rendered under different one are rendered again."""  # noqa: E501
+        return _hash_serialized_value(
+            {
+                "ge_version": ge_version,
+                "renderer": type(self.renderer_class).__qualname__,
+                "view": type(self.view_class).__qualname__,
+                "data_context_id": str(self.data_context_id),
+                "show_how_to_buttons": self.show_how_to_buttons,
+                # Options of renderer and view (e.g., "run_info_at_end") also change pages.
+                "renderer_config": self._renderer_config,
+                "view_config": self._view_config,
+                "view_runtime_environment": self._view_runtime_environment,
+                "run_name_filter": self.run_name_filter,
+                "validation_results_limit": self.validation_results_limit,
+            }
+        )
+
+    @contextmanager
+    def _get_page_render_executor(self) -> Iterator[Optional[Executor]]:
+        """Yields executor rendering pages of one build (None if pages are rendered serially)."""
+        if not self.max_workers or self.max_workers == 1:
+            yield None
+            return
+
+        # Every worker instantiates renderer and view (with its template environment) once.
+        executor: Executor
+        if self.use_process_pool and not self.cloud_mode:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_initialize_page_render_worker,
+                initargs=(self._renderer_config, self._view_config, self._view_runtime_environment),
+            )
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, initializer=self._initialize_page_render_thread
+            )
+
+        with executor:
+            yield executor
+
+    def _build_resource_pages(
+        self,
+        resource_keys_and_resources: List[Tuple[Any, Any]],
+        executor: Optional[Executor] = None,
+    ) -> List[bool]:
+        """Builds pages of resources (concurrently, if executor is given); returns, for every resource, whether its page was built."""  # noqa: E501
+        if executor is None:
+            return [
+                self._build_resource_page(resource_key=resource_key, resource=resource)
+                for resource_key, resource in resource_keys_and_resources
+            ]
+
+        if not isinstance(executor, ProcessPoolExecutor):
+            return list(
+                executor.map(
+                    lambda resource_key_and_resource: self._build_resource_page(
+                        *resource_key_and_resource
+                    ),
+                    resource_keys_and_resources,
+                )
+            )
+
+        built_pages: List[bool] = []
+        # Expectation Suites (which are bound to Data Context) are rendered in this process.
+        futures: list = [
+            None
+            if isinstance(resource_key, ExpectationSuiteIdentifier)
+            else executor.submit(
+                _render_page_in_worker,
+                self._prepare_resource_for_worker(resource),
+                self.data_context_id,
+                self.show_how_to_buttons,
+            )
+            for resource_key, resource in resource_keys_and_resources
+        ]
+        for (resource_key, resource), future in zip(resource_keys_and_resources, futures):
+            if future is None:
+                built_pages.append(
+                    self._build_resource_page(resource_key=resource_key, resource=resource)
+                )
+                continue
+
+            self._log_resource_page_rendering(resource_key=resource_key)
+            try:
+                self._write_resource_page(
+                    resource_key=resource_key, rendered_content=future.result()
+                )
             except Exception as e:
-                exception_message = """\
+                self._log_rendering_exception(e)
+                built_pages.append(False)
+            else:
+                built_pages.append(True)
+
+        return built_pages
+
+    def _prepare_resource_for_worker(self, resource):
+        """Resolves, in this process, what rendering of resource needs from Data Context (which worker processes lack)."""  # noqa: E501
+        expectation_suite_name: Optional[str] = resource.meta.get("expectation_suite_name")
+        if (
+            isinstance(self.renderer_class, ValidationResultsPageRenderer)
+            and expectation_suite_name
+        ):
+            self.renderer_class.add_meta_properties_to_render(
+                validation_results=resource, expectation_suite_name=expectation_suite_name
+            )
+
+        return resource
+
+    def _initialize_page_render_thread(self) -> None:
+        renderer, view = _instantiate_page_renderer_and_view(
+            renderer_config=self._renderer_config,
+            view_config=self._view_config,
+            view_runtime_environment=self._view_runtime_environment,
+            data_context=self.data_context,
+        )
+        self._page_render_thread_local.renderer = renderer
+        self._page_render_thread_local.view = view
+
+    def _build_resource_page(self, resource_key, resource) -> bool:
+        self._log_resource_page_rendering(resource_key=resource_key)
+
+        # Worker threads render with their own renderer and view (which are not thread-safe).
+        renderer = getattr(self._page_render_thread_local, "renderer", self.renderer_class)
+        view = getattr(self._page_render_thread_local, "view", self.view_class)
+        try:
+            rendered_content = renderer.render(resource)
+
+            if not self.cloud_mode:
+                rendered_content = view.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+
+            self._write_resource_page(resource_key=resource_key, rendered_content=rendered_content)
+        except Exception as e:
+            self._log_rendering_exception(e)
+            return False
+
+        return True
+
+    def _write_resource_page(self, resource_key, rendered_content) -> None:
+        if self.cloud_mode:
+            self.target_store.set(
+                GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
+                rendered_content,
+                source_type=resource_key.resource_type,
+                source_id=resource_key.id,
+            )
+        else:
+            # Verify type
+            self.target_store.set(
+                SiteSectionIdentifier(
+                    site_section_name=self.name,
+                    resource_identifier=resource_key,
+                ),
+                rendered_content,
+            )
+
+    def _log_resource_page_rendering(self, resource_key) -> None:
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.name
+            logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = resource_key.expectation_suite_identifier.name
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                )
+
+    @staticmethod
+    def _log_rendering_exception(e: Exception) -> None:
+        exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """  # noqa: E501
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400
+        exception_traceback = traceback.format_exc()
+        exception_message += (
+            f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message)
+
+
+# Renderer and view of page render worker process (see "_initialize_page_render_worker()").
+_worker_page_renderer: Any = None
+_worker_page_view: Any = None
+
+
+def _initialize_page_render_worker(
+    renderer_config: dict, view_config: dict, view_runtime_environment: dict
+) -> None:
+    global _worker_page_renderer, _worker_page_view
+    _worker_page_renderer, _worker_page_view = _instantiate_page_renderer_and_view(
+        renderer_config=renderer_config,
+        view_config=view_config,
+        view_runtime_environment=view_runtime_environment,
+    )
+
+
+def _instantiate_page_renderer_and_view(
+    renderer_config: dict,
+    view_config: dict,
+    view_runtime_environment: dict,
+    data_context: Optional[Any] = None,
+) -> Tuple[Any, Any]:
+    renderer = instantiate_class_from_config(
+        config=renderer_config,
+        runtime_environment={"data_context": data_context},
+        config_defaults={},
+    )
+    view = instantiate_class_from_config(
+        config=view_config,
+        runtime_environment=view_runtime_environment,
+        config_defaults={},
+    )
+    return renderer, view
+
+
+def _render_page_in_worker(resource, data_context_id, show_how_to_buttons) -> str:
+    rendered_content = _worker_page_renderer.render(resource)
+    return _worker_page_view.render(
+        rendered_content,
+        data_context_id=data_context_id,
+        show_how_to_buttons=show_how_to_buttons,
+    )
+
+
+def _to_page_resource(resource_key, resource):
+    if isinstance(resource_key, ExpectationSuiteIdentifier):
+        return ExpectationSuite(**resource)
+
+    return resource
+
+
+def _get_custom_data_docs_directory(
+    plugins_directory: Optional[str], directory_name: str
+) -> Optional[str]:
+    if not plugins_directory:
+        return None
+
+    directory = os.path.join(  # noqa: PTH118
+        plugins_directory, "custom_data_docs", directory_name
+    )
+    return directory if os.path.isdir(directory) else None  # noqa: PTH112
+
+
+def _hash_serialized_value(value: Union[str, bytes, dict]) -> str:
+    if isinstance(value, dict):
+        value = json.dumps(value, sort_keys=True, default=str)
+
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+
+    return hashlib.sha256(value).hexdigest()
+
+
+def _get_index_info(resource) -> Optional[dict]:
+    """Returns information about Validation Result, shown on index page (None for others)."""
+    if isinstance(resource, ExpectationSuite):
+        return None
+
+    return {
+        "success": resource.success,
+        "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+        "batch_spec": resource.meta.get("batch_spec", {}),
+    }
 
 
 class DefaultSiteIndexBuilder:
@@ -711,12 +1128,17 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param build_manifest: if given (incremental build), index information recorded for pages is used instead of
+        retrieving their validation results from the source store
         :return: tuple(index_page_url, index_links_dict)
         """  # noqa: E501
 
@@ -737,10 +1159,10 @@ class DefaultSiteIndexBuilder:
             self._build_validation_and_profiling_result_site_keys(skip_and_clean_missing)
         )
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, build_manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, build_manifest
         )
 
         viewable_content = ""
@@ -842,6 +1264,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -855,17 +1278,20 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
-            for profiling_result_key in profiling_result_site_keys:
+            for profiling_result_key, index_info in self._get_index_infos(
+                validation_result_keys=profiling_result_site_keys,
+                validations_store_name=self.source_stores.get("profiling"),
+                section_name="profiling",
+                build_manifest=build_manifest,
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
-                    )
+                    if index_info is None:
+                        raise exceptions.InvalidKeyError(  # noqa: TRY003, TRY301
+                            f"Unable to retrieve {profiling_result_key!s}"
+                        )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -888,6 +1314,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -910,18 +1337,21 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
-            for validation_result_key in validation_result_site_keys:
+            for validation_result_key, index_info in self._get_index_infos(
+                validation_result_keys=validation_result_site_keys,
+                validations_store_name=self.source_stores.get("validations"),
+                section_name="validations",
+                build_manifest=build_manifest,
+            ):
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
-                    )
+                    if index_info is None:
+                        raise exceptions.InvalidKeyError(  # noqa: TRY003, TRY301
+                            f"Unable to retrieve {validation_result_key!s}"
+                        )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = index_info["success"]
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -941,6 +1371,127 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
                     logger.warning(error_msg)
 
+    def _get_index_infos(
+        self,
+        validation_result_keys: List[ValidationResultIdentifier],
+        validations_store_name: Optional[str] = None,
+        section_name: Optional[str] = None,
+        build_manifest: Optional[SiteBuildManifest] = None,
+    ) -> Iterator[Tuple[ValidationResultIdentifier, Optional[dict]]]:
+        """Yields validation result keys with information shown on index page (None if not found).
+
+        Information recorded in build manifest (if given) is used as is, followed by summaries stored by validations
+        store (if it stores them); only remaining validation results are retrieved from source store.
+        """  # noqa: E501
+        index_infos: Dict[ValidationResultIdentifier, dict] = {}
+        if build_manifest is not None and section_name:
+            self._add_index_infos_from_build_manifest(
+                index_infos=index_infos,
+                validation_result_keys=validation_result_keys,
+                section_name=section_name,
+                build_manifest=build_manifest,
+            )
+
+        validations_store = self.data_context.stores[
+            validations_store_name or self.data_context.validations_store_name
+        ]
+        if isinstance(validations_store, ValidationsStore) and validations_store.stores_summaries:
+            self._add_index_infos_from_summaries(
+                index_infos=index_infos,
+                validation_result_keys=[
+                    validation_result_key
+                    for validation_result_key in validation_result_keys
+                    if validation_result_key not in index_infos
+                ],
+                validations_store=validations_store,
+            )
+
+        self._add_index_infos_from_validation_results(
+            index_infos=index_infos,
+            validation_result_keys=[
+                validation_result_key
+                for validation_result_key in validation_result_keys
+                if validation_result_key not in index_infos
+            ],
+            validations_store_name=validations_store_name,
+        )
+
+        validation_result_key: ValidationResultIdentifier
+        for validation_result_key in validation_result_keys:
+            yield validation_result_key, index_infos.get(validation_result_key)
+
+    @staticmethod
+    def _add_index_infos_from_build_manifest(
+        index_infos: Dict[ValidationResultIdentifier, dict],
+        validation_result_keys: List[ValidationResultIdentifier],
+        section_name: str,
+        build_manifest: SiteBuildManifest,
+    ) -> None:
+        validation_result_key: ValidationResultIdentifier
+        for validation_result_key in validation_result_keys:
+            page: Optional[dict] = build_manifest.get_page(
+                section_name=section_name, resource_key=validation_result_key
+            )
+            if page and page.get("index_info") is not None:
+                index_infos[validation_result_key] = page["index_info"]
+
+    def _add_index_infos_from_validation_results(
+        self,
+        index_infos: Dict[ValidationResultIdentifier, dict],
+        validation_result_keys: List[ValidationResultIdentifier],
+        validations_store_name: Optional[str] = None,
+    ) -> None:
+        validation_result_key: ValidationResultIdentifier
+        validation: Optional[Any]
+        for validation_result_key, validation in self._get_validation_results(
+            validation_result_keys=validation_result_keys,
+            validations_store_name=validations_store_name,
+        ):
+            if validation is None:
+                continue
+
+            try:
+                index_infos[validation_result_key] = _get_index_info(validation)
+            except Exception:
+                logger.debug(f"Unable to read index information of {validation_result_key!s}")
+
+    @staticmethod
+    def _add_index_infos_from_summaries(
+        index_infos: Dict[ValidationResultIdentifier, dict],
+        validation_result_keys: List[ValidationResultIdentifier],
+        validations_store: ValidationsStore,
+    ) -> None:
+        chunk_start: int
+        for chunk_start in range(0, len(validation_result_keys), SOURCE_STORE_GET_MANY_CHUNK_SIZE):
+            validation_result_keys_chunk = validation_result_keys[
+                chunk_start : chunk_start + SOURCE_STORE_GET_MANY_CHUNK_SIZE
+            ]
+            for validation_result_key, summary in zip(
+                validation_result_keys_chunk,
+                validations_store.get_summaries(validation_result_keys_chunk),
+            ):
+                if summary is not None:
+                    index_infos[validation_result_key] = summary
+
+    def _get_validation_results(
+        self,
+        validation_result_keys: List[ValidationResultIdentifier],
+        validations_store_name: Optional[str] = None,
+    ) -> Iterator[Tuple[ValidationResultIdentifier, Optional[Any]]]:
+        """Yields validation result keys with values (None if missing), fetched in chunks."""
+        validations_store = self.data_context.stores[
+            validations_store_name or self.data_context.validations_store_name
+        ]
+        chunk_start: int
+        for chunk_start in range(0, len(validation_result_keys), SOURCE_STORE_GET_MANY_CHUNK_SIZE):
+            validation_result_keys_chunk = validation_result_keys[
+                chunk_start : chunk_start + SOURCE_STORE_GET_MANY_CHUNK_SIZE
+            ]
+            yield from zip(
+                validation_result_keys_chunk,
+                validations_store.get_many(validation_result_keys_chunk, raise_on_missing=False),
+            )
+
 
 class CallToActionButton:
     def __init__(self, title, link) -> None:
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
+import threading
 import warnings
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Optional
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.checkpoint.util import send_slack_notification
+from great_expectations.checkpoint.util import run_actions, send_slack_notification
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_asset.util import parse_result_format
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
@@ -185,16 +188,19 @@ class ActionListValidationOperator(ValidationOperator):
         }
     """  # noqa: E501
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         data_context,
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},  # noqa: B006 # mutable default
+        actions_lock: Optional[threading.Lock] = None,
     ) -> None:
         super().__init__()
         self.data_context = data_context
         self.name = name
+        # Held while actions run (e.g., by Checkpoint running validations, which share DataContext, concurrently).  # noqa: E501
+        self._actions_lock = actions_lock
 
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
@@ -387,7 +393,8 @@ class ActionListValidationOperator(ValidationOperator):
         Runs all actions configured for this operator on the result of validating one
         batch against one expectation suite.
 
-        If an action fails with an exception, the method does not continue.
+        If an action fails with an exception, the method does not continue.  Consecutive
+        notification actions are dispatched concurrently (see "run_actions()").
 
         :param batch:
         :param expectation_suite:
@@ -396,31 +403,48 @@ class ActionListValidationOperator(ValidationOperator):
         :return: a dictionary: {action name -> result returned by the action}
         """
         batch_actions_results = {}
-        for action in self.action_list:
-            # NOTE: Eugene: 2019-09-23: log the info about the batch and the expectation suite
-            name = action["name"]
-            logger.debug(f"Processing validation action with name {name}")
 
-            if hasattr(batch, "active_batch_id"):
-                batch_identifier = batch.active_batch_id
-            else:
-                batch_identifier = batch.batch_id
+        if hasattr(batch, "active_batch_id"):
+            batch_identifier = batch.active_batch_id
+        else:
+            batch_identifier = batch.batch_id
 
-            if validation_result_id is None:
-                validation_result_id = ValidationResultIdentifier(
-                    expectation_suite_identifier=expectation_suite_identifier,
-                    run_id=run_id,
-                    batch_identifier=batch_identifier,
-                )
+        if validation_result_id is None:
+            validation_result_id = ValidationResultIdentifier(
+                expectation_suite_identifier=expectation_suite_identifier,
+                run_id=run_id,
+                batch_identifier=batch_identifier,
+            )
+
+        def _run_action(name: str):
+            # NOTE: Eugene: 2019-09-23: log the info about the batch and the expectation suite
+            logger.debug(f"Processing validation action with name {name}")
             try:
-                action_result = self.actions[name].run(
+                # Actions dispatched concurrently only read results of actions preceding them.
+                return self.actions[name].run(
                     validation_result_suite_identifier=validation_result_id,
                     validation_result_suite=batch_validation_result,
                     payload=batch_actions_results,
                     expectation_suite_identifier=expectation_suite_identifier,
                     checkpoint_identifier=checkpoint_identifier,
                 )
+            except Exception:
+                logger.exception(f"Error running action with name {name}")
+                raise
 
+        # Notification actions are dispatched concurrently; all others run in order, one at a time.
+        action_results = run_actions(
+            run_action_fns=[
+                functools.partial(_run_action, name=action["name"]) for action in self.action_list
+            ],
+            dispatch_concurrently=[
+                getattr(self.actions[action["name"]], "_dispatch_concurrently", False)
+                for action in self.action_list
+            ],
+        )
+        # Actions run while their results are consumed (holding "actions_lock", if given).
+        with self._actions_lock or contextlib.nullcontext():
+            for action, action_result in zip(self.action_list, action_results):
                 # Transform action_result if it not a dictionary.
                 if isinstance(action_result, GXCloudResourceRef):
                     transformed_result = {
@@ -438,10 +462,6 @@ class ActionListValidationOperator(ValidationOperator):
                 batch_actions_results[action["name"]] = transformed_result
                 batch_actions_results[action["name"]]["class"] = action["action"]["class_name"]
 
-            except Exception as e:
-                logger.exception(f"Error running action with name {action['name']}")
-                raise e  # noqa: TRY201
-
         return batch_actions_results
 
 
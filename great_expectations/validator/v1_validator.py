@@ -8,6 +8,9 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
 from great_expectations.core.result_format import ResultFormat
+from great_expectations.execution_engine.metric_resolution_profiler import (
+    MetricResolutionProfiler,
+)
 from great_expectations.validator.validator import Validator as OldValidator
 from great_expectations.validator.validator import calc_validation_statistics
 
@@ -64,6 +67,12 @@ class Validator:
         )
         statistics = calc_validation_statistics(results)
 
+        meta: dict[str, Any] = {}
+        profiler = self._wrapped_validator.execution_engine.metric_resolution_profiler
+        # Execution engine (e.g., test double) may not support profiling.
+        if isinstance(profiler, MetricResolutionProfiler):
+            meta["metric_resolution_profile"] = profiler.to_json_dict()
+
         # TODO: This was copy/pasted from Validator, but many fields were removed
         return ExpectationSuiteValidationResult(
             results=results,
@@ -76,10 +85,13 @@ class Validator:
                 "success_percent": statistics.success_percent,
             },
             batch_id=self.active_batch_id,
+            meta=meta,
         )
 
-    @property
+    @cached_property
     def active_batch_id(self) -> Optional[str]:
+        # Batch ID is pinned on first access, since Validators running concurrently may share
+        # ExecutionEngine (and thus its active Batch).
         return self._wrapped_validator.active_batch_id
 
     @cached_property
@@ -102,6 +114,7 @@ class Validator:
         results = self._wrapped_validator.graph_validate(
             configurations=processed_expectation_configs,
             runtime_configuration={"result_format": self.result_format.value},
+            batch_id=self.active_batch_id,
         )
 
         return results
@@ -6,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -24,6 +25,7 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 if TYPE_CHECKING:
     from great_expectations.core import IDDict
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.expectations.expectation import Expectation
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
@@ -82,12 +84,24 @@ class ValidationGraph:
     ) -> None:
         self._execution_engine = execution_engine
 
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges: List[MetricEdge] = []
+        self._edge_ids: Set[Tuple[_MetricKey, Optional[_MetricKey]]] = set()
+
+        # Adjacency index, keyed by "MetricConfiguration.id": "_vertices" holds first-seen
+        # "MetricConfiguration" object for every metric on left side of some edge, "_dependency_ids"
+        # maps metric to metrics it depends on, and "_dependent_ids" maps metric to its dependents.
+        # Index is maintained incrementally, so graph resolution never rescans list of edges.
+        self._vertices: Dict[_MetricKey, MetricConfiguration] = {}
+        self._dependency_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+        self._dependent_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        edge: MetricEdge
+        for edge in edges or []:
+            self._edges.append(edge)
+            edge_id = edge.id
+            if edge_id not in self._edge_ids:
+                self._edge_ids.add(edge_id)
+                self._index_edge(edge=edge, edge_id=edge_id)
 
     @override
     def __eq__(self, other) -> bool:
@@ -100,15 +114,30 @@ class ValidationGraph:
         return self._edges
 
     @property
-    def edge_ids(self) -> Set[Tuple[str, str]]:
+    def edge_ids(self) -> Set[Tuple[_MetricKey, Optional[_MetricKey]]]:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as set of two-tuples)."""  # noqa: E501
-        return {edge.id for edge in self._edges}
+        return self._edge_ids
 
     def add(self, edge: MetricEdge) -> None:
         """Adds supplied "MetricEdge" object to this "ValidationGraph" object (if not already present)."""  # noqa: E501
-        if edge.id not in self._edge_ids:
+        edge_id = edge.id
+        if edge_id not in self._edge_ids:
             self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+            self._edge_ids.add(edge_id)
+            self._index_edge(edge=edge, edge_id=edge_id)
+
+    def _index_edge(
+        self, edge: MetricEdge, edge_id: Tuple[_MetricKey, Optional[_MetricKey]]
+    ) -> None:
+        """Records supplied "MetricEdge" object in adjacency index (using its precomputed identifier)."""  # noqa: E501
+        left_id, right_id = edge_id
+        if left_id not in self._vertices:
+            self._vertices[left_id] = edge.left
+            self._dependency_ids[left_id] = set()
+
+        if right_id is not None:
+            self._dependency_ids[left_id].add(right_id)
+            self._dependent_ids.setdefault(right_id, set()).add(left_id)
 
     def build_metric_dependency_graph(
         self,
@@ -154,16 +183,17 @@ class ValidationGraph:
                         f"Metric {metric_configuration.id!s} has created a circular dependency"
                     )
                     continue
+                # Dependency is built first, so that its default kwargs (and hence its "id") are final when edge is indexed.  # noqa: E501
+                self.build_metric_dependency_graph(
+                    metric_configuration=metric_dependency,
+                    runtime_configuration=runtime_configuration,
+                )
                 self.add(
                     MetricEdge(
                         left=metric_configuration,
                         right=metric_dependency,
                     )
                 )
-                self.build_metric_dependency_graph(
-                    metric_configuration=metric_dependency,
-                    runtime_configuration=runtime_configuration,
-                )
 
     def set_metric_configuration_default_kwargs_if_absent(
         self, metric_configuration: MetricConfiguration
@@ -234,30 +264,34 @@ class ValidationGraph:
 
         ready_metrics: Set[MetricConfiguration]
         needed_metrics: Set[MetricConfiguration]
+        pending_dependency_counts: Dict[_MetricKey, int]
 
         exception_info: ExceptionInfo
 
-        progress_bar: Optional[tqdm] = None
+        # Scheduler state is computed once; then resolved metrics only visit their dependents.
+        ready_metrics, needed_metrics, pending_dependency_counts = self._initialize_schedule(
+            metrics=metrics
+        )
+
+        # Check to see if the user has disabled progress bars
+        disable = not show_progress_bars
+        if len(self.edges) < min_graph_edges_pbar_enable:
+            disable = True
+
+        # noinspection PyProtectedMember,SpellCheckingInspection
+        progress_bar: tqdm = tqdm(
+            total=len(ready_metrics) + len(needed_metrics),
+            desc="Calculating Metrics",
+            disable=disable,
+        )
+        progress_bar.update(0)
+        progress_bar.refresh()
+
+        resolved_metrics: Dict[_MetricKey, MetricValue]
+        resolved_metric_ids: List[_MetricKey]
 
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
-
-            # Check to see if the user has disabled progress bars
-            disable = not show_progress_bars
-            if len(self.edges) < min_graph_edges_pbar_enable:
-                disable = True
-
-            if progress_bar is None:
-                # noinspection PyProtectedMember,SpellCheckingInspection
-                progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
-                    desc="Calculating Metrics",
-                    disable=disable,
-                )
-            progress_bar.update(0)
-            progress_bar.refresh()
-
             computable_metrics = set()
 
             for metric in ready_metrics:
@@ -270,36 +304,39 @@ class ValidationGraph:
                 else:
                     computable_metrics.add(metric)
 
+            if len(computable_metrics) == 0:
+                # Nothing left can make progress (remaining metrics are aborted or blocked by them).
+                break
+
+            resolved_metric_ids = []
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.  # noqa: E501
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        runtime_configuration=runtime_configuration,
-                    )
+                resolved_metrics = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    runtime_configuration=runtime_configuration,
                 )
+                resolved_metric_ids = [
+                    metric_id for metric_id in resolved_metrics if metric_id not in metrics
+                ]
+                metrics.update(resolved_metrics)
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
                 if catch_exceptions:
+                    # Metrics, resolved despite failures of others, are kept (and not recomputed).
+                    resolved_metric_ids = [
+                        metric_id for metric_id in err.resolved_metrics if metric_id not in metrics
+                    ]
+                    metrics.update(err.resolved_metrics)
                     exception_traceback = traceback.format_exc()
-                    exception_message = str(err)
-                    exception_info = ExceptionInfo(
-                        exception_traceback=exception_traceback,
-                        exception_message=exception_message,
-                    )
                     for failed_metric in err.failed_metrics:
-                        if failed_metric.id in failed_metric_info:
-                            failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
-                            failed_metric_info[failed_metric.id]["exception_info"] = exception_info
-                        else:
-                            failed_metric_info[failed_metric.id] = {}
-                            failed_metric_info[failed_metric.id]["metric_configuration"] = (
-                                failed_metric
-                            )
-                            failed_metric_info[failed_metric.id]["num_failures"] = 1
-                            failed_metric_info[failed_metric.id]["exception_info"] = exception_info
+                        self._record_metric_failure(
+                            failed_metric_info=failed_metric_info,
+                            failed_metric=failed_metric,
+                            exception=err.metric_exceptions.get(failed_metric.id, err),
+                            exception_traceback=exception_traceback,
+                        )
 
                 else:
                     raise err  # noqa: TRY201
@@ -312,38 +349,115 @@ class ValidationGraph:
                 else:
                     raise e  # noqa: TRY201
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
-                len(ready_metrics) == len(aborted_metrics_info)
-            ):
+            ready_metrics = self._advance_schedule(
+                ready_metrics=ready_metrics,
+                resolved_metric_ids=resolved_metric_ids,
+                metrics=metrics,
+                pending_dependency_counts=pending_dependency_counts,
+            )
+            if len(ready_metrics) == 0:
                 done = True
 
-        progress_bar.close()  # type: ignore[union-attr]  # Incorrect flagging of 'Item "None" of "Optional[Any]" has no attribute "close"' in external package.
+        progress_bar.close()
 
         return aborted_metrics_info
 
+    @staticmethod
+    def _record_metric_failure(
+        failed_metric_info: _AbortedMetricsInfoDict,
+        failed_metric: MetricConfiguration,
+        exception: Exception,
+        exception_traceback: str,
+    ) -> None:
+        """Records failure of metric; failures that would recur on retry abort metric right away."""
+        exception_info = ExceptionInfo(
+            exception_traceback=exception_traceback,
+            exception_message=str(exception),
+        )
+        num_failures: int = (
+            MAX_METRIC_COMPUTATION_RETRIES
+            if isinstance(exception, gx_exceptions.ChunkedBatchDataError)
+            else 1
+        )
+        if failed_metric.id in failed_metric_info:
+            failed_metric_info[failed_metric.id]["num_failures"] += num_failures  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+            failed_metric_info[failed_metric.id]["exception_info"] = exception_info
+        else:
+            failed_metric_info[failed_metric.id] = {}
+            failed_metric_info[failed_metric.id]["metric_configuration"] = failed_metric
+            failed_metric_info[failed_metric.id]["num_failures"] = num_failures
+            failed_metric_info[failed_metric.id]["exception_info"] = exception_info
+
+    def _initialize_schedule(
+        self,
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration], Dict[_MetricKey, int]]:
+        """Computes initial state of topological scheduler from adjacency index.
+
+        Returns ready metrics (all dependencies available), needed metrics (some dependencies still unmet), and, for
+        every unresolved metric, count of its dependencies that are not yet available in "metrics".
+        """  # noqa: E501
+        ready_metrics: Set[MetricConfiguration] = set()
+        needed_metrics: Set[MetricConfiguration] = set()
+        pending_dependency_counts: Dict[_MetricKey, int] = {}
+
+        metric_id: _MetricKey
+        metric_configuration: MetricConfiguration
+        for metric_id, metric_configuration in self._vertices.items():
+            if metric_id in metrics:
+                continue
+
+            pending_dependency_count = sum(
+                1
+                for dependency_id in self._dependency_ids[metric_id]
+                if dependency_id not in metrics
+            )
+            pending_dependency_counts[metric_id] = pending_dependency_count
+            if pending_dependency_count == 0:
+                ready_metrics.add(metric_configuration)
+            else:
+                needed_metrics.add(metric_configuration)
+
+        return ready_metrics, needed_metrics, pending_dependency_counts
+
+    def _advance_schedule(
+        self,
+        ready_metrics: Set[MetricConfiguration],
+        resolved_metric_ids: Iterable[_MetricKey],
+        metrics: Dict[_MetricKey, MetricValue],
+        pending_dependency_counts: Dict[_MetricKey, int],
+    ) -> Set[MetricConfiguration]:
+        """Returns next wave of ready metrics, visiting only dependents of newly resolved metrics.
+
+        Ready metrics that did not get resolved (e.g., due to failure) remain ready, so that they can be retried.
+        """  # noqa: E501
+        next_ready_metrics: Set[MetricConfiguration] = {
+            metric for metric in ready_metrics if metric.id not in metrics
+        }
+
+        resolved_metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for resolved_metric_id in resolved_metric_ids:
+            for dependent_id in self._dependent_ids.get(resolved_metric_id, ()):
+                if dependent_id not in pending_dependency_counts:
+                    continue
+
+                pending_dependency_counts[dependent_id] -= 1
+                if pending_dependency_counts[dependent_id] == 0 and dependent_id not in metrics:
+                    next_ready_metrics.add(self._vertices[dependent_id])
+
+            pending_dependency_counts.pop(resolved_metric_id, None)
+
+        return next_ready_metrics
+
     def _parse(
         self,
         metrics: Dict[_MetricKey, MetricValue],
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""  # noqa: E501
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        """Given validation graph, returns the ready and needed metrics necessary for validation using the adjacency
+        index of validation graph (a graph structure of metric ids)"""  # noqa: E501
+        ready_metrics, needed_metrics, _ = self._initialize_schedule(metrics=metrics)
+        return ready_metrics, needed_metrics
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -370,6 +484,7 @@ class ExpectationValidationGraph:
         self,
         configuration: ExpectationConfiguration,
         graph: ValidationGraph,
+        expectation: Optional[Expectation] = None,
     ) -> None:
         if configuration is None:
             raise ValueError(  # noqa: TRY003
@@ -383,11 +498,17 @@ class ExpectationValidationGraph:
 
         self._configuration = configuration
         self._graph = graph
+        self._expectation = expectation
 
     @property
     def configuration(self) -> ExpectationConfiguration:
         return self._configuration
 
+    @property
+    def expectation(self) -> Optional[Expectation]:
+        """Expectation, built from "configuration" (if available), so that it can be reused for validation."""  # noqa: E501
+        return self._expectation
+
     @property
     def graph(self) -> ValidationGraph:
         return self._graph
@@ -414,13 +535,13 @@ class ExpectationValidationGraph:
         self,
         metric_info: _AbortedMetricsInfoDict,
     ) -> _AbortedMetricsInfoDict:
-        graph_metric_ids: List[_MetricKey] = []
-        edge: MetricEdge
-        vertex: MetricConfiguration
-        for edge in self.graph.edges:
-            for vertex in [edge.left, edge.right]:
-                if vertex is not None:
-                    graph_metric_ids.append(vertex.id)
+        graph_metric_ids: Set[_MetricKey] = set()
+        left_id: _MetricKey
+        right_id: Optional[_MetricKey]
+        for left_id, right_id in self.graph.edge_ids:
+            graph_metric_ids.add(left_id)
+            if right_id is not None:
+                graph_metric_ids.add(right_id)
 
         metric_id: _MetricKey
         metric_info_item: Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]]
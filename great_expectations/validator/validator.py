@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import copy
 import datetime
 import inspect
@@ -15,6 +16,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -46,6 +48,9 @@ from great_expectations.exceptions import (
     GreatExpectationsError,
     InvalidExpectationConfigurationError,
 )
+from great_expectations.execution_engine.metric_resolution_profiler import (
+    MetricResolutionProfiler,
+)
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
 from great_expectations.expectations.expectation_configuration import (
     ExpectationConfiguration,
@@ -83,6 +88,29 @@ from great_expectations.validator.validation_statistics import (
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
+# Domain kwargs, naming columns that metric computes over.
+_COLUMN_DOMAIN_KWARG_NAMES: Tuple[str, ...] = ("column", "column_A", "column_B", "column_list")
+
+# Table metrics, whose values for column Expectations are unaffected by column projection.
+_COLUMN_PROJECTION_TABLE_METRIC_NAMES: Set[str] = {
+    "table.columns",
+    "table.column_types",
+    "table.row_count",
+}
+
+
+def _get_domain_columns(domain_kwargs: dict) -> List[str]:
+    columns: List[str] = []
+    name: str
+    for name in _COLUMN_DOMAIN_KWARG_NAMES:
+        value = domain_kwargs.get(name)
+        if isinstance(value, (list, tuple)):
+            columns.extend(value)
+        elif value is not None:
+            columns.append(value)
+
+    return columns
+
 
 if TYPE_CHECKING:
     from great_expectations.core.batch import (
@@ -96,6 +124,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context import AbstractDataContext
     from great_expectations.datasource.fluent.interfaces import Batch as FluentBatch
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.expectations.expectation import Expectation
     from great_expectations.rule_based_profiler.expectation_configuration_builder import (
         ExpectationConfigurationBuilder,
     )
@@ -754,6 +783,7 @@ class Validator:
         self,
         configurations: List[ExpectationConfiguration],
         runtime_configuration: Optional[dict] = None,
+        batch_id: Optional[str] = None,
     ) -> List[ExpectationValidationResult]:
         """Obtains validation dependencies for each metric using the implementation of their associated expectation,
         then proceeds to add these dependencies to the validation graph, supply readily available metric implementations
@@ -764,6 +794,8 @@ class Validator:
             used to supply domain and values for metrics.
             runtime_configuration (dict): A dictionary of runtime keyword arguments, controlling semantics, such as the
             result_format.
+            batch_id (str): ID of Batch to validate (default is active Batch ID); pass it explicitly, if other Validators
+            share ExecutionEngine (and thus its active Batch) of this Validator.
 
         Returns:
             A list of Validations, validating that all necessary metrics are available.
@@ -771,6 +803,9 @@ class Validator:
         if runtime_configuration is None:
             runtime_configuration = {}
 
+        # Runtime configuration is copied once and then treated as read-only; each Expectation receives its own shallow copy.  # noqa: E501
+        runtime_configuration = copy.deepcopy(runtime_configuration)
+
         if runtime_configuration.get("catch_exceptions", True):
             catch_exceptions = True
         else:
@@ -791,12 +826,39 @@ class Validator:
             processed_configurations=processed_configurations,
             catch_exceptions=catch_exceptions,
             runtime_configuration=runtime_configuration,
+            batch_id=batch_id or self.active_batch_id,
         )
 
         graph: ValidationGraph = self._generate_suite_level_graph_from_expectation_level_sub_graphs(
             expectation_validation_graphs=expectation_validation_graphs
         )
 
+        self._register_expectations_with_metric_resolution_profiler(
+            expectation_validation_graphs=expectation_validation_graphs
+        )
+
+        with self._batch_columns_projected(
+            expectation_validation_graphs=expectation_validation_graphs,
+            runtime_configuration=runtime_configuration,
+        ):
+            return self._resolve_and_validate_processed_configurations(
+                graph=graph,
+                processed_configurations=processed_configurations,
+                expectation_validation_graphs=expectation_validation_graphs,
+                evrs=evrs,
+                catch_exceptions=catch_exceptions,
+                runtime_configuration=runtime_configuration,
+            )
+
+    def _resolve_and_validate_processed_configurations(  # noqa: PLR0913
+        self,
+        graph: ValidationGraph,
+        processed_configurations: List[ExpectationConfiguration],
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        evrs: List[ExpectationValidationResult],
+        catch_exceptions: bool,
+        runtime_configuration: dict,
+    ) -> List[ExpectationValidationResult]:
         resolved_metrics: _MetricsDict
 
         try:
@@ -827,17 +889,47 @@ class Validator:
             else:
                 raise err  # noqa: TRY201
 
+        return self._validate_processed_configurations(
+            processed_configurations=processed_configurations,
+            expectation_validation_graphs=expectation_validation_graphs,
+            resolved_metrics=resolved_metrics,
+            evrs=evrs,
+            catch_exceptions=catch_exceptions,
+            runtime_configuration=runtime_configuration,
+        )
+
+    def _validate_processed_configurations(  # noqa: PLR0913
+        self,
+        processed_configurations: List[ExpectationConfiguration],
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        resolved_metrics: _MetricsDict,
+        evrs: List[ExpectationValidationResult],
+        catch_exceptions: bool,
+        runtime_configuration: dict,
+    ) -> List[ExpectationValidationResult]:
+        # Expectations, built while generating metric dependency sub-graphs, are reused for validation.  # noqa: E501
+        expectation_validation_graph: ExpectationValidationGraph
+        expectations_by_configuration_id: Dict[int, Expectation] = {
+            id(expectation_validation_graph.configuration): expectation_validation_graph.expectation
+            for expectation_validation_graph in expectation_validation_graphs
+            if expectation_validation_graph.expectation is not None
+        }
+
         configuration: ExpectationConfiguration
+        expectation: Expectation | None
         result: ExpectationValidationResult
         for configuration in processed_configurations:
             try:
-                runtime_configuration_default = copy.deepcopy(runtime_configuration)
+                expectation = expectations_by_configuration_id.get(id(configuration))
+                if expectation is None:
+                    expectation = configuration.to_domain_obj()
 
-                expectation = configuration.to_domain_obj()
                 result = expectation.metrics_validate(
                     metrics=resolved_metrics,
                     execution_engine=self._execution_engine,
-                    runtime_configuration=runtime_configuration_default,
+                    runtime_configuration=self._copy_runtime_configuration(
+                        runtime_configuration=runtime_configuration
+                    ),
                 )
                 evrs.append(result)
             except Exception as err:
@@ -854,12 +946,13 @@ class Validator:
 
         return evrs
 
-    def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+    def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(  # noqa: PLR0913
         self,
         expectation_configurations: List[ExpectationConfiguration],
         processed_configurations: List[ExpectationConfiguration],
         catch_exceptions: bool,
         runtime_configuration: Optional[dict] = None,
+        batch_id: Optional[str] = None,
     ) -> Tuple[
         List[ExpectationValidationGraph],
         List[ExpectationValidationResult],
@@ -884,14 +977,16 @@ class Validator:
 
             evaluated_config = copy.deepcopy(configuration)
 
-            if self.active_batch_id:
-                evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
+            if batch_id:
+                evaluated_config.kwargs.update({"batch_id": batch_id})
 
             expectation = evaluated_config.to_domain_obj()
             validation_dependencies: ValidationDependencies = (
                 expectation.get_validation_dependencies(
                     execution_engine=self._execution_engine,
-                    runtime_configuration=runtime_configuration,
+                    runtime_configuration=self._copy_runtime_configuration(
+                        runtime_configuration=runtime_configuration
+                    ),
                 )
             )
 
@@ -902,6 +997,7 @@ class Validator:
                         metric_configurations=validation_dependencies.get_metric_configurations(),
                         runtime_configuration=runtime_configuration,
                     ),
+                    expectation=expectation,
                 )
                 expectation_validation_graphs.append(expectation_validation_graph)
                 processed_configurations.append(evaluated_config)
@@ -924,6 +1020,173 @@ class Validator:
 
         return expectation_validation_graphs, evrs, processed_configurations
 
+    def _register_expectations_with_metric_resolution_profiler(
+        self,
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+    ) -> None:
+        # Profile of metric resolution (if enabled) covers single validation run, aggregated per Expectation.  # noqa: E501
+        profiler: Optional[MetricResolutionProfiler] = (
+            self._execution_engine.metric_resolution_profiler
+        )
+        # Execution engine (e.g., test double) may not support profiling.
+        if not isinstance(profiler, MetricResolutionProfiler):
+            return
+
+        profiler.reset()
+
+        expectation_validation_graph: ExpectationValidationGraph
+        edge: MetricEdge
+        for expectation_validation_graph in expectation_validation_graphs:
+            profiler.add_expectation(
+                configuration=expectation_validation_graph.configuration,
+                metric_ids=itertools.chain.from_iterable(
+                    [edge.left.id] if edge.right is None else [edge.left.id, edge.right.id]
+                    for edge in expectation_validation_graph.graph.edges
+                ),
+            )
+
+    @contextlib.contextmanager
+    def _batch_columns_projected(
+        self,
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        runtime_configuration: dict,
+    ) -> Iterator[None]:
+        """Limits Batch data to columns, which metrics of validation graphs compute over.
+
+        All columns are restored afterwards, so that projection does not outlive "graph_validate()".
+        Restoring is lazy: data read so far is kept, so that later validations (e.g., interactive
+        "validator.expect_*()" calls) read only columns that were not read yet.
+        """
+        batch_columns: Dict[str, Optional[Set[str]]] = self._get_projected_batch_columns(
+            expectation_validation_graphs=expectation_validation_graphs,
+            runtime_configuration=runtime_configuration,
+        )
+
+        batch_id: str
+        columns: Optional[Set[str]]
+        for batch_id, columns in batch_columns.items():
+            self._execution_engine.project_batch_columns(batch_id=batch_id, columns=columns)
+
+        try:
+            yield
+        finally:
+            for batch_id, columns in batch_columns.items():
+                if columns is not None:
+                    self._execution_engine.project_batch_columns(batch_id=batch_id, columns=None)
+
+    def _get_projected_batch_columns(
+        self,
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        runtime_configuration: dict,
+    ) -> Dict[str, Optional[Set[str]]]:
+        """Returns columns (per Batch), which metrics of validation graphs compute over.
+
+        Columns, named by column Expectations, are kept (even if only "table.columns" is computed
+        for them, to check their existence).  All columns of Batch (None) are needed if any of its
+        metrics filters rows ("row_condition"), computes over entire table (other than
+        "_COLUMN_PROJECTION_TABLE_METRIC_NAMES" of column Expectations and "table.row_count"), if
+        position of column is checked, or if unexpected rows are included in results.
+        """
+        batch_columns: Dict[str, Optional[Set[str]]] = {}
+
+        expectation_validation_graph: ExpectationValidationGraph
+        is_column_expectation: bool
+        edge: MetricEdge
+        metric_configuration: Optional[MetricConfiguration]
+        for expectation_validation_graph in expectation_validation_graphs:
+            is_column_expectation = self._add_expectation_projected_columns(
+                batch_columns=batch_columns,
+                kwargs=expectation_validation_graph.configuration.kwargs,
+                runtime_configuration=runtime_configuration,
+            )
+            for edge in expectation_validation_graph.graph.edges:
+                for metric_configuration in (edge.left, edge.right):
+                    if metric_configuration is not None:
+                        self._add_metric_projected_columns(
+                            batch_columns=batch_columns,
+                            metric_configuration=metric_configuration,
+                            is_column_expectation=is_column_expectation,
+                        )
+
+        return batch_columns
+
+    def _add_expectation_projected_columns(
+        self,
+        batch_columns: Dict[str, Optional[Set[str]]],
+        kwargs: dict,
+        runtime_configuration: dict,
+    ) -> bool:
+        """Adds columns, which Expectation (and its results) refer to.
+
+        Returns:
+            Whether Expectation is column Expectation
+        """
+        result_format: Any = kwargs.get("result_format") or runtime_configuration.get(
+            "result_format"
+        )
+        if isinstance(result_format, dict):
+            self._add_projected_columns(
+                batch_columns=batch_columns,
+                batch_id=kwargs.get("batch_id"),
+                columns=None
+                if result_format.get("include_unexpected_rows")
+                else result_format.get("unexpected_index_column_names") or [],
+            )
+
+        is_column_expectation: bool = any(name in kwargs for name in _COLUMN_DOMAIN_KWARG_NAMES)
+        if is_column_expectation:
+            # Position of column (e.g., "column_index") is relative to all columns.
+            self._add_projected_columns(
+                batch_columns=batch_columns,
+                batch_id=kwargs.get("batch_id"),
+                columns=None
+                if kwargs.get("column_index") is not None
+                else _get_domain_columns(domain_kwargs=kwargs),
+            )
+
+        return is_column_expectation
+
+    def _add_metric_projected_columns(
+        self,
+        batch_columns: Dict[str, Optional[Set[str]]],
+        metric_configuration: MetricConfiguration,
+        is_column_expectation: bool,
+    ) -> None:
+        domain_kwargs: dict = metric_configuration.metric_domain_kwargs
+        columns: Optional[List[str]] = None
+        if domain_kwargs.get("row_condition"):
+            columns = None
+        elif any(name in domain_kwargs for name in _COLUMN_DOMAIN_KWARG_NAMES):
+            columns = _get_domain_columns(domain_kwargs=domain_kwargs)
+        elif metric_configuration.metric_name == "table.row_count" or (
+            is_column_expectation
+            and metric_configuration.metric_name in _COLUMN_PROJECTION_TABLE_METRIC_NAMES
+        ):
+            columns = []
+
+        self._add_projected_columns(
+            batch_columns=batch_columns, batch_id=domain_kwargs.get("batch_id"), columns=columns
+        )
+
+    def _add_projected_columns(
+        self,
+        batch_columns: Dict[str, Optional[Set[str]]],
+        batch_id: Optional[str],
+        columns: Optional[Sequence[str]],
+    ) -> None:
+        batch_id = batch_id or self.active_batch_id
+        if batch_id is None:
+            return
+
+        projection: Optional[Set[str]] = batch_columns.setdefault(batch_id, set())
+        if projection is None:
+            return
+
+        if columns is None:
+            batch_columns[batch_id] = None
+        else:
+            projection.update(columns)
+
     def _generate_suite_level_graph_from_expectation_level_sub_graphs(
         self,
         expectation_validation_graphs: List[ExpectationValidationGraph],
@@ -991,6 +1254,30 @@ class Validator:
 
         return resolved_metrics, evrs, processed_configurations
 
+    @staticmethod
+    def _copy_runtime_configuration(runtime_configuration: Optional[dict]) -> Optional[dict]:
+        """
+        Copy runtime configuration for validating single Expectation.
+
+        "Expectation.metrics_validate()" only assigns top-level keys of runtime configuration and completes "result_format"
+        dictionary in place; hence, copying these two levels (rather than deep copying everything) keeps one Expectation
+        from affecting runtime configuration of another.  All other nested values are shared and treated as read-only.
+        Args:
+            runtime_configuration: Runtime configuration snapshot, shared by all Expectations being validated
+
+        Returns:
+            Copy of runtime configuration, owned by single Expectation (or None, if no runtime configuration is given)
+        """  # noqa: E501
+        if runtime_configuration is None:
+            return None
+
+        runtime_configuration_copy: dict = dict(runtime_configuration)
+        result_format: Any = runtime_configuration_copy.get("result_format")
+        if isinstance(result_format, dict):
+            runtime_configuration_copy["result_format"] = dict(result_format)
+
+        return runtime_configuration_copy
+
     @staticmethod
     def _catch_exceptions_in_failing_expectation_validations(
         exception_traceback: str,
@@ -1443,6 +1730,12 @@ class Validator:
                 batch_id=self.active_batch_id,
             )
 
+            profiler: Optional[MetricResolutionProfiler] = (
+                self._execution_engine.metric_resolution_profiler
+            )
+            if isinstance(profiler, MetricResolutionProfiler):
+                result.meta["metric_resolution_profile"] = profiler.to_json_dict()
+
             self._data_context = validation_data_context
         except Exception:  # noqa: TRY302
             raise
@@ -1,5 +1,8 @@
+import functools
 import json
 import logging
+import threading
+import time
 from typing import Type, Union
 from unittest import mock
 
@@ -21,7 +24,12 @@ from great_expectations.checkpoint.actions import (
     UpdateDataDocsAction,
     ValidationAction,
 )
-from great_expectations.checkpoint.util import smtplib
+from great_expectations.checkpoint.util import (
+    NOTIFICATION_MAX_RETRIES,
+    get_notification_session,
+    run_actions,
+    smtplib,
+)
 from great_expectations.checkpoint.v1_checkpoint import Checkpoint, CheckpointResult
 from great_expectations.compatibility.pydantic import BaseModel, Field, ValidationError
 from great_expectations.core.expectation_validation_result import (
@@ -603,9 +611,7 @@ def test_api_action_create_payload(mock_context):
 
 
 @pytest.mark.big
-@mock.patch("great_expectations.checkpoint.actions.requests")
 def test_api_action_run(
-    mock_requests,
     validation_result_suite,
     validation_result_suite_id,
     mocker: MockerFixture,
@@ -613,7 +619,7 @@ def test_api_action_run(
 ):
     mock_response = mocker.MagicMock()
     mock_response.status_code = 200
-    mock_requests.post.return_value = mock_response
+    mocker.patch.object(Session, "post", return_value=mock_response)
     api_notification_action = APINotificationAction(url="http://www.example.com")
     response = api_notification_action.run(
         validation_result_suite,
@@ -896,3 +902,122 @@ class TestV1ActionRun:
     def test_UpdateDataDocsAction_run(self, checkpoint_result: CheckpointResult):
         action = UpdateDataDocsAction()
         action.v1_run(checkpoint_result=checkpoint_result)
+
+
+@pytest.mark.unit
+def test_notification_actions_are_dispatched_concurrently():
+    assert not StoreValidationResultAction._dispatch_concurrently
+    assert not UpdateDataDocsAction._dispatch_concurrently
+    for action_class in [
+        APINotificationAction,
+        EmailAction,
+        MicrosoftTeamsNotificationAction,
+        OpsgenieAlertAction,
+        PagerdutyAlertAction,
+        SlackNotificationAction,
+        SNSNotificationAction,
+    ]:
+        assert action_class._dispatch_concurrently
+
+
+@pytest.mark.unit
+def test_run_actions_keeps_order_and_runs_dependent_actions_first():
+    calls = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _store():
+        calls.append("store")
+        return "stored"
+
+    def _notify(name):
+        # Both notifications must be running at the same time to pass the barrier.
+        assert calls == ["store"]
+        barrier.wait()
+        return name
+
+    results = run_actions(
+        run_action_fns=[
+            _store,
+            functools.partial(_notify, "slack"),
+            functools.partial(_notify, "teams"),
+        ],
+        dispatch_concurrently=[False, True, True],
+    )
+
+    assert list(results) == ["stored", "slack", "teams"]
+
+
+@pytest.mark.unit
+def test_run_actions_does_not_wait_for_slow_action(caplog):
+    event = threading.Event()
+
+    results = run_actions(
+        run_action_fns=[lambda: event.wait(5), lambda: "done"],
+        dispatch_concurrently=[True, True],
+        timeout=0.1,
+    )
+
+    with caplog.at_level(logging.WARNING):
+        assert list(results) == [None, "done"]
+    event.set()
+
+    assert "did not complete within 0.1 seconds" in caplog.text
+
+
+@pytest.mark.unit
+def test_run_actions_cancels_pending_actions_of_timed_out_run():
+    started = []
+    event = threading.Event()
+
+    def _slow(name: str) -> str:
+        started.append(name)
+        event.wait(5)
+        return name
+
+    with mock.patch("great_expectations.checkpoint.util.MAX_CONCURRENT_ACTIONS", 1):
+        results = list(
+            run_actions(
+                run_action_fns=[
+                    functools.partial(_slow, "slack"),
+                    functools.partial(_slow, "teams"),
+                ],
+                dispatch_concurrently=[True, True],
+                timeout=0.1,
+            )
+        )
+    event.set()
+
+    assert results == [None, None]
+    # Action that has not started before timeout is cancelled (rather than left queued in pool).
+    time.sleep(0.1)
+    assert started == ["slack"]
+
+
+@pytest.mark.unit
+def test_run_actions_reraises_after_concurrent_actions_complete():
+    completed = []
+
+    def _fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        list(
+            run_actions(
+                run_action_fns=[_fail, lambda: completed.append("slack")],
+                dispatch_concurrently=[True, True],
+            )
+        )
+
+    assert completed == ["slack"]
+
+
+@pytest.mark.unit
+def test_notification_session_is_shared_and_retries():
+    session = get_notification_session()
+
+    assert get_notification_session() is session
+    retry = session.get_adapter("https://hooks.slack.com").max_retries
+    assert retry.total == NOTIFICATION_MAX_RETRIES
+    # Notifications are not idempotent; requests, which may have been processed, are not retried.
+    assert retry.status_forcelist == (429,)
+    assert retry.read == 0
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import pathlib
+import threading
+import time
 import uuid
 from typing import TYPE_CHECKING
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 import great_expectations as gx
@@ -35,6 +38,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
+from great_expectations.validator.validator import Validator as OldValidator
 from tests.test_utils import working_directory
 
 if TYPE_CHECKING:
@@ -489,6 +493,142 @@ class TestCheckpointResult:
             result_format=ResultFormat.SUMMARY,
         )
 
+    @pytest.fixture
+    def validation_definitions(self, mock_batch_def: MockerFixture, mocker: MockerFixture):
+        validation_definitions = []
+        for idx in range(4):
+            suite = mocker.Mock(spec=ExpectationSuite)
+            suite.name = f"{self.suite_name}_{idx}"
+            validation_definitions.append(
+                ValidationDefinition(
+                    name=f"{self.validation_definition_name}_{idx}",
+                    data=mock_batch_def,
+                    suite=suite,
+                )
+            )
+
+        return validation_definitions
+
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently_keeps_order_and_records_durations(
+        self, validation_definitions: list[ValidationDefinition]
+    ):
+        def _run(validation_definition: ValidationDefinition, **kwargs):
+            # Earlier validation definitions finish last.
+            time.sleep(0.01 * (len(validation_definitions) - int(validation_definition.name[-1])))
+            return ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name=validation_definition.suite.name,
+                batch_id=f"{self.datasource_name}-{self.asset_name}",
+            )
+
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name, validation_definitions=validation_definitions, actions=[]
+        )
+        with mock.patch.object(ValidationDefinition, "_run", autospec=True, side_effect=_run):
+            result = checkpoint.run(max_workers=4)
+
+        assert [key.expectation_suite_identifier.name for key in result.run_results] == [
+            validation_definition.suite.name for validation_definition in validation_definitions
+        ]
+        assert list(result.validation_durations) == list(result.run_results)
+        assert all(duration > 0 for duration in result.validation_durations.values())
+
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently_raises_first_exception_after_all_complete(
+        self,
+        validation_definitions: list[ValidationDefinition],
+        actions: list[ValidationAction],
+    ):
+        failing_validation_definition_names = [
+            validation_definitions[1].name,
+            validation_definitions[2].name,
+        ]
+
+        def _run(validation_definition: ValidationDefinition, **kwargs):
+            # Checkpoint holds copies of validation definitions, so they are matched by name.
+            if validation_definition.name in failing_validation_definition_names:
+                # Later validation definition fails first.
+                time.sleep(0.01 * (3 - int(validation_definition.name[-1])))
+                raise ValueError(f"Validation {validation_definition.name} failed")
+
+            return ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name=validation_definition.suite.name,
+                batch_id=f"{self.datasource_name}-{self.asset_name}",
+            )
+
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=validation_definitions,
+            actions=actions,
+        )
+        with mock.patch.object(
+            ValidationDefinition, "_run", autospec=True, side_effect=_run
+        ) as mock_run, mock.patch.object(ValidationAction, "v1_run") as mock_action_run:
+            with pytest.raises(ValueError) as e:
+                checkpoint.run(max_workers=2)
+
+        # Other validation definitions ran to completion; Checkpoint actions did not run.
+        assert mock_run.call_count == len(validation_definitions)
+        assert str(e.value) == f"Validation {validation_definitions[1].name} failed"
+        mock_action_run.assert_not_called()
+
+    @pytest.mark.filesystem
+    def test_checkpoint_run_concurrently_validates_each_batch_of_shared_datasource(
+        self, tmp_path: pathlib.Path, mocker: MockerFixture
+    ):
+        context = gx.get_context(mode="ephemeral")
+        ds = context.sources.add_pandas(self.datasource_name)
+
+        row_counts = {"asset_a": 3, "asset_b": 5}
+        validation_definitions: list[ValidationDefinition] = []
+        for asset_name, row_count in row_counts.items():
+            csv_path = tmp_path / f"{asset_name}.csv"
+            pd.DataFrame({self.column_name: range(row_count)}).to_csv(csv_path, index=False)
+            asset = ds.add_csv_asset(asset_name, filepath_or_buffer=csv_path)
+            suite = context.suites.add(
+                ExpectationSuite(
+                    name=f"{asset_name}_suite",
+                    expectations=[gxe.ExpectTableRowCountToEqual(value=row_count)],
+                )
+            )
+            validation_definitions.append(
+                ValidationDefinition(
+                    name=f"{asset_name}_validation_definition",
+                    data=asset.add_batch_definition(self.batch_definition_name),
+                    suite=suite,
+                )
+            )
+
+        # Both validations start only after both Batches are loaded into shared ExecutionEngine.
+        barrier = threading.Barrier(parties=len(validation_definitions), timeout=10)
+        graph_validate = OldValidator.graph_validate
+
+        def _graph_validate(validator: OldValidator, *args, **kwargs):
+            barrier.wait()
+            return graph_validate(validator, *args, **kwargs)
+
+        mocker.patch.object(
+            OldValidator, "graph_validate", autospec=True, side_effect=_graph_validate
+        )
+
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name, validation_definitions=validation_definitions, actions=[]
+        )
+        result = checkpoint.run(max_workers=2)
+
+        assert result.success is True
+        assert {
+            key.batch_identifier: validation_result.results[0].result["observed_value"]
+            for key, validation_result in result.run_results.items()
+        } == {
+            f"{self.datasource_name}-{asset_name}": row_count
+            for asset_name, row_count in row_counts.items()
+        }
+
     @pytest.mark.unit
     def test_result_init_no_run_results_raises_error(self, mocker: MockerFixture):
         with pytest.raises(ValueError) as e:
@@ -0,0 +1,71 @@
+import copy
+import pickle
+from unittest import mock
+
+import pytest
+
+from great_expectations.core import id_dict
+from great_expectations.core.id_dict import IDDict
+
+
+@pytest.mark.unit
+def test_id_dict_to_id_is_computed_once():
+    my_id_dict = IDDict({"column": "a", "row_condition": 'b=="x"'})
+    expected_id = IDDict({"column": "a", "row_condition": 'b=="x"'}).to_id()
+
+    with mock.patch.object(id_dict.hashlib, "md5", wraps=id_dict.hashlib.md5) as mock_md5:
+        assert my_id_dict.to_id() == expected_id
+        assert my_id_dict.to_id() == expected_id
+        assert hash(my_id_dict) == hash(expected_id)
+
+    assert mock_md5.call_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("column", "c"), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("row_condition"), id="delitem"),
+        pytest.param(lambda d: d.update(column="c"), id="update"),
+        pytest.param(lambda d: d.__ior__({"column": "c"}), id="ior"),
+        pytest.param(lambda d: d.pop("row_condition"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.setdefault("batch_id", "1234"), id="setdefault"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+    ],
+)
+def test_id_dict_mutation_discards_cached_id(mutate):
+    my_id_dict = IDDict({"column": "a", "row_condition": 'b=="x"'})
+    original_id = my_id_dict.to_id()
+
+    mutate(my_id_dict)
+
+    assert my_id_dict.to_id() != original_id
+    assert my_id_dict.to_id() == IDDict(my_id_dict).to_id()
+
+
+@pytest.mark.unit
+def test_id_dict_copies_have_consistent_id():
+    my_id_dict = IDDict({"column": "a", "row_condition": 'b=="x"'})
+    original_id = my_id_dict.to_id()
+
+    for my_copy in [
+        copy.copy(my_id_dict),
+        copy.deepcopy(my_id_dict),
+        pickle.loads(pickle.dumps(my_id_dict)),
+    ]:
+        assert my_copy.to_id() == original_id
+        my_copy["column"] = "c"
+        assert my_copy.to_id() != original_id
+
+    assert my_id_dict.to_id() == original_id
+
+
+@pytest.mark.unit
+def test_id_dict_to_id_with_explicit_keys_is_not_cached():
+    my_id_dict = IDDict({"column": "a", "batch_id": "1234"})
+
+    assert my_id_dict.to_id(id_keys=["column"]) == "column=a"
+    assert my_id_dict.to_id(id_ignore_keys=["column"]) == "batch_id=1234"
+    assert my_id_dict.to_id() not in ("column=a", "batch_id=1234")
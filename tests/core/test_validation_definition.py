@@ -137,6 +137,7 @@ class TestValidationRun:
                 )
             ],
             runtime_configuration={"result_format": "SUMMARY"},
+            batch_id=BATCH_ID,
         )
 
     @mock.patch.object(_PandasDataAsset, "build_batch_request", autospec=True)
@@ -166,6 +167,7 @@ class TestValidationRun:
                 )
             ],
             runtime_configuration={"result_format": "COMPLETE"},
+            batch_id=BATCH_ID,
         )
 
     @pytest.mark.unit
@@ -214,6 +216,7 @@ class TestValidationRun:
                 )
             ],
             runtime_configuration={"result_format": "SUMMARY"},
+            batch_id=BATCH_ID,
         )
 
         # validate we are calling set on the store with data that's roughly the right shape
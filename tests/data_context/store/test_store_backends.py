@@ -537,6 +537,62 @@ def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     assert set(my_store.list_keys()) == {(".ge_store_backend_id",), ("AAA",)}
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_list_keys_with_prefix(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_list_keys__dir"))
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory=project_path,
+        filepath_template="{0}/{1}/my_file_{2}.json",
+        filepath_prefix="validations",
+        suppress_store_backend_id=True,
+    )
+
+    my_store.set(("suite_a", "run_1", "AAA"), "aaa")
+    my_store.set(("suite_a", "run_2", "BBB"), "bbb")
+    my_store.set(("suite_ab", "run_1", "CCC"), "ccc")
+    my_store.set(("suite_b", "run_1", "DDD"), "ddd")
+
+    assert set(my_store.list_keys(prefix=("suite_a",))) == {
+        ("suite_a", "run_1", "AAA"),
+        ("suite_a", "run_2", "BBB"),
+    }
+    assert my_store.list_keys(prefix=("suite_a", "run_2")) == [("suite_a", "run_2", "BBB")]
+    assert my_store.list_keys(prefix=("suite_c",)) == []
+    assert len(my_store.list_keys()) == 4
+
+
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_get_many(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_get_many__dir"))
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory=project_path,
+        filepath_template="my_file_{0}",
+        suppress_store_backend_id=True,
+    )
+
+    keys = [(f"key_{idx}",) for idx in range(20)]
+    for key in keys:
+        my_store.set(key, key[0])
+
+    assert my_store.get_many(keys) == [key[0] for key in keys]
+    assert my_store.get_many(keys, max_workers=1) == [key[0] for key in keys]
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("key_0",), ("missing",)])
+
+    assert my_store.get_many([("missing",), ("key_1",)], raise_on_missing=False) == [
+        None,
+        "key_1",
+    ]
+
+    with pytest.raises(ValueError):
+        my_store.get_many(keys, max_workers=0)
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_TupleS3StoreBackend_with_prefix(aws_credentials):
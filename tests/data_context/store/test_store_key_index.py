@@ -0,0 +1,149 @@
+import datetime
+import os
+
+import pytest
+
+from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.store import (
+    TupleFilesystemStoreBackend,
+    ValidationsStore,
+)
+from great_expectations.data_context.store.store_key_index import StoreKeyIndex
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.exceptions import StoreBackendError, StoreConfigurationError
+
+
+@pytest.mark.unit
+def test_StoreKeyIndex_queries(tmp_path):
+    key_index = StoreKeyIndex(filepath=str(tmp_path / "index" / "keys.db"))
+    assert not key_index.is_built
+
+    key_index.add(("suite_a", "run_1"), {"expectation_suite_name": "suite_a", "run_time": "1"})
+    key_index.add(
+        ("suite_a", "run_2"),
+        {"expectation_suite_name": "suite_a", "run_time": "2", "success": False},
+    )
+    key_index.add(
+        ("suite_ab", "run_3"),
+        {"expectation_suite_name": "suite_ab", "run_time": "3", "success": True},
+    )
+
+    assert key_index.has_key(("suite_a", "run_1"))
+    assert not key_index.has_key(("suite_a",))
+    assert key_index.list_keys(prefix=("suite_a",)) == [("suite_a", "run_2"), ("suite_a", "run_1")]
+    assert key_index.filter_keys(limit=1) == [("suite_ab", "run_3")]
+    assert key_index.filter_keys(expectation_suite_name="suite_a", success=False) == [
+        ("suite_a", "run_2")
+    ]
+
+    key_index.move(("suite_a", "run_1"), ("suite_b", "run_1"))
+    key_index.remove(("suite_ab", "run_3"))
+    assert set(key_index.list_keys()) == {("suite_a", "run_2"), ("suite_b", "run_1")}
+
+    assert key_index.rebuild([(("suite_c", "run_4"), None)]) == 1
+    assert key_index.is_built
+    assert key_index.list_keys() == [("suite_c", "run_4")]
+
+    with pytest.raises(ValueError):
+        key_index.filter_keys(limit=0)
+
+
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_with_key_index(tmp_path):
+    root_directory = str(tmp_path)
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=root_directory,
+        base_directory="store",
+        filepath_template="my_file_{0}",
+        key_index_filepath="index/keys.db",
+    )
+    assert my_store.key_index.filepath == os.path.join(root_directory, "index/keys.db")  # noqa: PTH118
+
+    my_store.set(("AAA",), "aaa")
+
+    # Until built, key index is not consulted.
+    assert not my_store.key_index.is_built
+    assert set(my_store.list_keys()) == {(".ge_store_backend_id",), ("AAA",)}
+
+    assert my_store.rebuild_key_index() == 2
+
+    my_store.set(("BBB",), "bbb")
+    my_store.move(("AAA",), ("CCC",))
+    assert set(my_store.key_index.list_keys()) == {
+        (".ge_store_backend_id",),
+        ("BBB",),
+        ("CCC",),
+    }
+
+    # Objects written behind the back of StoreBackend are not seen until key index is rebuilt.
+    with open(os.path.join(root_directory, "store", "my_file_DDD"), "w") as outfile:  # noqa: PTH118
+        outfile.write("ddd")
+
+    assert not my_store.has_key(("DDD",))
+    assert my_store.rebuild_key_index() == 4
+    assert my_store.has_key(("DDD",))
+
+    my_store.remove_key(("BBB",))
+    assert not my_store.has_key(("BBB",))
+    assert set(my_store.list_keys()) == {(".ge_store_backend_id",), ("CCC",), ("DDD",)}
+
+    my_store_without_key_index = TupleFilesystemStoreBackend(
+        root_directory=root_directory,
+        base_directory="store",
+        filepath_template="my_file_{0}",
+    )
+    assert my_store_without_key_index.key_index is None
+    with pytest.raises(StoreBackendError):
+        my_store_without_key_index.rebuild_key_index()
+
+
+@pytest.mark.filesystem
+def test_ValidationsStore_filter_keys(tmp_path):
+    def _build_store(key_index_filepath=None) -> ValidationsStore:
+        store_backend = {
+            "class_name": "TupleFilesystemStoreBackend",
+            "root_directory": str(tmp_path),
+            "base_directory": "validations",
+        }
+        if key_index_filepath:
+            store_backend["key_index_filepath"] = key_index_filepath
+
+        return ValidationsStore(store_backend=store_backend)
+
+    indexed_store = _build_store(key_index_filepath="validations_index.db")
+
+    keys = []
+    for idx, (suite_name, success) in enumerate(
+        [("suite_a", True), ("suite_b", False), ("suite_a", False), ("suite_a", True)]
+    ):
+        key = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(name=suite_name),
+            run_id=RunIdentifier(
+                run_name=f"run_{idx}",
+                run_time=datetime.datetime(2023, 1, idx + 1, tzinfo=datetime.timezone.utc),
+            ),
+            batch_identifier="batch_id",
+        )
+        indexed_store.set(
+            key,
+            ExpectationSuiteValidationResult(success=success, results=[], suite_name=suite_name),
+        )
+        keys.append(key)
+
+    store_without_key_index = _build_store()
+    with pytest.raises(StoreConfigurationError):
+        store_without_key_index.rebuild_key_index()
+
+    assert indexed_store.rebuild_key_index() == len(keys)
+
+    for store in [indexed_store, store_without_key_index]:
+        assert store.filter_keys(expectation_suite_name="suite_a") == [keys[3], keys[2], keys[0]]
+        assert store.filter_keys(success=False) == [keys[2], keys[1]]
+        assert store.filter_keys(expectation_suite_name="suite_a", success=True, limit=1) == [
+            keys[3]
+        ]
+        assert store.filter_keys(limit=2) == [keys[3], keys[2]]
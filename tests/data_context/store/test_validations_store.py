@@ -6,6 +6,7 @@ from freezegun import freeze_time
 from moto import mock_s3
 
 from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -356,3 +357,79 @@ def test_gx_cloud_response_json_to_object_dict() -> None:
     actual = ValidationsStore.gx_cloud_response_json_to_object_dict(response_json)
 
     assert actual == expected
+
+
+@pytest.mark.filesystem
+def test_ValidationsStore_store_validation_results_with_summaries(tmp_path):
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path),
+        },
+        store_summaries=True,
+    )
+    assert my_store.stores_summaries
+    assert my_store.config["store_summaries"] is True
+
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="asset.quarantine"),
+        run_id=RunIdentifier(
+            run_name="prod_100",
+            run_time=datetime.datetime(2019, 10, 7, tzinfo=datetime.timezone.utc),
+        ),
+        batch_identifier="batch_id",
+    )
+    missing_key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="asset.quarantine"),
+        run_id=RunIdentifier(
+            run_name="prod_200",
+            run_time=datetime.datetime(2019, 10, 7, tzinfo=datetime.timezone.utc),
+        ),
+        batch_identifier="batch_id",
+    )
+    my_store.store_validation_results(
+        suite_validation_result=ExpectationSuiteValidationResult(
+            success=False,
+            results=[],
+            suite_name="asset.quarantine",
+            statistics={"evaluated_expectations": 1},
+            meta={"batch_spec": {"data_asset_name": "my_asset"}},
+        ),
+        suite_validation_result_identifier=key,
+    )
+
+    # Summaries are stored next to Validation Results, without being listed as such.
+    assert my_store.list_keys() == [key]
+    summary, missing_summary = my_store.get_summaries([key, missing_key])
+    assert missing_summary is None
+    assert summary["success"] is False
+    assert summary["statistics"] == {"evaluated_expectations": 1}
+    assert summary["asset_name"] == "my_asset"
+    assert summary["batch_spec"] == {"data_asset_name": "my_asset"}
+
+    # Overwriting a Validation Result through the generic Store API updates its summary.
+    my_store.set(
+        key,
+        ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset.quarantine"),
+    )
+    assert my_store.get_summaries([key])[0]["success"] is True
+
+    my_store.remove_key(key)
+    assert my_store.list_keys() == []
+    assert my_store.get_summaries([key]) == [None]
+
+
+@pytest.mark.unit
+def test_ValidationsStore_without_summaries():
+    my_store = ValidationsStore(store_backend={"class_name": "InMemoryStoreBackend"})
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="asset.quarantine"),
+        run_id=RunIdentifier(
+            run_name="prod_100",
+            run_time=datetime.datetime(2019, 10, 7, tzinfo=datetime.timezone.utc),
+        ),
+        batch_identifier="batch_id",
+    )
+
+    assert not my_store.stores_summaries
+    assert my_store.get_summaries([key]) == [None]
@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 import pathlib
 import re
 from typing import TYPE_CHECKING, List
+from unittest import mock
 
 import pytest
 
@@ -832,6 +835,123 @@ def test_relative_base_directory_path(tmp_path_factory):
     assert len(my_batch_definition_list) == 1
 
 
+@pytest.mark.filesystem
+@pytest.mark.slow  # creating small number of`file handles in temporary file system
+def test_batch_definitions_of_narrowed_batch_requests_are_served_from_one_listing(
+    tmp_path_factory,
+):
+    base_directory = str(tmp_path_factory.mktemp("test_lazy_data_reference_discovery"))
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "alpha-1.csv",
+            "alpha-2.csv",
+            "alpha-3.csv",
+            "beta-1.csv",
+            "beta-2.csv",
+        ],
+    )
+
+    my_data_connector = FilesystemDataConnector(
+        datasource_name="my_file_path_datasource",
+        data_asset_name="my_filesystem_data_asset",
+        batching_regex=re.compile(r"(?P<name>[a-z]+)-(?P<number>\d)\.csv"),
+        base_directory=pathlib.Path(base_directory),
+        glob_directive="*.csv",
+    )
+
+    def _get_paths_and_number_of_listings(
+        options: dict, batch_slice: str | None = None
+    ) -> tuple[list[str], int]:
+        with mock.patch.object(
+            my_data_connector,
+            "get_data_references",
+            wraps=my_data_connector.get_data_references,
+        ) as mock_get_data_references:
+            batch_definition_list: List[LegacyBatchDefinition] = (
+                my_data_connector.get_batch_definition_list(
+                    BatchRequest(
+                        datasource_name="my_file_path_datasource",
+                        data_asset_name="my_filesystem_data_asset",
+                        options=options,
+                        batch_slice=batch_slice,
+                    )
+                )
+            )
+
+        return [
+            batch_definition.batch_identifiers["path"] for batch_definition in batch_definition_list
+        ], mock_get_data_references.call_count
+
+    # Listing of file system cannot be narrowed to literal prefix "beta-", so first batch request
+    # lists all data references once, and populates cache with them.
+    assert _get_paths_and_number_of_listings(options={"name": "beta"}) == (
+        ["beta-1.csv", "beta-2.csv"],
+        1,
+    )
+    assert len(my_data_connector._data_references_cache) == 5
+
+    # Subsequent batch requests (narrowed, or not) are served from cache.
+    assert _get_paths_and_number_of_listings(options={}, batch_slice="[:2]") == (
+        ["alpha-1.csv", "alpha-2.csv"],
+        0,
+    )
+    assert _get_paths_and_number_of_listings(options={"name": "alpha"}, batch_slice="[-1]") == (
+        ["alpha-3.csv"],
+        0,
+    )
+    assert _get_paths_and_number_of_listings(options={}) == (
+        ["alpha-1.csv", "alpha-2.csv", "alpha-3.csv", "beta-1.csv", "beta-2.csv"],
+        0,
+    )
+
+
+@pytest.mark.filesystem
+@pytest.mark.slow  # creating small number of`file handles in temporary file system
+def test_refresh_data_references(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("test_refresh_data_references"))
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "events_20240101.csv",
+            "events_20240102.csv",
+        ],
+    )
+
+    my_data_connector = FilesystemDataConnector(
+        datasource_name="my_file_path_datasource",
+        data_asset_name="my_filesystem_data_asset",
+        batching_regex=re.compile(r"events_(?P<date>\d{8})\.csv"),
+        base_directory=pathlib.Path(base_directory),
+        glob_directive="*.csv",
+    )
+    assert my_data_connector.get_data_reference_count() == 2
+
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "events_20240103.csv",
+            "events_20231231.csv",  # backfilled; sorts before already listed data references
+        ],
+    )
+    assert my_data_connector.get_data_reference_count() == 2
+
+    my_data_connector.refresh_data_references(incremental=True)
+    assert my_data_connector.get_matched_data_references() == [
+        "events_20240101.csv",
+        "events_20240102.csv",
+        "events_20240103.csv",
+    ]
+
+    my_data_connector.refresh_data_references()
+    assert my_data_connector.get_matched_data_references() == [
+        "events_20231231.csv",
+        "events_20240101.csv",
+        "events_20240102.csv",
+        "events_20240103.csv",
+    ]
+
+
 # TODO: <Alex>ALEX-UNCOMMENT_WHEN_SORTERS_ARE_INCLUDED_AND_TEST_SORTED_BATCH_DEFINITION_LIST</Alex>
 # TODO: <Alex>ALEX</Alex>
 # def test_return_all_batch_definitions_sorted_sorter_named_that_does_not_match_group(
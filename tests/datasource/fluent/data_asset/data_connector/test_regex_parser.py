@@ -244,3 +244,56 @@ def test_regex_pattern_no_groups(regex_pattern_no_groups: re.Pattern, csv_path:
     assert regex_parser.get_all_group_indexes() == []
     assert regex_parser.get_group_name_to_group_value_mapping(target=target) == {}
     assert regex_parser.get_group_index_to_group_value_mapping(target=target) == {}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "pattern,group_name_to_group_value_mapping,expected_literal_prefix",
+    [
+        pytest.param(
+            r"data/yellow_tripdata_sample_(?P<year>\d{4})-(?P<month>\d{2})\.csv",
+            None,
+            "data/yellow_tripdata_sample_",
+            id="literal_characters_up_to_first_group",
+        ),
+        pytest.param(
+            r"data/yellow_tripdata_sample_(?P<year>\d{4})-(?P<month>\d{2})\.csv",
+            {"year": "2020"},
+            "data/yellow_tripdata_sample_2020-",
+            id="named_group_value",
+        ),
+        pytest.param(
+            r"data/yellow_tripdata_sample_(\d{4})-(\d{2})\.csv",
+            {"batch_request_param_1": "2020", "batch_request_param_2": "03"},
+            "data/yellow_tripdata_sample_2020-03.csv",
+            id="common_group_values",
+        ),
+        pytest.param(
+            r"(?P<path>data/(?P<name>(a)|(b))_(\d+)\.csv)",
+            {"name": "a", "batch_request_param_5": "7"},
+            "data/a_7.csv",
+            id="nested_groups_are_counted",
+        ),
+        pytest.param(r"^data/.*\.csv", None, "data/", id="wildcard"),
+        pytest.param(r"data/file_\d+\.csv", None, "data/file_", id="character_class"),
+        pytest.param(r"data/files?/.*", None, "data/file", id="optional_character"),
+        pytest.param(r"data/(?:2020|2021)/.*", None, "data/", id="alternation_in_group"),
+        pytest.param(r"data/a\.csv|data/b\.csv", None, "", id="top_level_alternation"),
+        pytest.param(r"(?i)data/.*", None, "", id="inline_flags"),
+    ],
+)
+def test_get_literal_prefix(
+    pattern: str,
+    group_name_to_group_value_mapping: dict | None,
+    expected_literal_prefix: str,
+):
+    regex_parser = RegExParser(
+        regex_pattern=re.compile(pattern), unnamed_regex_group_prefix="batch_request_param_"
+    )
+
+    assert (
+        regex_parser.get_literal_prefix(
+            group_name_to_group_value_mapping=group_name_to_group_value_mapping
+        )
+        == expected_literal_prefix
+    )
@@ -2,6 +2,7 @@ import logging
 import os
 import re
 from typing import TYPE_CHECKING, List
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -884,6 +885,79 @@ def test_foxtrot():
 
 
 @pytest.mark.unit
+@pytest.mark.big
+@mock_s3
+def test_listing_is_narrowed_by_batch_request_options_and_refreshed_incrementally():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client: BaseClient = boto3.client("s3", region_name=region_name)
+
+    keys: List[str] = [
+        "events/2024-01-01.csv",
+        "events/2024-01-02.csv",
+        "events/2024-02-01.csv",
+        "other/2024-01-01.csv",
+    ]
+    for key in keys:
+        client.put_object(Bucket=bucket, Body="x,y\n1,2\n", Key=key)
+
+    my_data_connector = S3DataConnector(
+        datasource_name="my_file_path_datasource",
+        data_asset_name="my_s3_data_asset",
+        batching_regex=re.compile(r"(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})\.csv"),
+        s3_client=client,
+        bucket=bucket,
+        prefix="events",
+        file_path_template_map_fn=S3Url.OBJECT_URL_TEMPLATE.format,
+    )
+
+    with mock.patch.object(
+        client, "list_objects_v2", wraps=client.list_objects_v2
+    ) as mock_list_objects:
+        batch_definition_list: List[LegacyBatchDefinition] = (
+            my_data_connector.get_batch_definition_list(
+                BatchRequest(
+                    datasource_name="my_file_path_datasource",
+                    data_asset_name="my_s3_data_asset",
+                    options={"year": "2024", "month": "01"},
+                )
+            )
+        )
+    assert [
+        batch_definition.batch_identifiers["path"] for batch_definition in batch_definition_list
+    ] == ["events/2024-01-01.csv", "events/2024-01-02.csv"]
+    assert mock_list_objects.call_args.kwargs["Prefix"] == "events/2024-01-"
+
+    # A narrowed listing that matches nothing is not a configuration error.
+    assert (
+        my_data_connector.get_batch_definition_list(
+            BatchRequest(
+                datasource_name="my_file_path_datasource",
+                data_asset_name="my_s3_data_asset",
+                options={"year": "2023"},
+            )
+        )
+        == []
+    )
+
+    assert my_data_connector.get_data_reference_count() == 3
+
+    client.put_object(Bucket=bucket, Body="x,y\n1,2\n", Key="events/2024-02-02.csv")
+    with mock.patch.object(
+        client, "list_objects_v2", wraps=client.list_objects_v2
+    ) as mock_list_objects:
+        my_data_connector.refresh_data_references(incremental=True)
+    assert mock_list_objects.call_args.kwargs["StartAfter"] == "events/2024-02-01.csv"
+    assert my_data_connector.get_matched_data_references() == [
+        "events/2024-01-01.csv",
+        "events/2024-01-02.csv",
+        "events/2024-02-01.csv",
+        "events/2024-02-02.csv",
+    ]
+
+
 def test_sanitize_prefix_behaves_the_same_as_local_files():
     def check_sameness(prefix, expected_output):
         s3_sanitized = sanitize_prefix_for_gcs_and_s3(text=prefix)
@@ -44,6 +44,7 @@ from great_expectations.datasource.fluent.batch_request import (
     BatchRequestOptions,
 )
 from great_expectations.datasource.fluent.interfaces import (
+    Batch,
     Sorter,
     TestConnectionError,
 )
@@ -124,6 +125,12 @@ def create_source() -> ContextManager:
 CreateSourceFixture: TypeAlias = Callable[..., ContextManager[PostgresDatasource]]
 
 
+def _load_batch_data(batches: List[Batch]) -> None:
+    """Batch data is built lazily; accessing it passes each batch spec to the execution engine."""
+    for batch in batches:
+        assert batch.data is not None
+
+
 @pytest.fixture
 def mock_test_connection(monkeypatch: pytest.MonkeyPatch):
     """Patches the test_connection method of the PostgresDatasource class to return True."""
@@ -313,7 +320,8 @@ def test_datasource_gets_batch_list_no_partitioner(empty_data_context, create_so
         ) = create_and_add_table_asset_without_testing_connection(
             source=source, name="my_asset", table_name="my_table"
         )
-        source.get_batch_list_from_batch_request(asset.build_batch_request())
+        batches = source.get_batch_list_from_batch_request(asset.build_batch_request())
+        _load_batch_data(batches)
 
 
 def assert_batch_specs_correct_with_year_month_partitioner_defaults(batch_specs):
@@ -369,6 +377,7 @@ def test_datasource_gets_batch_list_partitioner_with_unspecified_batch_request_o
         empty_batch_request = asset.build_batch_request(partitioner=partitioner)
         assert empty_batch_request.options == {}
         batches = source.get_batch_list_from_batch_request(empty_batch_request)
+        _load_batch_data(batches)
         assert_batch_specs_correct_with_year_month_partitioner_defaults(batch_specs)
         assert_batches_correct_with_year_month_partitioner_defaults(batches)
 
@@ -404,6 +413,7 @@ def test_datasource_gets_batch_list_partitioner_with_batch_request_options_set_t
         )
         assert batch_request_with_none.options == {"year": None, "month": None}
         batches = source.get_batch_list_from_batch_request(batch_request_with_none)
+        _load_batch_data(batches)
         # We should have 1 batch_spec per (year, month) pair
         assert_batch_specs_correct_with_year_month_partitioner_defaults(batch_specs)
         assert_batches_correct_with_year_month_partitioner_defaults(batches)
@@ -436,6 +446,7 @@ def test_datasource_gets_batch_list_partitioner_with_partially_specified_batch_r
         batches = source.get_batch_list_from_batch_request(
             asset.build_batch_request(options={"year": year}, partitioner=partitioner)
         )
+        _load_batch_data(batches)
         assert len(batch_specs) == len(_DEFAULT_TEST_MONTHS)
         for month in _DEFAULT_TEST_MONTHS:
             spec = {
@@ -493,6 +504,7 @@ def test_datasource_gets_batch_list_with_fully_specified_batch_request_options(
                 options={"month": month, "year": year}, partitioner=partitioner
             )
         )
+        _load_batch_data(batches)
         assert 1 == len(batches)
         assert batches[0].metadata == {"month": month, "year": year}
 
@@ -840,6 +852,85 @@ def test_postgres_slice_batch_count(
         assert len(batches) == expected_batch_count
 
 
+@pytest.mark.postgresql
+def test_batches_are_materialized_only_when_used(
+    empty_data_context,
+    create_source: CreateSourceFixture,
+) -> None:
+    batch_specs = []
+
+    def collect_batch_spec(spec: SqlAlchemyDatasourceBatchSpec) -> None:
+        batch_specs.append(spec)
+
+    with create_source(
+        validate_batch_spec=collect_batch_spec,
+        dialect="postgresql",
+        data_context=empty_data_context,
+    ) as source:
+        (
+            source,  # noqa: PLW2901
+            asset,
+        ) = create_and_add_table_asset_without_testing_connection(
+            source=source, name="my_asset", table_name="my_table"
+        )
+        asset.add_sorters(["year", "month"])
+        batch_request = asset.build_batch_request(
+            batch_slice="[-1:]", partitioner=PartitionerYearAndMonth(column_name="my_col")
+        )
+        (batch,) = asset.get_batch_list_from_batch_request(batch_request=batch_request)
+        assert batch.metadata == {"year": 2022, "month": 12}
+        assert not batch.is_loaded
+        assert batch_specs == []
+
+        _load_batch_data([batch])
+        assert batch.is_loaded
+        assert batch_specs == [batch.batch_spec]
+
+
+@pytest.mark.postgresql
+@pytest.mark.parametrize(
+    "order_by,options,batch_slice,expected_sort_and_limit",
+    [
+        pytest.param(["year", "month"], {}, "[-1:]", ([True, True], 1), id="latest"),
+        pytest.param(["year", "-month"], {}, "[:3]", ([False, True], 3), id="first_three"),
+        pytest.param(["year", "month"], {}, "[-5:-2]", ([True, True], 5), id="negative_range"),
+        pytest.param(["year", "month"], {}, "-1", ([True, True], 1), id="last_index"),
+        pytest.param(["year", "month"], {}, None, None, id="all_batches"),
+        pytest.param(["year", "month"], {}, "[::2]", None, id="step"),
+        pytest.param(["year", "month"], {}, "[-5:3]", None, id="mixed_signs"),
+        pytest.param(["year", "month"], {"year": 2021}, "[-1:]", None, id="filtered"),
+        pytest.param(["month", "year"], {}, "[-1:]", None, id="other_sort_order"),
+        pytest.param([], {}, "[-1:]", None, id="unsorted"),
+    ],
+)
+def test_partition_query_sort_and_limit(
+    create_source: CreateSourceFixture,
+    order_by: List[str],
+    options: BatchRequestOptions,
+    batch_slice: Optional[BatchSlice],
+    expected_sort_and_limit: Optional[Tuple[List[bool], int]],
+) -> None:
+    with create_source(validate_batch_spec=lambda _: None, dialect="postgresql") as source:
+        (
+            source,  # noqa: PLW2901
+            asset,
+        ) = create_and_add_table_asset_without_testing_connection(
+            source=source, name="my_asset", table_name="my_table"
+        )
+        asset.add_sorters(order_by)
+        partitioner = PartitionerYearAndMonth(column_name="my_col")
+        batch_request = asset.build_batch_request(
+            options=options, batch_slice=batch_slice, partitioner=partitioner
+        )
+        assert (
+            asset._get_partition_query_sort_and_limit(
+                batch_request=batch_request,
+                sql_partitioner=asset.get_partitioner_implementation(partitioner),
+            )
+            == expected_sort_and_limit
+        )
+
+
 @pytest.mark.postgresql
 def test_data_source_json_has_properties(create_source: CreateSourceFixture):
     with create_source(validate_batch_spec=lambda _: None, dialect="postgresql") as source:
@@ -1109,7 +1200,8 @@ def test_query_data_asset(empty_data_context, create_source):
         asset = source.add_query_asset(name="query_asset", query="SELECT * FROM my_table")
         assert asset.name == "query_asset"
         assert asset.query.lower() == query.lower()
-        source.get_batch_list_from_batch_request(asset.build_batch_request())
+        batches = source.get_batch_list_from_batch_request(asset.build_batch_request())
+        _load_batch_data(batches)
 
 
 @pytest.mark.postgresql
@@ -1172,6 +1264,7 @@ def test_partitioner_year(
         batches = source.get_batch_list_from_batch_request(
             asset.build_batch_request(partitioner=partitioner)
         )
+        _load_batch_data(batches)
         assert len(batches) == len(years)
         for i, year in enumerate(years):
             assert "year" in batches[i].metadata
@@ -1212,6 +1305,7 @@ def test_partitioner_year_and_month(
         batches = source.get_batch_list_from_batch_request(
             asset.build_batch_request(partitioner=partitioner)
         )
+        _load_batch_data(batches)
         assert len(batches) == len(years) * len(months)
         for i, year in enumerate(years):
             for j, month in enumerate(months):
@@ -1262,6 +1356,7 @@ def test_partitioner_year_and_month_and_day(
         batches = source.get_batch_list_from_batch_request(
             asset.build_batch_request(partitioner=partitioner)
         )
+        _load_batch_data(batches)
         assert len(batches) == len(years) * len(months) * len(days)
         for i, year in enumerate(years):
             for j, month in enumerate(months):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pathlib
+import sqlite3
 from contextlib import _GeneratorContextManager, contextmanager
 from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
 
@@ -9,12 +10,16 @@ import pytest
 from great_expectations.compatibility.pydantic import ValidationError
 from great_expectations.core.partitioners import (
     PartitionerConvertedDatetime,
+    PartitionerYearAndMonth,
 )
 from great_expectations.datasource.fluent import SqliteDatasource
 from tests.datasource.fluent.conftest import sqlachemy_execution_engine_mock_cls
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from great_expectations.data_context import AbstractDataContext
+    from great_expectations.datasource.fluent.sql_datasource import TableAsset
 
 
 @pytest.fixture
@@ -184,3 +189,104 @@ def test_create_temp_table(empty_data_context, create_sqlite_source):
         asset = source.add_query_asset(name="query_asset", query="SELECT * from table")
         _ = asset.get_batch_list_from_batch_request(asset.build_batch_request())
         assert source._execution_engine._create_temp_table is False
+
+
+@pytest.fixture
+def events_database_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    database_path = tmp_path / "events.db"
+    with sqlite3.connect(database_path) as connection:
+        connection.execute("CREATE TABLE events (id INTEGER, event_time TEXT)")
+        connection.executemany(
+            "INSERT INTO events VALUES (?, ?)",
+            [(1, "2023-01-05 10:00:00"), (2, "2023-02-07 11:00:00"), (3, "2023-02-08 12:00:00")],
+        )
+    return database_path
+
+
+def _insert_event(database_path: pathlib.Path, event_time: str) -> None:
+    with sqlite3.connect(database_path) as connection:
+        connection.execute("INSERT INTO events VALUES (?, ?)", (99, event_time))
+
+
+def _batch_metadata(asset: TableAsset) -> list[dict]:
+    batch_request = asset.build_batch_request(
+        partitioner=PartitionerYearAndMonth(column_name="event_time")
+    )
+    return [batch.metadata for batch in asset.get_batch_list_from_batch_request(batch_request)]
+
+
+@pytest.mark.sqlite
+def test_partition_cache_reuses_partitions_until_ttl_expires(
+    in_memory_runtime_context, events_database_path
+):
+    datasource = in_memory_runtime_context.sources.add_sqlite(
+        "events_datasource", connection_string=f"sqlite:///{events_database_path}"
+    )
+    asset = datasource.add_table_asset("events", table_name="events", order_by=["year", "month"])
+    asset.set_partition_cache_ttl(3600)
+
+    expected_metadata = [{"year": 2023, "month": 1}, {"year": 2023, "month": 2}]
+    assert _batch_metadata(asset) == expected_metadata
+
+    _insert_event(events_database_path, "2023-03-01 09:00:00")
+    assert _batch_metadata(asset) == expected_metadata
+
+    asset.clear_partition_cache()
+    assert _batch_metadata(asset) == [*expected_metadata, {"year": 2023, "month": 3}]
+
+
+@pytest.mark.sqlite
+def test_partition_cache_refreshes_datetime_partitions_incrementally(
+    in_memory_runtime_context, events_database_path
+):
+    datasource = in_memory_runtime_context.sources.add_sqlite(
+        "events_datasource", connection_string=f"sqlite:///{events_database_path}"
+    )
+    asset = datasource.add_table_asset("events", table_name="events", order_by=["year", "month"])
+    asset.set_partition_cache_ttl(0)
+
+    assert _batch_metadata(asset) == [{"year": 2023, "month": 1}, {"year": 2023, "month": 2}]
+
+    # A later partition is found by scanning only rows at or after the latest known event time.
+    _insert_event(events_database_path, "2023-04-02 08:00:00")
+    # A backfilled earlier partition is only found once all partitions are rediscovered.
+    _insert_event(events_database_path, "2022-12-31 23:00:00")
+    assert _batch_metadata(asset) == [
+        {"year": 2023, "month": 1},
+        {"year": 2023, "month": 2},
+        {"year": 2023, "month": 4},
+    ]
+
+    asset.set_partition_cache_ttl(None)
+    assert _batch_metadata(asset) == [
+        {"year": 2022, "month": 12},
+        {"year": 2023, "month": 1},
+        {"year": 2023, "month": 2},
+        {"year": 2023, "month": 4},
+    ]
+
+
+@pytest.mark.sqlite
+def test_partition_catalog_is_only_read_with_partition_cache(
+    in_memory_runtime_context, events_database_path, mocker: MockerFixture
+):
+    datasource = in_memory_runtime_context.sources.add_sqlite(
+        "events_datasource", connection_string=f"sqlite:///{events_database_path}"
+    )
+    asset = datasource.add_table_asset("events", table_name="events", order_by=["year", "month"])
+    get_catalog_data = mocker.spy(type(asset), "_get_batch_identifier_data_from_catalog")
+
+    expected_metadata = [{"year": 2023, "month": 1}, {"year": 2023, "month": 2}]
+    assert _batch_metadata(asset) == expected_metadata
+    get_catalog_data.assert_not_called()
+
+    asset.set_partition_cache_ttl(3600)
+    assert _batch_metadata(asset) == expected_metadata
+    get_catalog_data.assert_called_once()
+
+
+@pytest.mark.unit
+def test_partition_cache_ttl_must_be_non_negative(sqlite_datasource):
+    asset = sqlite_datasource.add_table_asset("events", table_name="events")
+    with pytest.raises(ValueError):
+        asset.set_partition_cache_ttl(-1)
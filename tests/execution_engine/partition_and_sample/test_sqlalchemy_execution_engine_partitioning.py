@@ -637,3 +637,81 @@ def test_sqlite_partition_and_sample_using_limit(
     for row_date in row_dates:
         assert row_date.month == 1
         assert row_date.year == 2018
+
+
+@pytest.mark.parametrize(
+    "partitioner_method_name,partitioner_kwargs,descending,limit,expected_batch_identifiers",
+    [
+        pytest.param(
+            "partition_on_year_and_month",
+            {"column_name": "pickup_datetime"},
+            [True, True],
+            2,
+            [
+                {"pickup_datetime": {"year": 2020, "month": 12}},
+                {"pickup_datetime": {"year": 2020, "month": 11}},
+            ],
+            id="year_and_month_latest",
+        ),
+        pytest.param(
+            "partition_on_date_parts",
+            {"column_name": "pickup_datetime", "date_parts": ["year", "month"]},
+            [False, True],
+            3,
+            [
+                {"pickup_datetime": {"year": 2018, "month": 12}},
+                {"pickup_datetime": {"year": 2018, "month": 11}},
+                {"pickup_datetime": {"year": 2018, "month": 10}},
+            ],
+            id="date_parts_mixed_directions",
+        ),
+        pytest.param(
+            "partition_on_mod_integer",
+            {"column_name": "passenger_count", "mod": 3},
+            [False],
+            2,
+            [{"passenger_count": None}, {"passenger_count": 0}],
+            id="mod_integer_nulls_first",
+        ),
+        pytest.param(
+            "partition_on_mod_integer",
+            {"column_name": "passenger_count", "mod": 3},
+            [True],
+            None,
+            [
+                {"passenger_count": 2},
+                {"passenger_count": 1},
+                {"passenger_count": 0},
+                {"passenger_count": None},
+            ],
+            id="mod_integer_descending_nulls_last",
+        ),
+    ],
+)
+@pytest.mark.sqlite
+def test_get_data_for_batch_identifiers_sorted_and_limited(
+    sa,
+    in_memory_sqlite_taxi_ten_trips_per_month_execution_engine,
+    partitioner_method_name: str,
+    partitioner_kwargs: dict,
+    descending: List[bool],
+    limit: int | None,
+    expected_batch_identifiers: List[dict],
+):
+    """What does this test and why?
+    Sort directions and limit are applied by the partition-discovery query, in the same order
+    (NULL values being smallest) as fluent SQL assets sort batches in Python.
+    """
+    engine: SqlAlchemyExecutionEngine = in_memory_sqlite_taxi_ten_trips_per_month_execution_engine
+    data_partitioner: SqlAlchemyDataPartitioner = SqlAlchemyDataPartitioner(dialect="sqlite")
+
+    batch_identifiers: List[dict] = data_partitioner.get_data_for_batch_identifiers(
+        execution_engine=engine,
+        selectable=sa.table("test", schema="main"),
+        partitioner_method_name=partitioner_method_name,
+        partitioner_kwargs=partitioner_kwargs,
+        descending=descending,
+        limit=limit,
+    )
+
+    assert batch_identifiers == expected_batch_identifiers
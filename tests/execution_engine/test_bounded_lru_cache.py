@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from great_expectations.execution_engine.bounded_lru_cache import BoundedLRUCache
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"max_memory_bytes": 0}])
+def test_bounded_lru_cache_rejects_non_positive_bounds(kwargs: dict):
+    with pytest.raises(ValueError):
+        BoundedLRUCache(**kwargs)
+
+
+@pytest.mark.unit
+def test_bounded_lru_cache_evicts_least_recently_used_entries_and_accounts_sizes():
+    released = []
+    cache: BoundedLRUCache[str, str] = BoundedLRUCache(
+        max_entries=2, max_memory_bytes=25, on_evict=released.append
+    )
+
+    assert cache.put(key="a", value="value_a", size=10)
+    assert cache.put(key="b", value="value_b", size=10)
+    assert cache.get("a") == "value_a"  # "a" becomes most recently used
+
+    assert cache.put(key="c", value="value_c", size=10)
+    assert released == ["value_b"]
+    assert cache.memory_bytes == 20
+
+    # Replacing entry releases its previous value, and accounts only for new size.
+    assert cache.put(key="c", value="value_c_2", size=15)
+    assert released == ["value_b", "value_c"]
+    assert cache.memory_bytes == 25
+
+    assert not cache.put(key="too_big", value="value", size=30)
+    assert "too_big" not in cache
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_bounded_lru_cache_remove_if_and_clear_release_entries():
+    released = []
+    cache: BoundedLRUCache[str, int] = BoundedLRUCache(on_evict=released.append)
+    for idx, key in enumerate(["a", "b", "c"]):
+        cache.put(key=key, value=idx, size=1)
+
+    cache.remove_if(lambda key, value: value % 2 == 0)
+    assert released == [0, 2]
+    assert "b" in cache
+    assert cache.memory_bytes == 1
+
+    cache.clear()
+    assert released == [0, 2, 1]
+    assert len(cache) == 0
+    assert cache.memory_bytes == 0
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.domain_records_cache import DomainRecordsCache
+
+
+@pytest.mark.unit
+def test_domain_records_cache_evicts_least_recently_used_entries_and_releases_them():
+    released = []
+    cache = DomainRecordsCache(max_memory_bytes=20, on_evict=released.append)
+
+    cache.put(key=("batch_1", "a"), value="mask_a", size=10)
+    cache.put(key=("batch_1", "b"), value="mask_b", size=10)
+    assert cache.get(("batch_1", "a")) == "mask_a"  # "a" becomes most recently used
+
+    cache.put(key=("batch_1", "c"), value="mask_c", size=10)
+
+    assert len(cache) == 2
+    assert ("batch_1", "b") not in cache
+    assert released == ["mask_b"]
+    assert cache.memory_bytes == 20
+
+    cache.put(key=("batch_1", "too_big"), value="mask", size=30)
+    assert ("batch_1", "too_big") not in cache
+
+
+@pytest.mark.unit
+def test_domain_records_cache_invalidate_batch():
+    cache = DomainRecordsCache()
+    cache.put(key=("batch_1", "a"), value="mask_a")
+    cache.put(key=("batch_2", "a"), value="mask_b")
+
+    cache.invalidate_batch(batch_id="batch_1")
+
+    assert ("batch_1", "a") not in cache
+    assert ("batch_2", "a") in cache
+
+
+@pytest.mark.unit
+def test_pandas_get_domain_records_evaluates_row_condition_once_per_batch():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [1.0, None, 3.0, None], "c": [1, 2, None, 4]})
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs = {
+        "column_A": "b",
+        "column_B": "c",
+        "row_condition": "a>1",
+        "condition_parser": "pandas",
+        "ignore_row_if": "either_value_is_missing",
+    }
+    expected = df.query("a>1").dropna(axis=0, how="any", subset=["b", "c"])
+
+    with mock.patch.object(
+        pd.DataFrame, "eval", autospec=True, side_effect=pd.DataFrame.eval
+    ) as mock_eval:
+        first = engine.get_domain_records(domain_kwargs=domain_kwargs)
+        second = engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+    assert mock_eval.call_count == 1
+    assert first.equals(expected)
+    assert second.equals(expected)
+
+    # Reloading data under same Batch ID invalidates cached row masks.
+    engine.load_batch_data(batch_data=df.iloc[:2], batch_id="1234")
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs).empty
@@ -317,3 +317,71 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(gx_exceptions.GreatExpectationsError):
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+@pytest.mark.unit
+def test_resolve_metrics_concurrently_matches_serial_resolution():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4.0, 5.0, 6.0, 7.0]})
+
+    resolved: Dict[int, Dict[Tuple[str, str, str], MetricValue]] = {}
+    for max_workers in (None, 4):
+        engine = PandasExecutionEngine(batch_data_dict={"my_id": df}, max_workers=max_workers)
+
+        metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+        metrics.update(results)
+
+        desired_metrics = []
+        for column in ("a", "b"):
+            for metric_name in ("column.mean", "column.max", "column.standard_deviation"):
+                metric = MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs={"column": column},
+                    metric_value_kwargs=None,
+                )
+                metric.metric_dependencies = {"table.columns": table_columns_metric}
+                desired_metrics.append(metric)
+
+        resolved[max_workers or 1] = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert len(resolved[4]) == 6
+    assert resolved[4] == resolved[1]
+
+
+@pytest.mark.unit
+def test_resolve_metrics_concurrently_reports_all_failed_metrics():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df}, max_workers=4)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    good_metric = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    bad_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "not_in_table"},
+            metric_value_kwargs=None,
+        )
+        for metric_name in ("column.mean", "column.max")
+    ]
+    for metric in [good_metric, *bad_metrics]:
+        metric.metric_dependencies = {"table.columns": table_columns_metric}
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(metrics_to_resolve=[good_metric, *bad_metrics], metrics=metrics)
+
+    assert {metric.id for metric in e.value.failed_metrics} == {metric.id for metric in bad_metrics}
+
+
+@pytest.mark.unit
+def test_execution_engine_rejects_non_positive_max_workers():
+    with pytest.raises(ValueError):
+        PandasExecutionEngine(max_workers=0)
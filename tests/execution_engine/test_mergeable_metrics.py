@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.mergeable_metrics import (
+    DistinctCountSketch,
+    MetricChunk,
+    QuantileSketch,
+    get_mergeable_metric,
+    is_cross_row_map_metric,
+    is_deferred_chunk_metric,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+@pytest.mark.unit
+def test_distinct_count_sketch_is_exact_below_threshold():
+    left = DistinctCountSketch.from_series(pd.Series(["a", "b", None, "a"]))
+    right = DistinctCountSketch.from_series(pd.Series(["b", "c"]))
+
+    merged = left.merge(right)
+
+    assert merged.is_exact
+    assert merged.estimate() == 3
+
+
+@pytest.mark.unit
+def test_distinct_count_sketch_approximates_beyond_threshold():
+    values = np.arange(200_000)
+    sketches = [
+        DistinctCountSketch.from_series(pd.Series(chunk), max_exact_values=1_000)
+        for chunk in np.array_split(np.concatenate([values, values[:50_000]]), 10)
+    ]
+
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged = merged.merge(sketch)
+
+    assert not merged.is_exact
+    assert merged.estimate() == pytest.approx(len(values), rel=0.05)
+
+
+@pytest.mark.unit
+def test_quantile_sketch_is_exact_below_capacity():
+    series = pd.Series([5, 1, None, 4, 2, 3])
+    sketch = QuantileSketch.from_series(series.iloc[:3]).merge(
+        QuantileSketch.from_series(series.iloc[3:])
+    )
+
+    assert sketch.is_exact
+    assert sketch.median() == series.median()
+    assert (
+        sketch.quantiles([0.25, 0.5, 0.75], interpolation="nearest")
+        == series.quantile([0.25, 0.5, 0.75], interpolation="nearest").tolist()
+    )
+
+
+@pytest.mark.unit
+def test_quantile_sketch_approximates_beyond_capacity():
+    values = np.random.default_rng(seed=42).normal(size=100_000)
+    sketch = QuantileSketch(capacity=1_000)
+    for chunk in np.array_split(values, 20):
+        sketch = sketch.merge(QuantileSketch.from_series(pd.Series(chunk), capacity=1_000))
+
+    assert not sketch.is_exact
+    assert sketch.count == len(values)
+    approximate_quantiles = sketch.quantiles([0.1, 0.5, 0.9])
+    exact_quantiles = np.quantile(values, [0.1, 0.5, 0.9])
+    assert np.allclose(approximate_quantiles, exact_quantiles, atol=0.05)
+
+
+@pytest.mark.unit
+def test_quantile_sketch_keeps_dtype_of_datetime_and_string_values():
+    timestamps = pd.Series(pd.date_range("2024-01-01", periods=9, freq="D"))
+    datetime_sketch = QuantileSketch.from_series(timestamps.iloc[:4]).merge(
+        QuantileSketch.from_series(timestamps.iloc[4:])
+    )
+    assert datetime_sketch.median() == timestamps.median()
+
+    compacted_datetime_sketch = QuantileSketch.from_series(timestamps, capacity=4)
+    assert not compacted_datetime_sketch.is_exact
+    assert all(
+        isinstance(value, pd.Timestamp) for value in compacted_datetime_sketch.quantiles([0, 1])
+    )
+
+    strings = pd.Series(list("abcdefghi"))
+    string_sketch = QuantileSketch.from_series(strings.iloc[:4], capacity=4).merge(
+        QuantileSketch.from_series(strings.iloc[4:], capacity=4)
+    )
+    assert not string_sketch.is_exact
+    assert string_sketch.quantiles([0.0]) == ["a"]
+    assert string_sketch.quantiles([0.5])[0] in set(strings)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_name,mergeable",
+    [
+        pytest.param("table.row_count", True, id="table.row_count"),
+        pytest.param("column.quantile_values", True, id="column.quantile_values"),
+        pytest.param("column_values.nonnull.unexpected_count", True, id="unexpected_count"),
+        pytest.param("column_values.in_set.unexpected_values", True, id="unexpected_values"),
+        pytest.param("column.most_common_value", False, id="column.most_common_value"),
+        pytest.param("column_values.in_set.unexpected_index_query", True, id="index_query"),
+    ],
+)
+def test_get_mergeable_metric(metric_name: str, mergeable: bool):
+    assert (get_mergeable_metric(metric_name=metric_name) is not None) is mergeable
+
+
+@pytest.mark.unit
+def test_is_deferred_chunk_metric():
+    assert is_deferred_chunk_metric(metric_name="column_values.nonnull.condition")
+    assert is_deferred_chunk_metric(metric_name="column_values.value_length.map")
+    assert not is_deferred_chunk_metric(metric_name="column_values.nonnull.unexpected_count")
+
+
+@pytest.mark.unit
+def test_is_cross_row_map_metric():
+    assert is_cross_row_map_metric(metric_name="column_values.unique.condition")
+    assert is_cross_row_map_metric(metric_name="compound_columns.count.map")
+    assert not is_cross_row_map_metric(metric_name="column_values.nonnull.condition")
+    assert not is_cross_row_map_metric(metric_name="column_values.unique.unexpected_count")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "result_format,expected_query",
+    [
+        pytest.param("SUMMARY", "df.filter(items=[1, 4, 5], axis=0)", id="summary"),
+        pytest.param("COMPLETE", "df.filter(items=[1, 4, 5, 6, 8], axis=0)", id="complete"),
+    ],
+)
+def test_unexpected_index_query_is_merged_across_chunks(result_format: str, expected_query: str):
+    metric_configuration = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_index_query",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "result_format": {"result_format": result_format, "partial_unexpected_count": 3}
+        },
+    )
+    mergeable_metric = get_mergeable_metric(metric_name=metric_configuration.metric_name)
+    assert mergeable_metric is not None
+
+    partial_result = None
+    for chunk_query in (
+        "df.filter(items=[1], axis=0)",
+        "df.filter(items=[], axis=0)",
+        "df.filter(items=[4, 5, 6], axis=0)",
+        "df.filter(items=[8], axis=0)",
+    ):
+        chunk_partial_result = mergeable_metric.partial(
+            MetricChunk(
+                metric_configuration=metric_configuration,
+                value_fn=lambda chunk_query=chunk_query: chunk_query,
+                column_fn=pd.Series,
+            )
+        )
+        partial_result = (
+            chunk_partial_result
+            if partial_result is None
+            else mergeable_metric.merge(partial_result, chunk_partial_result, metric_configuration)
+        )
+
+    assert mergeable_metric.finalize(partial_result, metric_configuration) == expected_query
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import pathlib
+from typing import Dict, Tuple
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    FilesystemMetricCache,
+    InMemoryMetricCache,
+    NoOpMetricCache,
+)
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_evicts_least_recently_used_entries():
+    cache = InMemoryMetricCache(max_entries=2)
+
+    cache.put(metric_id=("a", "", ""), value=1)
+    cache.put(metric_id=("b", "", ""), value=2)
+    assert cache[("a", "", "")] == 1  # "a" becomes most recently used
+
+    cache.put(metric_id=("c", "", ""), value=3)
+
+    assert len(cache) == 2
+    assert ("a", "", "") in cache
+    assert ("b", "", "") not in cache
+    assert ("c", "", "") in cache
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_respects_memory_budget():
+    series = pd.Series(range(1000), dtype="int64")
+    series_size = int(series.memory_usage(deep=True))
+
+    cache = InMemoryMetricCache(max_memory_bytes=int(series_size * 1.5))
+    cache.put(metric_id=("a", "", ""), value=series)
+    cache.put(metric_id=("b", "", ""), value=series.copy())
+
+    assert len(cache) == 1
+    assert ("b", "", "") in cache
+    assert cache.memory_bytes <= cache.max_memory_bytes
+
+    cache.put(metric_id=("too_big", "", ""), value=pd.Series(range(10000)))
+    assert ("too_big", "", "") not in cache
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_invalidate_batch():
+    cache = InMemoryMetricCache()
+    cache.put(metric_id=("a", "", ""), value=1, batch_id="batch_1")
+    cache.put(metric_id=("b", "", ""), value=2, batch_id="batch_2")
+
+    cache.invalidate_batch(batch_id="batch_1")
+
+    assert ("a", "", "") not in cache
+    assert cache[("b", "", "")] == 2
+
+
+@pytest.mark.unit
+def test_no_op_metric_cache_retains_nothing():
+    cache = NoOpMetricCache()
+    cache.put(metric_id=("a", "", ""), value=1)
+
+    assert len(cache) == 0
+    assert ("a", "", "") not in cache
+    with pytest.raises(KeyError):
+        _ = cache[("a", "", "")]
+
+
+@pytest.mark.filesystem
+def test_filesystem_metric_cache_persists_summary_metrics_by_fingerprint(
+    tmp_path: pathlib.Path,
+):
+    cache = FilesystemMetricCache(base_directory=tmp_path)
+    cache.put(metric_id=("column.max", "column=a", ()), value=3, batch_fingerprint="abc")
+    cache.put(
+        metric_id=("column_values.in_set.condition", "column=a", ()),
+        value="unpersistable partial function",
+        batch_fingerprint="abc",
+    )
+
+    other_cache = FilesystemMetricCache(base_directory=tmp_path)
+
+    assert other_cache.get(metric_id=("column.max", "column=a", ()), batch_fingerprint="abc") == 3
+    assert (
+        other_cache.get(metric_id=("column.max", "column=a", ()), batch_fingerprint="other") is None
+    )
+    assert (
+        other_cache.get(
+            metric_id=("column_values.in_set.condition", "column=a", ()),
+            batch_fingerprint="abc",
+        )
+        is None
+    )
+
+
+@pytest.mark.filesystem
+def test_execution_engine_reuses_persisted_metrics_for_unchanged_batch(
+    tmp_path: pathlib.Path, mocker
+):
+    mocker.patch.object(PandasExecutionEngine, "get_batch_fingerprint", return_value="abc")
+
+    def _resolve_column_max(df: pd.DataFrame) -> MetricValue:
+        engine = PandasExecutionEngine(
+            batch_data_dict={"my_id": df},
+            metric_cache=FilesystemMetricCache(base_directory=tmp_path),
+        )
+        metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+        metrics.update(results)
+
+        column_max = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        )
+        column_max.metric_dependencies = {"table.columns": table_columns_metric}
+        return engine.resolve_metrics(metrics_to_resolve=(column_max,), metrics=metrics)[
+            column_max.id
+        ]
+
+    assert _resolve_column_max(pd.DataFrame({"a": [1, 2, 3]})) == 3
+    # Same fingerprint means metric is served from persisted cache rather than recomputed.
+    assert _resolve_column_max(pd.DataFrame({"a": [1, 2, 30]})) == 3
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_resolution_profiler import (
+    COMPUTATION_SPAN_NAME,
+    WAVE_SPAN_NAME,
+    MetricResolutionProfiler,
+    MetricSpan,
+)
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.self_check.util import build_sa_validator_with_data
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+@pytest.mark.unit
+def test_metric_resolution_profiler_records_waves_and_spans():
+    spans: List[MetricSpan] = []
+    profiler = MetricResolutionProfiler(span_hooks=[spans.append])
+
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3]})})
+    engine.metric_resolution_profiler = profiler
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_max.metric_dependencies = {"table.columns": table_columns_metric}
+    assert (
+        engine.resolve_metrics(metrics_to_resolve=(column_max,), metrics=metrics)[column_max.id]
+        == 3
+    )
+
+    assert profiler.waves == 3
+    records_by_metric_name = {record.metric_name: record for record in profiler.records}
+    assert set(records_by_metric_name) == {"table.column_types", "table.columns", "column.max"}
+
+    column_max_record = records_by_metric_name["column.max"]
+    assert column_max_record.wave == 3
+    assert column_max_record.engine == "PandasExecutionEngine"
+    assert column_max_record.success
+    assert not column_max_record.cache_hit
+    assert column_max_record.compute_seconds >= 0
+
+    wave_span_ids = {span.span_id for span in spans if span.name == WAVE_SPAN_NAME}
+    computation_spans = [span for span in spans if span.name == COMPUTATION_SPAN_NAME]
+    assert len(wave_span_ids) == 3
+    assert computation_spans
+    assert all(span.parent_span_id in wave_span_ids for span in computation_spans)
+    assert all(span.duration_seconds >= 0 for span in spans)
+
+    profiler.reset()
+    assert profiler.waves == 0
+    assert profiler.records == []
+
+
+@pytest.mark.unit
+def test_metric_resolution_profiler_ignores_failing_span_hooks():
+    def _failing_span_hook(span: MetricSpan) -> None:
+        raise ValueError("Span hook failure")
+
+    profiler = MetricResolutionProfiler(span_hooks=[_failing_span_hook])
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3]})})
+    engine.metric_resolution_profiler = profiler
+
+    get_table_columns_metric(execution_engine=engine)
+
+    assert profiler.waves == 2
+
+
+@pytest.mark.unit
+def test_metric_resolution_profiler_binds_worker_thread_work_to_current_span():
+    spans: List[MetricSpan] = []
+    profiler = MetricResolutionProfiler(span_hooks=[spans.append])
+
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_min = MetricConfiguration(
+        metric_name="column.min",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+
+    def _compute_column_min() -> None:
+        with profiler.computation(
+            engine="SqlAlchemyExecutionEngine", metric_configurations=(column_min,), bundled=False
+        ):
+            profiler.record_query(lambda: "SELECT min(a) FROM t")
+
+    with profiler.wave(engine="SqlAlchemyExecutionEngine", metrics_to_resolve=(column_max,)):
+        with profiler.computation(
+            engine="SqlAlchemyExecutionEngine", metric_configurations=(column_max,), bundled=True
+        ):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(profiler.bind_to_current_span(_compute_column_min)).result()
+
+    spans_by_metric_names = {
+        tuple(span.attributes["gx.metric.names"]): span
+        for span in spans
+        if span.name == COMPUTATION_SPAN_NAME
+    }
+    column_max_span = spans_by_metric_names[("column.max",)]
+    column_min_span = spans_by_metric_names[("column.min",)]
+    assert column_min_span.parent_span_id == column_max_span.span_id
+    assert column_max_span.attributes["gx.queries"] == ["SELECT min(a) FROM t"]
+
+    records_by_metric_name = {record.metric_name: record for record in profiler.records}
+    assert records_by_metric_name["column.max"].queries == ["SELECT min(a) FROM t"]
+    assert records_by_metric_name["column.min"].queries == ["SELECT min(a) FROM t"]
+
+
+@pytest.mark.sqlite
+def test_metric_resolution_profile_is_aggregated_per_expectation(sa):
+    validator = build_sa_validator_with_data(
+        df=pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, None]}),
+        sa_engine_name="sqlite",
+        table_name="test_metric_resolution_profile",
+    )
+    profiler = MetricResolutionProfiler()
+    validator.execution_engine.metric_resolution_profiler = profiler
+
+    results = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 10},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "b"},
+            ),
+        ]
+    )
+    assert [result.success for result in results] == [True, False]
+
+    profile: dict = profiler.to_json_dict()
+    assert profile["waves"] > 0
+
+    column_max_records = [
+        record for record in profile["metrics"] if record["metric_name"] == "column.max"
+    ]
+    assert len(column_max_records) == 1
+    assert column_max_records[0]["bundled"]
+    assert any("max(" in query.lower() for query in column_max_records[0]["queries"])
+
+    expectation_profiles: List[dict] = profile["expectations"]
+    assert [
+        expectation_profile["expectation_type"] for expectation_profile in expectation_profiles
+    ] == ["expect_column_max_to_be_between", "expect_column_values_to_not_be_null"]
+    assert expectation_profiles[0]["domain_kwargs"] == {"column": "a"}
+    assert all(expectation_profile["queries"] > 0 for expectation_profile in expectation_profiles)
+    assert all(
+        expectation_profile["computed_metrics"] > 0 for expectation_profile in expectation_profiles
+    )
@@ -1,24 +1,45 @@
+from __future__ import annotations
+
+import io
 import os
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, azure, google
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    MultiPathBatchSpec,
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.execution_engine.pandas_batch_data import ProjectedPandasBatchData
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
+    _read_parquet_chunks,
+)
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
 )
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 @pytest.mark.unit
 def test_constructor_with_boto3_options():
@@ -403,6 +424,95 @@ def test_resolve_metric_bundle():
     )
 
 
+@pytest.mark.unit
+def test_resolve_metric_bundle_obtains_domain_records_once_per_compute_domain():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [10, 20, 30, None]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    aggregate_fn_metrics = []
+    desired_metrics = []
+    metric_name: str
+    column_name: str
+    for metric_name in ("column.min", "column.max", "column.mean"):
+        for column_name in ("a", "b"):
+            aggregate_fn_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                metric_domain_kwargs={
+                    "column": column_name,
+                    "row_condition": "a>1",
+                    "condition_parser": "pandas",
+                },
+                metric_value_kwargs=None,
+            )
+            aggregate_fn_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={
+                    "column": column_name,
+                    "row_condition": "a>1",
+                    "condition_parser": "pandas",
+                },
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": aggregate_fn_metric,
+                "table.columns": table_columns_metric,
+            }
+            aggregate_fn_metrics.append(aggregate_fn_metric)
+            desired_metrics.append(desired_metric)
+
+    results = engine.resolve_metrics(metrics_to_resolve=aggregate_fn_metrics, metrics=metrics)
+    metrics.update(results)
+
+    with mock.patch.object(
+        engine, "get_domain_records", wraps=engine.get_domain_records
+    ) as mock_get_domain_records, mock.patch.object(
+        pd.DataFrame, "agg", autospec=True, side_effect=pd.DataFrame.agg
+    ) as mock_agg:
+        results = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+
+    # Both columns share one compute Domain (row condition only), so records are filtered once.
+    assert mock_get_domain_records.call_count == 1
+    # One "DataFrame.agg()" call for "min"/"max" (dtype-preserving) and one for "mean" (float).
+    assert mock_agg.call_count == 2
+
+    expected_values = {
+        ("column.min", "a"): 2,
+        ("column.max", "a"): 4,
+        ("column.mean", "a"): 3.0,
+        ("column.min", "b"): 20.0,
+        ("column.max", "b"): 30.0,
+        ("column.mean", "b"): 25.0,
+    }
+    for desired_metric in desired_metrics:
+        assert (
+            results[desired_metric.id]
+            == expected_values[
+                (desired_metric.metric_name, desired_metric.metric_domain_kwargs["column"])
+            ]
+        )
+
+    # Integer column aggregates are not upcast to float by batching with float column or "mean".
+    column_min_a_metric = next(
+        desired_metric
+        for desired_metric in desired_metrics
+        if desired_metric.metric_name == "column.min"
+        and desired_metric.metric_domain_kwargs["column"] == "a"
+    )
+    assert isinstance(results[column_min_a_metric.id], np.integer)
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error  # noqa: E501
 @pytest.mark.unit
 def test_resolve_metric_bundle_with_nonexistent_metric():
@@ -673,3 +783,477 @@ def test_get_batch_with_gcs_misconfigured(gcs_batch_spec):
     # Raises error if batch_spec causes ExecutionEngine error
     with pytest.raises(gx_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+@pytest.fixture
+def chunked_csv_path(tmp_path) -> str:
+    path = tmp_path / "chunked.csv"
+    pd.DataFrame(
+        {
+            "a": [1, 5, 22, 3, 5, 10, None],
+            "b": ["x", "y", "x", None, "z", "y", "x"],
+        }
+    ).to_csv(path, index=False)
+    return str(path)
+
+
+def _validate_csv(
+    path: str, chunk_size: Optional[int], configurations: List, result_format: str = "BASIC"
+) -> List:
+    engine = PandasExecutionEngine(chunk_size=chunk_size)
+    batch_spec = PathBatchSpec(path=path, reader_method="read_csv")
+    batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    batch = Batch(data=batch_data, batch_spec=batch_spec, batch_markers=batch_markers)
+    return Validator(execution_engine=engine, batches=[batch]).graph_validate(
+        configurations=configurations,
+        runtime_configuration={"result_format": result_format},
+    )
+
+
+@pytest.mark.filesystem
+@pytest.mark.parametrize("result_format", ["BASIC", "SUMMARY", "COMPLETE"])
+def test_chunked_batch_data_validation_matches_in_memory_validation(
+    in_memory_runtime_context, chunked_csv_path, result_format: str
+):
+    configurations = [
+        ExpectationConfiguration(expectation_type=expectation_type, kwargs=kwargs)
+        for expectation_type, kwargs in (
+            ("expect_column_values_to_not_be_null", {"column": "b", "mostly": 0.8}),
+            ("expect_column_max_to_be_between", {"column": "a", "min_value": 20}),
+            ("expect_column_mean_to_be_between", {"column": "a", "min_value": 7}),
+            ("expect_column_median_to_be_between", {"column": "a", "max_value": 5}),
+            ("expect_column_stdev_to_be_between", {"column": "a", "min_value": 1}),
+            ("expect_column_unique_value_count_to_be_between", {"column": "b", "min_value": 3}),
+            (
+                "expect_column_distinct_values_to_be_in_set",
+                {"column": "b", "value_set": ["x", "y"]},
+            ),
+            ("expect_table_row_count_to_equal", {"value": 7}),
+            (
+                "expect_column_values_to_be_in_set",
+                {"column": "a", "value_set": [1, 3, 5], "mostly": 0.5},
+            ),
+            (
+                "expect_column_values_to_be_in_set",
+                {
+                    "column": "b",
+                    "value_set": ["x"],
+                    "row_condition": "a>4",
+                    "condition_parser": "pandas",
+                },
+            ),
+        )
+    ]
+
+    in_memory_results = _validate_csv(
+        path=chunked_csv_path,
+        chunk_size=None,
+        configurations=configurations,
+        result_format=result_format,
+    )
+    chunked_results = _validate_csv(
+        path=chunked_csv_path,
+        chunk_size=2,
+        configurations=configurations,
+        result_format=result_format,
+    )
+
+    assert len(chunked_results) == len(in_memory_results)
+    for chunked_result, in_memory_result in zip(chunked_results, in_memory_results):
+        assert not chunked_result.exception_info.get("raised_exception", False)
+        assert chunked_result.success == in_memory_result.success
+        for key, value in in_memory_result.result.items():
+            if isinstance(value, float):
+                assert chunked_result.result[key] == pytest.approx(value)
+            else:
+                # Details may hold Series (e.g., value counts), which are compared as values.
+                assert convert_to_json_serializable(
+                    chunked_result.result[key]
+                ) == convert_to_json_serializable(value)
+
+
+@pytest.mark.filesystem
+def test_chunked_batch_data_rejects_metrics_that_cannot_be_merged(
+    in_memory_runtime_context, chunked_csv_path
+):
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_most_common_value_to_be_in_set",
+        kwargs={"column": "b", "value_set": ["x"]},
+    )
+
+    (result,) = _validate_csv(path=chunked_csv_path, chunk_size=2, configurations=[configuration])
+
+    assert not result.success
+    assert any(
+        "cannot be computed on Batch data read in chunks" in exception_info.exception_message
+        for exception_info in result.exception_info.values()
+    )
+
+
+@pytest.mark.filesystem
+def test_chunked_batch_data_reports_error_of_every_failed_metric(
+    in_memory_runtime_context, chunked_csv_path
+):
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_most_common_value_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x"]},
+        ),
+        # Uniqueness of row depends on other rows, so it cannot be evaluated chunk by chunk.
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_unique", kwargs={"column": "b"}
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null", kwargs={"column": "a"}
+        ),
+    ]
+
+    results = _validate_csv(
+        path=chunked_csv_path,
+        chunk_size=2,
+        configurations=configurations,
+        result_format="SUMMARY",
+    )
+    results_by_expectation_type = {
+        result.expectation_config.expectation_type: result for result in results
+    }
+
+    exception_messages: Dict[str, List[str]] = {
+        expectation_type: [
+            exception_info.exception_message
+            for exception_info in results_by_expectation_type[
+                expectation_type
+            ].exception_info.values()
+        ]
+        for expectation_type in (
+            "expect_column_most_common_value_to_be_in_set",
+            "expect_column_values_to_be_unique",
+        )
+    }
+    assert exception_messages["expect_column_most_common_value_to_be_in_set"]
+    assert all(
+        '"column.most_common_value"' in message
+        for message in exception_messages["expect_column_most_common_value_to_be_in_set"]
+    )
+    assert exception_messages["expect_column_values_to_be_unique"]
+    assert all(
+        '"column_values.unique.condition"' in message and "depends on other rows" in message
+        for message in exception_messages["expect_column_values_to_be_unique"]
+    )
+
+    not_null_result = results_by_expectation_type["expect_column_values_to_not_be_null"]
+    assert not not_null_result.exception_info.get("raised_exception", False)
+    assert not_null_result.result["unexpected_count"] == 1
+    assert not_null_result.result["partial_unexpected_index_list"] == [6]
+
+
+class _NonSeekableStream:
+    """Readable, but not seekable (as are streamed bodies of cloud objects)."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = io.BytesIO(data)
+        self.closed = False
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.filesystem
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_read_parquet_chunks_spools_non_seekable_source(tmp_path):
+    df = pd.DataFrame({"a": range(5), "b": list("vwxyz")})
+    path = tmp_path / "chunked.parquet"
+    df.to_parquet(path)
+    stream = _NonSeekableStream(data=path.read_bytes())
+
+    chunks = list(_read_parquet_chunks(source=stream, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+    # Stream itself is closed by its owner, not by reader of chunks.
+    assert not stream.closed
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [0, -1, 1.5])
+def test_constructor_rejects_invalid_chunk_size(chunk_size):
+    with pytest.raises(ValueError):
+        PandasExecutionEngine(chunk_size=chunk_size)
+
+
+@pytest.fixture
+def multi_path_csv_directory(tmp_path) -> str:
+    directory = tmp_path / "parts"
+    directory.mkdir()
+    for index in range(5):
+        pd.DataFrame({"part": [index] * 3, "row": [0, 1, 2]}).to_csv(
+            directory / f"part-{index}.csv", index=False
+        )
+    (directory / "_SUCCESS").touch()
+    return str(directory)
+
+
+@pytest.mark.filesystem
+def test_get_batch_data_with_multi_path_batch_spec(multi_path_csv_directory):
+    paths = [os.path.join(multi_path_csv_directory, f"part-{index}.csv") for index in (3, 0, 4)]  # noqa: PTH118
+    batch_spec = MultiPathBatchSpec(paths=paths, reader_method="read_csv", max_workers=2)
+
+    df = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec).dataframe
+
+    assert df["part"].tolist() == [3, 3, 3, 0, 0, 0, 4, 4, 4]
+    assert df.index.tolist() == list(range(9))
+
+
+@pytest.mark.filesystem
+def test_get_batch_data_with_multi_path_batch_spec_directory_and_max_rows(
+    multi_path_csv_directory,
+):
+    engine = PandasExecutionEngine()
+
+    df = engine.get_batch_data(
+        batch_spec=MultiPathBatchSpec(directory=multi_path_csv_directory)
+    ).dataframe
+    assert df["part"].tolist() == [part for part in range(5) for _ in range(3)]
+
+    with mock.patch.object(engine, "_read_file", wraps=engine._read_file) as read_file:
+        df = engine.get_batch_data(
+            batch_spec=MultiPathBatchSpec(
+                directory=multi_path_csv_directory, max_workers=1, max_rows=4
+            )
+        ).dataframe
+
+    assert df["part"].tolist() == [0, 0, 0, 1]
+    assert df["row"].tolist() == [0, 1, 2, 0]
+    assert read_file.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_get_batch_data_with_multi_path_batch_spec_streams_s3_objects(mocker: MockerFixture):
+    csv_df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    parquet_df = pd.DataFrame({"a": [3], "b": ["z"]})
+    parquet_buffer = io.BytesIO()
+    parquet_df.to_parquet(parquet_buffer)
+    objects: Dict[str, bytes] = {
+        "data/part-0.csv": csv_df.to_csv(index=False).encode("utf-8"),
+        "data/part-1.parquet": parquet_buffer.getvalue(),
+    }
+    bodies: Dict[str, _NonSeekableStream] = {}
+
+    def _get_object(Bucket: str, Key: str) -> dict:
+        bodies[Key] = _NonSeekableStream(data=objects[Key])
+        return {"Body": bodies[Key]}
+
+    engine = PandasExecutionEngine()
+    engine._s3 = mocker.Mock(get_object=mocker.Mock(side_effect=_get_object))
+    read_csv = mocker.spy(pd, "read_csv")
+    read_parquet = mocker.spy(pd, "read_parquet")
+
+    df = engine.get_batch_data(
+        batch_spec=MultiPathBatchSpec(
+            paths=[f"s3://my-bucket/{key}" for key in objects], max_workers=2
+        )
+    ).dataframe
+
+    pd.testing.assert_frame_equal(df, pd.concat([csv_df, parquet_df], ignore_index=True))
+    # CSV is read from object stream as is; Parquet (which seeks) is buffered in memory first.
+    assert read_csv.call_args.args[0] is bodies["data/part-0.csv"]
+    assert isinstance(read_parquet.call_args.args[0], io.BytesIO)
+    assert all(body.closed for body in bodies.values())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({}, id="no_paths"),
+        pytest.param({"paths": ["a.csv"], "directory": "."}, id="paths_and_directory"),
+        pytest.param({"paths": ["a.csv"], "max_workers": 0}, id="max_workers"),
+        pytest.param({"paths": ["a.csv"], "max_rows": -1}, id="max_rows"),
+    ],
+)
+def test_multi_path_batch_spec_rejects_invalid_arguments(kwargs):
+    with pytest.raises(gx_exceptions.InvalidBatchSpecError):
+        MultiPathBatchSpec(**kwargs)
+
+
+@pytest.fixture
+def wide_csv_path(tmp_path) -> str:
+    path = tmp_path / "wide.csv"
+    pd.DataFrame({f"c{index}": range(index, index + 5) for index in range(20)}).to_csv(
+        path, index=False
+    )
+    return str(path)
+
+
+def _get_projected_validator(
+    mocker: MockerFixture, path: str
+) -> Tuple[Validator, ProjectedPandasBatchData]:
+    engine = PandasExecutionEngine(column_projection=True)
+    batch_spec = PathBatchSpec(path=path, reader_method="read_csv")
+    batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    assert isinstance(batch_data, ProjectedPandasBatchData)
+    batch_data._reader = mocker.Mock(wraps=batch_data._reader)
+    batch = Batch(data=batch_data, batch_spec=batch_spec, batch_markers=batch_markers)
+    return Validator(execution_engine=engine, batches=[batch]), batch_data
+
+
+@pytest.mark.filesystem
+def test_column_projection_reads_only_columns_of_validated_metrics(
+    mocker: MockerFixture, in_memory_runtime_context, wide_csv_path
+):
+    validator, batch_data = _get_projected_validator(mocker=mocker, path=wide_csv_path)
+
+    results = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "c3", "max_value": 7},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_pair_values_a_to_be_greater_than_b",
+                kwargs={"column_A": "c2", "column_B": "c1"},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_to_exist", kwargs={"column": "missing"}
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_equal", kwargs={"value": 5}
+            ),
+        ]
+    )
+
+    assert [result.success for result in results] == [True, True, False, True]
+    assert batch_data._reader.call_args_list == [mock.call(["c1", "c2", "c3", "missing"])]
+
+    # Projection is scoped to validation; afterwards, Batch data has all columns again.
+    assert batch_data.columns is None
+    assert validator.columns() == [f"c{index}" for index in range(20)]
+
+
+@pytest.mark.filesystem
+def test_column_projection_preserves_rows_if_no_projected_column_exists(
+    mocker: MockerFixture, in_memory_runtime_context, wide_csv_path
+):
+    validator, batch_data = _get_projected_validator(mocker=mocker, path=wide_csv_path)
+
+    results = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_equal", kwargs={"value": 5}
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_to_exist", kwargs={"column": "missing"}
+            ),
+        ]
+    )
+
+    assert [result.success for result in results] == [True, False]
+    assert results[0].result["observed_value"] == 5
+    assert batch_data._reader.call_args_list == [mock.call(["missing"])]
+
+
+@pytest.mark.filesystem
+def test_column_projection_reads_only_missing_columns_for_wider_projection(
+    mocker: MockerFixture, in_memory_runtime_context, wide_csv_path
+):
+    engine = PandasExecutionEngine(column_projection=True)
+    batch_data = engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=wide_csv_path, reader_method="read_csv")
+    )
+    batch_data._reader = mocker.Mock(wraps=batch_data._reader)
+    engine.load_batch_data(batch_id="wide", batch_data=batch_data)
+
+    engine.project_batch_columns(batch_id="wide", columns=["c0"])
+    assert list(batch_data.dataframe.columns) == ["c0"]
+
+    engine.project_batch_columns(batch_id="wide", columns=["c0", "c2", "missing"])
+    assert list(batch_data.dataframe.columns) == ["c0", "c2"]
+    assert batch_data.dataframe["c2"].tolist() == [2, 3, 4, 5, 6]
+
+    # Data read so far is reused for narrower projections.
+    engine.project_batch_columns(batch_id="wide", columns=["c2"])
+    assert list(batch_data.dataframe.columns) == ["c0", "c2"]
+
+    assert batch_data._reader.call_args_list == [mock.call(["c0"]), mock.call(["c2", "missing"])]
+
+    engine.project_batch_columns(batch_id="wide", columns=None)
+    assert batch_data.columns is None
+    assert list(batch_data.dataframe.columns) == [f"c{index}" for index in range(20)]
+
+    # Data with all columns is reused for any projection.
+    engine.project_batch_columns(batch_id="wide", columns=["c0", "c5"])
+    assert len(batch_data.dataframe.columns) == 20
+    assert batch_data._reader.call_count == 3
+
+
+@pytest.mark.filesystem
+def test_column_projection_keeps_data_between_validations(
+    mocker: MockerFixture, in_memory_runtime_context, wide_csv_path
+):
+    validator, batch_data = _get_projected_validator(mocker=mocker, path=wide_csv_path)
+
+    for column in ("c1", "c1", "c4"):
+        (result,) = validator.graph_validate(
+            configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_be_null",
+                    kwargs={"column": column},
+                )
+            ]
+        )
+        assert result.success
+
+    # Only columns, which were not read yet, are read; data is not read again for each validation.
+    assert batch_data._reader.call_args_list == [mock.call(["c1"]), mock.call(["c4"])]
+
+
+@pytest.mark.filesystem
+def test_column_projection_is_skipped_for_partitioned_batch_spec(wide_csv_path):
+    engine = PandasExecutionEngine(column_projection=True)
+    batch_spec = PathBatchSpec(
+        path=wide_csv_path,
+        reader_method="read_csv",
+        partitioner_method="partition_on_column_value",
+        partitioner_kwargs={"column_name": "c0", "batch_identifiers": {"c0": 1}},
+    )
+
+    batch_data = engine.get_batch_data(batch_spec=batch_spec)
+
+    assert not isinstance(batch_data, ProjectedPandasBatchData)
+    assert len(batch_data.dataframe.columns) == 20
+
+
+@pytest.mark.unit
+def test_constructor_rejects_invalid_dtype_backend():
+    with pytest.raises(ValueError):
+        PandasExecutionEngine(dtype_backend="arrow")
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow") or int(pd.__version__.split(".")[0]) < 2,
+    reason="Arrow-backed DataFrames require pyarrow and pandas 2.0 or later",
+)
+@pytest.mark.filesystem
+def test_arrow_backed_projected_parquet_batch_data(tmp_path):
+    path = tmp_path / "wide.parquet"
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.5, 2.5, None]}).to_parquet(path)
+    engine = PandasExecutionEngine(column_projection=True, dtype_backend="pyarrow")
+    batch_data = engine.get_batch_data(batch_spec=PathBatchSpec(path=str(path)))
+
+    engine.load_batch_data(batch_id="wide", batch_data=batch_data)
+    engine.project_batch_columns(batch_id="wide", columns=["c", "a", "missing"])
+
+    df = batch_data.dataframe
+    assert list(df.columns) == ["a", "c"]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert df["c"].isna().tolist() == [False, False, True]
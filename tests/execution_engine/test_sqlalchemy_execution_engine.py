@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import Dict, Tuple, cast
+import threading
+from typing import Dict, List, Tuple, cast
 from unittest import mock
 
 import pandas as pd
@@ -22,6 +23,9 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -1073,6 +1077,86 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+def _build_bundled_column_max_configurations(
+    sa, columns: Tuple[str, ...]
+) -> List[MetricComputationConfiguration]:
+    # Every column yields distinct Domain; hence, separate query.
+    return [
+        MetricComputationConfiguration(
+            metric_configuration=MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs={"column": column},
+                metric_value_kwargs=None,
+            ),
+            metric_fn=sa.func.max(sa.column(column)),
+            metric_provider_kwargs={},
+            compute_domain_kwargs={
+                "row_condition": f'col("{column}")>0',
+                "condition_parser": "great_expectations__experimental__",
+            },
+            accessor_domain_kwargs={},
+        )
+        for column in columns
+    ]
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_executes_domain_queries_concurrently(sa, mocker):
+    execution_engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2], "b": [3, 4]}), sa)
+    execution_engine._max_workers = 2
+    mocker.patch.object(
+        SqlAlchemyExecutionEngine,
+        "supports_concurrent_metric_resolution",
+        new_callable=mocker.PropertyMock,
+        return_value=True,
+    )
+
+    barrier = threading.Barrier(parties=2, timeout=5)
+    thread_names: List[str] = []
+
+    def _resolve_domain_query(query: dict) -> Dict[Tuple[str, str, str], MetricValue]:
+        thread_names.append(threading.current_thread().name)
+        # Both Domain queries must be in flight at same time to pass barrier.
+        barrier.wait()
+        metric_configuration: MetricConfiguration = query["metric_configurations"][0]
+        if metric_configuration.metric_domain_kwargs["column"] == "b":
+            raise gx_exceptions.ExecutionEngineError(message="query failed")
+
+        return {metric_configuration.id: 2}
+
+    mocker.patch.object(
+        execution_engine,
+        "_resolve_metric_bundle_domain_query",
+        side_effect=_resolve_domain_query,
+    )
+
+    metric_fn_bundle = _build_bundled_column_max_configurations(sa=sa, columns=("a", "b"))
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        execution_engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    assert len(thread_names) == 2
+    assert all(name.startswith("SqlAlchemyExecutionEngine-queries") for name in thread_names)
+    # Only metrics of failed Domain are reported, so that "ValidationGraph" retries just those.
+    assert [metric.id for metric in e.value.failed_metrics] == [
+        metric_fn_bundle[1].metric_configuration.id
+    ]
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_executes_domain_queries_serially_on_persisted_connection(sa):
+    execution_engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2], "b": [3, 4]}), sa)
+    execution_engine._max_workers = 2
+    assert not execution_engine.supports_concurrent_metric_resolution
+
+    metric_fn_bundle = _build_bundled_column_max_configurations(sa=sa, columns=("a", "b"))
+    results = execution_engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    assert results == {
+        metric_fn_bundle[0].metric_configuration.id: 2,
+        metric_fn_bundle[1].metric_configuration.id: 4,
+    }
+
+
 @pytest.mark.sqlite
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
@@ -1136,13 +1220,28 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
 
     validate_tmp_tables(execution_engine=execution_engine)
 
+    aggregate_fn_metric = MetricConfiguration(
+        metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    aggregate_fn_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+    }
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=(aggregate_fn_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
+    validate_tmp_tables(execution_engine=execution_engine)
+
     desired_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_fn_metric,
     }
     # noinspection PyUnusedLocal
     results = execution_engine.resolve_metrics(
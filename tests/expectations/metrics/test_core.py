@@ -788,6 +788,72 @@ def test_quantiles_metric_sa(sa):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+def _resolve_quantiles_metric_sa(
+    engine: SqlAlchemyExecutionEngine, table_row_count: int, metric_value_kwargs: dict, mocker
+) -> Tuple[MetricValue, int]:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    table_row_count_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    metrics[table_row_count_metric.id] = table_row_count
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=metric_value_kwargs,
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+        "table.row_count": table_row_count_metric,
+    }
+
+    execute_query_spy = mocker.spy(engine, "execute_query")
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    return results[desired_metric.id], execute_query_spy.call_count
+
+
+@pytest.mark.sqlite
+def test_quantiles_metric_sa_computes_all_quantiles_in_one_query(sa, mocker):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [7, 3, 9, 1, 5, 2, 8, 4, 10, 6]}), sa)
+
+    quantiles, query_count = _resolve_quantiles_metric_sa(
+        engine=engine,
+        table_row_count=10,
+        metric_value_kwargs={"quantiles": [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0]},
+        mocker=mocker,
+    )
+
+    assert quantiles == [1, 1, 2, 5, 7, 9, 10]
+    assert query_count == 1
+
+
+@pytest.mark.sqlite
+def test_quantiles_metric_sa_uses_sample_when_relative_error_is_allowed(sa, mocker):
+    num_rows = 5000
+    engine = build_sa_execution_engine(pd.DataFrame({"a": range(1, num_rows + 1)}), sa)
+
+    quantiles, query_count = _resolve_quantiles_metric_sa(
+        engine=engine,
+        table_row_count=num_rows,
+        metric_value_kwargs={"quantiles": [0.25, 0.5, 0.75], "allow_relative_error": 0.05},
+        mocker=mocker,
+    )
+
+    assert query_count == 1
+    # Sample is sized for rank error of 5% with 99% confidence; exceeding double that is practically impossible.  # noqa: E501
+    for quantile, value in zip([0.25, 0.5, 0.75], quantiles):
+        assert abs(value - quantile * num_rows) <= 0.1 * num_rows
+
+
 @pytest.mark.spark
 def test_quantiles_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -2428,13 +2494,27 @@ def test_map_unique_column_exists_sa(sa):
     results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -2541,13 +2621,27 @@ def test_map_unique_empty_query_sa(sa):
     results = engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -2557,6 +2651,69 @@ def test_map_unique_empty_query_sa(sa):
     assert results[desired_metric.id] == 0
 
 
+@pytest.mark.sqlite
+def test_map_unique_unexpected_counts_of_domain_share_one_query_sa(sa, mocker):
+    engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 3, None], "b": ["foo", "foo", "baz", "qux", "foo"]}),
+        sa,
+    )
+
+    table_columns_metric: MetricConfiguration
+    metrics: dict
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    unexpected_count_metrics: Dict[str, MetricConfiguration] = {}
+    column: str
+    for column in ("a", "b"):
+        condition_metric = MetricConfiguration(
+            metric_name=f"column_values.unique.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        condition_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        metrics.update(
+            engine.resolve_metrics(metrics_to_resolve=(condition_metric,), metrics=metrics)
+        )
+
+        unexpected_count_partial_metric = MetricConfiguration(
+            metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        unexpected_count_partial_metric.metric_dependencies = {
+            "unexpected_condition": condition_metric,
+            "table.columns": table_columns_metric,
+        }
+        metrics.update(
+            engine.resolve_metrics(
+                metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+            )
+        )
+
+        unexpected_count_metric = MetricConfiguration(
+            metric_name=f"column_values.unique.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        unexpected_count_metric.metric_dependencies = {
+            "metric_partial_fn": unexpected_count_partial_metric,
+            "table.columns": table_columns_metric,
+        }
+        unexpected_count_metrics[column] = unexpected_count_metric
+
+    execute_query_spy = mocker.spy(engine, "execute_query")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=tuple(unexpected_count_metrics.values()),
+        metrics=metrics,
+    )
+
+    assert execute_query_spy.call_count == 1
+    assert results[unexpected_count_metrics["a"].id] == 2
+    assert results[unexpected_count_metrics["b"].id] == 3
+
+
 @pytest.mark.spark
 def test_map_unique_column_exists_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -3193,6 +3350,23 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_A": "b",
+            "column_B": "c",
+        },
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -3202,7 +3376,7 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -3273,6 +3447,23 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_A": "a",
+            "column_B": "d",
+        },
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -3282,7 +3473,7 @@ def test_map_column_pairs_equal_metric_sa(sa):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -5161,6 +5352,22 @@ def test_map_multicolumn_sum_equal_sa(sa):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b"],
+        },
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -5169,7 +5376,7 @@ def test_map_multicolumn_sum_equal_sa(sa):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -5239,6 +5446,22 @@ def test_map_multicolumn_sum_equal_sa(sa):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b", "c"],
+        },
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -5247,7 +5470,7 @@ def test_map_multicolumn_sum_equal_sa(sa):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -6397,6 +6620,23 @@ def test_map_select_column_values_unique_within_record_sa(sa):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b", "c"],
+            "ignore_row_if": "all_values_are_missing",
+        },
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -6406,7 +6646,7 @@ def test_map_select_column_values_unique_within_record_sa(sa):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -6485,6 +6725,23 @@ def test_map_select_column_values_unique_within_record_sa(sa):  # noqa: PLR0915
     )
     metrics.update(results)
 
+    unexpected_count_partial_metric = MetricConfiguration(
+        metric_name=f"{unexpected_count_metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={
+            "column_list": ["a", "b", "c"],
+            "ignore_row_if": "any_value_is_missing",
+        },
+        metric_value_kwargs=None,
+    )
+    unexpected_count_partial_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_count_partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     unexpected_count_metric = MetricConfiguration(
         metric_name=unexpected_count_metric_name,
         metric_domain_kwargs={
@@ -6494,7 +6751,7 @@ def test_map_select_column_values_unique_within_record_sa(sa):  # noqa: PLR0915
         metric_value_kwargs=None,
     )
     unexpected_count_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": unexpected_count_partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(metrics_to_resolve=(unexpected_count_metric,), metrics=metrics)
@@ -254,11 +254,17 @@ def test_get_table_metric_provider_metric_dependencies(empty_sqlite_db):
         metric_name="column.max", metric_domain_kwargs={}, metric_value_kwargs=None
     )
     dependencies = mp.get_evaluation_dependencies(metric, execution_engine=PandasExecutionEngine())
+    assert (
+        dependencies["metric_partial_fn"].id[0]
+        == f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}"
+    )
 
+    metric_partial_fn_metric: MetricConfiguration = dependencies["metric_partial_fn"]
     table_column_types_metric: MetricConfiguration = dependencies["table.column_types"]
     table_columns_metric: MetricConfiguration = dependencies["table.columns"]
     table_row_count_metric: MetricConfiguration = dependencies["table.row_count"]
     assert dependencies == {
+        "metric_partial_fn": metric_partial_fn_metric,
         "table.column_types": table_column_types_metric,
         "table.columns": table_columns_metric,
         "table.row_count": table_row_count_metric,
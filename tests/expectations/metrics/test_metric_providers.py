@@ -224,7 +224,7 @@ def test__column_pair_map_metric__registration(mock_registry):
 
     CustomColumnPairValuesEqualSeven()
 
-    assert len(mock_registry._registered_metrics.keys()) == prev_registered_metric_key_count + 7
+    assert len(mock_registry._registered_metrics.keys()) == prev_registered_metric_key_count + 8
 
     for key in mock_registry._registered_metrics.keys():
         if "column_pair_values.equal_seven" in key:
@@ -233,6 +233,7 @@ def test__column_pair_map_metric__registration(mock_registry):
     new_keys = [
         "column_pair_values.equal_seven.condition",
         "column_pair_values.equal_seven.unexpected_count",
+        "column_pair_values.equal_seven.unexpected_count.aggregate_fn",
         "column_pair_values.equal_seven.unexpected_index_list",
         "column_pair_values.equal_seven.unexpected_index_query",
         "column_pair_values.equal_seven.unexpected_rows",
@@ -278,11 +279,12 @@ def test__multicolumn_map_metric__registration(mock_registry):
 
     CustomMultiColumnValuesEqualSeven()
 
-    assert len(mock_registry._registered_metrics.keys()) == prev_registered_metric_key_count + 7
+    assert len(mock_registry._registered_metrics.keys()) == prev_registered_metric_key_count + 8
 
     new_keys = [
         "multicolumn_values.equal_seven.condition",
         "multicolumn_values.equal_seven.unexpected_count",
+        "multicolumn_values.equal_seven.unexpected_count.aggregate_fn",
         "multicolumn_values.equal_seven.unexpected_index_list",
         "multicolumn_values.equal_seven.unexpected_index_query",
         "multicolumn_values.equal_seven.unexpected_rows",
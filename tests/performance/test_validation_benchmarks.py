@@ -0,0 +1,90 @@
+"""
+Benchmark core validation path against synthetic data, using pandas, SQLite, and (local-mode) Spark.
+"""
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from tests.performance import validation_benchmark_util
+from tests.performance.validation_benchmark_util import (
+    BenchmarkMeasurement,
+    DatasetSpec,
+)
+
+pytestmark = pytest.mark.performance
+
+
+@pytest.mark.parametrize("number_of_expectations", [10, 500, 5_000])
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        DatasetSpec(rows=1_000, columns=10, null_density=0.1, cardinality=100),
+        DatasetSpec(rows=100_000, columns=10, null_density=0.1, cardinality=100),
+        DatasetSpec(rows=100_000, columns=50, null_density=0.5, cardinality=10_000),
+    ],
+    ids=lambda dataset: dataset.name,
+)
+@pytest.mark.parametrize("engine", ["pandas", "sqlite", "spark"])
+def test_graph_validate_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    engine: str,
+    dataset: DatasetSpec,
+    number_of_expectations: int,
+):
+    """Benchmark "Validator.graph_validate()" across engines, dataset shapes, and suite sizes.
+
+    Besides timings collected by pytest-benchmark, "extra_info" of every benchmark (included in "--benchmark-json"
+    output) records peak memory, number of queries issued, number of graph waves, and number of metrics resolved.
+    """  # noqa: E501
+    _skip_if_performance_tests_not_enabled(pytestconfig=pytestconfig, engine=engine)
+
+    spark = None
+    if engine == "spark":
+        from great_expectations.execution_engine import SparkDFExecutionEngine
+
+        spark = SparkDFExecutionEngine.get_or_create_spark_session()
+
+    df = validation_benchmark_util.generate_dataframe(dataset=dataset)
+    configurations = validation_benchmark_util.generate_expectation_configurations(
+        dataset=dataset, number_of_expectations=number_of_expectations
+    )
+
+    def _setup():
+        # Building Validator (and loading data into SQLite or Spark) is kept out of measured time.
+        validator = validation_benchmark_util.build_validator(engine=engine, df=df, spark=spark)
+        return (), {
+            "validator": validator,
+            "configurations": configurations,
+            "engine": engine,
+            "spark": spark,
+        }
+
+    measurement: BenchmarkMeasurement = benchmark.pedantic(
+        validation_benchmark_util.measure_graph_validate,
+        setup=_setup,
+        iterations=1,
+        rounds=1,
+    )
+
+    benchmark.extra_info.update(
+        {
+            "peak_memory_bytes": measurement.peak_memory_bytes,
+            "query_count": measurement.query_count,
+            "graph_waves": measurement.graph_waves,
+            "metrics_resolved": measurement.metrics_resolved,
+            "resolve_metrics_seconds": measurement.resolve_metrics_seconds,
+        }
+    )
+
+    assert measurement.expectations_validated == number_of_expectations
+    assert measurement.graph_waves > 0
+
+
+def _skip_if_performance_tests_not_enabled(pytestconfig: _pytest.config.Config, engine: str):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    if engine == "spark" and not pytestconfig.getoption("spark"):
+        pytest.skip('Benchmarking "spark" engine requires --spark flag.')
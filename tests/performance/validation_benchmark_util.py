@@ -0,0 +1,623 @@
+"""
+Helper utilities for benchmarking the core validation path ("Validator.graph_validate()", "ValidationGraph.resolve()",
+    and "ExecutionEngine.resolve_metrics()") against synthetic datasets and synthetic Expectation Suites, using
+    PandasExecutionEngine, SqlAlchemyExecutionEngine (backed by SQLite), and local-mode SparkDFExecutionEngine.
+
+Results are written as machine-readable JSON report, so that reports produced at different commits can be compared:
+
+    python -m tests.performance.validation_benchmark_util --engines pandas sqlite \\
+        --rows 10000 100000 --expectations 10 500 5000 --output validation_benchmarks.json
+
+    python -m tests.performance.validation_benchmark_util --engines pandas \\
+        --compare-to baseline_validation_benchmarks.json --output validation_benchmarks.json
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from great_expectations import __version__ as ge_version
+from great_expectations.compatibility import pyspark
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.self_check.util import (
+    build_pandas_validator_with_data,
+    build_sa_validator_with_data,
+    build_spark_validator_with_data,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+REPORT_VERSION = 1
+
+ENGINES = ("pandas", "sqlite", "spark")
+
+DEFAULT_ROWS = (1_000, 100_000)
+DEFAULT_COLUMNS = (10,)
+DEFAULT_NULL_DENSITIES = (0.1,)
+DEFAULT_CARDINALITIES = (100,)
+DEFAULT_EXPECTATIONS = (10, 500, 5_000)
+
+# Relative increase (of median wall time, peak memory, or query count), above which benchmark is reported as regression.  # noqa: E501
+DEFAULT_REGRESSION_TOLERANCE = 0.1
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Shape of synthetic dataset: half of its columns are numeric, the other half are strings."""
+
+    rows: int
+    columns: int
+    null_density: float
+    cardinality: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.rows}x{self.columns}-nulls{self.null_density}-card{self.cardinality}"
+
+    @property
+    def numeric_column_names(self) -> List[str]:
+        return [f"num_{idx}" for idx in range((self.columns + 1) // 2)]
+
+    @property
+    def string_column_names(self) -> List[str]:
+        return [f"str_{idx}" for idx in range(self.columns // 2)]
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    engine: str
+    dataset: DatasetSpec
+    number_of_expectations: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.engine}-{self.dataset.name}-exp{self.number_of_expectations}"
+
+
+@dataclass
+class BenchmarkMeasurement:
+    """Measurements of single "Validator.graph_validate()" call.
+
+    "peak_memory_bytes" covers Python (including NumPy/pandas) allocations only; memory used by SQLite or by the Spark
+    JVM is not included.  "query_count" is number of SQL statements executed (SQLite) or number of Spark jobs started
+    (Spark), and is None for pandas.  "graph_waves" is number of "ExecutionEngine.resolve_metrics()" calls, issued by
+    "ValidationGraph.resolve()" while working through metric dependency graph.
+    """  # noqa: E501
+
+    wall_time_seconds: float
+    peak_memory_bytes: int
+    query_count: Optional[int]
+    graph_waves: int
+    metrics_resolved: int
+    resolve_metrics_seconds: float
+    expectations_validated: int
+    successful_expectations: int
+
+
+@dataclass
+class BenchmarkResult:
+    case: BenchmarkCase
+    measurements: List[BenchmarkMeasurement] = field(default_factory=list)
+
+    def to_json_dict(self) -> dict:
+        wall_times: List[float] = [
+            measurement.wall_time_seconds for measurement in self.measurements
+        ]
+        last_measurement: BenchmarkMeasurement = self.measurements[-1]
+        return {
+            "name": self.case.name,
+            "engine": self.case.engine,
+            "number_of_expectations": self.case.number_of_expectations,
+            **asdict(self.case.dataset),
+            "rounds": len(self.measurements),
+            "wall_time_seconds": wall_times,
+            "median_wall_time_seconds": statistics.median(wall_times),
+            "peak_memory_bytes": max(
+                measurement.peak_memory_bytes for measurement in self.measurements
+            ),
+            "query_count": last_measurement.query_count,
+            "graph_waves": last_measurement.graph_waves,
+            "metrics_resolved": last_measurement.metrics_resolved,
+            "median_resolve_metrics_seconds": statistics.median(
+                measurement.resolve_metrics_seconds for measurement in self.measurements
+            ),
+            "expectations_validated": last_measurement.expectations_validated,
+            "successful_expectations": last_measurement.successful_expectations,
+        }
+
+
+def generate_dataframe(dataset: DatasetSpec, seed: int = 0) -> pd.DataFrame:
+    """Generates synthetic dataset; same "dataset" and "seed" always produce same data."""
+    rng = np.random.default_rng(seed)
+
+    data: Dict[str, Any] = {}
+
+    column_name: str
+    values: np.ndarray
+    for column_name in dataset.numeric_column_names:
+        values = rng.integers(0, dataset.cardinality, size=dataset.rows).astype(float)
+        values[rng.random(dataset.rows) < dataset.null_density] = np.nan
+        data[column_name] = values
+
+    for column_name in dataset.string_column_names:
+        values = np.array(
+            [f"value_{value}" for value in rng.integers(0, dataset.cardinality, size=dataset.rows)],
+            dtype=object,
+        )
+        values[rng.random(dataset.rows) < dataset.null_density] = None
+        data[column_name] = values
+
+    return pd.DataFrame(data)
+
+
+def generate_expectation_configurations(
+    dataset: DatasetSpec, number_of_expectations: int
+) -> List[ExpectationConfiguration]:
+    """Generates synthetic Expectation Suite, cycling through column-level and table-level Expectation templates.
+
+    Parameters vary with position in suite, so that larger suites also depend on more distinct metrics (rather than
+    merely repeating identical Expectations).
+    """  # noqa: E501
+    templates: List[Callable[[int], ExpectationConfiguration]] = []
+
+    column_name: str
+    for column_name in dataset.numeric_column_names:
+        templates.extend(_numeric_column_templates(column_name=column_name, dataset=dataset))
+
+    for column_name in dataset.string_column_names:
+        templates.extend(_string_column_templates(column_name=column_name, dataset=dataset))
+
+    templates.extend(_table_templates(dataset=dataset))
+
+    template: Callable[[int], ExpectationConfiguration]
+    return [
+        template(idx)
+        for idx, template in zip(range(number_of_expectations), itertools.cycle(templates))
+    ]
+
+
+def _numeric_column_templates(
+    column_name: str, dataset: DatasetSpec
+) -> List[Callable[[int], ExpectationConfiguration]]:
+    cardinality: int = dataset.cardinality
+    return [
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": column_name, "mostly": 1.0 - dataset.null_density},
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={
+                "column": column_name,
+                "min_value": idx % cardinality,
+                "max_value": cardinality,
+                "mostly": 0.5,
+            },
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": column_name,
+                "value_set": list(range(idx % cardinality + 1)),
+            },
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": column_name, "min_value": 0, "max_value": cardinality + idx},
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": column_name, "min_value": 0, "max_value": cardinality + idx},
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_unique_value_count_to_be_between",
+            kwargs={"column": column_name, "min_value": 1, "max_value": cardinality + idx},
+        ),
+    ]
+
+
+def _string_column_templates(
+    column_name: str, dataset: DatasetSpec
+) -> List[Callable[[int], ExpectationConfiguration]]:
+    cardinality: int = dataset.cardinality
+    return [
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": column_name, "mostly": 1.0 - dataset.null_density},
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": column_name,
+                "value_set": [f"value_{value}" for value in range(idx % cardinality + 1)],
+            },
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_value_lengths_to_be_between",
+            kwargs={"column": column_name, "min_value": 1, "max_value": 8 + idx % 8},
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_column_distinct_values_to_be_in_set",
+            kwargs={
+                "column": column_name,
+                "value_set": [f"value_{value}" for value in range(cardinality)],
+            },
+        ),
+    ]
+
+
+def _table_templates(dataset: DatasetSpec) -> List[Callable[[int], ExpectationConfiguration]]:
+    column_names: List[str] = dataset.numeric_column_names + dataset.string_column_names
+    return [
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 0, "max_value": dataset.rows + idx},
+        ),
+        lambda idx: ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_set",
+            kwargs={"column_set": column_names},
+        ),
+    ]
+
+
+def build_validator(
+    engine: str,
+    df: pd.DataFrame,
+    spark: Optional[pyspark.SparkSession] = None,
+) -> Validator:
+    if engine == "pandas":
+        return build_pandas_validator_with_data(df=df)
+
+    if engine == "sqlite":
+        return build_sa_validator_with_data(
+            df=df, sa_engine_name="sqlite", table_name="benchmark_table"
+        )
+
+    if engine == "spark":
+        if spark is None:
+            raise ValueError('Benchmarking "spark" engine requires SparkSession.')
+
+        return build_spark_validator_with_data(df=df, spark=spark)
+
+    raise ValueError(f'Unknown engine "{engine}"; must be one of {ENGINES}.')
+
+
+def measure_graph_validate(
+    validator: Validator,
+    configurations: List[ExpectationConfiguration],
+    engine: str,
+    spark: Optional[pyspark.SparkSession] = None,
+) -> BenchmarkMeasurement:
+    """Runs "Validator.graph_validate()" once, recording wall time, peak memory, queries, and graph waves."""  # noqa: E501
+    resolve_metrics_stats: Dict[str, Any] = {"calls": 0, "metrics": 0, "seconds": 0.0}
+
+    with _count_queries(
+        validator=validator, engine=engine, spark=spark
+    ) as get_query_count, _count_graph_waves(validator=validator, stats=resolve_metrics_stats):
+        tracemalloc.start()
+        try:
+            start: float = time.perf_counter()
+            results = validator.graph_validate(
+                configurations=configurations,
+                runtime_configuration={"catch_exceptions": True},
+            )
+            wall_time_seconds: float = time.perf_counter() - start
+            peak_memory_bytes: int = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        query_count: Optional[int] = get_query_count()
+
+    return BenchmarkMeasurement(
+        wall_time_seconds=wall_time_seconds,
+        peak_memory_bytes=peak_memory_bytes,
+        query_count=query_count,
+        graph_waves=resolve_metrics_stats["calls"],
+        metrics_resolved=resolve_metrics_stats["metrics"],
+        resolve_metrics_seconds=resolve_metrics_stats["seconds"],
+        expectations_validated=len(results),
+        successful_expectations=sum(1 for result in results if result.success),
+    )
+
+
+@contextmanager
+def _count_queries(
+    validator: Validator,
+    engine: str,
+    spark: Optional[pyspark.SparkSession] = None,
+) -> Iterator[Callable[[], Optional[int]]]:
+    if engine == "sqlite":
+        statements: List[str] = []
+
+        # noinspection PyUnusedLocal
+        def _before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ) -> None:
+            statements.append(statement)
+
+        sa_engine = validator.execution_engine.engine  # type: ignore[attr-defined]
+        sa.event.listen(sa_engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield lambda: len(statements)
+        finally:
+            sa.event.remove(sa_engine, "before_cursor_execute", _before_cursor_execute)
+    elif engine == "spark" and spark is not None:
+        job_group_id: str = f"gx_validation_benchmark_{uuid.uuid4().hex}"
+        spark.sparkContext.setJobGroup(job_group_id, "Great Expectations validation benchmark")
+        try:
+            yield lambda: len(spark.sparkContext.statusTracker().getJobIdsForGroup(job_group_id))
+        finally:
+            spark.sparkContext.setLocalProperty("spark.jobGroup.id", None)  # type: ignore[arg-type]
+    else:
+        yield lambda: None
+
+
+@contextmanager
+def _count_graph_waves(validator: Validator, stats: Dict[str, Any]) -> Iterator[None]:
+    # Shadowing bound method on instance counts every wave issued by "ValidationGraph.resolve()".
+    execution_engine = validator.execution_engine
+    resolve_metrics = execution_engine.resolve_metrics
+
+    def _resolve_metrics(
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[dict] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> dict:
+        metrics_to_resolve = list(metrics_to_resolve)
+        start: float = time.perf_counter()
+        try:
+            return resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        finally:
+            stats["calls"] += 1
+            stats["metrics"] += len(metrics_to_resolve)
+            stats["seconds"] += time.perf_counter() - start
+
+    execution_engine.resolve_metrics = _resolve_metrics  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        del execution_engine.resolve_metrics
+
+
+def run_benchmark_case(
+    case: BenchmarkCase,
+    rounds: int = 1,
+    spark: Optional[pyspark.SparkSession] = None,
+    df: Optional[pd.DataFrame] = None,
+) -> BenchmarkResult:
+    """Runs benchmark case "rounds" times; every round uses fresh Validator, so that metric caches start out cold."""  # noqa: E501
+    if rounds < 1:
+        raise ValueError(f'"rounds" must be a positive integer (got "{rounds}").')
+
+    if df is None:
+        df = generate_dataframe(dataset=case.dataset)
+
+    configurations: List[ExpectationConfiguration] = generate_expectation_configurations(
+        dataset=case.dataset, number_of_expectations=case.number_of_expectations
+    )
+
+    result = BenchmarkResult(case=case)
+    for _ in range(rounds):
+        validator: Validator = build_validator(engine=case.engine, df=df, spark=spark)
+        result.measurements.append(
+            measure_graph_validate(
+                validator=validator,
+                configurations=configurations,
+                engine=case.engine,
+                spark=spark,
+            )
+        )
+
+    return result
+
+
+def build_benchmark_cases(
+    engines: Sequence[str] = ("pandas", "sqlite"),
+    rows: Sequence[int] = DEFAULT_ROWS,
+    columns: Sequence[int] = DEFAULT_COLUMNS,
+    null_densities: Sequence[float] = DEFAULT_NULL_DENSITIES,
+    cardinalities: Sequence[int] = DEFAULT_CARDINALITIES,
+    expectations: Sequence[int] = DEFAULT_EXPECTATIONS,
+) -> List[BenchmarkCase]:
+    return [
+        BenchmarkCase(
+            engine=engine,
+            dataset=DatasetSpec(
+                rows=number_of_rows,
+                columns=number_of_columns,
+                null_density=null_density,
+                cardinality=cardinality,
+            ),
+            number_of_expectations=number_of_expectations,
+        )
+        for engine, number_of_rows, number_of_columns, null_density, cardinality, number_of_expectations in itertools.product(  # noqa: E501
+            engines, rows, columns, null_densities, cardinalities, expectations
+        )
+    ]
+
+
+def run_benchmarks(
+    cases: List[BenchmarkCase],
+    rounds: int = 1,
+    spark: Optional[pyspark.SparkSession] = None,
+) -> dict:
+    """Runs all benchmark cases and returns report (see "build_report()")."""
+    dataframes: Dict[DatasetSpec, pd.DataFrame] = {}
+    results: List[BenchmarkResult] = []
+
+    case: BenchmarkCase
+    for case in cases:
+        if case.dataset not in dataframes:
+            dataframes[case.dataset] = generate_dataframe(dataset=case.dataset)
+
+        results.append(
+            run_benchmark_case(case=case, rounds=rounds, spark=spark, df=dataframes[case.dataset])
+        )
+
+    return build_report(results=results)
+
+
+def build_report(results: List[BenchmarkResult]) -> dict:
+    return {
+        "version": REPORT_VERSION,
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "great_expectations_version": ge_version,
+        "git_commit": _get_git_commit(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas_version": pd.__version__,
+        "results": [result.to_json_dict() for result in results],
+    }
+
+
+def compare_reports(
+    baseline: dict,
+    candidate: dict,
+    tolerance: float = DEFAULT_REGRESSION_TOLERANCE,
+) -> List[dict]:
+    """Compares benchmark results (matched by name) of two reports.
+
+    Args:
+        baseline: report, produced at reference commit
+        candidate: report, produced at commit under test
+        tolerance: relative increase, above which change is flagged as regression
+
+    Returns:
+        List of comparisons (one per benchmark present in both reports), with ratios of candidate to baseline values
+    """  # noqa: E501
+    baseline_results: Dict[str, dict] = {result["name"]: result for result in baseline["results"]}
+
+    comparisons: List[dict] = []
+
+    candidate_result: dict
+    for candidate_result in candidate["results"]:
+        baseline_result: Optional[dict] = baseline_results.get(candidate_result["name"])
+        if baseline_result is None:
+            continue
+
+        ratios: Dict[str, Optional[float]] = {
+            key: _get_ratio(baseline_result.get(key), candidate_result.get(key))
+            for key in ("median_wall_time_seconds", "peak_memory_bytes", "query_count")
+        }
+        comparisons.append(
+            {
+                "name": candidate_result["name"],
+                "ratios": ratios,
+                "regressions": sorted(
+                    key
+                    for key, ratio in ratios.items()
+                    if ratio is not None and ratio > 1.0 + tolerance
+                ),
+            }
+        )
+
+    return comparisons
+
+
+def _get_ratio(
+    baseline_value: Optional[float], candidate_value: Optional[float]
+) -> Optional[float]:
+    if baseline_value is None or candidate_value is None or baseline_value == 0:
+        return None
+
+    return candidate_value / baseline_value
+
+
+def _get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark Validator.graph_validate() against synthetic data and suites."
+    )
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=["pandas", "sqlite"])
+    parser.add_argument("--rows", nargs="+", type=int, default=list(DEFAULT_ROWS))
+    parser.add_argument("--columns", nargs="+", type=int, default=list(DEFAULT_COLUMNS))
+    parser.add_argument(
+        "--null-densities", nargs="+", type=float, default=list(DEFAULT_NULL_DENSITIES)
+    )
+    parser.add_argument("--cardinalities", nargs="+", type=int, default=list(DEFAULT_CARDINALITIES))
+    parser.add_argument("--expectations", nargs="+", type=int, default=list(DEFAULT_EXPECTATIONS))
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--output", help="Path of JSON report (printed to stdout if omitted).")
+    parser.add_argument("--compare-to", help="Path of baseline JSON report to compare against.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_REGRESSION_TOLERANCE)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_argument_parser().parse_args(argv)
+
+    spark: Optional[pyspark.SparkSession] = None
+    if "spark" in args.engines:
+        from great_expectations.execution_engine import SparkDFExecutionEngine
+
+        spark = SparkDFExecutionEngine.get_or_create_spark_session()
+
+    cases: List[BenchmarkCase] = build_benchmark_cases(
+        engines=args.engines,
+        rows=args.rows,
+        columns=args.columns,
+        null_densities=args.null_densities,
+        cardinalities=args.cardinalities,
+        expectations=args.expectations,
+    )
+    report: dict = run_benchmarks(cases=cases, rounds=args.rounds, spark=spark)
+
+    if args.output:
+        with open(args.output, "w") as outfile:
+            json.dump(report, outfile, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if not args.compare_to:
+        return 0
+
+    with open(args.compare_to) as infile:
+        baseline: dict = json.load(infile)
+
+    comparisons: List[dict] = compare_reports(
+        baseline=baseline, candidate=report, tolerance=args.tolerance
+    )
+    comparison: dict
+    for comparison in comparisons:
+        ratios: str = ", ".join(
+            f"{key}={ratio:.2f}x" for key, ratio in comparison["ratios"].items() if ratio
+        )
+        status: str = "REGRESSION" if comparison["regressions"] else "ok"
+        print(f"{status:<10} {comparison['name']}: {ratios}", file=sys.stderr)
+
+    return 1 if any(comparison["regressions"] for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
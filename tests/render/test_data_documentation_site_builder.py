@@ -1,18 +1,37 @@
+import copy
+import datetime
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict
 
 import pytest
 
+from great_expectations.core import (
+    ExpectationSuite,
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.render.components import LegacyDiagnosticRendererType
+from great_expectations.render.renderer.page_renderer import ValidationResultsPageRenderer
+from great_expectations.render.view import DefaultJinjaPageView
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -125,3 +144,221 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+def _add_validation_results(context, count: int) -> list:
+    keys = []
+    for idx in range(count):
+        key = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+            run_id=RunIdentifier(
+                run_name=f"run_{idx}",
+                run_time=datetime.datetime(2024, 1, idx + 1, tzinfo=datetime.timezone.utc),
+            ),
+            batch_identifier="my_batch",
+        )
+        context.validations_store.set(
+            key,
+            ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name="my_suite",
+                meta={"batch_spec": {"data_asset_name": "my_asset"}},
+            ),
+        )
+        keys.append(key)
+
+    return keys
+
+
+def _build_local_site_builder(context, **site_config):
+    local_site_config = copy.deepcopy(context._project_config.data_docs_sites["local_site"])
+    local_site_config.update(site_config)
+    return instantiate_class_from_config(
+        config=local_site_config,
+        runtime_environment={
+            "data_context": context,
+            "root_directory": context.root_directory,
+            "site_name": "local_site",
+        },
+        config_defaults={"module_name": "great_expectations.render.renderer.site_builder"},
+    )
+
+
+def test_site_builder_incremental_build_renders_only_changed_resources(tmp_path, mocker):
+    context = get_context(project_root_dir=str(tmp_path))
+    validations_store = context.validations_store
+    keys = _add_validation_results(context, count=2)
+
+    site_builder = _build_local_site_builder(context, incremental=True)
+    validations_site_section_builder = site_builder.site_section_builders["validations"]
+    mock_render = mocker.patch.object(validations_site_section_builder.renderer_class, "render")
+    mocker.patch.object(
+        validations_site_section_builder.view_class, "render", return_value="<html></html>"
+    )
+
+    _, index_links_dict = site_builder.build()
+    assert mock_render.call_count == 2
+    assert site_builder.target_store.read_build_manifest() is not None
+
+    # Unchanged resources are not rendered again, and index is built without retrieving them.
+    validations_store.set(
+        keys[1],
+        ExpectationSuiteValidationResult(
+            success=False,
+            results=[],
+            suite_name="my_suite",
+            meta={"batch_spec": {"data_asset_name": "my_asset"}},
+        ),
+    )
+    mock_get_many = mocker.spy(validations_store, "get_many")
+
+    _, index_links_dict = site_builder.build()
+    assert mock_render.call_count == 3
+    mock_get_many.assert_not_called()
+    assert {
+        link["run_name"]: (link["validation_success"], link["asset_name"])
+        for link in index_links_dict["validations_links"]
+    } == {"run_0": (True, "my_asset"), "run_1": (False, "my_asset")}
+
+
+def test_site_section_builder_fingerprint_includes_section_config(tmp_path):
+    context = get_context(project_root_dir=str(tmp_path))
+
+    def _get_fingerprint(**validations_config) -> str:
+        site_builder = _build_local_site_builder(
+            context, site_section_builders={"validations": validations_config}
+        )
+        return site_builder.site_section_builders["validations"]._get_fingerprint()
+
+    fingerprint = _get_fingerprint()
+    assert _get_fingerprint() == fingerprint
+    assert (
+        _get_fingerprint(
+            renderer={"class_name": "ValidationResultsPageRenderer", "run_info_at_end": True}
+        )
+        != fingerprint
+    )
+    assert _get_fingerprint(validation_results_limit=1) != fingerprint
+
+
+def test_site_builder_renders_pages_concurrently(tmp_path, mocker):
+    context = get_context(project_root_dir=str(tmp_path))
+    keys = _add_validation_results(context, count=5)
+
+    site_builder = _build_local_site_builder(context, max_workers=3)
+    validations_site_section_builder = site_builder.site_section_builders["validations"]
+    assert validations_site_section_builder.max_workers == 3
+    # Worker threads render with their own renderer and view instances.
+    mock_render = mocker.patch.object(ValidationResultsPageRenderer, "render")
+    mocker.patch.object(DefaultJinjaPageView, "render", return_value="<html></html>")
+
+    _, index_links_dict = site_builder.build()
+
+    assert len(mock_render.call_args_list) == len(keys)
+    assert len(index_links_dict["validations_links"]) == len(keys)
+    for key in keys:
+        assert site_builder.get_resource_url(resource_identifier=key) is not None
+
+
+def _add_validation_result_with_expectation(context, run_name: str) -> ValidationResultIdentifier:
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="my_suite"),
+        run_id=RunIdentifier(
+            run_name=run_name,
+            run_time=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        ),
+        batch_identifier="my_batch",
+    )
+    context.validations_store.set(
+        key,
+        ExpectationSuiteValidationResult(
+            success=True,
+            results=[
+                ExpectationValidationResult(
+                    success=True,
+                    expectation_config=ExpectationConfiguration(
+                        expectation_type="expect_column_values_to_not_be_null",
+                        kwargs={"column": "my_column"},
+                    ),
+                    result={"element_count": 3, "unexpected_count": 0},
+                )
+            ],
+            suite_name="my_suite",
+            meta={
+                "expectation_suite_name": "my_suite",
+                "run_id": key.run_id,
+                "batch_spec": {"data_asset_name": "my_asset"},
+            },
+        ),
+    )
+    return key
+
+
+def _read_page(site_builder, resource_identifier) -> str:
+    url = site_builder.get_resource_url(resource_identifier=resource_identifier)
+    with open(url[len("file://") :]) as page_file:
+        return page_file.read()
+
+
+def test_site_builder_renders_pages_in_process_pool(tmp_path):
+    context = get_context(project_root_dir=str(tmp_path))
+    key = _add_validation_result_with_expectation(context, run_name="my_run")
+
+    site_builder = _build_local_site_builder(context, max_workers=2, use_process_pool=True)
+    site_builder.build()
+
+    page = _read_page(site_builder, key)
+    assert "my_suite" in page
+    assert "my_column" in page
+    assert "values must never be null" in page
+
+
+def test_site_section_builder_resolves_suite_meta_properties_for_worker_processes(tmp_path):
+    context = get_context(project_root_dir=str(tmp_path))
+    meta_properties = {"Data Dimension": "properties.dimension"}
+    context.suites.add(
+        ExpectationSuite(
+            name="my_suite",
+            meta={
+                "notes": {
+                    "format": LegacyDiagnosticRendererType.META_PROPERTIES,
+                    "content": meta_properties,
+                }
+            },
+        )
+    )
+    key = _add_validation_result_with_expectation(context, run_name="my_run")
+    site_builder = _build_local_site_builder(context, max_workers=2, use_process_pool=True)
+    validations_site_section_builder = site_builder.site_section_builders["validations"]
+
+    resource = validations_site_section_builder._prepare_resource_for_worker(
+        context.validations_store.get(key)
+    )
+
+    (evr,) = resource.results
+    assert evr.expectation_config.kwargs["meta_properties_to_render"] == meta_properties
+
+
+@pytest.mark.parametrize(
+    "max_workers,use_process_pool,executor_class",
+    [
+        pytest.param(None, False, None, id="serial"),
+        pytest.param(1, True, None, id="single_worker"),
+        pytest.param(2, False, ThreadPoolExecutor, id="threads"),
+        pytest.param(2, True, ProcessPoolExecutor, id="processes"),
+    ],
+)
+def test_site_section_builder_page_render_executor(
+    tmp_path, max_workers, use_process_pool, executor_class
+):
+    context = get_context(project_root_dir=str(tmp_path))
+    site_builder = _build_local_site_builder(
+        context, max_workers=max_workers, use_process_pool=use_process_pool
+    )
+
+    with site_builder.site_section_builders["validations"]._get_page_render_executor() as executor:
+        if executor_class is None:
+            assert executor is None
+        else:
+            assert isinstance(executor, executor_class)
@@ -304,7 +304,7 @@ def test_parse_validation_graph(
     ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(needed_metrics) == 11
 
     # Show that including "nonexistent" metric in dictionary of resolved metrics does not increase ready_metrics count.  # noqa: E501
     available_metrics = {("nonexistent", "nonexistent", "nonexistent"): "NONE"}
@@ -314,7 +314,7 @@ def test_parse_validation_graph(
     ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(needed_metrics) == 11
 
 
 @pytest.mark.unit
@@ -322,7 +322,7 @@ def test_populate_dependencies(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
 ):
     assert (
-        len(expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges) == 33
+        len(expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges) == 41
     )
 
 
@@ -406,6 +406,63 @@ def test_resolve_validation_graph_with_bad_config_catch_exceptions_true(
     )
 
 
+@pytest.mark.unit
+def test_resolve_validation_graph_schedules_waves_from_dependency_index():
+    class RecordingExecutionEngine:
+        def __init__(self) -> None:
+            self.waves: list = []
+
+        # noinspection PyUnusedLocal
+        def resolve_metrics(
+            self,
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            self.waves.append(
+                sorted(
+                    metric_configuration.metric_name for metric_configuration in metrics_to_resolve
+                )
+            )
+            return {
+                metric_configuration.id: "my_value" for metric_configuration in metrics_to_resolve
+            }
+
+    execution_engine = RecordingExecutionEngine()
+
+    table_row_count = MetricConfiguration(metric_name="table.row_count", metric_domain_kwargs={})
+    table_columns = MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={})
+    column_max = MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": "a"})
+    column_min = MetricConfiguration(metric_name="column.min", metric_domain_kwargs={"column": "a"})
+
+    graph = ValidationGraph(
+        execution_engine=cast(ExecutionEngine, execution_engine),
+        edges=[
+            MetricEdge(left=table_row_count),
+            MetricEdge(left=table_columns),
+            MetricEdge(left=column_max, right=table_columns),
+            MetricEdge(left=column_min, right=table_columns),
+            MetricEdge(left=column_min, right=table_row_count),
+            MetricEdge(left=column_min, right=column_max),
+        ],
+    )
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert execution_engine.waves == [
+        ["table.columns", "table.row_count"],
+        ["column.max"],
+        ["column.min"],
+    ]
+    assert set(resolved_metrics.keys()) == {
+        table_row_count.id,
+        table_columns.id,
+        column_max.id,
+        column_min.id,
+    }
+    assert aborted_metrics_info == {}
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "show_progress_bars, are_progress_bars_disabled, ",
@@ -780,6 +780,61 @@ def test_graph_validate_with_runtime_config(in_memory_runtime_context, basic_dat
     ]
 
 
+@pytest.mark.big
+def test_graph_validate_builds_each_expectation_once(in_memory_runtime_context, basic_datasource):
+    in_memory_runtime_context.datasources["my_datasource"] = basic_datasource
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        RuntimeBatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "runtime_parameters": {
+                    "batch_data": df,
+                },
+                "batch_identifiers": {
+                    "pipeline_stage_name": 0,
+                    "airflow_run_id": 0,
+                    "custom_key_0": 0,
+                },
+            }
+        )
+    )
+
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 10},
+        ),
+    ]
+    runtime_configuration = {"result_format": {"result_format": "SUMMARY"}}
+
+    with mock.patch.object(
+        ExpectationConfiguration,
+        "to_domain_obj",
+        autospec=True,
+        side_effect=ExpectationConfiguration.to_domain_obj,
+    ) as mock_to_domain_obj:
+        result = Validator(
+            execution_engine=basic_datasource.execution_engine,
+            data_context=in_memory_runtime_context,
+            batches=[batch],
+        ).graph_validate(
+            configurations=expectation_configurations,
+            runtime_configuration=runtime_configuration,
+        )
+
+    assert mock_to_domain_obj.call_count == len(expectation_configurations)
+    assert [evr.success for evr in result] == [True, False]
+    assert runtime_configuration == {"result_format": {"result_format": "SUMMARY"}}
+
+
 @pytest.mark.big
 def test_graph_validate_with_exception(basic_datasource):
     # noinspection PyUnusedLocal